@@ -0,0 +1,164 @@
+"""Admission control: bounded concurrency with a bounded FIFO wait queue."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+
+
+def _handed_over(waiter: asyncio.Future[None]) -> bool:
+    """Whether release() gave this waiter a slot (possibly racing a timeout)."""
+    return waiter.done() and not waiter.cancelled()
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a call is turned away instead of being run."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason  # "queue_full" or "queue_timeout"
+
+
+@dataclass
+class AdmissionStats:  # pylint: disable=too-many-instance-attributes
+    """Counters and gauges for an AdmissionController."""
+
+    admitted: int = 0
+    queued: int = 0  # admitted calls that had to wait for a slot
+    rejected_queue_full: int = 0
+    rejected_queue_timeout: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    wait_seconds_total: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average time admitted calls spent in the queue."""
+        return self.wait_seconds_total / self.admitted if self.admitted else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """The stats as a plain dict, including the mean wait time."""
+        return {**asdict(self), "mean_wait_seconds": self.mean_wait_seconds}
+
+
+class AdmissionController:
+    """Limit concurrent calls, queueing a bounded number of the rest.
+
+    Up to ``max_concurrent`` callers hold a slot at once. Further callers wait
+    in FIFO order, at most ``max_queue`` of them; a caller arriving to a full
+    queue, or waiting longer than ``queue_timeout`` seconds, is rejected with
+    AdmissionRejectedError so the client can back off rather than pile up.
+
+    ``max_concurrent=0`` disables the limit. ``on_admit`` is called with the
+    seconds each admitted caller waited for its slot.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+        on_admit: Callable[[float], None] = lambda _waited: None,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.stats = AdmissionStats()
+        self._clock = clock
+        self._on_admit = on_admit
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether concurrency is limited at all."""
+        return self.max_concurrent > 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None, None]:
+        """Hold a slot for the duration of the ``async with`` block.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait times out.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot; pair every successful call with release()."""
+        if not self.enabled or (
+            self.stats.in_flight < self.max_concurrent and not self._waiters
+        ):
+            self._admit(0.0)
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.stats.rejected_queue_full += 1
+            raise AdmissionRejectedError(
+                f"Server is at capacity ({self.max_concurrent} running, "
+                f"{len(self._waiters)} queued); retry later",
+                "queue_full",
+            )
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._update_queue_depth()
+        started = self._clock()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout or None)
+        except TimeoutError:
+            if not _handed_over(waiter):
+                self._forget(waiter)
+                self.stats.rejected_queue_timeout += 1
+                raise AdmissionRejectedError(
+                    f"Timed out after {self.queue_timeout:g}s waiting for a free "
+                    f"slot ({self.max_concurrent} running); retry later",
+                    "queue_timeout",
+                ) from None
+        except asyncio.CancelledError:
+            if _handed_over(waiter):
+                self.release()  # pass the slot on to the next caller
+            else:
+                self._forget(waiter)
+            raise
+        # release() handed its slot over, so in_flight already counts this call
+        self.stats.queued += 1
+        self._admit(self._clock() - started, handed_over=True)
+
+    def release(self) -> None:
+        """Give a slot back, handing it to the longest-waiting caller."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._update_queue_depth()
+                return
+        self.stats.in_flight -= 1
+        self._update_queue_depth()
+
+    def _admit(self, waited: float, handed_over: bool = False) -> None:
+        self.stats.admitted += 1
+        if not handed_over:
+            self.stats.in_flight += 1
+        self.stats.wait_seconds_total += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        self._on_admit(waited)
+
+    def _forget(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._update_queue_depth()
+
+    def _update_queue_depth(self) -> None:
+        self.stats.queue_depth = len(self._waiters)
+        self.stats.max_queue_depth = max(
+            self.stats.max_queue_depth, self.stats.queue_depth
+        )
@@ -1,21 +1,49 @@
-"""Fabric API Client for Python"""
+"""Asynchronous Fabric API Client for Python"""
 
+import logging
 import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from httpx_retries import Retry, RetryTransport
 
 from fabric_mcp import __version__ as fabric_mcp_version
-from fabric_mcp.utils import Log
-
-logger = Log().logger
+from fabric_mcp import json_codec
+from fabric_mcp.constants import (
+    BACKEND_EJECTION_TIME_ENV,
+    BACKEND_FAILURE_THRESHOLD,
+    DEFAULT_BACKEND_EJECTION_TIME,
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_LB_STRATEGY,
+    HEALTH_CHECK_INTERVAL_ENV,
+    HEALTH_CHECK_PATH,
+    LB_STRATEGY_ENV,
+)
+from fabric_mcp.metrics import UpstreamTimer
+from fabric_mcp.tracing import inject_trace_context, span
+from fabric_mcp.utils import get_env_float
+
+if TYPE_CHECKING:
+    from fabric_mcp.load_balancer import LoadBalancingTransport
+
+# Configured by Log() when the server starts, not as a side effect of importing
+logger = logging.getLogger("FabricMCP")
 
 DEFAULT_BASE_URL = "http://127.0.0.1:8080"  # Default for fabric --serve
 DEFAULT_TIMEOUT = 30  # seconds
 
 
+def _endpoint_label(endpoint: str) -> str:
+    """The endpoint with pattern names replaced, to keep metric labels bounded."""
+    path = endpoint.split("?", 1)[0]
+    if path.startswith("/patterns/") and path != "/patterns/names":
+        return "/patterns/{name}"
+    return path
+
+
 @dataclass
 class RequestConfig:
     """Configuration for HTTP request parameters."""
@@ -26,8 +54,12 @@ class RequestConfig:
     headers: dict[str, str] | None = None
 
 
-class FabricApiClient:
-    """Client for interacting with the Fabric REST API."""
+class FabricApiClient:  # pylint: disable=too-many-instance-attributes
+    """Asynchronous client for interacting with the Fabric REST API.
+
+    Built on httpx.AsyncClient so that many concurrent MCP sessions can share one
+    event loop (and one connection pool) without blocking each other.
+    """
 
     FABRIC_API_HEADER = "X-API-Key"
     REDACTED_HEADERS = ["Authorization", FABRIC_API_HEADER]
@@ -43,11 +75,16 @@ class FabricApiClient:
 
         Args:
             base_url: The base URL for the Fabric API. Defaults to env
-                FABRIC_BASE_URL or DEFAULT_BASE_URL.
+                FABRIC_BASE_URL or DEFAULT_BASE_URL. A comma-separated list of
+                URLs load-balances requests across several Fabric servers.
             api_key: The API key for authentication. Defaults to env FABRIC_API_KEY.
             timeout: Request timeout in seconds.
         """
-        self.base_url = base_url or os.environ.get("FABRIC_BASE_URL", DEFAULT_BASE_URL)
+        base_urls = base_url or os.environ.get("FABRIC_BASE_URL", DEFAULT_BASE_URL)
+        self.base_urls = [url.strip() for url in base_urls.split(",") if url.strip()]
+        if not self.base_urls:
+            self.base_urls = [DEFAULT_BASE_URL]
+        self.base_url = self.base_urls[0]
         self.api_key = api_key or os.environ.get("FABRIC_API_KEY")
         self.timeout = timeout
 
@@ -58,8 +95,10 @@ class FabricApiClient:
 
         # Configure retry strategy for httpx
         # Basic limits, retries are handled by transport
-        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
-        # Configure retries directly on the transport
+        self.max_connections = 100
+        limits = httpx.Limits(
+            max_connections=self.max_connections, max_keepalive_connections=20
+        )
 
         # New retry strategy with backoff using httpx-retries
         retry_strategy = Retry(
@@ -75,23 +114,112 @@ class FabricApiClient:
                 "TRACE",
             ],  # Methods to retry on
         )
-        transport = RetryTransport(retry=retry_strategy)
-
         headers = {"User-Agent": f"FabricMCPClient/v{fabric_mcp_version}"}
         if self.api_key:
             headers[self.FABRIC_API_HEADER] = f"{self.api_key}"
 
-        self.client = httpx.Client(
+        # httpx ignores `limits` when a custom transport is supplied, so the
+        # pool limits go on the async transport that RetryTransport wraps.
+        self._pool_transport = httpx.AsyncHTTPTransport(limits=limits)
+        http_transport: httpx.AsyncBaseTransport = self._pool_transport
+        self.load_balancer: LoadBalancingTransport | None = None
+        if len(self.base_urls) > 1:
+            # Below the retry layer, so each retry may go to another backend
+            # Imported only when there is more than one backend to balance
+            # pylint: disable-next=import-outside-toplevel
+            from fabric_mcp import load_balancer
+
+            self.load_balancer = load_balancer.LoadBalancingTransport(
+                self.base_urls,
+                http_transport,
+                strategy=os.environ.get(LB_STRATEGY_ENV, DEFAULT_LB_STRATEGY),
+                failure_threshold=BACKEND_FAILURE_THRESHOLD,
+                ejection_time=get_env_float(
+                    BACKEND_EJECTION_TIME_ENV, DEFAULT_BACKEND_EJECTION_TIME
+                ),
+                health_check_interval=get_env_float(
+                    HEALTH_CHECK_INTERVAL_ENV, DEFAULT_HEALTH_CHECK_INTERVAL
+                ),
+                health_check_path=HEALTH_CHECK_PATH,
+                health_check_headers=headers,
+            )
+            http_transport = self.load_balancer
+        # RetryTransport does not close the transport it wraps, so keep a handle
+        self._http_transport = http_transport
+        transport = RetryTransport(retry=retry_strategy, transport=http_transport)
+
+        self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=headers,
             timeout=self.timeout,
-            limits=limits,
             transport=transport,
         )
 
-        logger.info("FabricApiClient initialized for base URL: %s", self.base_url)
+        logger.info(
+            "FabricApiClient initialized for base URL: %s", ", ".join(self.base_urls)
+        )
+
+    def _prepare_request(
+        self, method: str, endpoint: str, config: RequestConfig
+    ) -> dict[str, str]:
+        """Collect the per-request headers and log the request at DEBUG level.
+
+        httpx merges these into the client's default headers when sending, so
+        the defaults are only copied (and redacted) when DEBUG logging is on.
+
+        Returns:
+            The headers to send in addition to the client defaults.
+        """
+        request_headers: dict[str, str] = {}
+        if config.json_data is not None:
+            # The body is pre-encoded by json_codec, so label it ourselves
+            request_headers["Content-Type"] = "application/json"
+        if config.headers:
+            request_headers.update(config.headers)
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_request(method, endpoint, config, request_headers)
+        return request_headers
+
+    def _log_request(
+        self,
+        method: str,
+        endpoint: str,
+        config: RequestConfig,
+        request_headers: dict[str, str],
+    ) -> None:
+        """Log a request with its effective headers, API keys masked."""
+        # httpx lower-cases header names, so match them case-insensitively
+        redacted = {name.lower() for name in self.REDACTED_HEADERS}
+        log_request_headers = {
+            key: "***REDACTED***" if key.lower() in redacted else value
+            for key, value in {**self.client.headers, **request_headers}.items()
+        }
+
+        logger.debug("Request: %s %s", method, endpoint)
+        logger.debug("Headers: %s", log_request_headers)
+        if config.params:
+            logger.debug("Params: %s", config.params)
+        if config.json_data:
+            logger.debug("JSON Body: %s", config.json_data)
+        elif config.data:
+            logger.debug("Body: <raw data>")
 
-    def _request(
+    def _span_attributes(self, method: str, label: str) -> dict[str, str]:
+        """OpenTelemetry HTTP client attributes for a request span."""
+        return {
+            "http.request.method": method,
+            "url.path": label,
+            "server.address": self.base_url,
+        }
+
+    @staticmethod
+    def _encode_json_body(config: RequestConfig) -> bytes | None:
+        """Serialize the JSON body with the configured fast JSON codec."""
+        if config.json_data is None:
+            return None
+        return json_codec.dumps(config.json_data)
+
+    async def _request(
         self,
         method: str,
         endpoint: str,
@@ -115,38 +243,30 @@ class FabricApiClient:
         if config is None:
             config = RequestConfig()
 
-        effective_request_headers = dict(self.client.headers)
-        if config.headers:
-            effective_request_headers.update(config.headers)
-        log_request_headers = dict(effective_request_headers)
-
-        # Mask API key in logs
-        for header_key in self.REDACTED_HEADERS:
-            if header_key in log_request_headers:
-                log_request_headers[header_key] = "***REDACTED***"
-
-        logger.debug("Request: %s %s", method, endpoint)
-        logger.debug("Headers: %s", log_request_headers)
-        if config.params:
-            logger.debug("Params: %s", config.params)
-        if config.json_data:
-            logger.debug("JSON Body: %s", config.json_data)
-        elif config.data:
-            logger.debug("Body: <raw data>")
+        request_headers = self._prepare_request(method, endpoint, config)
 
+        label = _endpoint_label(endpoint)
         try:
-            response = self.client.request(
-                method=method,
-                url=endpoint,
-                params=config.params,
-                json=config.json_data,
-                data=config.data,
-                timeout=self.timeout,
-                headers=effective_request_headers,
-            )
-            logger.debug("Response Status: %s", response.status_code)
-            response.raise_for_status()
-            return response
+            with (
+                span(f"{method} {label}", self._span_attributes(method, label)) as sp,
+                UpstreamTimer(method, label) as timer,
+            ):
+                inject_trace_context(request_headers)
+                response = await self.client.request(
+                    method=method,
+                    url=endpoint,
+                    params=config.params,
+                    content=self._encode_json_body(config),
+                    data=config.data,
+                    timeout=self.timeout,
+                    headers=request_headers,
+                )
+                timer.status = str(response.status_code)
+                if sp is not None:
+                    sp.set_attribute("http.response.status_code", response.status_code)
+                logger.debug("Response Status: %s", response.status_code)
+                response.raise_for_status()
+                return response
         except httpx.RequestError as e:
             logger.error("API request failed: %s %s - %s", method, endpoint, e)
             raise
@@ -162,14 +282,14 @@ class FabricApiClient:
 
     # --- Public API Methods ---
 
-    def get(
+    async def get(
         self, endpoint: str, params: dict[str, Any] | None = None, **kwargs: Any
     ) -> httpx.Response:
         """Sends a GET request."""
         config = RequestConfig(params=params, **kwargs)
-        return self._request("GET", endpoint, config)
+        return await self._request("GET", endpoint, config)
 
-    def post(
+    async def post(
         self,
         endpoint: str,
         json_data: dict[str, Any] | None = None,
@@ -178,9 +298,9 @@ class FabricApiClient:
     ) -> httpx.Response:
         """Sends a POST request."""
         config = RequestConfig(json_data=json_data, data=data, **kwargs)
-        return self._request("POST", endpoint, config)
+        return await self._request("POST", endpoint, config)
 
-    def put(
+    async def put(
         self,
         endpoint: str,
         json_data: dict[str, Any] | None = None,
@@ -189,14 +309,92 @@ class FabricApiClient:
     ) -> httpx.Response:
         """Sends a PUT request."""
         config = RequestConfig(json_data=json_data, data=data, **kwargs)
-        return self._request("PUT", endpoint, config)
+        return await self._request("PUT", endpoint, config)
 
-    def delete(self, endpoint: str, **kwargs: Any) -> httpx.Response:
+    async def delete(self, endpoint: str, **kwargs: Any) -> httpx.Response:
         """Sends a DELETE request."""
         config = RequestConfig(**kwargs)
-        return self._request("DELETE", endpoint, config)
+        return await self._request("DELETE", endpoint, config)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None = None,
+        data: Any | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[httpx.Response, None]:
+        """Sends a request and yields the response before its body is read.
+
+        The body is consumed incrementally (e.g. with ``response.aiter_bytes()``)
+        inside the ``async with`` block, so callers see Server-Sent Events as the
+        server emits them. The connection returns to the pool when the block exits.
+
+        Raises:
+            httpx.RequestError: For connection errors, timeouts, etc.
+            httpx.HTTPStatusError: For 4xx or 5xx responses. The error body is
+                read first so ``e.response.text`` is available.
+        """
+        config = RequestConfig(json_data=json_data, data=data, **kwargs)
+        request_headers = self._prepare_request(method, endpoint, config)
+
+        label = _endpoint_label(endpoint)
+        try:
+            # Not made current: callers hold the response open across the
+            # yields of an async generator (see tracing.span)
+            with (
+                span(
+                    f"{method} {label}",
+                    self._span_attributes(method, label),
+                    current=False,
+                ) as sp,
+                UpstreamTimer(method, label) as timer,
+            ):
+                inject_trace_context(request_headers, sp)
+                async with self.client.stream(
+                    method=method,
+                    url=endpoint,
+                    params=config.params,
+                    content=self._encode_json_body(config),
+                    data=config.data,
+                    timeout=self.timeout,
+                    headers=request_headers,
+                ) as response:
+                    timer.status = str(response.status_code)
+                    if sp is not None:
+                        sp.add_event("response_headers")
+                        sp.set_attribute(
+                            "http.response.status_code", response.status_code
+                        )
+                    logger.debug("Response Status: %s", response.status_code)
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+                    yield response
+        except httpx.RequestError as e:
+            logger.error("API request failed: %s %s - %s", method, endpoint, e)
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "API request failed with status %s: %s %s - %s",
+                e.response.status_code,
+                method,
+                endpoint,
+                e,
+            )
+            raise
+
+    def pool_usage(self) -> tuple[int, int]:
+        """Return the number of (active, idle) connections in the shared pool."""
+        # httpx keeps its httpcore connection pool private; read it defensively
+        pool: object = getattr(self._pool_transport, "_pool", None)
+        connections: list[Any] = getattr(pool, "connections", [])
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return len(connections) - idle, idle
 
-    def close(self):
+    async def close(self):
         """Closes the httpx client and releases resources."""
-        self.client.close()
+        await self.client.aclose()
+        await self._http_transport.aclose()
         logger.info("FabricApiClient closed.")
@@ -0,0 +1,328 @@
+"""In-process caches for Fabric API responses."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar, cast
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def stable_hash(obj: Any) -> str:
+    """Return a hash of a JSON-serializable object that ignores dict key order."""
+    encoded = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (fresh, stale or negative)."""
+        served = self.hits + self.stale_hits + self.negative_hits
+        lookups = served + self.misses
+        return served / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the counters (and hit ratio) as a plain dict."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "evictions": self.evictions,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class BackgroundRefreshes(Generic[K]):
+    """Background refresh tasks, at most one per key at a time."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[K, asyncio.Task[None]] = {}
+
+    def start(self, key: K, refresh: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """Run refresh() in the background unless key is already refreshing."""
+        if key in self._tasks:
+            return
+        task = asyncio.create_task(refresh())
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    async def wait(self) -> None:
+        """Wait until every refresh in flight has finished."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def cancel(self) -> None:
+        """Cancel every refresh in flight."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    stored_at: float
+
+
+class StaleWhileRevalidateCache(Generic[K, V]):
+    """TTL cache that serves stale values while refreshing them in the background.
+
+    - Within ``ttl`` seconds of being stored, a value is returned immediately.
+    - After ``ttl``, the stale value is still returned immediately, and a single
+      background task reloads it; concurrent lookups do not start more reloads.
+    - After ``ttl + max_stale`` seconds (if ``max_stale`` is set) the value is
+      too old to serve and the lookup waits for a fresh load.
+
+    Loader failures are never cached: a failed miss propagates the error to the
+    caller, and a failed background refresh keeps serving the stale value.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_stale: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl: Seconds a value is considered fresh. ``0`` disables caching.
+            max_stale: Seconds past ``ttl`` a stale value may still be served,
+                or ``None`` for no limit.
+            clock: Monotonic time source, injectable for tests.
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: dict[K, _Entry[V]] = {}
+        self._refreshing: BackgroundRefreshes[K] = BackgroundRefreshes()
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are cached at all."""
+        return self.ttl > 0
+
+    async def get(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value for key, loading it with loader when needed."""
+        if not self.enabled:
+            self.stats.misses += 1
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age <= self.ttl:
+                self.stats.hits += 1
+                return entry.value
+            if self.max_stale is None or age <= self.ttl + self.max_stale:
+                self.stats.stale_hits += 1
+                self._schedule_refresh(key, loader)
+                return entry.value
+
+        self.stats.misses += 1
+        value = await loader()
+        self._store(key, value)
+        return value
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Drop one cached key, or every key when called without one."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait until every background refresh in flight has finished."""
+        await self._refreshing.wait()
+
+    async def close(self) -> None:
+        """Cancel background refreshes and drop all cached values."""
+        await self._refreshing.cancel()
+        self._entries.clear()
+
+    def _store(self, key: K, value: V) -> None:
+        self._entries[key] = _Entry(value, self._clock())
+
+    def _schedule_refresh(self, key: K, loader: Callable[[], Awaitable[V]]) -> None:
+        self._refreshing.start(key, lambda: self._refresh(key, loader))
+
+    async def _refresh(self, key: K, loader: Callable[[], Awaitable[V]]) -> None:
+        try:
+            value = await loader()
+        except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+            self.stats.refresh_failures += 1
+            self._logger.warning("Background refresh of %r failed: %s", key, e)
+            return
+        self.stats.refreshes += 1
+        self._store(key, value)
+
+
+@dataclass
+class _SizedEntry(Generic[V]):
+    value: V | None
+    error: Exception | None
+    size: int
+    expires_at: float
+
+
+class ByteBoundedLRUCache(Generic[K, V]):  # pylint: disable=too-many-instance-attributes
+    """LRU cache bounded by the total size of its values rather than their count.
+
+    Each entry expires ``ttl`` seconds after it was stored. When adding an entry
+    would exceed ``max_bytes``, least recently used entries are evicted first; a
+    single value larger than ``max_bytes`` is returned but never stored.
+
+    Errors accepted by ``cache_error`` (e.g. "pattern not found") are cached as
+    negative entries for ``negative_ttl`` seconds and re-raised on lookup, so a
+    repeated request for something missing does not reach the server either.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        sizeof: Callable[[V], int],
+        *,
+        negative_ttl: float = 0,
+        cache_error: Callable[[Exception], bool] = lambda _: False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_bytes: Upper bound on the summed size of cached entries.
+                ``0`` disables caching.
+            ttl: Seconds a value stays cached. ``0`` disables caching.
+            sizeof: Returns the size in bytes accounted for a value.
+            negative_ttl: Seconds an error accepted by cache_error stays cached.
+                ``0`` disables negative caching.
+            cache_error: Decides whether a loader error is negatively cached.
+            clock: Monotonic time source, injectable for tests.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stats = CacheStats()
+        self._sizeof = sizeof
+        self._cache_error = cache_error
+        self._clock = clock
+        self._entries: OrderedDict[K, _SizedEntry[V]] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are cached at all."""
+        return self.max_bytes > 0 and self.ttl > 0
+
+    @property
+    def current_bytes(self) -> int:
+        """Summed size of the entries currently cached."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key has an unexpired value; does not count as a lookup."""
+        entry = self._entries.get(cast(K, key))
+        return (
+            entry is not None
+            and entry.error is None
+            and self._clock() < entry.expires_at
+        )
+
+    async def get(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value for key, loading it with loader when needed.
+
+        Raises:
+            Exception: A negatively cached error, or whatever loader raises.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            if entry.error is not None:
+                raise entry.error.with_traceback(None)
+            return cast(V, entry.value)
+
+        try:
+            value = await loader()
+        except Exception as e:
+            if self.negative_ttl > 0 and self.enabled and self._cache_error(e):
+                self._put(key, None, e, len(str(e)), self.negative_ttl)
+            raise
+        self.put(key, value)
+        return value
+
+    def peek(self, key: K) -> V | None:
+        """Return the cached value for key, or None on a miss.
+
+        Negatively cached errors are treated as misses here.
+        """
+        entry = self._lookup(key)
+        return None if entry is None or entry.error is not None else entry.value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value for key, evicting older entries to make room."""
+        if self.enabled:
+            self._put(key, value, None, self._sizeof(value), self.ttl)
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Drop one cached key, or every key when called without one."""
+        if key is None:
+            self._entries.clear()
+            self._bytes = 0
+        elif key in self._entries:
+            self._remove(key)
+
+    def _lookup(self, key: K) -> _SizedEntry[V] | None:
+        """Return the live entry for key (updating recency and stats), if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._clock() < entry.expires_at:
+                self._entries.move_to_end(key)
+                if entry.error is not None:
+                    self.stats.negative_hits += 1
+                else:
+                    self.stats.hits += 1
+                return entry
+            self._remove(key)
+        self.stats.misses += 1
+        return None
+
+    def _put(
+        self, key: K, value: V | None, error: Exception | None, size: int, ttl: float
+    ) -> None:
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+        while self._bytes + size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+        self._entries[key] = _SizedEntry(value, error, size, self._clock() + ttl)
+        self._bytes += size
+
+    def _remove(self, key: K) -> None:
+        self._bytes -= self._entries.pop(key).size
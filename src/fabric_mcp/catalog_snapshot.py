@@ -0,0 +1,179 @@
+"""On-disk snapshot of the Fabric catalog, for warm starts of new processes."""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from . import json_codec
+from .cache import BackgroundRefreshes
+
+V = TypeVar("V")
+
+# Bumped whenever the format of stored values changes; older snapshots are dropped
+SCHEMA_VERSION = 1
+
+
+class CatalogSnapshot:  # pylint: disable=too-many-instance-attributes
+    """Catalog responses (pattern names and details, models, strategies) in SQLite.
+
+    Every response fetched from Fabric is written to the snapshot. A new
+    process loads the snapshot once and answers from it immediately, even
+    before Fabric is reachable, while a single background task per key
+    revalidates the entry against Fabric. Once a key has been revalidated,
+    lookups go to the regular caches and Fabric again.
+
+    The database uses WAL mode, so several server processes can share one
+    snapshot file. Entries older than ``max_age`` seconds are not loaded.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_age: float,
+        *,
+        discard_error: Callable[[Exception], bool] = lambda _: False,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: The SQLite database file; created on first write.
+            max_age: Seconds a stored entry may be used at startup.
+            discard_error: Decides whether a revalidation error means the
+                entry is gone upstream (e.g. "pattern not found"), so that
+                it is dropped instead of served.
+            wall_clock: Wall-clock time source, injectable for tests.
+        """
+        self.path = path
+        self.max_age = max_age
+        self._discard_error = discard_error
+        self._wall_clock = wall_clock
+        # Encoded values loaded from disk and not yet revalidated in this process
+        self._stale: dict[str, bytes] = {}
+        self._refreshing: BackgroundRefreshes[str] = BackgroundRefreshes()
+        self._loading: asyncio.Task[None] | None = None
+        self._logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._stale)
+
+    async def load(self) -> None:
+        """Read the entries younger than max_age from disk, once.
+
+        The database is read in a worker thread; callers arriving while it
+        runs wait for the same read, and later calls return at once.
+        """
+        if self._loading is None:
+            self._loading = asyncio.create_task(self._load())
+        await asyncio.shield(self._loading)
+
+    async def _load(self) -> None:
+        rows = await asyncio.to_thread(self._read, self._wall_clock() - self.max_age)
+        self._stale = {key: bytes(value) for key, value in rows}
+        if rows:
+            self._logger.info("Loaded %d catalog entries from %s", len(rows), self.path)
+
+    async def get(self, key: str, load: Callable[[], Awaitable[V]]) -> V:
+        """Return the snapshot's value for key while load revalidates it.
+
+        Keys without a snapshot entry, or already revalidated, are loaded
+        directly.
+        """
+        stored = self._stale.get(key)
+        if stored is None:
+            return await load()
+        self._refreshing.start(key, lambda: self._refresh(key, load))
+        # Decoded on every lookup, so callers cannot change the stored value
+        return cast(V, json_codec.loads(stored))
+
+    async def put(self, key: str, value: Any) -> None:
+        """Store a value fetched from Fabric."""
+        self._stale.pop(key, None)
+        encoded = json_codec.dumps(value)
+        await asyncio.to_thread(self._write, key, encoded)
+
+    def forget(self, key: str | None = None) -> None:
+        """Stop serving one loaded entry, or all of them, until revalidated."""
+        if key is None:
+            self._stale.clear()
+        else:
+            self._stale.pop(key, None)
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait until every background revalidation in flight has finished."""
+        await self._refreshing.wait()
+
+    async def close(self) -> None:
+        """Cancel background revalidations."""
+        await self._refreshing.cancel()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=5)
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with db:
+                if version:
+                    db.execute("DROP TABLE IF EXISTS catalog")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS catalog (key TEXT PRIMARY KEY,"
+                    " value BLOB NOT NULL, stored_at REAL NOT NULL)"
+                )
+                db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            db.execute("PRAGMA journal_mode = WAL")
+        db.execute("PRAGMA synchronous = NORMAL")
+        return db
+
+    def _read(self, oldest: float) -> list[tuple[str, bytes]]:
+        if not self.path.exists():
+            return []
+        try:
+            with closing(self._connect()) as db:
+                return db.execute(
+                    "SELECT key, value FROM catalog WHERE stored_at > ?", (oldest,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            self._logger.warning(
+                "Ignoring unreadable catalog snapshot %s: %s", self.path, e
+            )
+            return []
+
+    def _write(self, key: str, encoded: bytes) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as db:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO catalog VALUES (?, ?, ?)",
+                        (key, encoded, self._wall_clock()),
+                    )
+        except (OSError, sqlite3.Error) as e:
+            self._logger.warning(
+                "Could not write catalog snapshot %s: %s", self.path, e
+            )
+
+    def _delete(self, key: str) -> None:
+        try:
+            with closing(self._connect()) as db:
+                with db:
+                    db.execute("DELETE FROM catalog WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            self._logger.warning(
+                "Could not write catalog snapshot %s: %s", self.path, e
+            )
+
+    async def _refresh(self, key: str, load: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await load()
+        except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+            if self._discard_error(e):
+                self._stale.pop(key, None)
+                await asyncio.to_thread(self._delete, key)
+                return
+            self._logger.warning("Revalidating %r from the snapshot failed: %s", key, e)
+            return
+        # The loader may have been answered by a cache without calling put()
+        self._stale.pop(key, None)
@@ -0,0 +1,167 @@
+"""Token estimates and boundary-aware splitting of oversized pattern inputs."""
+
+import math
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class ModelProfile(NamedTuple):
+    """What the splitter needs to know about a model."""
+
+    context_window: int  # tokens
+    chars_per_token: float  # average for English text with the model's tokenizer
+
+
+# Longest matching prefix of the (lower-cased) model name wins
+_MODEL_PROFILES: dict[str, ModelProfile] = {
+    "gpt-4o": ModelProfile(128_000, 4.0),
+    "gpt-4.1": ModelProfile(1_000_000, 4.0),
+    "gpt-4-turbo": ModelProfile(128_000, 3.7),
+    "gpt-4": ModelProfile(8_192, 3.7),
+    "gpt-3.5-turbo": ModelProfile(16_385, 3.7),
+    "o1": ModelProfile(128_000, 4.0),
+    "o3": ModelProfile(200_000, 4.0),
+    "o4": ModelProfile(200_000, 4.0),
+    "claude": ModelProfile(200_000, 3.5),
+    "gemini": ModelProfile(1_000_000, 4.0),
+    "llama3": ModelProfile(8_192, 3.8),
+    "llama-3": ModelProfile(128_000, 3.8),
+    "mistral": ModelProfile(32_000, 3.5),
+    "mixtral": ModelProfile(32_000, 3.5),
+    "deepseek": ModelProfile(64_000, 3.5),
+}
+_DEFAULT_PROFILE = ModelProfile(8_192, 3.5)
+
+_PARAGRAPH = re.compile(r".*?(?:\n[ \t]*\n\s*|\Z)", re.DOTALL)
+_SENTENCE = re.compile(r".*?(?:[.!?。！？]+[\"')\]]*\s+|\Z)", re.DOTALL)
+_WORD = re.compile(r"\S*\s*")
+
+
+@lru_cache(maxsize=64)
+def model_profile(model: str) -> ModelProfile:
+    """Look up a model's context window and tokenizer density by name."""
+    name = model.lower().rsplit("/", 1)[-1]
+    matches = [prefix for prefix in _MODEL_PROFILES if name.startswith(prefix)]
+    if not matches:
+        return _DEFAULT_PROFILE
+    return _MODEL_PROFILES[max(matches, key=len)]
+
+
+def estimate_tokens(text: str, model: str = "") -> int:
+    """Estimate how many tokens text takes for model, without a tokenizer.
+
+    ASCII text is counted at the model's average characters per token; other
+    characters (e.g. CJK), which tokenizers split much more finely, count as
+    one token each. The estimate errs on the high side.
+    """
+    return math.ceil(_token_weight(text, model_profile(model).chars_per_token))
+
+
+def _token_weight(text: str, chars_per_token: float) -> float:
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars / chars_per_token + (len(text) - ascii_chars)
+
+
+def split_text(
+    text: str, max_tokens: int, overlap_tokens: int = 0, model: str = ""
+) -> list[str]:
+    """Split text into chunks of at most max_tokens (estimated) tokens.
+
+    Chunks end at paragraph breaks where possible, then at sentence ends, and
+    only split inside a sentence (between words) when one sentence alone is
+    too long. Consecutive chunks share up to overlap_tokens of text so context
+    is not lost at the seams. Joining the chunks without their overlaps gives
+    back the original text.
+    """
+    if estimate_tokens(text, model) <= max_tokens:
+        return [text] if text.strip() else []
+
+    chunks: list[str] = []
+    current: list[tuple[str, int]] = []
+    current_tokens = 0
+    for unit in _split_units(text, max_tokens, model):
+        tokens = estimate_tokens(unit, model)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("".join(u for u, _ in current))
+            current = _overlap_tail(
+                current, min(overlap_tokens, max_tokens - tokens), model
+            )
+            current_tokens = sum(t for _, t in current)
+        current.append((unit, tokens))
+        current_tokens += tokens
+    if current:
+        chunks.append("".join(u for u, _ in current))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def _split_units(text: str, max_tokens: int, model: str) -> list[str]:
+    """Break text into pieces that each fit max_tokens, as coarse as possible."""
+    units: list[str] = []
+    for paragraph in _pieces(_PARAGRAPH, text):
+        if estimate_tokens(paragraph, model) <= max_tokens:
+            units.append(paragraph)
+            continue
+        for sentence in _pieces(_SENTENCE, paragraph):
+            if estimate_tokens(sentence, model) <= max_tokens:
+                units.append(sentence)
+            else:
+                units.extend(_split_words(sentence, max_tokens, model))
+    return units
+
+
+def _split_words(text: str, max_tokens: int, model: str) -> list[str]:
+    """Pack words into pieces of at most max_tokens; cut words that alone exceed it."""
+    chars_per_token = model_profile(model).chars_per_token
+    pieces: list[str] = []
+    current: list[str] = []
+    current_weight = 0.0
+    for word in _pieces(_WORD, text):
+        weight = _token_weight(word, chars_per_token)
+        if current and current_weight + weight > max_tokens:
+            pieces.append("".join(current))
+            current, current_weight = [], 0.0
+        while weight > max_tokens:
+            # Roughly max_tokens worth of characters, at least one
+            cut = max(1, int(len(word) * max_tokens / weight))
+            pieces.append(word[:cut])
+            word = word[cut:]
+            weight = _token_weight(word, chars_per_token)
+        current.append(word)
+        current_weight += weight
+    if current:
+        pieces.append("".join(current))
+    return [piece for piece in pieces if piece]
+
+
+def _pieces(pattern: re.Pattern[str], text: str) -> list[str]:
+    return [match.group() for match in pattern.finditer(text) if match.group()]
+
+
+def _overlap_tail(
+    units: list[tuple[str, int]], budget: int, model: str
+) -> list[tuple[str, int]]:
+    """The trailing text of a chunk that fits in the overlap budget.
+
+    Whole units are kept while they fit; the unit that does not is trimmed to
+    its trailing sentences, so long paragraphs still overlap.
+    """
+    tail: list[tuple[str, int]] = []
+    used = 0
+    for unit, tokens in reversed(units):
+        if used + tokens <= budget:
+            tail.insert(0, (unit, tokens))
+            used += tokens
+            continue
+        sentences: list[str] = []
+        for sentence in reversed(_pieces(_SENTENCE, unit)):
+            sentence_tokens = estimate_tokens(sentence, model)
+            if used + sentence_tokens > budget:
+                break
+            sentences.insert(0, sentence)
+            used += sentence_tokens
+        if sentences:
+            partial = "".join(sentences)
+            tail.insert(0, (partial, estimate_tokens(partial, model)))
+        break
+    return tail
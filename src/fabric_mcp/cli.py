@@ -7,7 +7,7 @@ import click
 
 from fabric_mcp import __version__
 
-from .core import DEFAULT_MCP_HTTP_PATH, FabricMCP
+from .constants import DEFAULT_MCP_HTTP_PATH
 from .utils import Log
 
 
@@ -115,6 +115,9 @@ def _run_server(config: ServerConfig) -> None:
     log = Log(config.log_level)
     logger = log.logger
 
+    # fastmcp dominates start-up time; --help and --version do without it
+    from .core import FabricMCP  # pylint: disable=import-outside-toplevel
+
     fabric_mcp = FabricMCP(config.log_level)
 
     if config.transport == "stdio":
@@ -1,10 +1,98 @@
 """Constants used throughout the fabric-mcp package."""
 
 DEFAULT_MCP_HTTP_PATH = "/message"
+METRICS_HTTP_PATH = "/metrics"  # Prometheus scrape endpoint (HTTP transport)
+
+# Optional OpenTelemetry tracing: "otlp" or "file" (unset disables tracing)
+TRACE_EXPORTER_ENV = "FABRIC_MCP_TRACE_EXPORTER"
+TRACE_FILE_ENV = "FABRIC_MCP_TRACE_FILE"
+DEFAULT_TRACE_FILE = "fabric-mcp-traces.jsonl"
+
+# Log output: "rich" (human-readable, the default) or "json" (one JSON object
+# per line, written by a background thread)
+LOG_FORMAT_ENV = "FABRIC_MCP_LOG_FORMAT"
+DEFAULT_LOG_FORMAT = "rich"
+LOG_FORMATS = ("rich", "json")
 
 DEFAULT_VENDOR = "openai"
 DEFAULT_MODEL = "gpt-4o"  # Default model if none specified in config
 
+# Load balancing when FABRIC_BASE_URL lists several comma-separated backends
+LB_STRATEGY_ENV = "FABRIC_MCP_LB_STRATEGY"
+DEFAULT_LB_STRATEGY = "least_outstanding"
+HEALTH_CHECK_INTERVAL_ENV = "FABRIC_MCP_HEALTH_CHECK_INTERVAL"
+DEFAULT_HEALTH_CHECK_INTERVAL = 10.0
+BACKEND_EJECTION_TIME_ENV = "FABRIC_MCP_BACKEND_EJECTION_TIME"
+DEFAULT_BACKEND_EJECTION_TIME = 30.0
+BACKEND_FAILURE_THRESHOLD = 3  # consecutive failures before ejection
+HEALTH_CHECK_PATH = "/patterns/names"  # cheap endpoint every Fabric server has
+
+# MCP logger name for streamed pattern output sent as log notifications
+STREAM_LOGGER_NAME = "fabric_mcp.stream"
+
+# Seconds the pattern list is served from cache before it is refreshed in the
+# background; override with FABRIC_MCP_PATTERN_LIST_TTL (0 disables the cache)
+PATTERN_LIST_TTL_ENV = "FABRIC_MCP_PATTERN_LIST_TTL"
+DEFAULT_PATTERN_LIST_TTL = 60.0
+
+# Pattern details cache: total size bound, TTL of cached details and TTL of
+# cached "pattern not found" results (0 disables the respective caching)
+PATTERN_CACHE_BYTES_ENV = "FABRIC_MCP_PATTERN_CACHE_BYTES"
+DEFAULT_PATTERN_CACHE_BYTES = 4 * 1024 * 1024
+PATTERN_CACHE_TTL_ENV = "FABRIC_MCP_PATTERN_CACHE_TTL"
+DEFAULT_PATTERN_CACHE_TTL = 300.0
+PATTERN_NOT_FOUND_TTL_ENV = "FABRIC_MCP_PATTERN_NOT_FOUND_TTL"
+DEFAULT_PATTERN_NOT_FOUND_TTL = 30.0
+
+# Result cache for deterministic (temperature 0) pattern runs. Opt-in: it is
+# enabled by giving the memory tier a size and/or the disk tier a directory
+RESULT_CACHE_BYTES_ENV = "FABRIC_MCP_RESULT_CACHE_BYTES"
+DEFAULT_RESULT_CACHE_BYTES = 0
+RESULT_CACHE_TTL_ENV = "FABRIC_MCP_RESULT_CACHE_TTL"
+DEFAULT_RESULT_CACHE_TTL = 86400.0
+RESULT_CACHE_DIR_ENV = "FABRIC_MCP_RESULT_CACHE_DIR"
+
+# On-disk snapshot of pattern names and details, models and strategies, so new
+# processes can answer catalog calls at once. Opt-in: enabled by giving a path
+CATALOG_SNAPSHOT_ENV = "FABRIC_MCP_CATALOG_SNAPSHOT"
+CATALOG_SNAPSHOT_MAX_AGE_ENV = "FABRIC_MCP_CATALOG_SNAPSHOT_MAX_AGE"
+DEFAULT_CATALOG_SNAPSHOT_MAX_AGE = 7 * 86400.0
+
+# Read pattern names and details straight from Fabric's patterns directory
+# instead of the REST API. Opt-in, for fabric-mcp on the same host as Fabric
+LOCAL_PATTERNS_DIR_ENV = "FABRIC_MCP_LOCAL_PATTERNS_DIR"
+LOCAL_PATTERNS_POLL_INTERVAL_ENV = "FABRIC_MCP_LOCAL_PATTERNS_POLL_INTERVAL"
+DEFAULT_LOCAL_PATTERNS_POLL_INTERVAL = 2.0
+
+# Admission control for upstream /chat calls: at most MAX_CONCURRENT_PATTERNS
+# run at once (0 = unlimited), PATTERN_QUEUE_SIZE more wait up to
+# PATTERN_QUEUE_TIMEOUT seconds, and anything beyond that is rejected
+MAX_CONCURRENT_PATTERNS_ENV = "FABRIC_MCP_MAX_CONCURRENT_PATTERNS"
+DEFAULT_MAX_CONCURRENT_PATTERNS = 16
+PATTERN_QUEUE_SIZE_ENV = "FABRIC_MCP_PATTERN_QUEUE_SIZE"
+DEFAULT_PATTERN_QUEUE_SIZE = 64
+PATTERN_QUEUE_TIMEOUT_ENV = "FABRIC_MCP_PATTERN_QUEUE_TIMEOUT"
+DEFAULT_PATTERN_QUEUE_TIMEOUT = 30.0
+
+# Upper bound (and default) for concurrent /chat calls of one batch tool call;
+# callers may ask for less with max_parallel
+BATCH_PARALLELISM_ENV = "FABRIC_MCP_BATCH_PARALLELISM"
+DEFAULT_BATCH_PARALLELISM = 8
+
+# Map-reduce runs: inputs larger than one chunk (estimated tokens; never more
+# than half the model's context window) are split into chunks that overlap
+MAPREDUCE_CHUNK_TOKENS_ENV = "FABRIC_MCP_MAPREDUCE_CHUNK_TOKENS"
+DEFAULT_MAPREDUCE_CHUNK_TOKENS = 8000
+DEFAULT_MAPREDUCE_OVERLAP_TOKENS = 200
+MAPREDUCE_SEPARATOR = "\n\n---\n\n"  # between partial outputs given to reduce
+
+# JSON backend: orjson, msgspec or json; "auto" picks the fastest installed
+JSON_BACKEND_ENV = "FABRIC_MCP_JSON_BACKEND"
+
+# JSON-RPC implementation-defined error code for calls rejected because the
+# server is at capacity (-32000 is taken by the MCP SDK's CONNECTION_CLOSED)
+SERVER_BUSY = -32001
+
 # Sensitive configuration key patterns for redaction
 SENSITIVE_CONFIG_PATTERNS = ["*_API_KEY", "*_TOKEN", "*_SECRET", "*_PASSWORD"]
 
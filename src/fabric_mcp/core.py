@@ -1,29 +1,72 @@
 """Core MCP server implementation using the Model Context Protocol."""
+# pylint: disable=too-many-lines
 
+import asyncio
 import logging
+import time
 from asyncio.exceptions import CancelledError
-from collections.abc import Generator
-from typing import Any
+from collections.abc import AsyncGenerator, Generator
+from contextlib import (
+    AbstractAsyncContextManager,
+    aclosing,
+    asynccontextmanager,
+    contextmanager,
+)
+from typing import Any, Literal, cast, overload
 
 import httpx
 from anyio import WouldBlock
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from fastmcp.server.http import StarletteWithLifespan
+from mcp.server.session import ServerSession
+from mcp.shared.exceptions import McpError
 from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
 from . import __version__
+from .admission import AdmissionRejectedError
 from .api_client import FabricApiClient  # Re-export for test compatibility
+from .cache import stable_hash
+from .chunking import model_profile, split_text
 from .config import get_default_model
-from .constants import DEFAULT_MCP_HTTP_PATH, DEFAULT_MODEL, DEFAULT_VENDOR
+from .constants import (
+    BATCH_PARALLELISM_ENV,
+    DEFAULT_BATCH_PARALLELISM,
+    DEFAULT_MAPREDUCE_CHUNK_TOKENS,
+    DEFAULT_MAPREDUCE_OVERLAP_TOKENS,
+    DEFAULT_MCP_HTTP_PATH,
+    DEFAULT_MODEL,
+    DEFAULT_VENDOR,
+    MAPREDUCE_CHUNK_TOKENS_ENV,
+    MAPREDUCE_SEPARATOR,
+    METRICS_HTTP_PATH,
+    SERVER_BUSY,
+    STREAM_LOGGER_NAME,
+)
 from .fabric_tools import FabricToolsMixin
-from .models import PatternExecutionConfig
+from .metrics import CONTENT_TYPE, ChatTimer, timed_tool
+from .models import PatternExecutionConfig, PatternRun
+from .result_cache import CachedResult
 from .sse_parser import SSEParserMixin
-from .utils import raise_mcp_error
+from .tracing import configure_tracing, shutdown_tracing, traced_tool
+from .utils import get_env_float, raise_mcp_error
 from .validation import ValidationMixin
 
 # Re-export for test compatibility
 __all__ = ["FabricMCP", "FabricApiClient"]
 
 
+def _request_session(ctx: Context) -> ServerSession:
+    """The session of the request ctx belongs to."""
+    return cast(
+        ServerSession,
+        ctx.request_context.session,  # pyright: ignore[reportUnknownMemberType]
+    )
+
+
 class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin):
     """Base class for the Model Context Protocol server."""
 
@@ -38,16 +81,79 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
         self._default_vendor: str | None = None
         self._load_default_config()
 
-        # Explicitly register tool methods
+        # Explicitly register tool methods, timing (and, when enabled, tracing)
+        # every call
+        configure_tracing()
         for fn in (
             self.fabric_list_patterns,
             self.fabric_get_pattern_details,
+            self.fabric_search_patterns,
             self.fabric_run_pattern,
+            self.fabric_run_pattern_batch,
+            self.fabric_run_pipeline,
+            self.fabric_run_pattern_fanout,
+            self.fabric_run_pattern_mapreduce,
             self.fabric_list_models,
             self.fabric_list_strategies,
             self.fabric_get_configuration,
         ):
-            self.tool(fn)
+            self.tool(timed_tool(traced_tool(fn)))
+
+        # Served by the HTTP transports only, next to the MCP endpoint
+        self.custom_route(METRICS_HTTP_PATH, methods=["GET"])(self._metrics_endpoint)
+
+    async def close(self) -> None:
+        """Release the shared API client and caches when the server stops.
+
+        The transports call this once, on shutdown: after stdin closes for
+        stdio, and when the HTTP app's lifespan ends for streamable HTTP. The
+        client's connection pool and the caches are therefore shared by every
+        MCP session, rather than set up again for each one. Pending spans are
+        flushed last, once nothing is left to record them.
+        """
+        await self._close_caches()
+        await self._close_api_client()
+        shutdown_tracing()
+
+    async def run_stdio_async(self) -> None:
+        """Run the server over stdio, then close it."""
+        try:
+            await super().run_stdio_async()
+        finally:
+            await self.close()
+
+    def http_app(
+        self,
+        path: str | None = None,
+        middleware: list[Middleware] | None = None,
+        json_response: bool | None = None,
+        stateless_http: bool | None = None,
+        transport: Literal["streamable-http", "sse"] = "streamable-http",
+    ) -> StarletteWithLifespan:
+        """Create the HTTP app, closing the server when its lifespan ends."""
+        app = super().http_app(
+            path=path,
+            middleware=middleware,
+            json_response=json_response,
+            stateless_http=stateless_http,
+            transport=transport,
+        )
+        serve = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app: Starlette) -> AsyncGenerator[None, None]:
+            try:
+                async with serve(app):
+                    yield
+            finally:
+                await self.close()
+
+        app.router.lifespan_context = lifespan
+        return app
+
+    async def _metrics_endpoint(self, _request: Request) -> Response:
+        """Serve Prometheus metrics."""
+        return PlainTextResponse(self.render_metrics(), media_type=CONTENT_TYPE)
 
     def _load_default_config(self) -> None:
         """Load default model configuration from Fabric environment.
@@ -106,17 +212,59 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
 
         return vendor_name, model_name
 
-    def _execute_fabric_pattern(
+    @overload
+    async def _execute_fabric_pattern(
+        self,
+        pattern_name: str,
+        input_text: str,
+        config: PatternExecutionConfig | None,
+        stream: Literal[False] = False,
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def _execute_fabric_pattern(
+        self,
+        pattern_name: str,
+        input_text: str,
+        config: PatternExecutionConfig | None,
+        stream: Literal[True],
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+    ) -> AsyncGenerator[dict[str, Any], None]: ...
+
+    @overload
+    async def _execute_fabric_pattern(
+        self,
+        pattern_name: str,
+        input_text: str,
+        config: PatternExecutionConfig | None,
+        stream: bool,
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+    ) -> dict[str, Any] | AsyncGenerator[dict[str, Any], None]: ...
+
+    async def _execute_fabric_pattern(
         self,
         pattern_name: str,
         input_text: str,
         config: PatternExecutionConfig | None,
         stream: bool = False,
-    ) -> dict[Any, Any] | Generator[dict[str, Any], None, None]:
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+    ) -> dict[str, Any] | AsyncGenerator[dict[str, Any], None]:
         """
         Execute a Fabric pattern against the API.
 
-        Separated from the tool method to reduce complexity.
+        Separated from the tool method to reduce complexity. In streaming mode the
+        returned async generator opens the /chat request on first iteration and
+        yields each chunk as soon as it is decoded.
+
+        Deterministic (temperature 0) runs go through the result cache when it
+        is enabled: a hit is returned without calling Fabric, replayed chunk by
+        chunk in streaming mode. cache_bypass skips the cache entirely;
+        cache_refresh skips the lookup but stores the new result.
         """
         # AC5: Client-side validation
         if not pattern_name or not pattern_name.strip():
@@ -161,19 +309,99 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
             else 0.0,
         }
 
-        # AC1: Use FabricApiClient to call Fabric's /chat endpoint
-        api_client = FabricApiClient()
-        try:
-            # AC4: Handle Server-Sent Events (SSE) stream response
-            response = api_client.post("/chat", json_data=request_payload)
-            response.raise_for_status()  # Raise HTTPError for bad responses
+        deterministic = request_payload["temperature"] == 0
+        result_cache = self._get_result_cache()
+        cache_key = None
+        if deterministic and result_cache.enabled and not cache_bypass:
+            cache_key = stable_hash(request_payload)
+            cached = None if cache_refresh else await result_cache.get(cache_key)
+            if cached is not None:
+                return cached.replay() if stream else cached.as_output()
+
+        if stream:
+            # Return an async generator that yields chunks as Fabric emits them
+            chunks = self._stream_fabric_pattern(request_payload)
+            if cache_key is None:
+                return chunks
+            return self._cache_pattern_stream(chunks, cache_key)
+
+        if deterministic:
+            # Deterministic runs with an identical payload share one /chat call
+            result = await self._get_singleflight().do(
+                ("POST /chat", cache_key or stable_hash(request_payload)),
+                lambda: self._run_fabric_pattern(request_payload),
+            )
+            if cache_key is not None:
+                await result_cache.put(cache_key, CachedResult.from_output(result))
+            return dict(result)
+        return await self._run_fabric_pattern(request_payload)
+
+    async def _cache_pattern_stream(
+        self, chunks: AsyncGenerator[dict[str, Any], None], cache_key: str
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Pass chunks through, storing the result once the stream completes.
 
-            if stream:
-                # Return generator for streaming mode
-                return self._parse_sse_stream(response)
-            # Return accumulated result for non-streaming mode
-            return self._parse_sse_response(response)
+        Nothing is stored if the stream fails or is closed early.
+        """
+        contents: list[str] = []
+        output_format = "text"
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                if chunk["type"] == "content":
+                    contents.append(chunk["content"])
+                    output_format = chunk["format"]
+                yield chunk
+        await self._get_result_cache().put(
+            cache_key, CachedResult.from_chunks(output_format, contents)
+        )
+
+    async def _run_fabric_pattern(
+        self, request_payload: dict[str, Any]
+    ) -> dict[str, str]:
+        """Call Fabric's /chat endpoint and return the accumulated output."""
+        async with self._get_admission().slot():
+            timer = ChatTimer(request_payload["prompts"][0]["model"])
+            # AC1: Use the shared FabricApiClient to call Fabric's /chat endpoint
+            with self._translate_fabric_errors():
+                # AC4: Handle Server-Sent Events (SSE) stream response
+                async with self._open_chat_stream(request_payload) as response:
+                    result = await self._parse_sse_response(response, timer)
+            timer.finish()
+            return result
+
+    async def _stream_fabric_pattern(
+        self, request_payload: dict[str, Any]
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield SSE chunks from Fabric's /chat endpoint as they arrive.
+
+        The upstream response (and its admission slot) stays open while the
+        caller iterates and is released as soon as the generator finishes or
+        is closed.
+        """
+        async with self._get_admission().slot():
+            timer = ChatTimer(request_payload["prompts"][0]["model"])
+            with self._translate_fabric_errors():
+                async with (
+                    self._open_chat_stream(request_payload) as response,
+                    aclosing(self._parse_sse_stream(response)) as chunks,
+                ):
+                    async for chunk in chunks:
+                        if chunk["type"] == "content":
+                            timer.content(chunk["content"])
+                        yield chunk
+            timer.finish()
 
+    def _open_chat_stream(
+        self, request_payload: dict[str, Any]
+    ) -> AbstractAsyncContextManager[httpx.Response]:
+        """Open a streamed POST /chat request on the shared API client."""
+        return self._get_api_client().stream("POST", "/chat", json_data=request_payload)
+
+    @contextmanager
+    def _translate_fabric_errors(self) -> Generator[None, None, None]:
+        """Map transport and HTTP failures from /chat onto builtin exceptions."""
+        try:
+            yield
         except httpx.ConnectError as e:
             logger = logging.getLogger(__name__)
             logger.error("Failed to connect to Fabric API: %s", e)
@@ -190,10 +418,8 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
             logger = logging.getLogger(__name__)
             logger.error("Unexpected error calling Fabric API: %s", e)
             raise RuntimeError(f"Unexpected error executing pattern: {e}") from e
-        finally:
-            api_client.close()
 
-    def fabric_run_pattern(
+    async def fabric_run_pattern(
         self,
         pattern_name: str,
         input_text: str = "",
@@ -208,19 +434,24 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
         strategy_name: str | None = None,
         variables: dict[str, str] | None = None,
         attachments: list[str] | None = None,
-    ) -> dict[str, Any] | Generator[dict[str, Any], None, None]:
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
         """
         Execute a Fabric pattern with input text and return output.
 
         This tool calls the Fabric API's /chat endpoint to execute a named pattern
-        with the provided input text. Returns either complete output (non-streaming)
-        or a generator of chunks (streaming) based on the stream parameter.
+        with the provided input text. In streaming mode each content chunk is
+        forwarded to the MCP client as soon as Fabric produces it: as a progress
+        notification when the request carries a progress token, otherwise as an
+        info log notification. Both modes return the complete output.
 
         Args:
             pattern_name: The name of the fabric pattern to run (required).
             input_text: The input text to be processed by the pattern (optional).
-            stream: Whether to stream the output. If True, returns a generator of
-            chunks.
+            stream: Whether to stream the output. If True, chunks are sent to the
+            client as notifications while the pattern runs.
             config: Optional configuration for execution parameters.
             model_name: Optional model name override (e.g., "gpt-4", "claude-3-opus").
             vendor_name: Optional vendor name override (e.g., "openai", "anthropic").
@@ -231,15 +462,18 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
             strategy_name: Optional strategy name for pattern execution.
             variables: Optional map of key-value strings for pattern variables.
             attachments: Optional list of file paths/URLs to attach to the pattern.
+            cache_bypass: Neither read nor store this run in the result cache.
+            cache_refresh: Ignore any cached result but store the new one.
+            ctx: MCP request context, injected by FastMCP; used to send streamed
+            chunks to the client.
 
         Returns:
-            dict[Any, Any] | Generator: For non-streaming, returns dict with
-            'output_format' and 'output_text'.
-            For streaming, returns a generator yielding dict chunks
-            with 'type', 'format', and 'content'.
+            dict[Any, Any]: Contains 'output_format' and 'output_text'.
 
         Raises:
-            McpError: For any API errors, connection issues, or parsing problems.
+            McpError: For any API errors, connection issues, or parsing problems;
+            with code SERVER_BUSY when too many patterns are already running
+            and queued.
         """
 
         # Validate new parameters
@@ -269,10 +503,24 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
             attachments,
         )
 
-        try:
-            return self._execute_fabric_pattern(
-                pattern_name, input_text, merged_config, stream
+        with self._pattern_errors_as_mcp(pattern_name):
+            result = await self._execute_fabric_pattern(
+                pattern_name,
+                input_text,
+                merged_config,
+                stream,
+                cache_bypass=cache_bypass,
+                cache_refresh=cache_refresh,
             )
+            if isinstance(result, dict):
+                return result
+            return await self._relay_pattern_stream(result, ctx)
+
+    @contextmanager
+    def _pattern_errors_as_mcp(self, pattern_name: str) -> Generator[None, None, None]:
+        """Map pattern execution failures onto McpError for the MCP client."""
+        try:
+            yield
         except RuntimeError as e:
             error_message = str(e)
             # Check for pattern not found (500 with file not found message)
@@ -302,6 +550,12 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
                 INTERNAL_ERROR,
                 f"Error executing pattern '{pattern_name}': {e}",
             )
+        except AdmissionRejectedError as e:
+            raise_mcp_error(
+                e,
+                SERVER_BUSY,
+                f"Pattern '{pattern_name}' not run: {e}",
+            )
         except ValueError as e:
             raise_mcp_error(
                 e,
@@ -309,6 +563,526 @@ class FabricMCP(FastMCP[None], FabricToolsMixin, SSEParserMixin, ValidationMixin
                 f"Invalid parameter for pattern '{pattern_name}': {e}",
             )
 
+    async def fabric_run_pattern_batch(
+        self,
+        pattern_name: str,
+        inputs: list[str],
+        config: PatternExecutionConfig | None = None,
+        max_parallel: int | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run one Fabric pattern over many inputs concurrently.
+
+        Each input is sent to Fabric's /chat endpoint as its own run, with up to
+        max_parallel runs in flight at once. A failing input does not fail the
+        batch: its entry carries the error instead of the output. When the
+        request carries a progress token, a progress notification is sent as
+        each input completes.
+
+        Args:
+            pattern_name: The name of the fabric pattern to run (required).
+            inputs: Input texts, each processed by one pattern run (required).
+            config: Optional configuration shared by every run.
+            max_parallel: Optional number of runs in flight at once. Defaults to,
+            and is capped by, FABRIC_MCP_BATCH_PARALLELISM.
+            ctx: MCP request context, injected by FastMCP; used to report
+            progress.
+
+        Returns:
+            dict[str, Any]: 'results' lists one entry per input, in input order:
+            either 'output_format' and 'output_text', or 'error' with the MCP
+            error 'code' and 'message', plus its 'duration_seconds'.
+            'succeeded' and 'failed' count them.
+
+        Raises:
+            McpError: If the pattern name, inputs, config or max_parallel are
+            invalid; nothing is sent to Fabric then.
+        """
+        self._validate_string_parameter("pattern_name", pattern_name)
+        if not inputs:
+            raise_mcp_error(
+                ValueError(), INVALID_PARAMS, "inputs must be a non-empty list"
+            )
+        self._validate_execution_config(config)
+        parallelism = self._batch_parallelism(max_parallel)
+
+        results = await self._run_patterns_concurrently(
+            [(pattern_name, input_text, config) for input_text in inputs],
+            parallelism,
+            ctx,
+        )
+        failed = sum(1 for result in results if "error" in result)
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+        }
+
+    async def fabric_run_pattern_fanout(
+        self,
+        patterns: list[PatternRun],
+        input_text: str = "",
+        max_parallel: int | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run one input through several Fabric patterns concurrently.
+
+        Every pattern gets the same input text and may carry its own execution
+        configuration. The runs go to Fabric's /chat endpoint in parallel, so
+        the call takes about as long as the slowest pattern rather than the
+        sum of all of them. A failing pattern does not fail the others.
+
+        Args:
+            patterns: Pattern runs, each a 'pattern_name' with an optional
+            'config' (required, at least one, names must be unique).
+            input_text: The input text processed by every pattern (optional).
+            max_parallel: Optional number of runs in flight at once. Defaults to,
+            and is capped by, FABRIC_MCP_BATCH_PARALLELISM.
+            ctx: MCP request context, injected by FastMCP; used to report
+            progress.
+
+        Returns:
+            dict[str, Any]: 'results' maps each pattern name to either
+            'output_format' and 'output_text', or 'error' with the MCP error
+            'code' and 'message', plus its 'duration_seconds'. 'succeeded' and
+            'failed' count them; 'total_seconds' is the wall-clock time.
+
+        Raises:
+            McpError: If the patterns, their configs or max_parallel are
+            invalid; nothing is sent to Fabric then.
+        """
+        if not patterns:
+            raise_mcp_error(
+                ValueError(), INVALID_PARAMS, "patterns must be a non-empty list"
+            )
+        names = [run.pattern_name for run in patterns]
+        for run in patterns:
+            self._validate_string_parameter("pattern_name", run.pattern_name)
+            self._validate_execution_config(run.config)
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise_mcp_error(
+                ValueError(),
+                INVALID_PARAMS,
+                f"patterns must be unique; repeated: {', '.join(duplicates)}",
+            )
+        parallelism = self._batch_parallelism(max_parallel)
+
+        started = time.perf_counter()
+        results = await self._run_patterns_concurrently(
+            [(run.pattern_name, input_text, run.config) for run in patterns],
+            parallelism,
+            ctx,
+        )
+        failed = sum(1 for result in results if "error" in result)
+        return {
+            "results": dict(zip(names, results, strict=True)),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "total_seconds": time.perf_counter() - started,
+        }
+
+    async def fabric_run_pattern_mapreduce(
+        self,
+        pattern_name: str,
+        input_text: str,
+        reduce_pattern_name: str | None = None,
+        config: PatternExecutionConfig | None = None,
+        chunk_tokens: int | None = None,
+        overlap_tokens: int | None = None,
+        max_parallel: int | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a Fabric pattern over an input too large for one model call.
+
+        The input is split into overlapping chunks at paragraph or sentence
+        boundaries, sized by a token estimate for the configured model. The
+        pattern runs on the chunks concurrently (map), then the reduce pattern
+        runs over the joined partial outputs (reduce). If those are still too
+        large for one call, they are reduced in groups first. An input that
+        fits in one chunk is simply run once.
+
+        Args:
+            pattern_name: The fabric pattern to run on each chunk (required).
+            input_text: The (large) input text to process (required).
+            reduce_pattern_name: Optional pattern that combines the partial
+            outputs; defaults to pattern_name.
+            config: Optional configuration for every run; its model also sets
+            the chunk size.
+            chunk_tokens: Optional chunk size in estimated tokens. Defaults to
+            FABRIC_MCP_MAPREDUCE_CHUNK_TOKENS, at most half the model's
+            context window.
+            overlap_tokens: Optional tokens shared by consecutive chunks
+            (default 200, at most half a chunk). Must be less than
+            chunk_tokens when both are given.
+            max_parallel: Optional number of chunk runs in flight at once.
+            Defaults to, and is capped by, FABRIC_MCP_BATCH_PARALLELISM.
+            ctx: MCP request context, injected by FastMCP; used to report
+            progress of the map phase.
+
+        Returns:
+            dict[str, Any]: 'output_format' and 'output_text' of the final
+            reduce, the number of 'chunks', 'reduce_rounds', and
+            'map_seconds', 'reduce_seconds' and 'total_seconds'.
+
+        Raises:
+            McpError: If a parameter is invalid (checked before anything is
+            sent to Fabric), or any chunk or reduce run fails; the message
+            names the failing run.
+        """
+        self._validate_string_parameter("pattern_name", pattern_name)
+        self._validate_string_parameter("reduce_pattern_name", reduce_pattern_name)
+        self._validate_execution_config(config)
+        if chunk_tokens is not None and chunk_tokens < 1:
+            raise_mcp_error(
+                ValueError(), INVALID_PARAMS, "chunk_tokens must be at least 1"
+            )
+        if overlap_tokens is not None and overlap_tokens < 0:
+            raise_mcp_error(
+                ValueError(), INVALID_PARAMS, "overlap_tokens must not be negative"
+            )
+        if (
+            chunk_tokens is not None
+            and overlap_tokens is not None
+            and overlap_tokens >= chunk_tokens
+        ):
+            raise_mcp_error(
+                ValueError(),
+                INVALID_PARAMS,
+                "overlap_tokens must be less than chunk_tokens",
+            )
+        parallelism = self._batch_parallelism(max_parallel)
+        _, model = self.get_vendor_and_model(config or PatternExecutionConfig())
+        budget = chunk_tokens or min(
+            int(
+                get_env_float(
+                    MAPREDUCE_CHUNK_TOKENS_ENV, DEFAULT_MAPREDUCE_CHUNK_TOKENS
+                )
+            ),
+            model_profile(model).context_window // 2,
+        )
+        budget = max(budget, 1)
+        if overlap_tokens is None:
+            overlap_tokens = DEFAULT_MAPREDUCE_OVERLAP_TOKENS
+        overlap = min(overlap_tokens, budget // 2)
+
+        started = time.perf_counter()
+        chunks = split_text(input_text, budget, overlap, model)
+        if len(chunks) <= 1:
+            with self._pattern_errors_as_mcp(pattern_name):
+                result = await self._execute_fabric_pattern(
+                    pattern_name, input_text, config
+                )
+            elapsed = time.perf_counter() - started
+            return {
+                **result,
+                "chunks": 1,
+                "reduce_rounds": 0,
+                "map_seconds": elapsed,
+                "reduce_seconds": 0.0,
+                "total_seconds": elapsed,
+            }
+
+        partials = await self._run_phase(
+            "chunk", pattern_name, chunks, config, parallelism, ctx
+        )
+        map_done = time.perf_counter()
+
+        reduce_name = reduce_pattern_name or pattern_name
+        reduce_rounds = 1
+        combined = MAPREDUCE_SEPARATOR.join(partials)
+        groups = split_text(combined, budget, 0, model)
+        while len(groups) > 1:
+            # Too large for one reduce call: reduce groups of partials first,
+            # for as long as that keeps shrinking the text
+            partials = await self._run_phase(
+                f"reduce round {reduce_rounds}",
+                reduce_name,
+                groups,
+                config,
+                parallelism,
+                None,
+            )
+            reduce_rounds += 1
+            reduced = MAPREDUCE_SEPARATOR.join(partials)
+            if len(reduced) >= len(combined):
+                combined = reduced
+                break
+            combined = reduced
+            groups = split_text(combined, budget, 0, model)
+
+        try:
+            with self._pattern_errors_as_mcp(reduce_name):
+                result = await self._execute_fabric_pattern(
+                    reduce_name, combined, config
+                )
+        except McpError as e:
+            raise_mcp_error(
+                e, e.error.code, f"Map-reduce final reduce failed: {e.error.message}"
+            )
+        finished = time.perf_counter()
+        return {
+            **result,
+            "chunks": len(chunks),
+            "reduce_rounds": reduce_rounds,
+            "map_seconds": map_done - started,
+            "reduce_seconds": finished - map_done,
+            "total_seconds": finished - started,
+        }
+
+    async def _run_phase(
+        self,
+        phase: str,
+        pattern_name: str,
+        inputs: list[str],
+        config: PatternExecutionConfig | None,
+        parallelism: int,
+        ctx: Context | None,
+    ) -> list[str]:
+        """Run one map-reduce phase concurrently and return its outputs in order.
+
+        Raises:
+            McpError: If any run fails, naming the first failing input.
+        """
+        results = await self._run_patterns_concurrently(
+            [(pattern_name, text, config) for text in inputs], parallelism, ctx
+        )
+        for index, result in enumerate(results, start=1):
+            if "error" in result:
+                raise_mcp_error(
+                    RuntimeError(result["error"]["message"]),
+                    result["error"]["code"],
+                    f"Map-reduce {phase} {index}/{len(inputs)} ('{pattern_name}') "
+                    f"failed: {result['error']['message']}",
+                )
+        return [result["output_text"] for result in results]
+
+    def _batch_parallelism(self, max_parallel: int | None) -> int:
+        """Runs in flight for one multi-run tool call.
+
+        Raises:
+            McpError: If max_parallel is less than 1.
+        """
+        parallelism = int(
+            get_env_float(BATCH_PARALLELISM_ENV, DEFAULT_BATCH_PARALLELISM)
+        )
+        if max_parallel is not None:
+            if max_parallel < 1:
+                raise_mcp_error(
+                    ValueError(), INVALID_PARAMS, "max_parallel must be at least 1"
+                )
+            parallelism = min(parallelism, max_parallel)
+        return max(parallelism, 1)
+
+    async def _run_patterns_concurrently(
+        self,
+        runs: list[tuple[str, str, PatternExecutionConfig | None]],
+        parallelism: int,
+        ctx: Context | None,
+    ) -> list[dict[str, Any]]:
+        """Execute (pattern_name, input_text, config) runs, parallelism at a time.
+
+        Returns:
+            One entry per run, in order: the run's output, or 'error' with the
+            MCP error 'code' and 'message'; both with 'duration_seconds'.
+        """
+        limit = asyncio.Semaphore(parallelism)
+        completed = 0
+
+        async def run_one(
+            pattern_name: str, input_text: str, config: PatternExecutionConfig | None
+        ) -> dict[str, Any]:
+            nonlocal completed
+            async with limit:
+                started = time.perf_counter()
+                try:
+                    with self._pattern_errors_as_mcp(pattern_name):
+                        output = await self._execute_fabric_pattern(
+                            pattern_name, input_text, config
+                        )
+                    result: dict[str, Any] = dict(output)
+                except McpError as e:
+                    result = {
+                        "error": {"code": e.error.code, "message": e.error.message}
+                    }
+                result["duration_seconds"] = time.perf_counter() - started
+            completed += 1
+            if ctx is not None:
+                await self._notify_batch_progress(ctx, completed, len(runs))
+            return result
+
+        return list(await asyncio.gather(*(run_one(*run) for run in runs)))
+
+    async def _notify_batch_progress(
+        self, ctx: Context, completed: int, total: int
+    ) -> None:
+        """Report batch progress if the client supplied a progress token.
+
+        Like stream chunks, progress is tied to the tool call's request.
+        """
+        meta = ctx.request_context.meta  # pyright: ignore[reportUnknownMemberType]
+        if meta is not None and meta.progressToken is not None:
+            await _request_session(ctx).send_progress_notification(
+                progress_token=meta.progressToken,
+                progress=completed,
+                total=total,
+                related_request_id=ctx.request_id,
+            )
+
+    async def fabric_run_pipeline(
+        self,
+        stages: list[PatternRun],
+        input_text: str = "",
+        stream: bool = False,
+        include_intermediate: bool = False,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run several Fabric patterns in sequence, each on the previous output.
+
+        The input text goes to the first stage and every stage's output becomes
+        the next stage's input, all inside the server, so intermediate results
+        never travel back to the MCP client. Each stage may carry its own
+        execution configuration.
+
+        A pattern needs its complete input before it can start, so stages run
+        one after another. With stream set, the final stage's chunks are sent
+        to the client as they arrive, as for fabric_run_pattern.
+
+        Args:
+            stages: Ordered pattern runs, each a 'pattern_name' with an optional
+            'config' (required, at least one).
+            input_text: The input text for the first stage (optional).
+            stream: Whether to stream the final stage's output to the client.
+            include_intermediate: Whether to return every stage's output text,
+            not only the last one.
+            ctx: MCP request context, injected by FastMCP; used to send streamed
+            chunks to the client.
+
+        Returns:
+            dict[str, Any]: 'output_format' and 'output_text' of the final
+            stage, 'stages' with each stage's 'pattern_name',
+            'duration_seconds' and 'output_chars' (plus 'output_text' with
+            include_intermediate), and the pipeline's 'total_seconds'.
+
+        Raises:
+            McpError: If no stages are given or a stage is invalid (checked
+            before any stage runs), or a stage fails; the message names the
+            failing stage.
+        """
+        if not stages:
+            raise_mcp_error(
+                ValueError(), INVALID_PARAMS, "stages must be a non-empty list"
+            )
+        for stage in stages:
+            self._validate_string_parameter("pattern_name", stage.pattern_name)
+            self._validate_execution_config(stage.config)
+
+        started = time.perf_counter()
+        stage_reports: list[dict[str, Any]] = []
+        result: dict[str, str] = {"output_format": "text", "output_text": input_text}
+        for index, stage in enumerate(stages, start=1):
+            stage_started = time.perf_counter()
+            relay = stream and index == len(stages)
+            try:
+                with self._pattern_errors_as_mcp(stage.pattern_name):
+                    output = await self._execute_fabric_pattern(
+                        stage.pattern_name,
+                        result["output_text"],
+                        stage.config,
+                        stream=relay,
+                    )
+                    if isinstance(output, dict):
+                        result = output
+                    else:
+                        result = await self._relay_pattern_stream(output, ctx)
+            except McpError as e:
+                raise_mcp_error(
+                    e,
+                    e.error.code,
+                    f"Pipeline stage {index}/{len(stages)} "
+                    f"('{stage.pattern_name}') failed: {e.error.message}",
+                )
+            report: dict[str, Any] = {
+                "pattern_name": stage.pattern_name,
+                "duration_seconds": time.perf_counter() - stage_started,
+                "output_chars": len(result["output_text"]),
+            }
+            if include_intermediate:
+                report["output_text"] = result["output_text"]
+            stage_reports.append(report)
+
+        return {
+            **result,
+            "stages": stage_reports,
+            "total_seconds": time.perf_counter() - started,
+        }
+
+    async def _relay_pattern_stream(
+        self,
+        chunks: AsyncGenerator[dict[str, Any], None],
+        ctx: Context | None,
+    ) -> dict[str, str]:
+        """Forward streamed content chunks to the MCP client and aggregate them.
+
+        The chunk generator is closed on the spot if the caller is cancelled
+        or a notification fails, releasing its admission slot and upstream
+        response right away rather than when it is garbage collected.
+
+        Returns:
+            dict[str, str]: Contains 'output_format' and 'output_text' fields.
+        """
+        output_chunks: list[str] = []
+        output_format = "text"
+
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                if chunk["type"] != "content":
+                    continue
+                output_chunks.append(chunk["content"])
+                output_format = chunk["format"]
+                if ctx is not None and chunk["content"]:
+                    await self._notify_stream_chunk(
+                        ctx, len(output_chunks), chunk["content"]
+                    )
+
+        return {
+            "output_format": output_format,
+            "output_text": "".join(output_chunks),
+        }
+
+    async def _notify_stream_chunk(
+        self, ctx: Context, sequence: int, content: str
+    ) -> None:
+        """Send one streamed chunk to the client on the request that asked for it.
+
+        The chunk travels as the message of a progress notification (progress is
+        the chunk sequence number, total is unknown) when the client supplied a
+        progress token, and as an info log notification otherwise. Both carry
+        the tool call's request id: over streamable HTTP, that sends them on
+        the call's own response stream, ahead of its result, rather than on the
+        session's standalone GET stream.
+        """
+        session = _request_session(ctx)
+        meta = ctx.request_context.meta  # pyright: ignore[reportUnknownMemberType]
+        if meta is not None and meta.progressToken is not None:
+            await session.send_progress_notification(
+                progress_token=meta.progressToken,
+                progress=sequence,
+                message=content,
+                related_request_id=ctx.request_id,
+            )
+        else:
+            await session.send_log_message(
+                level="info",
+                data=content,
+                logger=STREAM_LOGGER_NAME,
+                related_request_id=ctx.request_id,
+            )
+
     def get_default_model_config(self) -> tuple[str | None, str | None]:
         """Get the current default model configuration.
 
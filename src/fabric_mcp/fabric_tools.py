@@ -1,31 +1,432 @@
 """Fabric MCP tool implementations and related functionality."""
 
+import asyncio
 import fnmatch
 import logging
-from typing import Any, cast
+import os
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar, cast
 
 import httpx
 from mcp.shared.exceptions import McpError
 from mcp.types import INTERNAL_ERROR, INVALID_PARAMS, ErrorData
 
-from fabric_mcp.utils import raise_mcp_error
+from fabric_mcp.utils import get_env_float, raise_mcp_error
 
+from .admission import AdmissionController, AdmissionStats
 from .api_client import FabricApiClient
+from .cache import ByteBoundedLRUCache, CacheStats, StaleWhileRevalidateCache
+from .catalog_snapshot import CatalogSnapshot
 from .constants import (
     API_KEY_PREFIXES,
+    BATCH_PARALLELISM_ENV,
+    CATALOG_SNAPSHOT_ENV,
+    CATALOG_SNAPSHOT_MAX_AGE_ENV,
+    DEFAULT_BATCH_PARALLELISM,
+    DEFAULT_CATALOG_SNAPSHOT_MAX_AGE,
+    DEFAULT_LOCAL_PATTERNS_POLL_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_PATTERNS,
+    DEFAULT_PATTERN_CACHE_BYTES,
+    DEFAULT_PATTERN_CACHE_TTL,
+    DEFAULT_PATTERN_LIST_TTL,
+    DEFAULT_PATTERN_NOT_FOUND_TTL,
+    DEFAULT_PATTERN_QUEUE_SIZE,
+    DEFAULT_PATTERN_QUEUE_TIMEOUT,
+    DEFAULT_RESULT_CACHE_BYTES,
+    DEFAULT_RESULT_CACHE_TTL,
+    LOCAL_PATTERNS_DIR_ENV,
+    LOCAL_PATTERNS_POLL_INTERVAL_ENV,
+    MAX_CONCURRENT_PATTERNS_ENV,
+    PATTERN_CACHE_BYTES_ENV,
+    PATTERN_CACHE_TTL_ENV,
+    PATTERN_LIST_TTL_ENV,
+    PATTERN_NOT_FOUND_TTL_ENV,
+    PATTERN_QUEUE_SIZE_ENV,
+    PATTERN_QUEUE_TIMEOUT_ENV,
+    RESULT_CACHE_BYTES_ENV,
+    RESULT_CACHE_DIR_ENV,
+    RESULT_CACHE_TTL_ENV,
     SENSITIVE_CONFIG_PATTERNS,
 )
+from .local_patterns import LocalPatternSource
+from .metrics import (
+    PATTERN_QUEUE_WAIT,
+    PROCESS_METRICS,
+    CallbackMetric,
+    Metric,
+    Sample,
+    render,
+)
 from .models import PatternExecutionConfig
+from .result_cache import ResultCache
+from .search_index import PatternSearchIndex
+from .singleflight import SingleFlight
 from .validation import ValidationMixin
 
 # Re-export FabricApiClient so tests can still patch fabric_mcp.core.FabricApiClient
 __all__ = ["FabricApiClient", "FabricToolsMixin"]
 
+T = TypeVar("T")
+
+
+def _pattern_details_size(details: dict[str, str]) -> int:
+    """Approximate memory footprint of cached pattern details, in bytes."""
+    return sum(len(k) + len(v.encode()) for k, v in details.items())
+
 
-class FabricToolsMixin(ValidationMixin):
+def _is_pattern_not_found(error: Exception) -> bool:
+    """Whether a pattern details lookup failed because the pattern is missing."""
+    return isinstance(error, McpError) and error.error.code == INVALID_PARAMS
+
+
+class FabricToolsMixin(ValidationMixin):  # pylint: disable=too-many-instance-attributes
     """Mixin class providing all Fabric MCP tool implementations."""
 
-    def _make_fabric_api_request(
+    # Shared, long-lived API client (created lazily, reused by every tool call)
+    _api_client: FabricApiClient | None = None
+
+    # Pattern name list cache (created lazily, see _get_pattern_list_cache)
+    _pattern_list_cache: StaleWhileRevalidateCache[str, list[str]] | None = None
+
+    # Coalesces identical concurrent Fabric API calls (created lazily)
+    _singleflight: SingleFlight[tuple[str, str], Any] | None = None
+
+    # Pattern details cache (created lazily, see _get_pattern_details_cache)
+    _pattern_details_cache: ByteBoundedLRUCache[str, dict[str, str]] | None = None
+
+    # Deterministic pattern run results (created lazily, see _get_result_cache)
+    _result_cache: ResultCache | None = None
+
+    # Catalog responses persisted across processes (see _get_catalog_snapshot)
+    _catalog_snapshot: CatalogSnapshot | None = None
+    _catalog_snapshot_loaded: bool = False
+
+    # Patterns read from Fabric's patterns directory (see _get_local_patterns)
+    _local_patterns: LocalPatternSource | None = None
+    _local_patterns_loaded: bool = False
+
+    # Full-text index over pattern details (created by the first search)
+    _pattern_index: PatternSearchIndex | None = None
+
+    # Bounds concurrent upstream /chat calls (created lazily, see _get_admission)
+    _admission: AdmissionController | None = None
+
+    def _get_api_client(self) -> FabricApiClient:
+        """Return the shared Fabric API client, creating it on first use.
+
+        Reusing one client keeps the underlying httpx connection pool (and its
+        keep-alive connections) alive across tool calls instead of paying a new
+        TCP/TLS handshake on every request.
+        """
+        if self._api_client is None:
+            self._api_client = FabricApiClient()
+        return self._api_client
+
+    async def _close_api_client(self) -> None:
+        """Close the shared Fabric API client, if one has been created."""
+        if self._api_client is not None:
+            api_client, self._api_client = self._api_client, None
+            await api_client.close()
+
+    def _get_singleflight(self) -> SingleFlight[tuple[str, str], Any]:
+        """Return the group that coalesces identical concurrent Fabric calls.
+
+        Keys are (method, endpoint) for GET requests and ("POST /chat",
+        payload hash) for deterministic pattern runs.
+        """
+        if self._singleflight is None:
+            self._singleflight = SingleFlight()
+        return self._singleflight
+
+    def _get_pattern_list_cache(self) -> StaleWhileRevalidateCache[str, list[str]]:
+        """Return the pattern list cache, creating it on first use.
+
+        The TTL comes from FABRIC_MCP_PATTERN_LIST_TTL; once it expires the cached
+        list is still returned while a background request refreshes it.
+        """
+        if self._pattern_list_cache is None:
+            ttl = get_env_float(PATTERN_LIST_TTL_ENV, DEFAULT_PATTERN_LIST_TTL)
+            self._pattern_list_cache = StaleWhileRevalidateCache(ttl)
+        return self._pattern_list_cache
+
+    def _get_pattern_details_cache(
+        self,
+    ) -> ByteBoundedLRUCache[str, dict[str, str]]:
+        """Return the pattern details cache, creating it on first use.
+
+        Entries are bounded by FABRIC_MCP_PATTERN_CACHE_BYTES in total and
+        expire after FABRIC_MCP_PATTERN_CACHE_TTL seconds; "pattern not found"
+        results are cached for FABRIC_MCP_PATTERN_NOT_FOUND_TTL seconds.
+        """
+        if self._pattern_details_cache is None:
+            self._pattern_details_cache = ByteBoundedLRUCache(
+                max_bytes=int(
+                    get_env_float(PATTERN_CACHE_BYTES_ENV, DEFAULT_PATTERN_CACHE_BYTES)
+                ),
+                ttl=get_env_float(PATTERN_CACHE_TTL_ENV, DEFAULT_PATTERN_CACHE_TTL),
+                sizeof=_pattern_details_size,
+                negative_ttl=get_env_float(
+                    PATTERN_NOT_FOUND_TTL_ENV, DEFAULT_PATTERN_NOT_FOUND_TTL
+                ),
+                cache_error=_is_pattern_not_found,
+            )
+        return self._pattern_details_cache
+
+    def _get_result_cache(self) -> ResultCache:
+        """Return the pattern run result cache, creating it on first use.
+
+        The cache is disabled unless FABRIC_MCP_RESULT_CACHE_BYTES (memory tier)
+        or FABRIC_MCP_RESULT_CACHE_DIR (disk tier) is set.
+        """
+        if self._result_cache is None:
+            directory = os.environ.get(RESULT_CACHE_DIR_ENV)
+            self._result_cache = ResultCache(
+                max_bytes=int(
+                    get_env_float(RESULT_CACHE_BYTES_ENV, DEFAULT_RESULT_CACHE_BYTES)
+                ),
+                ttl=get_env_float(RESULT_CACHE_TTL_ENV, DEFAULT_RESULT_CACHE_TTL),
+                directory=Path(directory).expanduser() if directory else None,
+            )
+        return self._result_cache
+
+    async def _get_catalog_snapshot(self) -> CatalogSnapshot | None:
+        """Return the catalog snapshot, loading it from disk on first use.
+
+        The snapshot is disabled (None) unless FABRIC_MCP_CATALOG_SNAPSHOT names
+        its file; FABRIC_MCP_CATALOG_SNAPSHOT_MAX_AGE limits the age of the
+        entries loaded. The file is read off the event loop.
+        """
+        if not self._catalog_snapshot_loaded:
+            self._catalog_snapshot_loaded = True
+            path = os.environ.get(CATALOG_SNAPSHOT_ENV)
+            if path:
+                self._catalog_snapshot = CatalogSnapshot(
+                    Path(path).expanduser(),
+                    max_age=get_env_float(
+                        CATALOG_SNAPSHOT_MAX_AGE_ENV, DEFAULT_CATALOG_SNAPSHOT_MAX_AGE
+                    ),
+                    discard_error=_is_pattern_not_found,
+                )
+        if self._catalog_snapshot is not None:
+            await self._catalog_snapshot.load()
+        return self._catalog_snapshot
+
+    def _get_local_patterns(self) -> LocalPatternSource | None:
+        """Return the local pattern source, or None to use the Fabric API.
+
+        Enabled by FABRIC_MCP_LOCAL_PATTERNS_DIR. The directory is watched for
+        changes when watchfiles is installed, and otherwise checked at most
+        every FABRIC_MCP_LOCAL_PATTERNS_POLL_INTERVAL seconds. If it is not a
+        readable directory on first use, an error is logged and the Fabric API
+        is used instead, rather than serving an empty catalog.
+        """
+        if not self._local_patterns_loaded:
+            self._local_patterns_loaded = True
+            directory = os.environ.get(LOCAL_PATTERNS_DIR_ENV)
+            if directory:
+                path = Path(directory).expanduser()
+                if path.is_dir() and os.access(path, os.R_OK | os.X_OK):
+                    self._local_patterns = LocalPatternSource(
+                        path,
+                        poll_interval=get_env_float(
+                            LOCAL_PATTERNS_POLL_INTERVAL_ENV,
+                            DEFAULT_LOCAL_PATTERNS_POLL_INTERVAL,
+                        ),
+                        on_change=self._index_pattern,
+                    )
+                else:
+                    logging.getLogger(__name__).error(
+                        "%s=%s is not a readable directory; "
+                        "reading patterns from the Fabric API instead",
+                        LOCAL_PATTERNS_DIR_ENV,
+                        directory,
+                    )
+        if self._local_patterns is not None:
+            self._local_patterns.start_watching()
+        return self._local_patterns
+
+    async def _get_catalog(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """Look up a catalog response, from the snapshot while it is unrevalidated.
+
+        Args:
+            key: The Fabric endpoint the response comes from.
+            load: Returns the response from the in-process caches or Fabric.
+        """
+        snapshot = await self._get_catalog_snapshot()
+        if snapshot is None:
+            return await load()
+        return await snapshot.get(key, load)
+
+    async def _save_catalog(self, key: str, value: Any) -> None:
+        """Write a catalog response fetched from Fabric to the snapshot."""
+        snapshot = await self._get_catalog_snapshot()
+        if snapshot is not None:
+            await snapshot.put(key, value)
+
+    async def wait_for_catalog_revalidation(self) -> None:
+        """Wait until catalog entries served from the snapshot are revalidated."""
+        if self._catalog_snapshot is not None:
+            await self._catalog_snapshot.wait_for_refreshes()
+
+    def _get_admission(self) -> AdmissionController:
+        """Return the admission controller for /chat calls, creating it on first use.
+
+        Limits come from FABRIC_MCP_MAX_CONCURRENT_PATTERNS,
+        FABRIC_MCP_PATTERN_QUEUE_SIZE and FABRIC_MCP_PATTERN_QUEUE_TIMEOUT.
+        """
+        if self._admission is None:
+            self._admission = AdmissionController(
+                max_concurrent=int(
+                    get_env_float(
+                        MAX_CONCURRENT_PATTERNS_ENV, DEFAULT_MAX_CONCURRENT_PATTERNS
+                    )
+                ),
+                max_queue=int(
+                    get_env_float(PATTERN_QUEUE_SIZE_ENV, DEFAULT_PATTERN_QUEUE_SIZE)
+                ),
+                queue_timeout=get_env_float(
+                    PATTERN_QUEUE_TIMEOUT_ENV, DEFAULT_PATTERN_QUEUE_TIMEOUT
+                ),
+                on_admit=PATTERN_QUEUE_WAIT.observe,
+            )
+        return self._admission
+
+    def invalidate_pattern_cache(self, pattern_name: str | None = None) -> None:
+        """Forget cached pattern data so the next lookup goes to Fabric.
+
+        Args:
+            pattern_name: Pattern whose cached details (or "not found" result)
+                to drop. When omitted, all pattern details and the pattern list
+                are dropped.
+        """
+        if self._pattern_details_cache is not None:
+            self._pattern_details_cache.invalidate(pattern_name)
+        if pattern_name is None and self._pattern_list_cache is not None:
+            self._pattern_list_cache.invalidate()
+        if self._catalog_snapshot is not None:
+            self._catalog_snapshot.forget(
+                None if pattern_name is None else f"/patterns/{pattern_name}"
+            )
+        if self._local_patterns is not None:
+            self._local_patterns.invalidate()
+        if self._pattern_index is not None:
+            # Indexed again from fresh details by the next search
+            if pattern_name is None:
+                self._pattern_index.clear()
+            else:
+                self._pattern_index.remove(pattern_name)
+
+    async def _close_caches(self) -> None:
+        """Cancel background refreshes and drop all cached API responses."""
+        if self._pattern_list_cache is not None:
+            await self._pattern_list_cache.close()
+        if self._pattern_details_cache is not None:
+            self._pattern_details_cache.invalidate()
+        if self._catalog_snapshot is not None:
+            await self._catalog_snapshot.close()
+        if self._local_patterns is not None:
+            await self._local_patterns.close()
+
+    def get_cache_stats(self) -> dict[str, CacheStats]:
+        """Return hit/miss counters for each response cache, keyed by tool."""
+        return {
+            "fabric_list_patterns": self._get_pattern_list_cache().stats,
+            "fabric_get_pattern_details": self._get_pattern_details_cache().stats,
+            "fabric_run_pattern": self._get_result_cache().stats,
+        }
+
+    def get_admission_stats(self) -> AdmissionStats:
+        """Return queue depth, wait time and rejection counters for /chat calls."""
+        return self._get_admission().stats
+
+    def render_metrics(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Latency histograms are recorded as requests happen; cache, admission and
+        connection pool figures are read from their live counters right here.
+        """
+        return render((*PROCESS_METRICS, *self._state_metrics()))
+
+    def _state_metrics(self) -> tuple[Metric, ...]:
+        """Scrape-time views of the caches, admission queue and connection pool."""
+        admission = self.get_admission_stats()
+        cache_stats = self.get_cache_stats()
+
+        def pool_connections() -> list[Sample]:
+            if self._api_client is None:
+                return []
+            active, idle = self._api_client.pool_usage()
+            return [(("active",), active), (("idle",), idle)]
+
+        def pool_max() -> list[Sample]:
+            if self._api_client is None:
+                return []
+            return [((), self._api_client.max_connections)]
+
+        def cache_lookups() -> list[Sample]:
+            return [
+                ((cache, result), count)
+                for cache, stats in cache_stats.items()
+                for result, count in (
+                    ("hit", stats.hits),
+                    ("stale_hit", stats.stale_hits),
+                    ("negative_hit", stats.negative_hits),
+                    ("miss", stats.misses),
+                )
+            ]
+
+        return (
+            CallbackMetric(
+                "fabric_mcp_pattern_runs_in_flight",
+                "Pattern runs holding an admission slot.",
+                (),
+                lambda: [((), admission.in_flight)],
+            ),
+            CallbackMetric(
+                "fabric_mcp_pattern_queue_depth",
+                "Pattern runs waiting for an admission slot.",
+                (),
+                lambda: [((), admission.queue_depth)],
+            ),
+            CallbackMetric(
+                "fabric_mcp_pattern_rejections_total",
+                "Pattern runs turned away by admission control.",
+                ("reason",),
+                lambda: [
+                    (("queue_full",), admission.rejected_queue_full),
+                    (("queue_timeout",), admission.rejected_queue_timeout),
+                ],
+                kind="counter",
+            ),
+            CallbackMetric(
+                "fabric_mcp_upstream_pool_connections",
+                "Connections to Fabric in the shared pool.",
+                ("state",),
+                pool_connections,
+            ),
+            CallbackMetric(
+                "fabric_mcp_upstream_pool_max_connections",
+                "Size limit of the shared Fabric connection pool.",
+                (),
+                pool_max,
+            ),
+            CallbackMetric(
+                "fabric_mcp_cache_hit_ratio",
+                "Fraction of lookups served from each response cache.",
+                ("cache",),
+                lambda: [((name,), st.hit_ratio) for name, st in cache_stats.items()],
+            ),
+            CallbackMetric(
+                "fabric_mcp_cache_lookups_total",
+                "Response cache lookups by result.",
+                ("cache", "result"),
+                cache_lookups,
+                kind="counter",
+            ),
+        )
+
+    async def _make_fabric_api_request(
         self,
         endpoint: str,
         pattern_name: str | None = None,
@@ -45,12 +446,10 @@ class FabricToolsMixin(ValidationMixin):
             McpError: For any API errors, connection issues, or parsing problems
         """
         try:
-            api_client = FabricApiClient()
-            try:
-                response = api_client.get(endpoint)
-                return response.json()
-            finally:
-                api_client.close()
+            # Concurrent requests for the same endpoint share one upstream GET
+            return await self._get_singleflight().do(
+                ("GET", endpoint), lambda: self._get_json(endpoint)
+            )
         except httpx.RequestError as e:
             raise_mcp_error(
                 e,
@@ -89,9 +488,28 @@ class FabricToolsMixin(ValidationMixin):
                 )
             ) from e
 
-    def fabric_list_patterns(self) -> list[str]:
+    async def _get_json(self, endpoint: str) -> Any:
+        """GET an endpoint from the Fabric API and decode its JSON body."""
+        response = await self._get_api_client().get(endpoint)
+        return response.json()
+
+    async def fabric_list_patterns(self) -> list[str]:
         """Return a list of available fabric patterns."""
-        response_data = self._make_fabric_api_request(
+        local = self._get_local_patterns()
+        if local is not None:
+            return await local.names()
+        patterns = await self._get_catalog(
+            "/patterns/names",
+            lambda: self._get_pattern_list_cache().get(
+                "/patterns/names", self._fetch_pattern_names
+            ),
+        )
+        # Copy so callers cannot mutate the cached list
+        return list(patterns)
+
+    async def _fetch_pattern_names(self) -> list[str]:
+        """Fetch and validate the pattern name list from the Fabric API."""
+        response_data = await self._make_fabric_api_request(
             "/patterns/names", operation="retrieving patterns"
         )
 
@@ -118,16 +536,139 @@ class FabricToolsMixin(ValidationMixin):
 
         patterns = cast(list[str], response_data)
 
+        if self._pattern_index is not None:
+            # Patterns gone upstream leave search results with this refresh
+            self._pattern_index.retain(patterns)
+        await self._save_catalog("/patterns/names", patterns)
         return patterns
 
-    def fabric_get_pattern_details(self, pattern_name: str) -> dict[str, str]:
+    async def fabric_get_pattern_details(self, pattern_name: str) -> dict[str, str]:
         """Retrieve detailed information for a specific Fabric pattern."""
-        # Use helper method for API request with pattern-specific error handling
-        response_data = self._make_fabric_api_request(
+        local = self._get_local_patterns()
+        if local is not None:
+            details = await local.details(pattern_name)
+            if details is None:
+                raise_mcp_error(
+                    FileNotFoundError(pattern_name),
+                    INVALID_PARAMS,
+                    f"Pattern '{pattern_name}' not found in {local.directory}",
+                )
+            self._index_pattern(pattern_name, details)
+            return details
+        details = await self._get_catalog(
             f"/patterns/{pattern_name}",
-            pattern_name=pattern_name,
-            operation="retrieving pattern details",
+            lambda: self._get_pattern_details_cache().get(
+                pattern_name, lambda: self._fetch_pattern_details(pattern_name)
+            ),
         )
+        self._index_pattern(pattern_name, details)
+        # Copy so callers cannot mutate the cached details
+        return dict(details)
+
+    async def fabric_search_patterns(
+        self, query: str, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Search Fabric patterns by keywords, best matches first.
+
+        Ranks patterns by how well their name, description and system prompt
+        match the query (BM25), so the right pattern can be found without
+        fetching the details of every pattern.
+
+        Args:
+            query: Keywords describing the task, e.g. "summarize a paper".
+            limit: Maximum number of results to return (default 10).
+
+        Returns:
+            list[dict[str, Any]]: The 'name', 'description' and relevance
+            'score' of each matching pattern, best match first.
+
+        Raises:
+            McpError: If the query is empty, limit is less than 1, or the
+            pattern list cannot be retrieved.
+        """
+        self._validate_string_parameter("query", query)
+        if limit < 1:
+            raise_mcp_error(ValueError(), INVALID_PARAMS, "limit must be at least 1")
+        index = await self._sync_pattern_index()
+        return [
+            {
+                "name": hit.name,
+                "description": hit.description,
+                "score": round(hit.score, 4),
+            }
+            for hit in index.search(query, limit)
+        ]
+
+    def _index_pattern(self, pattern_name: str, details: dict[str, str] | None) -> None:
+        """Bring the search index in line with a pattern's latest details.
+
+        Called with every details lookup and fetch from Fabric (so snapshot
+        revalidations reach the index too), and by the local pattern source
+        when a pattern changes (None: removed). Does nothing before a search.
+        """
+        if self._pattern_index is None:
+            return
+        if details is None:
+            self._pattern_index.remove(pattern_name)
+        else:
+            self._pattern_index.update(pattern_name, details)
+
+    async def _sync_pattern_index(self) -> PatternSearchIndex:
+        """Return the search index, updated for patterns added or removed.
+
+        The first call indexes every pattern, fetching details up to
+        FABRIC_MCP_BATCH_PARALLELISM at a time; later calls only compare
+        names and look up the details of new patterns and of patterns whose
+        cached details expired, which fetches them again from Fabric. Each
+        fetch updates the index through _index_pattern.
+        """
+        if self._pattern_index is None:
+            self._pattern_index = PatternSearchIndex()
+        index = self._pattern_index
+        names = await self.fabric_list_patterns()
+        index.retain(names)
+        missing = [name for name in names if name not in index]
+        details_cache = self._get_pattern_details_cache()
+        if self._get_local_patterns() is None and details_cache.enabled:
+            missing += [
+                name for name in names if name in index and name not in details_cache
+            ]
+        if missing:
+            limit = asyncio.Semaphore(
+                max(
+                    int(
+                        get_env_float(BATCH_PARALLELISM_ENV, DEFAULT_BATCH_PARALLELISM)
+                    ),
+                    1,
+                )
+            )
+
+            async def index_one(name: str) -> None:
+                async with limit:
+                    try:
+                        await self.fabric_get_pattern_details(name)
+                    except McpError as e:
+                        # Left out of results, and tried again by the next search
+                        logging.getLogger(__name__).warning(
+                            "Cannot index pattern '%s': %s", name, e
+                        )
+
+            await asyncio.gather(*(index_one(name) for name in missing))
+        return index
+
+    async def _fetch_pattern_details(self, pattern_name: str) -> dict[str, str]:
+        """Fetch and validate one pattern's details from the Fabric API."""
+        # Use helper method for API request with pattern-specific error handling
+        try:
+            response_data = await self._make_fabric_api_request(
+                f"/patterns/{pattern_name}",
+                pattern_name=pattern_name,
+                operation="retrieving pattern details",
+            )
+        except McpError as e:
+            if _is_pattern_not_found(e):
+                self._index_pattern(pattern_name, None)
+            raise
 
         # Validate response data type
         if not isinstance(response_data, dict):
@@ -155,11 +696,17 @@ class FabricToolsMixin(ValidationMixin):
             "system_prompt": response_data["Pattern"],
         }
 
+        self._index_pattern(pattern_name, details)
+        await self._save_catalog(f"/patterns/{pattern_name}", details)
         return details
 
-    def fabric_list_models(self) -> dict[Any, Any]:
+    async def fabric_list_models(self) -> dict[Any, Any]:
         """Retrieve configured Fabric models by vendor."""
-        response_data = self._make_fabric_api_request(
+        return await self._get_catalog("/models/names", self._fetch_models)
+
+    async def _fetch_models(self) -> dict[Any, Any]:
+        """Fetch and validate the models by vendor from the Fabric API."""
+        response_data = await self._make_fabric_api_request(
             "/models/names", operation="retrieving models"
         )
 
@@ -229,15 +776,21 @@ class FabricToolsMixin(ValidationMixin):
                     )
 
         # Return validated structure
-        return {
+        result = {
             "models": cast(list[str], models),
             "vendors": cast(dict[str, list[str]], vendors),
         }
+        await self._save_catalog("/models/names", result)
+        return result
 
-    def fabric_list_strategies(self) -> dict[Any, Any]:
+    async def fabric_list_strategies(self) -> dict[Any, Any]:
         """Retrieve available Fabric strategies."""
+        return await self._get_catalog("/strategies", self._fetch_strategies)
+
+    async def _fetch_strategies(self) -> dict[Any, Any]:
+        """Fetch and validate the strategies from the Fabric API."""
         # Use helper method for API request
-        response_data = self._make_fabric_api_request(
+        response_data = await self._make_fabric_api_request(
             "/strategies", operation="retrieving strategies"
         )
 
@@ -290,9 +843,11 @@ class FabricToolsMixin(ValidationMixin):
                     cast(Any, item),
                 )
 
-        return {"strategies": validated_strategies}
+        result = {"strategies": validated_strategies}
+        await self._save_catalog("/strategies", result)
+        return result
 
-    def fabric_get_configuration(self) -> dict[Any, Any]:
+    async def fabric_get_configuration(self) -> dict[Any, Any]:
         """Retrieve Fabric configuration with sensitive values redacted.
 
         Returns:
@@ -306,7 +861,7 @@ class FabricToolsMixin(ValidationMixin):
             McpError: For any API errors, connection issues, or invalid responses.
         """
         # Get configuration from Fabric API
-        response_data = self._make_fabric_api_request(
+        response_data = await self._make_fabric_api_request(
             "/config", operation="retrieving configuration"
         )
 
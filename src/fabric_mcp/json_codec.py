@@ -0,0 +1,104 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+orjson or msgspec is used when installed (``pip install fabric-mcp[fast-json]``
+pulls in orjson); otherwise the standard library ``json`` module. Set
+``FABRIC_MCP_JSON_BACKEND`` to ``orjson``, ``msgspec`` or ``json`` to force a
+backend, or leave it unset (``auto``) to pick the fastest one available.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import JSON_BACKEND_ENV
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A JSON backend: decode from str/bytes, encode to UTF-8 bytes."""
+
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any], bytes]
+    decode_error: type[Exception]
+
+
+def _stdlib_codec() -> JsonCodec:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    return JsonCodec("json", json.loads, _dumps, json.JSONDecodeError)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    # pylint cannot introspect the orjson extension module
+    # pylint: disable-next=no-member
+    return JsonCodec("orjson", orjson.loads, orjson.dumps, orjson.JSONDecodeError)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return JsonCodec("msgspec", decoder.decode, encoder.encode, msgspec.DecodeError)
+
+
+_BACKENDS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Return the named JSON codec.
+
+    Args:
+        name: ``orjson``, ``msgspec``, ``json``, or ``auto`` for the first of
+            those that can be imported.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If a specific backend was requested but is not installed.
+    """
+    name = name.strip().lower()
+    if name == "auto":
+        for factory in _BACKENDS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend '{name}'. Expected one of: "
+            f"auto, {', '.join(_BACKENDS)}"
+        )
+    return _BACKENDS[name]()
+
+
+def _select_codec() -> JsonCodec:
+    """Pick the process-wide codec from FABRIC_MCP_JSON_BACKEND."""
+    requested = os.environ.get(JSON_BACKEND_ENV, "auto")
+    try:
+        return get_codec(requested)
+    except (ImportError, ValueError) as e:
+        logging.getLogger(__name__).warning(
+            "Cannot use JSON backend %r (%s); falling back to stdlib json.",
+            requested,
+            e,
+        )
+        return _stdlib_codec()
+
+
+codec = _select_codec()
+
+# Module-level aliases for the hot paths
+loads = codec.loads
+dumps = codec.dumps
+JSONDecodeError = codec.decode_error
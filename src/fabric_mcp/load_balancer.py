@@ -0,0 +1,287 @@
+"""Client-side load balancing of Fabric API requests across several backends."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass
+
+import httpx
+
+# Scheduling strategies accepted by LoadBalancingTransport
+LEAST_OUTSTANDING = "least_outstanding"
+POWER_OF_TWO_CHOICES = "p2c"
+STRATEGIES = (LEAST_OUTSTANDING, POWER_OF_TWO_CHOICES)
+
+# Upstream statuses that count as a backend failure for passive health checks
+_FAILURE_STATUSES = frozenset({502, 503, 504})
+
+_HEALTH_CHECK_TIMEOUT = httpx.Timeout(5.0)
+
+
+@dataclass
+class Backend:
+    """A Fabric server and the load balancer's view of its state."""
+
+    url: httpx.URL
+    outstanding: int = 0  # requests sent whose response is not yet closed
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+
+    def is_available(self, now: float) -> bool:
+        """Whether the backend may receive traffic (i.e. is not ejected)."""
+        return now >= self.ejected_until
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body wrapper that reports when the response is closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+
+class LoadBalancingTransport(httpx.AsyncBaseTransport):  # pylint: disable=too-many-instance-attributes
+    """httpx transport that spreads requests over several Fabric servers.
+
+    Requests are built against the first backend's URL (the client's base URL)
+    and rewritten to the backend chosen for them:
+
+    - ``least_outstanding`` picks the backend with the fewest requests in
+      flight, where a streamed response counts until it is closed.
+    - ``p2c`` (power of two choices) compares two random backends and picks
+      the less loaded one.
+
+    Passive health checks eject a backend for ``ejection_time`` seconds after
+    ``failure_threshold`` consecutive connection errors or 502/503/504
+    responses. Active health checks probe every backend each
+    ``health_check_interval`` seconds and readmit ejected backends that
+    answer. If every backend is ejected, requests are spread over all of them
+    rather than failing outright.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        base_urls: list[str],
+        transport: httpx.AsyncBaseTransport,
+        *,
+        strategy: str = LEAST_OUTSTANDING,
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+        health_check_interval: float = 10.0,
+        health_check_path: str = "/",
+        health_check_headers: Mapping[str, str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            base_urls: Backend base URLs; the first is the client's base URL.
+            transport: Transport that sends the rewritten requests.
+            strategy: ``least_outstanding`` or ``p2c``.
+            failure_threshold: Consecutive failures before a backend is ejected.
+            ejection_time: Seconds an ejected backend receives no traffic.
+            health_check_interval: Seconds between active health checks;
+                ``0`` disables them.
+            health_check_path: Path probed by active health checks.
+            health_check_headers: Headers sent with health check probes.
+            clock: Monotonic time source, injectable for tests.
+            rng: Random source for tie-breaking and ``p2c``.
+
+        Raises:
+            ValueError: If no backends are given or the strategy is unknown.
+        """
+        if not base_urls:
+            raise ValueError("At least one backend URL is required")
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown load balancing strategy '{strategy}'. "
+                f"Expected one of: {', '.join(STRATEGIES)}"
+            )
+        self.backends = [Backend(httpx.URL(url)) for url in base_urls]
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self.health_check_interval = health_check_interval
+        self.health_check_path = health_check_path
+        self._health_check_headers = dict(health_check_headers or {})
+        self._transport = transport
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._health_task: asyncio.Task[None] | None = None
+        self._logger = logging.getLogger(__name__)
+
+    def choose(self) -> Backend:
+        """Pick the backend for the next request."""
+        now = self._clock()
+        candidates = [b for b in self.backends if b.is_available(now)]
+        if not candidates:
+            candidates = self.backends  # fail open rather than refuse traffic
+        if self.strategy == POWER_OF_TWO_CHOICES and len(candidates) > 2:
+            candidates = self._rng.sample(candidates, 2)
+        fewest = min(b.outstanding for b in candidates)
+        return self._rng.choice([b for b in candidates if b.outstanding == fewest])
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request to the chosen backend and track its outcome."""
+        self._ensure_health_checks()
+        backend = self.choose()
+        routed = self._route(request, backend)
+
+        backend.outstanding += 1
+        backend.requests += 1
+        try:
+            response = await self._transport.handle_async_request(routed)
+        except httpx.TransportError:
+            backend.outstanding -= 1
+            self._record_failure(backend)
+            raise
+        except BaseException:
+            # Cancelled (or failed in the transport itself): the backend is not
+            # at fault, but the request no longer occupies it
+            backend.outstanding -= 1
+            raise
+
+        if response.status_code in _FAILURE_STATUSES:
+            self._record_failure(backend)
+        else:
+            backend.consecutive_failures = 0
+
+        if not isinstance(response.stream, httpx.AsyncByteStream):
+            backend.outstanding -= 1
+            raise TypeError("The wrapped transport returned a synchronous stream")
+        if response.is_error:
+            # The retry layer drops responses it retries without closing them,
+            # so read error bodies (small) now and release the backend at once
+            try:
+                body = b"".join([chunk async for chunk in response.stream])
+            finally:
+                await response.stream.aclose()
+                backend.outstanding -= 1
+            stream: httpx.AsyncByteStream = httpx.ByteStream(body)
+        else:
+
+            def release() -> None:
+                backend.outstanding -= 1
+
+            stream = _TrackedStream(response.stream, release)
+
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=stream,
+            request=routed,
+            extensions=response.extensions,
+        )
+
+    async def check_health(self) -> None:
+        """Probe every backend once, ejecting or readmitting it accordingly."""
+        await asyncio.gather(*(self._probe(b) for b in self.backends))
+
+    async def aclose(self) -> None:
+        """Stop active health checks and close the underlying transport."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
+        await self._transport.aclose()
+
+    def _route(self, request: httpx.Request, backend: Backend) -> httpx.Request:
+        """Rebuild a request made against the first backend for another one."""
+        primary = self.backends[0].url
+        path = request.url.path
+        if path.startswith(primary.path.rstrip("/")):
+            path = path[len(primary.path.rstrip("/")) :]
+        url = backend.url.copy_with(
+            path=backend.url.path.rstrip("/") + path, query=request.url.query
+        )
+        headers = request.headers.copy()
+        headers["Host"] = url.netloc.decode("ascii")
+        return httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            stream=request.stream,
+            extensions=request.extensions,
+        )
+
+    def _record_failure(self, backend: Backend) -> None:
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        if backend.consecutive_failures >= self.failure_threshold:
+            if backend.is_available(self._clock()):
+                self._logger.warning(
+                    "Ejecting Fabric backend %s for %.0fs after %d failures",
+                    backend.url,
+                    self.ejection_time,
+                    backend.consecutive_failures,
+                )
+            backend.ejected_until = self._clock() + self.ejection_time
+
+    def _ensure_health_checks(self) -> None:
+        if (
+            self._health_task is None
+            and self.health_check_interval > 0
+            and len(self.backends) > 1
+        ):
+            self._health_task = asyncio.create_task(self._run_health_checks())
+            self._health_task.add_done_callback(self._health_checks_done)
+
+    def _health_checks_done(self, task: asyncio.Task[None]) -> None:
+        if task.cancelled():
+            return
+        if (error := task.exception()) is not None:
+            self._logger.error("Fabric backend health checks stopped", exc_info=error)
+        if self._health_task is task:
+            self._health_task = None  # Started again by the next request
+
+    async def _run_health_checks(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.check_health()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # A failed round must not end the checks; the next one may pass
+                self._logger.exception("Fabric backend health check failed")
+
+    async def _probe(self, backend: Backend) -> None:
+        url = backend.url.copy_with(
+            path=backend.url.path.rstrip("/") + self.health_check_path
+        )
+        headers = {**self._health_check_headers, "Host": url.netloc.decode("ascii")}
+        request = httpx.Request(
+            "GET",
+            url,
+            headers=headers,
+            extensions={"timeout": _HEALTH_CHECK_TIMEOUT.as_dict()},
+        )
+        try:
+            response = await self._transport.handle_async_request(request)
+            await response.aclose()
+        except httpx.TransportError:
+            self._record_failure(backend)
+            return
+        if response.status_code >= 500:
+            self._record_failure(backend)
+            return
+        if not backend.is_available(self._clock()):
+            self._logger.info("Fabric backend %s is healthy again", backend.url)
+        backend.consecutive_failures = 0
+        backend.ejected_until = 0.0
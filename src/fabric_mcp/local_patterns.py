@@ -0,0 +1,234 @@
+"""Fabric patterns read straight from Fabric's patterns directory.
+
+When fabric-mcp runs on the same host as Fabric, pattern names and details
+can come from ``~/.config/fabric/patterns/<name>/system.md`` instead of the
+Fabric REST API. The directory is indexed once; after that only patterns
+that changed are read again. Changes are picked up by a file watcher when
+``watchfiles`` is installed (``pip install fabric-mcp[watch]``, inotify on
+Linux), and otherwise by comparing file modification times at most every
+``poll_interval`` seconds. Directory scans and file reads run in a worker
+thread, off the event loop.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+PATTERN_FILE = "system.md"
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexedPattern:
+    mtime_ns: int
+    size: int
+    details: dict[str, str]
+
+
+def pattern_description(system_prompt: str) -> str:
+    """The first paragraph of a pattern that is not a heading, on one line."""
+    for paragraph in re.split(r"\n\s*\n", system_prompt):
+        text = " ".join(paragraph.split())
+        if text and not text.startswith("#"):
+            return text
+    return ""
+
+
+class LocalPatternSource:  # pylint: disable=too-many-instance-attributes
+    """Index of the patterns in a Fabric patterns directory.
+
+    Details have the same shape as fabric_get_pattern_details returns:
+    ``name``, ``description`` (the first paragraph of the pattern) and
+    ``system_prompt``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        poll_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Callable[[str, dict[str, str] | None], None] = lambda _n, _d: None,
+    ):
+        """
+        Args:
+            directory: The patterns directory, one subdirectory per pattern.
+            poll_interval: Seconds between modification time checks while no
+                file watcher runs; ``0`` checks on every lookup.
+            clock: Monotonic time source, injectable for tests.
+            on_change: Called with a pattern's name and new details whenever
+                a pattern is read again, and with None when it is removed.
+        """
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._on_change = on_change
+        self._patterns: dict[str, _IndexedPattern] = {}
+        self._scanned_at: float | None = None
+        # Serializes scans and reloads, so the index has a single writer
+        self._lock = asyncio.Lock()
+        self._unreadable = False
+        self._watch_task: asyncio.Task[None] | None = None
+        self._watch_stop: asyncio.Event | None = None
+        self._watchfiles_missing = False
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def watching(self) -> bool:
+        """Whether a file watcher keeps the index up to date."""
+        return self._watch_task is not None and not self._watch_task.done()
+
+    async def names(self) -> list[str]:
+        """Return the pattern names, sorted."""
+        await self._refresh_if_due()
+        return sorted(self._patterns)
+
+    async def details(self, name: str) -> dict[str, str] | None:
+        """Return a copy of one pattern's details, or None if there is none."""
+        await self._refresh_if_due()
+        indexed = self._patterns.get(name)
+        return None if indexed is None else dict(indexed.details)
+
+    def invalidate(self) -> None:
+        """Check every pattern for changes on the next lookup."""
+        self._scanned_at = None
+
+    def start_watching(self) -> None:
+        """Watch the directory for changes, if watchfiles is installed.
+
+        Must be called from a running event loop. Does nothing when a watcher
+        already runs.
+        """
+        if self.watching or self._watchfiles_missing:
+            return
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from watchfiles import awatch
+        except ImportError:
+            self._watchfiles_missing = True
+            return
+        if not self.directory.is_dir():
+            return
+
+        self._watch_stop = asyncio.Event()
+        changes = awatch(
+            self.directory, stop_event=self._watch_stop, debounce=200, step=50
+        )
+
+        async def watch() -> None:
+            try:
+                await self._refresh_if_due()
+                async for batch in changes:
+                    names = {self._pattern_name(path) for _, path in batch}
+                    async with self._lock:
+                        # Even if size and mtime look the same, something changed
+                        await self._reload(names, force=True)
+            except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                # Polling takes over again from the next lookup
+                self._logger.warning("Watching %s failed: %s", self.directory, e)
+                self.invalidate()
+
+        self._watch_task = asyncio.create_task(watch())
+
+    async def close(self) -> None:
+        """Stop the file watcher, if one runs."""
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            if self._watch_stop is not None:
+                self._watch_stop.set()
+            try:
+                await asyncio.wait_for(task, timeout=1)
+            except TimeoutError:
+                pass  # wait_for cancelled the watcher
+
+    def _pattern_name(self, path: str) -> str:
+        """The pattern a changed path belongs to ("" outside any pattern)."""
+        try:
+            relative = Path(path).relative_to(self.directory)
+        except ValueError:
+            self.invalidate()  # Unexpected path: check everything instead
+            return ""
+        return relative.parts[0] if relative.parts else ""
+
+    async def _refresh_if_due(self) -> None:
+        async with self._lock:
+            if self.watching and self._scanned_at is not None:
+                return
+            now = self._clock()
+            if self._scanned_at is None or now - self._scanned_at >= self.poll_interval:
+                await self._scan()
+                self._scanned_at = now
+
+    async def _scan(self) -> None:
+        """Read new and modified patterns and drop removed ones."""
+        try:
+            entries = await asyncio.to_thread(self._list_directory)
+        except OSError as e:
+            # Reported once until the directory can be read again
+            if not self._unreadable:
+                self._logger.warning("Cannot read patterns directory: %s", e)
+            self._unreadable = True
+            entries = set[str]()
+        else:
+            self._unreadable = False
+        await self._reload(entries | set(self._patterns))
+
+    def _list_directory(self) -> set[str]:
+        with os.scandir(self.directory) as entries:
+            return {e.name for e in entries if e.is_dir()}
+
+    async def _reload(self, names: set[str], force: bool = False) -> None:
+        """Bring the given patterns up to date with the files on disk.
+
+        Patterns whose file size and modification time are unchanged are not
+        read again, unless force is set. Must be called with the lock held.
+        """
+        changes = await asyncio.to_thread(self._read_patterns, names, force)
+        for name, indexed in changes.items():
+            if indexed is None:
+                if self._patterns.pop(name, None) is not None:
+                    self._on_change(name, None)
+            else:
+                self._patterns[name] = indexed
+                self._on_change(name, dict(indexed.details))
+
+    def _read_patterns(
+        self, names: set[str], force: bool
+    ) -> dict[str, _IndexedPattern | None]:
+        """Read the given patterns' files; None marks a pattern that is gone.
+
+        Runs in a worker thread and leaves the index alone: _reload applies
+        the result on the event loop.
+        """
+        changes: dict[str, _IndexedPattern | None] = {}
+        for name in names:
+            if not name or name.startswith("."):
+                continue
+            path = self.directory / name / PATTERN_FILE
+            try:
+                stat = path.stat()
+                indexed = self._patterns.get(name)
+                if (
+                    not force
+                    and indexed
+                    and (indexed.mtime_ns, indexed.size)
+                    == (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                    )
+                ):
+                    continue
+                system_prompt = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                changes[name] = None
+                continue
+            details = {
+                "name": name,
+                "description": pattern_description(system_prompt),
+                "system_prompt": system_prompt,
+            }
+            changes[name] = _IndexedPattern(stat.st_mtime_ns, stat.st_size, details)
+        return changes
@@ -0,0 +1,329 @@
+"""Prometheus metrics, rendered in the text exposition format.
+
+The handful of metric types the server needs are implemented here rather than
+pulling in a client library. Recording a sample is a dict lookup plus a bisect
+and an integer add, all on the event loop thread, so no locking is needed and
+the hot path stays cheap; all formatting work happens when ``/metrics`` is
+scraped.
+"""
+
+import functools
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+from .chunking import model_profile
+
+R = TypeVar("R")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from a fast cache hit to a long pattern run
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+TOKENS_PER_SECOND_BUCKETS = (1, 5, 10, 20, 30, 50, 75, 100, 150, 200, 300, 500)
+
+Labels = tuple[str, ...]
+Sample = tuple[Labels, float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Labels, values: Labels, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class: a named metric family with fixed label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def render(self) -> list[str]:
+        """Return the exposition lines for this family, headers included."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._render_samples(),
+        ]
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Gauge(Metric):
+    """A value that goes up and down, e.g. requests in flight."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {} if labelnames else {(): 0}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Add amount to the series for labels."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        """Subtract amount from the series for labels."""
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def value(self, *labels: str) -> float:
+        """Current value of the series for labels."""
+        return self._values.get(labels, 0)
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative ``le`` buckets, with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: a count per bucket (the last one is +Inf), then the sum
+        self._series: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation in the series for labels."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations in the series for labels."""
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def _render_samples(self) -> list[str]:
+        lines: list[str] = []
+        bounds = (*self.buckets, float("inf"))
+        for labels, series in self._series.items():
+            cumulative = 0.0
+            for bound, count in zip(bounds, series, strict=False):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{suffix} {_format_value(cumulative)}")
+        return lines
+
+
+class CallbackMetric(Metric):
+    """A gauge or counter whose samples are read from live state at scrape time.
+
+    Used for values the server already tracks (cache counters, pool usage), so
+    nothing extra happens on the hot path.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels,
+        collect: Callable[[], Iterable[Sample]],
+        kind: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in self._collect()
+        ]
+
+
+def render(metrics: Iterable[Metric]) -> str:
+    """Render metric families in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# --- Process-wide metrics, recorded on the hot path ---
+
+TOOL_DURATION = Histogram(
+    "fabric_mcp_tool_duration_seconds",
+    "Time spent in an MCP tool call.",
+    ("tool", "outcome"),
+)
+TOOL_CALLS_IN_FLIGHT = Gauge(
+    "fabric_mcp_tool_calls_in_flight",
+    "MCP tool calls currently running.",
+    ("tool",),
+)
+UPSTREAM_DURATION = Histogram(
+    "fabric_mcp_upstream_request_duration_seconds",
+    "Time for a Fabric REST API request, including the streamed body.",
+    ("method", "endpoint", "status"),
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "fabric_mcp_upstream_requests_in_flight",
+    "Fabric REST API requests currently open.",
+)
+CHAT_TIME_TO_FIRST_TOKEN = Histogram(
+    "fabric_mcp_chat_time_to_first_token_seconds",
+    "Time from sending a /chat request to its first content chunk.",
+    ("model",),
+)
+CHAT_TOKENS_PER_SECOND = Histogram(
+    "fabric_mcp_chat_tokens_per_second",
+    "Estimated output tokens per second of a /chat response, after the first.",
+    ("model",),
+    buckets=TOKENS_PER_SECOND_BUCKETS,
+)
+PATTERN_QUEUE_WAIT = Histogram(
+    "fabric_mcp_pattern_queue_wait_seconds",
+    "Time a pattern run waited for an admission slot (0 if one was free).",
+)
+
+PROCESS_METRICS: tuple[Metric, ...] = (
+    TOOL_DURATION,
+    TOOL_CALLS_IN_FLIGHT,
+    UPSTREAM_DURATION,
+    UPSTREAM_IN_FLIGHT,
+    CHAT_TIME_TO_FIRST_TOKEN,
+    CHAT_TOKENS_PER_SECOND,
+    PATTERN_QUEUE_WAIT,
+)
+
+
+def timed_tool(fn: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+    """Wrap an async tool so its latency and in-flight count are recorded.
+
+    functools.wraps keeps the signature visible to FastMCP, which builds the
+    tool's input schema from it.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> R:
+        TOOL_CALLS_IN_FLIGHT.inc(name)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await fn(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            TOOL_DURATION.observe(time.perf_counter() - started, name, outcome)
+            TOOL_CALLS_IN_FLIGHT.dec(name)
+
+    return wrapper
+
+
+class UpstreamTimer:
+    """Times one Fabric API request as a ``with`` block.
+
+    Set ``status`` to the HTTP status code once a response arrives; requests
+    that fail without one are recorded as "error".
+    """
+
+    __slots__ = ("_method", "_endpoint", "_started", "status")
+
+    def __init__(self, method: str, endpoint: str):
+        self._method = method
+        self._endpoint = endpoint
+        self._started = 0.0
+        self.status = "error"
+
+    def __enter__(self) -> "UpstreamTimer":
+        UPSTREAM_IN_FLIGHT.inc()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        UPSTREAM_DURATION.observe(
+            time.perf_counter() - self._started,
+            self._method,
+            self._endpoint,
+            self.status,
+        )
+        UPSTREAM_IN_FLIGHT.dec()
+
+
+class ChatTimer:
+    """Times one /chat response for the time-to-first-token and tokens/s metrics.
+
+    Create it just before sending the request, call content() for every content
+    chunk and finish() when the response ends.
+    """
+
+    __slots__ = ("_model", "_started", "_first", "_chars")
+
+    def __init__(self, model: str):
+        self._model = model
+        self._started = time.perf_counter()
+        self._first: float | None = None
+        self._chars = 0
+
+    def content(self, text: str) -> None:
+        """Record a content chunk as it arrives."""
+        if self._first is None:
+            self._first = time.perf_counter()
+            CHAT_TIME_TO_FIRST_TOKEN.observe(self._first - self._started, self._model)
+        self._chars += len(text)
+
+    def finish(self) -> None:
+        """Record the generation rate once the response is complete."""
+        if self._first is None:
+            return
+        elapsed = time.perf_counter() - self._first
+        if elapsed > 0 and self._chars:
+            tokens = self._chars / model_profile(self._model).chars_per_token
+            CHAT_TOKENS_PER_SECOND.observe(tokens / elapsed, self._model)
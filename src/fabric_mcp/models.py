@@ -16,3 +16,11 @@ class PatternExecutionConfig:  # pylint: disable=too-many-instance-attributes
     top_p: float | None = None
     presence_penalty: float | None = None
     frequency_penalty: float | None = None
+
+
+@dataclass
+class PatternRun:
+    """One pattern to run (e.g. a pipeline stage), with its optional configuration."""
+
+    pattern_name: str
+    config: PatternExecutionConfig | None = None
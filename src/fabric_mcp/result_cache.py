@@ -0,0 +1,157 @@
+"""Cache of deterministic pattern run results, in memory and optionally on disk."""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from . import json_codec
+from .cache import ByteBoundedLRUCache, CacheStats
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    """Output of a pattern run, with the boundaries of its streamed chunks."""
+
+    output_format: str
+    output_text: str
+    chunk_ends: tuple[int, ...]
+
+    @classmethod
+    def from_chunks(cls, output_format: str, chunks: list[str]) -> "CachedResult":
+        """Build a result from the content chunks of a streamed run."""
+        ends: list[int] = []
+        end = 0
+        for chunk in chunks:
+            end += len(chunk)
+            ends.append(end)
+        return cls(output_format, "".join(chunks), tuple(ends))
+
+    @classmethod
+    def from_output(cls, output: dict[str, str]) -> "CachedResult":
+        """Build a result from a non-streamed run's output (a single chunk)."""
+        text = output["output_text"]
+        return cls(output["output_format"], text, (len(text),))
+
+    def size(self) -> int:
+        """Approximate memory footprint in bytes."""
+        return len(self.output_text.encode()) + 8 * len(self.chunk_ends)
+
+    def as_output(self) -> dict[str, str]:
+        """Return the result in fabric_run_pattern's output format."""
+        return {"output_format": self.output_format, "output_text": self.output_text}
+
+    async def replay(self) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield the result as the chunks a streamed run produced."""
+        start = 0
+        for end in self.chunk_ends:
+            yield {
+                "type": "content",
+                "format": self.output_format,
+                "content": self.output_text[start:end],
+            }
+            start = end
+        yield {"type": "complete", "format": self.output_format, "content": ""}
+
+
+class ResultCache:
+    """Two-tier cache of pattern run results keyed by request payload hash.
+
+    The memory tier is a byte-bounded LRU. The optional disk tier stores one
+    JSON file per result in ``directory``, so cached results survive restarts
+    and can be shared between server processes; results found on disk are
+    promoted to memory. Both tiers expire entries ``ttl`` seconds after they
+    were stored.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        directory: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            max_bytes: Size bound of the memory tier; ``0`` disables it.
+            ttl: Seconds a result stays cached; ``0`` disables the cache.
+            directory: Directory for the disk tier, or ``None`` for memory only.
+            clock: Monotonic time source for the memory tier.
+            wall_clock: Wall-clock time source for the disk tier.
+        """
+        self.ttl = ttl
+        self.directory = directory
+        self.stats = CacheStats()
+        self._memory: ByteBoundedLRUCache[str, CachedResult] = ByteBoundedLRUCache(
+            max_bytes, ttl, sizeof=CachedResult.size, clock=clock
+        )
+        self._wall_clock = wall_clock
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether either tier stores results."""
+        return self.ttl > 0 and (self._memory.enabled or self.directory is not None)
+
+    async def get(self, key: str) -> CachedResult | None:
+        """Return the cached result for key, or None on a miss."""
+        result = self._memory.peek(key)
+        if result is None and self.directory is not None:
+            path = self.directory / f"{key}.json"
+            result = await asyncio.to_thread(self._read_file, path)
+            if result is not None:
+                self._memory.put(key, result)
+        if result is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return result
+
+    async def put(self, key: str, result: CachedResult) -> None:
+        """Store a result in every enabled tier."""
+        if not self.enabled:
+            return
+        self._memory.put(key, result)
+        if self.directory is not None:
+            path = self.directory / f"{key}.json"
+            await asyncio.to_thread(self._write_file, path, result)
+
+    def _read_file(self, path: Path) -> CachedResult | None:
+        try:
+            record = json_codec.loads(path.read_bytes())
+            if self._wall_clock() - record["stored_at"] >= self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return CachedResult(
+                record["output_format"],
+                record["output_text"],
+                tuple(record["chunk_ends"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, json_codec.JSONDecodeError) as e:
+            self._logger.warning("Ignoring unreadable cached result %s: %s", path, e)
+            return None
+
+    def _write_file(self, path: Path, result: CachedResult) -> None:
+        record = {
+            "stored_at": self._wall_clock(),
+            "output_format": result.output_format,
+            "output_text": result.output_text,
+            "chunk_ends": list(result.chunk_ends),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial JSON
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(json_codec.dumps(record))
+            os.replace(tmp_name, path)
+        except OSError as e:
+            self._logger.warning("Could not write cached result %s: %s", path, e)
@@ -0,0 +1,140 @@
+"""In-memory full-text index for searching Fabric patterns (BM25)."""
+
+import heapq
+import math
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import NamedTuple
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# How much one occurrence of a word counts in each field of a pattern: a query
+# word in a pattern's name weighs as much as three in its system prompt
+FIELD_WEIGHTS = {"name": 3.0, "description": 2.0, "system_prompt": 1.0}
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase words; "extract_wisdom" is two words."""
+    return _WORD.findall(text.lower())
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result."""
+
+    name: str
+    description: str
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Document:
+    fields: tuple[str, ...]  # As indexed, to tell whether an update changes it
+    terms: dict[str, float]  # Field-weighted term frequencies
+    length: float
+
+    @property
+    def description(self) -> str:
+        """The description field, second in FIELD_WEIGHTS."""
+        return self.fields[1]
+
+
+class PatternSearchIndex:
+    """Inverted index over pattern names, descriptions and system prompts.
+
+    Patterns are added, replaced and removed one at a time, touching only the
+    postings of their own words, so keeping the index in line with a changing
+    catalog never means rebuilding it. Queries are ranked with Okapi BM25
+    over the field-weighted term frequencies (see FIELD_WEIGHTS).
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Args:
+            k1: BM25 term frequency saturation.
+            b: BM25 document length normalization, from 0 (none) to 1 (full).
+        """
+        self.k1 = k1
+        self.b = b
+        self._documents: dict[str, _Document] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._documents
+
+    def update(self, name: str, details: Mapping[str, str]) -> None:
+        """Index a pattern's details, replacing what was indexed for name.
+
+        Details are fabric_get_pattern_details results; an update with the
+        same field values as already indexed does nothing.
+        """
+        fields = tuple(details.get(field, "") for field in FIELD_WEIGHTS)
+        indexed = self._documents.get(name)
+        if indexed is not None and indexed.fields == fields:
+            return
+        self.remove(name)
+
+        terms: dict[str, float] = {}
+        for text, weight in zip(fields, FIELD_WEIGHTS.values(), strict=True):
+            for word in tokenize(text):
+                terms[word] = terms.get(word, 0.0) + weight
+        document = _Document(fields, terms, sum(terms.values()))
+        self._documents[name] = document
+        self._total_length += document.length
+        for word, frequency in document.terms.items():
+            self._postings.setdefault(word, {})[name] = frequency
+
+    def remove(self, name: str) -> None:
+        """Drop a pattern from the index, if it is there."""
+        document = self._documents.pop(name, None)
+        if document is None:
+            return
+        self._total_length -= document.length
+        for word in document.terms:
+            postings = self._postings[word]
+            del postings[name]
+            if not postings:
+                del self._postings[word]
+
+    def retain(self, names: Iterable[str]) -> None:
+        """Drop every pattern not in names."""
+        keep = set(names)
+        for name in [name for name in self._documents if name not in keep]:
+            self.remove(name)
+
+    def clear(self) -> None:
+        """Drop every pattern."""
+        self._documents.clear()
+        self._postings.clear()
+        self._total_length = 0.0
+
+    def search(self, query: str, limit: int) -> list[SearchHit]:
+        """Return up to limit patterns matching any query word, best first.
+
+        Patterns with equal scores are ordered by name.
+        """
+        count = len(self._documents)
+        if not count:
+            return []
+        average_length = self._total_length / count or 1.0
+        scores: dict[str, float] = {}
+        for word in set(tokenize(query)):
+            postings = self._postings.get(word)
+            if postings is None:
+                continue
+            # Lucene's BM25 idf, which stays positive for very common words
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for name, frequency in postings.items():
+                length = self._documents[name].length
+                norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                gain = idf * frequency * (self.k1 + 1) / (frequency + norm)
+                scores[name] = scores.get(name, 0.0) + gain
+        best = heapq.nsmallest(limit, scores.items(), key=lambda hit: (-hit[1], hit[0]))
+        return [
+            SearchHit(name, self._documents[name].description, score)
+            for name, score in best
+        ]
@@ -0,0 +1,67 @@
+"""Coalescing of identical concurrent upstream calls ("singleflight")."""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    executions: int = 0  # calls that actually ran
+    coalesced: int = 0  # calls that joined one already in flight
+
+
+@dataclass
+class _Call(Generic[V]):
+    task: asyncio.Task[V]
+    waiters: int = 0
+
+
+class SingleFlight(Generic[K, V]):
+    """Share one in-flight call among all concurrent callers with the same key.
+
+    The first caller for a key starts the call in its own task; callers that
+    arrive while it is running await the same task and receive the same result
+    or exception. Once it finishes the key is released, so later callers start
+    a new call (results are not cached).
+
+    A caller being cancelled does not cancel the shared call for the others; it
+    is only cancelled when every caller waiting on it has gone away.
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._calls: dict[K, _Call[V]] = {}
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+    async def do(self, key: K, fn: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """Run fn for key, or join the call for key already in flight."""
+        call = self._calls.get(key)
+        if call is None:
+            self.stats.executions += 1
+            call = _Call(asyncio.create_task(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._release(key, call))
+        else:
+            self.stats.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _release(self, key: K, call: _Call[V]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
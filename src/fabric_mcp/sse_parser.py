@@ -1,20 +1,192 @@
 """Server-Sent Events (SSE) parsing utilities for fabric-mcp."""
 
-import json
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from . import json_codec
+from .metrics import ChatTimer
+from .tracing import span
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(slots=True)
+class ServerSentEvent:
+    """A single event dispatched by SSEDecoder."""
+
+    data: str
+    event: str = "message"
+    id: str = ""
+    retry: int | None = None
+
+
+class SSEDecoder:
+    """Incremental decoder for ``text/event-stream`` bodies.
+
+    Implements the event stream interpretation rules of the WHATWG HTML
+    specification: LF, CRLF and bare CR line endings (including a CRLF split
+    across two chunks), multi-line ``data`` fields, ``event``, ``id`` and
+    ``retry`` fields, comment lines and a leading UTF-8 BOM.
+
+    Each chunk is cut at its last blank line: the complete events before it are
+    decoded from UTF-8 in one call and split apart, and only the trailing
+    partial event is carried over as bytes. Events made of a single ``data``
+    line, which is all Fabric ever sends, skip per-line field parsing.
+    """
+
+    def __init__(self) -> None:
+        self._pending: bytes = b""  # partial event carried over from the last chunk
+        self._data: list[str] = []
+        self._event = ""
+        self._last_event_id = ""
+        self._retry: int | None = None
+        self._skip_lf: bool = False  # previous chunk ended with CR
+        self._at_start = True  # BOM not yet checked
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Consume a chunk of the body and return the events it completed."""
+        if self._skip_lf and chunk:
+            self._skip_lf = False
+            if chunk[0] == 0x0A:
+                chunk = chunk[1:]
+        if self._pending:
+            chunk = self._pending + chunk
+
+        if self._at_start:
+            if len(chunk) < len(_UTF8_BOM) and _UTF8_BOM.startswith(chunk):
+                self._pending = chunk  # wait for enough bytes to rule out a BOM
+                return []
+            self._at_start = False
+            if chunk.startswith(_UTF8_BOM):
+                chunk = chunk[len(_UTF8_BOM) :]
+
+        if b"\r" in chunk:
+            # A CR ending the chunk may be the first half of a CRLF
+            self._skip_lf = chunk.endswith(b"\r")
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        complete, blank_line, self._pending = chunk.rpartition(b"\n\n")
+        if not blank_line:
+            return []
+
+        events: list[ServerSentEvent] = []
+        for block in complete.decode("utf-8", "replace").split("\n\n"):
+            if block.startswith("data:") and "\n" not in block:
+                value = block[6:] if block[5:6] == " " else block[5:]
+                events.append(ServerSentEvent(value, "message", self._last_event_id))
+            else:
+                for line in block.split("\n"):
+                    self._process_line(line, events)
+                self._dispatch(events)
+        return events
+
+    def flush(self) -> list[ServerSentEvent]:
+        """Finish the stream and return any event still being assembled.
+
+        Strictly, an event not followed by a blank line is discarded at end of
+        stream; it is dispatched here instead so that a server which omits the
+        final blank line does not lose its last event.
+        """
+        events: list[ServerSentEvent] = []
+        if self._pending:
+            for line in self._pending.decode("utf-8", "replace").split("\n"):
+                self._process_line(line, events)
+            self._pending = b""
+        self._dispatch(events)
+        return events
+
+    def _process_line(self, line: str, events: list[ServerSentEvent]) -> None:
+        """Interpret one complete line of the stream."""
+        if not line:
+            self._dispatch(events)
+            return
+        if line[0] == ":":
+            return  # comment
+
+        name, _, value = line.partition(":")
+        if value[:1] == " ":
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        elif name == "id":
+            if "\0" not in value:
+                self._last_event_id = value
+        elif name == "retry":
+            if value.isascii() and value.isdigit():
+                self._retry = int(value)
+        # Any other field name is ignored
+
+    def _dispatch(self, events: list[ServerSentEvent]) -> None:
+        """Emit the pending event, if it has data, and reset per-event state."""
+        if self._data:
+            events.append(
+                ServerSentEvent(
+                    "\n".join(self._data),
+                    self._event or "message",
+                    self._last_event_id,
+                    self._retry,
+                )
+            )
+            self._data = []
+        self._event = ""
+        self._retry = None
+
 
 class SSEParserMixin:
     """Mixin class providing SSE parsing functionality."""
 
-    def _parse_sse_response(self, response: httpx.Response) -> dict[str, str]:
+    async def _iter_sse_events(
+        self, response: httpx.Response
+    ) -> AsyncGenerator[ServerSentEvent, None]:
+        """Decode events from the raw response bytes as they arrive."""
+        decoder = SSEDecoder()
+        received = events = 0
+        with span("sse.parse", current=False) as sp:
+            try:
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+                    for event in decoder.feed(chunk):
+                        if events == 0 and sp is not None:
+                            sp.add_event("first_event")
+                        events += 1
+                        yield event
+                for event in decoder.flush():
+                    events += 1
+                    yield event
+            finally:
+                if sp is not None:
+                    sp.set_attributes({"sse.bytes": received, "sse.events": events})
+
+    def _decode_sse_data(self, event: ServerSentEvent) -> dict[str, Any]:
+        """Decode the JSON payload carried by a Fabric SSE event.
+
+        Raises:
+            RuntimeError: If the event data is not valid JSON.
+        """
+        try:
+            return json_codec.loads(event.data)
+        except json_codec.JSONDecodeError as e:
+            logger = logging.getLogger(__name__)
+            logger.warning("Failed to parse SSE JSON: %s", e)
+            # For malformed SSE data, raise an error after logging
+            raise RuntimeError(f"Malformed SSE data: {e}") from e
+
+    async def _parse_sse_response(
+        self, response: httpx.Response, timer: ChatTimer | None = None
+    ) -> dict[str, str]:
         """
         Parse Server-Sent Events response from Fabric API.
 
+        Events are decoded as the bytes arrive, so the body is never buffered whole.
+        Content chunks are reported to timer, if given, as they arrive.
+
         Returns:
             dict[str, str]: Contains 'output_format' and 'output_text' fields.
         """
@@ -23,39 +195,28 @@ class SSEParserMixin:
         output_format = "text"  # default
         has_data = False  # Track if we received any actual data
 
-        # Parse SSE response line by line
-        for line in response.iter_lines():
-            line = line.strip()
-            if not line:
-                continue
-
-            # SSE lines start with "data: "
-            if line.startswith("data: "):
+        async with aclosing(self._iter_sse_events(response)) as events:
+            async for event in events:
                 has_data = True
-                try:
-                    data = json.loads(line[6:])  # Remove "data: " prefix
-
-                    if data.get("type") == "content":
-                        # Collect content chunks
-                        content = data.get("content", "")
-                        output_chunks.append(content)
-                        # Update format if provided
-                        output_format = data.get("format", output_format)
-
-                    elif data.get("type") == "complete":
-                        # End of stream
-                        break
-
-                    elif data.get("type") == "error":
-                        # Handle error from Fabric API
-                        error_msg = data.get("content", "Unknown Fabric API error")
-                        raise RuntimeError(f"Fabric API error: {error_msg}")
-
-                except json.JSONDecodeError as e:
-                    logger = logging.getLogger(__name__)
-                    logger.warning("Failed to parse SSE JSON: %s", e)
-                    # For malformed SSE data, raise an error after logging
-                    raise RuntimeError(f"Malformed SSE data: {e}") from e
+                data = self._decode_sse_data(event)
+
+                if data.get("type") == "content":
+                    # Collect content chunks
+                    content = data.get("content", "")
+                    output_chunks.append(content)
+                    if timer is not None:
+                        timer.content(content)
+                    # Update format if provided
+                    output_format = data.get("format", output_format)
+
+                elif data.get("type") == "complete":
+                    # End of stream
+                    break
+
+                elif data.get("type") == "error":
+                    # Handle error from Fabric API
+                    error_msg = data.get("content", "Unknown Fabric API error")
+                    raise RuntimeError(f"Fabric API error: {error_msg}")
 
         # Check if we received no data at all
         if not has_data:
@@ -67,9 +228,9 @@ class SSEParserMixin:
             "output_text": "".join(output_chunks),
         }
 
-    def _parse_sse_stream(
+    async def _parse_sse_stream(
         self, response: httpx.Response
-    ) -> Generator[dict[str, Any], None, None]:
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """
         Parse Server-Sent Events response from Fabric API in streaming mode.
 
@@ -84,52 +245,39 @@ class SSEParserMixin:
         has_data = False  # Track if we received any actual data
         logger = logging.getLogger(__name__)
 
-        # Parse SSE response line by line
-        for line in response.iter_lines():
-            line = line.strip()
-            if not line:
-                continue
-
-            # SSE lines start with "data: "
-            if line.startswith("data: "):
+        async with aclosing(self._iter_sse_events(response)) as events:
+            async for event in events:
                 has_data = True
-                try:
-                    data = json.loads(line[6:])  # Remove "data: " prefix
-
-                    if data.get("type") == "content":
-                        # Yield content chunks in real-time
-                        yield {
-                            "type": "content",
-                            "format": data.get("format", "text"),
-                            "content": data.get("content", ""),
-                        }
-
-                    elif data.get("type") == "complete":
-                        # Yield completion signal and end stream
-                        yield {
-                            "type": "complete",
-                            "format": data.get("format", "text"),
-                            "content": data.get("content", ""),
-                        }
-                        return
-
-                    elif data.get("type") == "error":
-                        # Yield error and end stream
-                        error_msg = data.get("content", "Unknown Fabric API error")
-                        raise RuntimeError(f"Fabric API error: {error_msg}")
-                    else:
-                        # Handle unexpected types gracefully
-                        logger.warning(
-                            "Unexpected SSE type: %s", data.get("type", "unknown")
-                        )
-                        raise RuntimeError(
-                            "Unexpected SSE data type "
-                            f"received: {data.get('type', 'unknown')}"
-                        )
-
-                except json.JSONDecodeError as e:
-                    logger.warning("Failed to parse SSE JSON: %s", e)
-                    raise RuntimeError(f"Malformed SSE data: {e}") from e
+                data = self._decode_sse_data(event)
+
+                if data.get("type") == "content":
+                    # Yield content chunks in real-time
+                    yield {
+                        "type": "content",
+                        "format": data.get("format", "text"),
+                        "content": data.get("content", ""),
+                    }
+
+                elif data.get("type") == "complete":
+                    # Yield completion signal and end stream
+                    yield {
+                        "type": "complete",
+                        "format": data.get("format", "text"),
+                        "content": data.get("content", ""),
+                    }
+                    return
+
+                elif data.get("type") == "error":
+                    # Yield error and end stream
+                    error_msg = data.get("content", "Unknown Fabric API error")
+                    raise RuntimeError(f"Fabric API error: {error_msg}")
+                else:
+                    # Handle unexpected types gracefully
+                    unexpected = data.get("type", "unknown")
+                    logger.warning("Unexpected SSE type: %s", unexpected)
+                    raise RuntimeError(
+                        f"Unexpected SSE data type received: {unexpected}"
+                    )
 
         # Check if we received no data at all
         if not has_data:
@@ -0,0 +1,197 @@
+"""Optional OpenTelemetry tracing of tool calls, Fabric requests and SSE parsing.
+
+Tracing is off unless ``FABRIC_MCP_TRACE_EXPORTER`` is set and the
+OpenTelemetry SDK is installed (``pip install fabric-mcp[otel]``):
+
+- ``otlp`` exports to an OTLP/HTTP collector, configured with the standard
+  ``OTEL_EXPORTER_OTLP_*`` variables (``http://localhost:4318`` by default).
+- ``file`` appends one JSON span per line to ``FABRIC_MCP_TRACE_FILE``.
+
+While tracing is off, span() is a shared no-op context manager and
+traced_tool() returns the tool unchanged, so the disabled path costs nothing.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+from collections.abc import Awaitable, Callable, Generator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, TextIO, TypeVar
+
+from .constants import DEFAULT_TRACE_FILE, TRACE_EXPORTER_ENV, TRACE_FILE_ENV
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.trace import Span, Tracer
+
+R = TypeVar("R")
+
+AttributeValue = str | bool | int | float
+
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class _Tracing:
+    """The process-wide tracer, set by configure_tracing()."""
+
+    tracer: Tracer | None = None
+    provider: TracerProvider | None = None
+    # Opened for the file exporter, closed by shutdown_tracing()
+    trace_file: TextIO | None = None
+
+
+def configure_tracing(exporter: SpanExporter | None = None) -> bool:
+    """Turn tracing on as configured by FABRIC_MCP_TRACE_EXPORTER.
+
+    Safe to call more than once; only the first successful call sets up the
+    exporter.
+
+    Args:
+        exporter: Export spans here instead of the configured exporter.
+
+    Returns:
+        True if tracing is enabled.
+    """
+    if _Tracing.tracer is not None:
+        return True
+    name = os.environ.get(TRACE_EXPORTER_ENV, "").strip().lower()
+    if exporter is None and not name:
+        return False
+
+    logger = logging.getLogger(__name__)
+    try:
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        from . import __version__
+
+        exporter = exporter or _make_exporter(name)
+    except (ImportError, ValueError) as e:
+        logger.warning("Tracing disabled: %s", e)
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": "fabric-mcp", "service.version": __version__}
+        )
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    _Tracing.provider = provider
+    _Tracing.tracer = provider.get_tracer("fabric_mcp", __version__)
+    logger.info("Tracing enabled, exporting spans via %s", type(exporter).__name__)
+    return True
+
+
+def _make_exporter(name: str) -> SpanExporter:
+    """Build the span exporter named by FABRIC_MCP_TRACE_EXPORTER.
+
+    Raises:
+        ImportError: If the exporter's package is not installed.
+        ValueError: If the name is unknown.
+    """
+    # pylint: disable=import-outside-toplevel
+    if name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+    if name == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        path = os.path.expanduser(os.environ.get(TRACE_FILE_ENV, DEFAULT_TRACE_FILE))
+        out = open(path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        _Tracing.trace_file = out
+        return ConsoleSpanExporter(
+            out=out, formatter=lambda span: span.to_json(indent=None) + "\n"
+        )
+    raise ValueError(
+        f"unknown {TRACE_EXPORTER_ENV} value {name!r}; expected otlp or file"
+    )
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans, close the trace file and turn tracing off."""
+    if _Tracing.provider is not None:
+        _Tracing.provider.shutdown()
+    if _Tracing.trace_file is not None:
+        _Tracing.trace_file.close()
+    _Tracing.tracer = _Tracing.provider = _Tracing.trace_file = None
+
+
+def span(
+    name: str,
+    attributes: Mapping[str, AttributeValue] | None = None,
+    current: bool = True,
+) -> AbstractContextManager[Span | None]:
+    """Record a span around a ``with`` block; yields None while tracing is off.
+
+    Exceptions leaving the block are recorded on the span. Pass current=False
+    inside async generators: the span then gets the caller's span as parent
+    but is not made current, since a generator's context can change between
+    iterations.
+    """
+    tracer = _Tracing.tracer
+    if tracer is None:
+        return _NO_SPAN
+    if current:
+        return tracer.start_as_current_span(name, attributes=attributes)
+    return _detached_span(tracer, name, attributes)
+
+
+@contextmanager
+def _detached_span(
+    tracer: Tracer, name: str, attributes: Mapping[str, AttributeValue] | None
+) -> Generator[Span, None, None]:
+    # pylint: disable-next=import-outside-toplevel
+    from opentelemetry.trace import Status, StatusCode
+
+    new_span = tracer.start_span(name, attributes=attributes)
+    try:
+        yield new_span
+    except Exception as e:  # not GeneratorExit: closing a generator is no error
+        new_span.record_exception(e)
+        new_span.set_status(Status(StatusCode.ERROR, f"{type(e).__name__}: {e}"))
+        raise
+    finally:
+        new_span.end()
+
+
+def inject_trace_context(headers: dict[str, str], parent: Span | None = None) -> None:
+    """Add W3C ``traceparent``/``tracestate`` headers for a span.
+
+    Uses the current span, or parent if given (e.g. a span opened with
+    current=False).
+    """
+    if _Tracing.tracer is not None:
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry.propagate import inject
+        from opentelemetry.trace import set_span_in_context
+
+        inject(headers, None if parent is None else set_span_in_context(parent))
+
+
+def traced_tool(fn: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+    """Wrap an async tool in a span, or return it as is while tracing is off.
+
+    Decided when the tool is registered, so configure_tracing() must run
+    before the server is created.
+    """
+    tracer = _Tracing.tracer
+    if tracer is None:
+        return fn
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> R:
+        with tracer.start_as_current_span(
+            f"tool {name}", attributes={"mcp.tool.name": name}
+        ):
+            return await fn(*args, **kwargs)
+
+    return wrapper
@@ -1,13 +1,18 @@
 """Utility functions for the fabric_mcp module."""
 
+import atexit
+import copy
+import json
 import logging
+import math
 import os
-from typing import NoReturn
+import queue
+import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import NoReturn, TextIO
 
-from mcp.shared.exceptions import McpError
-from mcp.types import ErrorData
-from rich.console import Console
-from rich.logging import RichHandler
+from .constants import DEFAULT_LOG_FORMAT, LOG_FORMAT_ENV, LOG_FORMATS
 
 
 def raise_mcp_error(e: Exception, code: int, message: str) -> NoReturn:
@@ -15,6 +20,11 @@ def raise_mcp_error(e: Exception, code: int, message: str) -> NoReturn:
 
     This function always raises an exception and never returns.
     """
+    # Imported here so that importing this module stays cheap (see cli.py)
+    # pylint: disable-next=import-outside-toplevel
+    from mcp.shared.exceptions import McpError
+    from mcp.types import ErrorData  # pylint: disable=import-outside-toplevel
+
     raise McpError(
         ErrorData(
             code=code,
@@ -23,6 +33,79 @@ def raise_mcp_error(e: Exception, code: int, message: str) -> NoReturn:
     ) from e
 
 
+def get_env_float(name: str, default: float) -> float:
+    """Read a finite, non-negative number from an environment variable.
+
+    Falls back to the default, with a warning, if the value is not a valid
+    finite, non-negative number (``nan`` and ``inf`` are rejected).
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if value < 0 or not math.isfinite(value):
+        logging.getLogger(__name__).warning(
+            "Ignoring invalid %s=%r; using %s.", name, raw, default
+        )
+        return default
+    return value
+
+
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects for log collectors.
+
+    Fields passed with ``extra=`` are included as top-level keys; values that
+    are not JSON types are written with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, object] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records with their message merged but otherwise unformatted.
+
+    The stock QueueHandler runs the formatter in the logging thread; here only
+    the arguments are merged (they may be mutated later), and JSON encoding and
+    traceback rendering are left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        return record
+
+
 class Log:
     """
     Custom class to handle logging setup and log levels.
@@ -31,32 +114,89 @@ class Log:
     provided during initialization, the class attempts to use the `FABRIC_MCP_LOG_LEVEL`
     environment variable as a fallback. If the environment variable is not set, the
     default log level is `INFO`.
+
+    The output format comes from `FABRIC_MCP_LOG_FORMAT`: `rich` (the default)
+    writes human-readable records, `json` writes one JSON object per line from a
+    background thread, so that formatting and I/O stay off the event loop.
     """
 
-    def __init__(self, level: str = ""):
-        """Initialize the Log class with a specific log level."""
+    # The listener of the current `json` configuration, if any
+    _listener: QueueListener | None = None
+
+    def __init__(self, level: str = "", stream: TextIO | None = None):
+        """Initialize the Log class with a specific log level.
+
+        Args:
+            level: The log level, unless `FABRIC_MCP_LOG_LEVEL` is set.
+            stream: Where to write records; defaults to stderr.
+        """
         level = os.environ.get("FABRIC_MCP_LOG_LEVEL", level) or "INFO"
         self._level_name = level.upper()
         self._level = Log.log_level(self._level_name)
 
-        handler = RichHandler(
-            console=Console(stderr=True),
-            rich_tracebacks=True,
+        log_format = (
+            os.environ.get(LOG_FORMAT_ENV, "").strip().lower() or DEFAULT_LOG_FORMAT
         )
-        formatter = logging.Formatter(
-            "%(asctime)s - %(module)s  - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
+        invalid_format = log_format not in LOG_FORMATS
+        if invalid_format:
+            log_format = DEFAULT_LOG_FORMAT
+        self._format = log_format
 
         self._logger = logging.getLogger("FabricMCP")
         self._logger.setLevel(self.level_name)
 
-        self.logger.setLevel(self.level_name)
-
         # Remove any existing handlers to avoid duplicates on reconfiguration
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
-        self._logger.addHandler(handler)
+        Log.shutdown()
+
+        if log_format == "json":
+            self._logger.addHandler(self._json_handler(stream or sys.stderr))
+        else:
+            self._logger.addHandler(self._rich_handler(stream))
+
+        if invalid_format:
+            self._logger.warning(
+                "Ignoring invalid %s=%r; using %s.",
+                LOG_FORMAT_ENV,
+                os.environ.get(LOG_FORMAT_ENV),
+                DEFAULT_LOG_FORMAT,
+            )
+
+    @staticmethod
+    def _rich_handler(stream: TextIO | None) -> logging.Handler:
+        # pylint: disable=import-outside-toplevel
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        console = Console(file=stream) if stream else Console(stderr=True)
+        handler = RichHandler(console=console, rich_tracebacks=True)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(module)s  - %(levelname)s - %(message)s")
+        )
+        return handler
+
+    @staticmethod
+    def _json_handler(stream: TextIO) -> logging.Handler:
+        output = logging.StreamHandler(stream)
+        output.setFormatter(JsonFormatter())
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(records, output)
+        listener.start()
+        Log._listener = listener
+        return _DeferredQueueHandler(records)
+
+    @staticmethod
+    def shutdown() -> None:
+        """Write out queued records and stop the background thread."""
+        listener, Log._listener = Log._listener, None
+        if listener is not None:
+            listener.stop()
+
+    @property
+    def log_format(self) -> str:
+        """Return the output format, `rich` or `json`."""
+        return self._format
 
     @property
     def level_name(self) -> str:
@@ -97,3 +237,7 @@ class Log:
                 f"Invalid log level: {level}. Choose from {list(levels.keys())}."
             )
         return levels[level_upper]
+
+
+# Flush records still queued for the json listener when the process exits
+atexit.register(Log.shutdown)
@@ -4,6 +4,7 @@ from typing import Any, cast
 
 from mcp.types import INVALID_PARAMS
 
+from fabric_mcp.models import PatternExecutionConfig
 from fabric_mcp.utils import raise_mcp_error
 
 
@@ -145,3 +146,19 @@ class ValidationMixin:
 
         # Validate attachments parameter format
         self._validate_attachments_parameter(attachments)
+
+    def _validate_execution_config(self, config: PatternExecutionConfig | None) -> None:
+        """Validate the execution control parameters held by a config."""
+        if config is None:
+            return
+        self._validate_execution_parameters(
+            config.model_name,
+            config.vendor_name,
+            config.temperature,
+            config.top_p,
+            config.presence_penalty,
+            config.frequency_penalty,
+            config.strategy_name,
+            config.variables,
+            config.attachments,
+        )
@@ -0,0 +1,64 @@
+"""Benchmark: shared pooled FabricApiClient vs. one client per request.
+
+Runs against the mock Fabric API server and reports the per-call latency of
+creating (and closing) a fresh client for every request versus reusing the
+long-lived client owned by FabricMCP.
+"""
+
+import pytest
+
+from fabric_mcp.api_client import FabricApiClient
+from fabric_mcp.core import FabricMCP
+from tests.shared.benchmark_utils import summarize_latencies, time_async_calls
+from tests.shared.fabric_api.utils import (
+    MockFabricAPIServer,
+    fabric_api_server_fixture,
+)
+
+_ = fabric_api_server_fixture  # to get rid of unused variable warning
+
+ITERATIONS = 200
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_shared_client_is_faster_than_client_per_call(
+    mock_fabric_api_server: MockFabricAPIServer,
+) -> None:
+    """Reusing one client should beat building a client per request."""
+
+    async def client_per_call() -> None:
+        api_client = FabricApiClient(base_url=mock_fabric_api_server.base_url)
+        try:
+            await api_client.get("/patterns/names")
+        finally:
+            await api_client.close()
+
+    shared_client = FabricApiClient(base_url=mock_fabric_api_server.base_url)
+
+    async def pooled_call() -> None:
+        await shared_client.get("/patterns/names")
+
+    server = FabricMCP(log_level="WARNING")
+
+    try:
+        per_call = summarize_latencies(
+            "client per call", await time_async_calls(client_per_call, ITERATIONS)
+        )
+        pooled = summarize_latencies(
+            "shared client", await time_async_calls(pooled_call, ITERATIONS)
+        )
+        tool = summarize_latencies(
+            "fabric_list_patterns (shared client)",
+            await time_async_calls(server.fabric_list_patterns, ITERATIONS),
+        )
+    finally:
+        await shared_client.close()
+        await getattr(server, "_close_api_client")()
+
+    print()
+    for stats in (per_call, pooled, tool):
+        print(stats.format())
+    print(f"speedup (mean): {per_call.mean_ms / pooled.mean_ms:.2f}x")
+
+    assert pooled.mean_ms < per_call.mean_ms
@@ -0,0 +1,304 @@
+"""Benchmark: every tool end to end, over stdio and streamable HTTP.
+
+Run with ``make benchmark``. Starts the mock Fabric API server and a real
+fabric-mcp server process per transport, then drives each tool through a
+fastmcp Client at several concurrency levels over one MCP session. For every
+(transport, tool, concurrency) it reports throughput, p50/p95/p99 latency and,
+for streamed runs, the time to the first streamed chunk.
+
+Results are written as JSON so that runs can be compared across commits:
+
+- ``FABRIC_MCP_BENCHMARK_OUTPUT``: results file; defaults to
+  ``benchmark-results/e2e-<commit>.json`` in the repository root.
+- ``FABRIC_MCP_BENCHMARK_BASELINE``: an earlier results file; the benchmark
+  fails if any workload regressed beyond ``FABRIC_MCP_BENCHMARK_TOLERANCE``
+  (a fraction, default 0.25). ``tests/scripts/compare_benchmarks`` makes
+  the same comparison between two saved files.
+- ``FABRIC_MCP_BENCHMARK_CONCURRENCY``: comma-separated levels (default 1,4,16).
+- ``FABRIC_MCP_BENCHMARK_CALLS``: calls per workload and level (default 32).
+
+The mock answers instantly unless its ``MOCK_FABRIC_*`` knobs are set (see
+tests/shared/fabric_api/chat_behavior.py), e.g. ``MOCK_FABRIC_FIRST_TOKEN_DELAY=0.5
+MOCK_FABRIC_TOKENS_PER_SECOND=50 MOCK_FABRIC_OUTPUT_TOKENS=200`` for LLM-like
+timing.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport, StreamableHttpTransport
+from fastmcp.exceptions import ToolError
+from mcp.shared.exceptions import McpError
+
+from fabric_mcp.core import DEFAULT_MCP_HTTP_PATH
+from tests.shared.benchmark_utils import (
+    ThroughputResult,
+    compare_results,
+    save_results,
+    summarize_latencies,
+)
+from tests.shared.fabric_api.utils import MockFabricAPIServer
+from tests.shared.port_utils import find_free_port
+from tests.shared.transport_test_utils import get_expected_tools, run_server
+
+ROOT = Path(__file__).resolve().parents[2]
+
+INPUT_TEXT = "The quick brown fox jumps over the lazy dog. " * 20
+
+# (label, tool, arguments, streamed) - every tool, plus streamed pattern runs
+WORKLOADS: list[tuple[str, str, dict[str, Any], bool]] = [
+    ("fabric_list_patterns", "fabric_list_patterns", {}, False),
+    (
+        "fabric_get_pattern_details",
+        "fabric_get_pattern_details",
+        {"pattern_name": "summarize"},
+        False,
+    ),
+    (
+        "fabric_search_patterns",
+        "fabric_search_patterns",
+        {"query": "summarize key insights"},
+        False,
+    ),
+    (
+        "fabric_run_pattern",
+        "fabric_run_pattern",
+        {"pattern_name": "summarize", "input_text": INPUT_TEXT},
+        False,
+    ),
+    (
+        "fabric_run_pattern (stream)",
+        "fabric_run_pattern",
+        {"pattern_name": "summarize", "input_text": INPUT_TEXT, "stream": True},
+        True,
+    ),
+    (
+        "fabric_run_pattern_batch",
+        "fabric_run_pattern_batch",
+        {"pattern_name": "summarize", "inputs": [INPUT_TEXT, INPUT_TEXT]},
+        False,
+    ),
+    (
+        "fabric_run_pipeline",
+        "fabric_run_pipeline",
+        {
+            "stages": [
+                {"pattern_name": "extract_insights"},
+                {"pattern_name": "summarize"},
+            ],
+            "input_text": INPUT_TEXT,
+        },
+        False,
+    ),
+    (
+        "fabric_run_pipeline (stream)",
+        "fabric_run_pipeline",
+        {
+            "stages": [
+                {"pattern_name": "extract_insights"},
+                {"pattern_name": "summarize"},
+            ],
+            "input_text": INPUT_TEXT,
+            "stream": True,
+        },
+        True,
+    ),
+    (
+        "fabric_run_pattern_fanout",
+        "fabric_run_pattern_fanout",
+        {
+            "patterns": [
+                {"pattern_name": "summarize"},
+                {"pattern_name": "extract_insights"},
+            ],
+            "input_text": INPUT_TEXT,
+        },
+        False,
+    ),
+    (
+        "fabric_run_pattern_mapreduce",
+        "fabric_run_pattern_mapreduce",
+        {"pattern_name": "summarize", "input_text": INPUT_TEXT, "chunk_tokens": 100},
+        False,
+    ),
+    ("fabric_list_models", "fabric_list_models", {}, False),
+    ("fabric_list_strategies", "fabric_list_strategies", {}, False),
+    ("fabric_get_configuration", "fabric_get_configuration", {}, False),
+]
+
+
+def _concurrency_levels() -> list[int]:
+    raw = os.environ.get("FABRIC_MCP_BENCHMARK_CONCURRENCY", "1,4,16")
+    return [int(level) for level in raw.split(",") if level.strip()]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+@asynccontextmanager
+async def _mcp_client(
+    transport: str, env: dict[str, str]
+) -> AsyncGenerator[Client[Any], None]:
+    """A connected client for a fabric-mcp server process on the transport."""
+    if transport == "stdio":
+        stdio = StdioTransport(
+            command=sys.executable,
+            args=["-m", "fabric_mcp.cli", "--transport", "stdio"],
+            env={**os.environ, **env},
+        )
+        async with Client(stdio) as client:
+            yield client
+        return
+
+    config = {
+        "host": "127.0.0.1",
+        "port": find_free_port(),
+        "mcp_path": DEFAULT_MCP_HTTP_PATH,
+    }
+    async with run_server(config, "http", env) as running:
+        url = f"http://{running['host']}:{running['port']}{running['mcp_path']}"
+        async with Client(StreamableHttpTransport(url)) as client:
+            yield client
+
+
+async def _run_workload(
+    client: Client[Any],
+    transport: str,
+    workload: tuple[str, str, dict[str, Any], bool],
+    concurrency: int,
+    calls: int,
+) -> ThroughputResult:
+    """Make calls tool calls, concurrency at a time, and summarize them."""
+    label, tool, arguments, streamed = workload
+    latencies: list[float] = []
+    first_chunks: list[float] = []
+    errors = 0
+    remaining = iter(range(calls))
+
+    async def one_call() -> None:
+        nonlocal errors
+        started = time.perf_counter()
+        first: list[float] = []
+
+        async def on_progress(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            _ = progress, total  # only the arrival of the first chunk matters
+            if message and not first:
+                first.append(time.perf_counter() - started)
+
+        try:
+            await client.call_tool(
+                tool, arguments, progress_handler=on_progress if streamed else None
+            )
+        except (ToolError, McpError):
+            errors += 1
+            return
+        latencies.append(time.perf_counter() - started)
+        first_chunks.extend(first)
+
+    async def worker() -> None:
+        for _ in remaining:
+            await one_call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return ThroughputResult(
+        transport=transport,
+        tool=label,
+        concurrency=concurrency,
+        calls=calls,
+        errors=errors,
+        throughput_rps=len(latencies) / elapsed,
+        latency=summarize_latencies(label, latencies),
+        ttft=summarize_latencies(label, first_chunks) if first_chunks else None,
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_end_to_end_tool_latency_and_throughput() -> None:
+    """Every tool should answer without errors on both transports."""
+    assert {tool for _, tool, _, _ in WORKLOADS} == set(get_expected_tools())
+    levels = _concurrency_levels()
+    calls = int(os.environ.get("FABRIC_MCP_BENCHMARK_CALLS", "32"))
+
+    results: list[ThroughputResult] = []
+    with MockFabricAPIServer(log_level="warning") as fabric:
+        env = {
+            "FABRIC_BASE_URL": fabric.base_url,
+            "FABRIC_API_KEY": "benchmark",  # ignored by the mock
+            "FABRIC_MCP_LOG_LEVEL": "WARNING",
+            "FASTMCP_LOG_LEVEL": "WARNING",
+        }
+        for transport in ("stdio", "http"):
+            async with _mcp_client(transport, env) as client:
+                for workload in WORKLOADS:
+                    await _run_workload(client, transport, workload, 1, 2)  # warm up
+                    for concurrency in levels:
+                        results.append(
+                            await _run_workload(
+                                client, transport, workload, concurrency, calls
+                            )
+                        )
+
+    commit = _git_commit()
+    output = Path(
+        os.environ.get("FABRIC_MCP_BENCHMARK_OUTPUT")
+        or ROOT / "benchmark-results" / f"e2e-{commit}.json"
+    )
+    save_results(
+        output,
+        results,
+        {
+            "commit": commit,
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "calls": calls,
+            "concurrency": levels,
+        },
+    )
+
+    print()
+    for result in results:
+        print(result.format())
+    print(f"results written to {output}")
+
+    assert all(result.errors == 0 for result in results)
+
+    baseline = os.environ.get("FABRIC_MCP_BENCHMARK_BASELINE")
+    if baseline:
+        tolerance = float(os.environ.get("FABRIC_MCP_BENCHMARK_TOLERANCE", "0.25"))
+        regressions = compare_results(
+            json.loads(Path(baseline).read_text(encoding="utf-8")),
+            json.loads(output.read_text(encoding="utf-8")),
+            tolerance,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        assert not regressions
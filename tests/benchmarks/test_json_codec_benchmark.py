@@ -0,0 +1,84 @@
+"""Throughput benchmarks for the JSON codec backends.
+
+Run with ``make benchmark``. Decodes 10k token-sized SSE event payloads (the
+per-event work in the SSE parser) and encodes a typical /chat request payload,
+once per installed backend.
+"""
+
+import importlib.util
+import json
+
+import pytest
+
+from fabric_mcp.json_codec import get_codec
+from tests.shared.benchmark_utils import summarize_latencies, time_calls
+
+EVENTS = 10_000
+ITERATIONS = 20
+
+BACKENDS = [
+    name
+    for name in ("json", "orjson", "msgspec")
+    if name == "json" or importlib.util.find_spec(name) is not None
+]
+
+SSE_PAYLOADS = [
+    json.dumps({"type": "content", "content": f"tok{i} ", "format": "text"})
+    for i in range(EVENTS)
+]
+
+CHAT_PAYLOAD = {
+    "prompts": [
+        {
+            "userInput": "Lorem ipsum dolor sit amet. " * 200,
+            "patternName": "summarize",
+            "model": "gpt-4o",
+            "vendor": "openai",
+            "contextName": "",
+            "strategyName": "",
+            "variables": {"role": "expert", "tone": "concise"},
+        }
+    ],
+    "language": "en",
+    "temperature": 0.7,
+    "topP": 0.9,
+    "frequencyPenalty": 0.0,
+    "presencePenalty": 0.0,
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_json_codec_throughput(backend: str) -> None:
+    """Report SSE payload decode and /chat payload encode throughput."""
+    codec = get_codec(backend)
+    total_bytes = sum(len(p) for p in SSE_PAYLOADS)
+
+    def decode_all() -> None:
+        loads = codec.loads
+        for payload in SSE_PAYLOADS:
+            loads(payload)
+
+    def encode_chat() -> None:
+        codec.dumps(CHAT_PAYLOAD)
+
+    assert [codec.loads(p) for p in SSE_PAYLOADS[:3]] == [
+        json.loads(p) for p in SSE_PAYLOADS[:3]
+    ]
+
+    decode = summarize_latencies(
+        f"{backend}: decode {EVENTS} SSE payloads",
+        time_calls(decode_all, ITERATIONS, warmup=2),
+    )
+    encode = summarize_latencies(
+        f"{backend}: encode /chat payload",
+        time_calls(encode_chat, ITERATIONS * 100),
+    )
+
+    seconds = decode.mean_ms / 1000
+    print()
+    print(
+        f"{decode.format()} {total_bytes / (1024 * 1024) / seconds:8.1f}MiB/s "
+        f"{EVENTS / seconds:12,.0f} ev/s"
+    )
+    print(encode.format())
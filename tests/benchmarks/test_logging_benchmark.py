@@ -0,0 +1,100 @@
+"""Benchmark: Fabric API client throughput under each logging mode.
+
+Run with ``make benchmark``. Sends requests through FabricApiClient to an
+in-process mock transport, so the client's own work (including its logging)
+is what gets measured, and reports requests per second for:
+
+- INFO: the production default, where no per-request records are built;
+- DEBUG with ``rich`` output, the human-readable default;
+- DEBUG with ``json`` output written directly by the logging thread;
+- DEBUG with ``json`` output handed to the background listener.
+
+All output goes to os.devnull so terminal speed does not skew the results.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TextIO
+
+import httpx
+import pytest
+
+from fabric_mcp.api_client import FabricApiClient
+from fabric_mcp.utils import JsonFormatter, Log
+
+REQUESTS = 1_000
+CONCURRENCY = 20
+
+
+def _handler(_: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=["summarize"])
+
+
+@contextmanager
+def _logging_mode(
+    mode: str, sink: TextIO, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Configure the FabricMCP logger for one benchmark mode."""
+    monkeypatch.delenv("FABRIC_MCP_LOG_LEVEL", raising=False)
+    level, _, log_format = mode.partition(" ")
+    monkeypatch.setenv("FABRIC_MCP_LOG_FORMAT", "json" if "json" in mode else "rich")
+    log = Log(level, stream=sink)
+    if log_format == "json direct":
+        # Same formatter, but encoded and written on the calling thread
+        direct = logging.StreamHandler(sink)
+        direct.setFormatter(JsonFormatter())
+        log.logger.handlers[:] = [direct]
+        Log.shutdown()
+    try:
+        yield
+    finally:
+        Log.shutdown()
+        monkeypatch.delenv("FABRIC_MCP_LOG_FORMAT")
+        Log("INFO")
+
+
+async def _requests_per_second() -> float:
+    client = FabricApiClient(base_url="http://fabric.test", api_key="secret")
+    client.client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client.client.headers,
+        transport=httpx.MockTransport(_handler),
+    )
+    per_worker = REQUESTS // CONCURRENCY
+
+    async def worker() -> None:
+        for _ in range(per_worker):
+            await client.post("/chat", json_data={"prompts": [{"pattern": "x"}]})
+
+    try:
+        await worker()  # warm up
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return per_worker * CONCURRENCY / (time.perf_counter() - started)
+    finally:
+        await client.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_requests_per_second_by_logging_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """JSON logging should sustain more requests per second than rich output."""
+    modes = ("INFO", "DEBUG rich", "DEBUG json direct", "DEBUG json queued")
+    results: dict[str, float] = {}
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        for mode in modes:
+            with _logging_mode(mode, sink, monkeypatch):
+                results[mode] = await _requests_per_second()
+
+    print()
+    for mode, rps in results.items():
+        print(f"{mode:<20} {rps:10.0f} requests/s")
+
+    assert results["DEBUG json queued"] > results["DEBUG rich"]
+    assert results["INFO"] > results["DEBUG rich"]
@@ -0,0 +1,85 @@
+"""Benchmark: cost of recording metrics on the hot path.
+
+Run with ``make benchmark``. Compares a bare async tool with the same tool
+wrapped by timed_tool, and times the per-chunk ChatTimer bookkeeping against
+the per-chunk work it sits next to (decoding one SSE JSON payload).
+"""
+
+import json
+
+import pytest
+
+from fabric_mcp import json_codec
+from fabric_mcp.metrics import ChatTimer, timed_tool
+from tests.shared.benchmark_utils import (
+    summarize_latencies,
+    time_async_calls,
+    time_calls,
+)
+
+ITERATIONS = 20_000
+CHUNKS = 10_000
+
+PAYLOAD = json.dumps({"type": "content", "content": "token ", "format": "text"})
+
+
+async def _noop_tool(text: str) -> str:
+    return text
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_timed_tool_overhead() -> None:
+    """Timing a tool call should cost a few microseconds at most."""
+    timed = timed_tool(_noop_tool)
+
+    async def bare_call() -> None:
+        await _noop_tool("x")
+
+    async def timed_call() -> None:
+        await timed("x")
+
+    bare = summarize_latencies(
+        "bare tool", await time_async_calls(bare_call, ITERATIONS)
+    )
+    wrapped = summarize_latencies(
+        "timed_tool", await time_async_calls(timed_call, ITERATIONS)
+    )
+
+    print()
+    for stats in (bare, wrapped):
+        print(stats.format())
+    overhead_us = (wrapped.mean_ms - bare.mean_ms) * 1000
+    print(f"timed_tool overhead: {overhead_us:.2f}us per call")
+
+    # A pattern run takes hundreds of milliseconds; this is noise next to it
+    assert overhead_us < 20
+
+
+@pytest.mark.benchmark
+def test_chat_timer_per_chunk_cost() -> None:
+    """Recording a content chunk should cost less than decoding it."""
+
+    def record_chunks() -> None:
+        timer = ChatTimer("gpt-4o")
+        for _ in range(CHUNKS):
+            timer.content("token ")
+        timer.finish()
+
+    def decode_chunks() -> None:
+        loads = json_codec.loads
+        for _ in range(CHUNKS):
+            loads(PAYLOAD)
+
+    timer = summarize_latencies(
+        f"ChatTimer: {CHUNKS} chunks", time_calls(record_chunks, 20, warmup=2)
+    )
+    decode = summarize_latencies(
+        f"decode {CHUNKS} SSE payloads", time_calls(decode_chunks, 20, warmup=2)
+    )
+
+    print()
+    for stats in (timer, decode):
+        print(stats.format())
+
+    assert timer.mean_ms < decode.mean_ms
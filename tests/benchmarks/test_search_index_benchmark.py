@@ -0,0 +1,83 @@
+"""Benchmark: full-text pattern search over a Fabric-sized catalog.
+
+Run with ``make benchmark``. Indexes a few hundred synthetic patterns with
+system prompts of typical length, then times queries and single-pattern
+updates against the index.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from fabric_mcp.search_index import PatternSearchIndex
+from tests.shared.benchmark_utils import summarize_latencies, time_calls
+
+PATTERNS = 250
+PROMPT_WORDS = 600
+ITERATIONS = 2_000
+
+VOCABULARY = [f"word{i}" for i in range(3_000)] + [
+    "you",
+    "the",
+    "and",
+    "output",
+    "summary",
+    "extract",
+    "insights",
+    "write",
+    "analyze",
+    "markdown",
+]
+
+
+def _catalog() -> dict[str, dict[str, str]]:
+    rng = random.Random(42)
+    catalog: dict[str, dict[str, str]] = {}
+    for i in range(PATTERNS):
+        name = f"{rng.choice(VOCABULARY[-6:])}_{i}"
+        catalog[name] = {
+            "name": name,
+            "description": " ".join(rng.choices(VOCABULARY, k=15)),
+            "system_prompt": " ".join(rng.choices(VOCABULARY, k=PROMPT_WORDS)),
+        }
+    return catalog
+
+
+@pytest.mark.benchmark
+def test_search_latency() -> None:
+    """A ranked top-10 query should take well under a millisecond."""
+    catalog = _catalog()
+    index = PatternSearchIndex()
+
+    def build_index() -> None:
+        for name, details in catalog.items():
+            index.update(name, details)
+
+    build = summarize_latencies(
+        f"index {PATTERNS} patterns", time_calls(build_index, 1, warmup=0)
+    )
+
+    query = summarize_latencies(
+        "search 'extract insights from the output'",
+        time_calls(
+            lambda: index.search("extract insights from the output", 10), ITERATIONS
+        ),
+    )
+
+    name, details = next(iter(catalog.items()))
+    versions = [
+        dict(details, description=f"{details['description']} v{i}") for i in (1, 2)
+    ]
+    alternating = itertools.cycle(versions)
+    update = summarize_latencies(
+        "update one pattern",
+        time_calls(lambda: index.update(name, next(alternating)), ITERATIONS),
+    )
+
+    print()
+    for stats in (build, query, update):
+        print(stats.format())
+
+    assert query.p95_ms < 1.0
+    assert update.p95_ms < 1.0
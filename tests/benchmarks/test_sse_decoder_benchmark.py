@@ -0,0 +1,99 @@
+"""Microbenchmarks for the incremental SSE decoder.
+
+Run with ``make benchmark``. Each scenario decodes the same synthetic Fabric
+stream (10k token-sized content events) delivered in a different shape, and
+compares SSEDecoder against line-based framing via ``httpx.Response.iter_lines``.
+"""
+
+import json
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from fabric_mcp.sse_parser import SSEDecoder
+from tests.shared.benchmark_utils import summarize_latencies, time_calls
+
+EVENTS = 10_000
+ITERATIONS = 20
+LARGE_CHUNK = 64 * 1024
+
+
+def build_stream(newline: bytes) -> bytes:
+    """Build a Fabric-style SSE body of EVENTS small content events."""
+    events = [
+        b"data: "
+        + json.dumps(
+            {"type": "content", "content": f"tok{i} ", "format": "text"}
+        ).encode()
+        + newline
+        + newline
+        for i in range(EVENTS)
+    ]
+    return b"".join(events)
+
+
+def split_events(body: bytes, newline: bytes) -> list[bytes]:
+    """One chunk per event, as a token-by-token upstream would deliver them."""
+    separator = newline + newline
+    return [event + separator for event in body.split(separator) if event]
+
+
+def split_fixed(body: bytes, size: int) -> list[bytes]:
+    """Fixed-size chunks that cut through lines and line endings."""
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def decode_with_sse_decoder(chunks: list[bytes]) -> int:
+    """Count data payloads produced by SSEDecoder."""
+    decoder = SSEDecoder()
+    count = 0
+    for chunk in chunks:
+        count += len(decoder.feed(chunk))
+    return count + len(decoder.flush())
+
+
+def decode_with_iter_lines(chunks: list[bytes]) -> int:
+    """Count data payloads using the previous line-based approach."""
+    response = httpx.Response(200, content=iter(chunks))
+    count = 0
+    for line in response.iter_lines():
+        line = line.strip()
+        if line.startswith("data: "):
+            _ = line[6:]
+            count += 1
+    return count
+
+
+SCENARIOS: dict[str, Callable[[], list[bytes]]] = {
+    "10k tiny chunks (LF)": lambda: split_events(build_stream(b"\n"), b"\n"),
+    "10k tiny chunks (CRLF)": lambda: split_events(build_stream(b"\r\n"), b"\r\n"),
+    "64KiB chunks (LF)": lambda: split_fixed(build_stream(b"\n"), LARGE_CHUNK),
+    "64KiB chunks (CRLF)": lambda: split_fixed(build_stream(b"\r\n"), LARGE_CHUNK),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_sse_decoder_throughput(scenario: str) -> None:
+    """Report SSE framing throughput for one stream shape."""
+    chunks = SCENARIOS[scenario]()
+    total_bytes = sum(len(chunk) for chunk in chunks)
+
+    assert decode_with_sse_decoder(chunks) == EVENTS
+    assert decode_with_iter_lines(chunks) == EVENTS
+
+    decoder = summarize_latencies(
+        f"SSEDecoder: {scenario}",
+        time_calls(lambda: decode_with_sse_decoder(chunks), ITERATIONS, warmup=2),
+    )
+    legacy = summarize_latencies(
+        f"iter_lines: {scenario}",
+        time_calls(lambda: decode_with_iter_lines(chunks), ITERATIONS, warmup=2),
+    )
+
+    print()
+    for stats in (decoder, legacy):
+        mib_per_s = total_bytes / (1024 * 1024) / (stats.mean_ms / 1000)
+        events_per_s = EVENTS / (stats.mean_ms / 1000)
+        print(f"{stats.format()} {mib_per_s:8.1f}MiB/s {events_per_s:12,.0f} ev/s")
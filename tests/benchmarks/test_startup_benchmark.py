@@ -0,0 +1,73 @@
+"""Benchmark: cold start of the fabric-mcp command.
+
+Run with ``make benchmark``. Starts fresh processes and reports the median
+wall-clock time of:
+
+- ``fabric-mcp --version``, which should not load the MCP server stack;
+- ``fabric-mcp --transport stdio`` until it answers an MCP ``initialize``
+  request, i.e. how long an MCP client waits before it can use the server.
+
+``FABRIC_MCP_BENCHMARK_STARTS`` sets the number of starts (default 9).
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+COMMAND = [sys.executable, "-m", "fabric_mcp.cli"]
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "0"},
+    },
+}
+
+
+def _version_seconds() -> float:
+    started = time.perf_counter()
+    subprocess.run([*COMMAND, "--version"], capture_output=True, check=True)
+    return time.perf_counter() - started
+
+
+def _initialize_seconds() -> float:
+    started = time.perf_counter()
+    with subprocess.Popen(
+        [*COMMAND, "--transport", "stdio"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**os.environ, "FABRIC_MCP_LOG_LEVEL": "WARNING"},
+    ) as server:
+        assert server.stdin is not None and server.stdout is not None
+        server.stdin.write(json.dumps(INITIALIZE) + "\n")
+        server.stdin.flush()
+        response = json.loads(server.stdout.readline())
+        elapsed = time.perf_counter() - started
+        server.kill()
+    assert "result" in response, response
+    return elapsed
+
+
+@pytest.mark.benchmark
+def test_cold_start() -> None:
+    """--version should start several times faster than the server."""
+    starts = int(os.environ.get("FABRIC_MCP_BENCHMARK_STARTS", "9"))
+    version = statistics.median(_version_seconds() for _ in range(starts))
+    initialize = statistics.median(_initialize_seconds() for _ in range(starts))
+
+    print()
+    print(f"{'--version':<28} {version * 1000:8.0f} ms")
+    print(f"{'stdio initialize response':<28} {initialize * 1000:8.0f} ms")
+
+    assert version * 3 < initialize
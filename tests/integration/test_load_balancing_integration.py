@@ -0,0 +1,81 @@
+"""Integration tests for load balancing across several mock Fabric servers."""
+
+from collections.abc import Generator
+
+import pytest
+
+from fabric_mcp.api_client import FabricApiClient
+from tests.shared.fabric_api.utils import MockFabricAPIServer
+
+
+@pytest.fixture(name="mock_servers")
+def mock_servers_fixture() -> Generator[list[MockFabricAPIServer], None, None]:
+    """Run two mock Fabric API servers on free ports."""
+    servers = [MockFabricAPIServer(), MockFabricAPIServer()]
+    try:
+        for server in servers:
+            server.start()
+        yield servers
+    finally:
+        for server in servers:
+            server.stop()
+
+
+@pytest.mark.integration
+class TestLoadBalancingIntegration:
+    """Test FabricApiClient against several real mock servers."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_spread_over_backends(
+        self, mock_servers: list[MockFabricAPIServer]
+    ):
+        """Test that concurrent requests reach every backend."""
+        client = FabricApiClient(
+            base_url=",".join(s.base_url for s in mock_servers), api_key=""
+        )
+        assert client.load_balancer is not None
+        try:
+            async with client.stream("POST", "/chat", json_data=_chat_payload()):
+                for _ in range(4):
+                    response = await client.get("/patterns/names")
+                    assert response.status_code == 200
+        finally:
+            await client.close()
+
+        requests = [b.requests for b in client.load_balancer.backends]
+        assert sorted(requests) == [1, 4]
+
+    @pytest.mark.asyncio
+    async def test_stopped_backend_is_ejected(
+        self, mock_servers: list[MockFabricAPIServer]
+    ):
+        """Test that requests keep succeeding when one backend goes away."""
+        client = FabricApiClient(
+            base_url=",".join(s.base_url for s in mock_servers), api_key=""
+        )
+        assert client.load_balancer is not None
+        live, dead = client.load_balancer.backends
+        mock_servers[1].stop()
+        try:
+            # Requests routed to the dead backend fail over on retry
+            while dead.failures == 0 and live.requests < 20:
+                response = await client.get("/patterns/names")
+                assert response.status_code == 200
+            assert dead.failures >= 1
+
+            # Active health checks eject it, so it no longer receives traffic
+            for _ in range(3):
+                await client.load_balancer.check_health()
+            dead_requests = dead.requests
+            for _ in range(3):
+                response = await client.get("/patterns/names")
+                assert response.status_code == 200
+        finally:
+            await client.close()
+
+        assert dead.requests == dead_requests
+
+
+def _chat_payload() -> dict[str, object]:
+    """Minimal /chat request accepted by the mock server."""
+    return {"prompts": [{"userInput": "hello", "patternName": "summarize"}]}
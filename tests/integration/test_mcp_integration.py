@@ -73,7 +73,7 @@ class TestFabricMCPCore(TestFixturesBase):
     async def test_tool_registration_and_discovery(self, mcp_tools: dict[str, Tool]):
         """Test that MCP tools are properly registered and discoverable."""
         # Check that tools are registered
-        assert len(mcp_tools) == 6
+        assert len(mcp_tools) == 11
 
         # Verify each tool is callable
         for tool in mcp_tools.values():
@@ -85,7 +85,7 @@ class TestFabricMCPCore(TestFixturesBase):
             COMMON_PATTERN_LIST
         )
         with mock_fabric_api_client(builder):
-            result: list[str] = list_patterns_tool()
+            result: list[str] = await list_patterns_tool()
             assert isinstance(result, list)
             assert len(result) == 3
 
@@ -97,7 +97,7 @@ class TestFabricMCPCore(TestFixturesBase):
             system_prompt="# Test pattern system prompt",
         )
         with mock_fabric_api_client(builder):
-            result = pattern_details_tool("test_pattern")
+            result = await pattern_details_tool("test_pattern")
             assert isinstance(result, dict)
             assert "name" in result
 
@@ -112,7 +112,7 @@ class TestFabricMCPCore(TestFixturesBase):
         with mock_fabric_api_client(builder) as mock_client:
             # Execute the tool
             list_patterns_tool = getattr(mcp_tools["fabric_list_patterns"], "fn")
-            result: list[str] = list_patterns_tool()
+            result: list[str] = await list_patterns_tool()
 
             assert isinstance(result, list)
             assert len(result) > 0
@@ -120,7 +120,7 @@ class TestFabricMCPCore(TestFixturesBase):
 
             # Verify API client was called correctly
             mock_client.get.assert_called_once_with("/patterns/names")
-            mock_client.close.assert_called_once()
+            mock_client.close.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_fabric_pattern_details_with_mocked_api(
@@ -138,7 +138,7 @@ class TestFabricMCPCore(TestFixturesBase):
             pattern_details_tool = getattr(
                 mcp_tools["fabric_get_pattern_details"], "fn"
             )
-            result = pattern_details_tool("analyze_claims")
+            result = await pattern_details_tool("analyze_claims")
 
             # Verify response structure
             assert isinstance(result, dict)
@@ -151,7 +151,7 @@ class TestFabricMCPCore(TestFixturesBase):
 
             # Verify API client was called correctly
             mock_client.get.assert_called_once_with("/patterns/analyze_claims")
-            mock_client.close.assert_called_once()
+            mock_client.close.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_fabric_run_pattern_with_mocked_api(self, mcp_tools: dict[str, Tool]):
@@ -165,7 +165,7 @@ class TestFabricMCPCore(TestFixturesBase):
         with mock_fabric_api_client(builder) as _:
             # Execute the tool (now uses real implementation)
             run_pattern_tool = getattr(mcp_tools["fabric_run_pattern"], "fn")
-            result = run_pattern_tool(
+            result = await run_pattern_tool(
                 pattern_name="analyze_claims",
                 input_text="Test input text",
                 stream=False,
@@ -192,7 +192,7 @@ class TestFabricMCPCore(TestFixturesBase):
             list_patterns_tool = getattr(mcp_tools["fabric_list_patterns"], "fn")
 
             with pytest.raises(McpError) as exc_info:
-                list_patterns_tool()
+                await list_patterns_tool()
 
             assert "Failed to connect to Fabric API" in str(
                 exc_info.value.error.message
@@ -212,7 +212,7 @@ class TestFabricMCPCore(TestFixturesBase):
             list_patterns_tool = getattr(mcp_tools["fabric_list_patterns"], "fn")
 
             with pytest.raises(McpError) as exc_info:
-                list_patterns_tool()
+                await list_patterns_tool()
 
             assert "Fabric API error during" in str(exc_info.value.error.message)
 
@@ -250,13 +250,13 @@ class TestFabricMCPCore(TestFixturesBase):
 
         # Step 1: List patterns
         list_patterns_tool = getattr(mcp_tools["fabric_list_patterns"], "fn")
-        patterns: list[str] = list_patterns_tool()
+        patterns: list[str] = await list_patterns_tool()
         assert isinstance(patterns, list)
         assert len(patterns) > 0
 
         # Step 2: Get pattern details using a pattern that exists in mock server
         pattern_details_tool = getattr(mcp_tools["fabric_get_pattern_details"], "fn")
-        details = pattern_details_tool("summarize")
+        details = await pattern_details_tool("summarize")
         assert isinstance(details, dict)
         assert "name" in details
         assert details["name"] == "summarize"
@@ -265,7 +265,7 @@ class TestFabricMCPCore(TestFixturesBase):
 
         # Step 3: Run pattern
         run_pattern_tool = getattr(mcp_tools["fabric_run_pattern"], "fn")
-        result = run_pattern_tool("test_pattern", "Test input")
+        result = await run_pattern_tool("test_pattern", "Test input")
         assert isinstance(result, dict)
         assert "output_format" in result
         assert "output_text" in result
@@ -131,7 +131,7 @@ class TransportTestBase:
         Expects connection error when Fabric API unavailable.
         """
         # Override environment to point to non-existent Fabric API
-        monkeypatch.setenv("FABRIC_BASE_URL", "http://localhost:99999")
+        monkeypatch.setenv("FABRIC_BASE_URL", f"http://localhost:{INVALID_PORT}")
         monkeypatch.setenv("FABRIC_API_KEY", "test")
 
         async with run_server(server_config, self.transport_type) as config:
@@ -186,6 +186,15 @@ class TransportTestBase:
     ) -> None:
         """Test fabric_run_pattern tool with streaming."""
         _ = mock_fabric_api_server  # eliminate unused variable warning
+        streamed: list[tuple[float, str]] = []
+
+        async def on_progress(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            _ = total  # unknown while streaming
+            if message is not None:
+                streamed.append((progress, message))
+
         async with run_server(server_config, self.transport_type) as config:
             url = self.get_server_url(config)
             client = self.create_client(url)
@@ -198,6 +207,7 @@ class TransportTestBase:
                         "input_text": "test input",
                         "stream": True,
                     },
+                    progress_handler=on_progress,
                 )
                 assert result is not None
                 assert isinstance(result, list)
@@ -205,6 +215,46 @@ class TransportTestBase:
                 assert len(result) > 0
                 self._validate_pattern_run_result(result)
 
+                # Every chunk was forwarded, in order, before the aggregated
+                # result: nothing may still be on its way once the call returns
+                received = list(streamed)
+                await asyncio.sleep(0.2)
+                assert streamed == received
+                assert len(received) > 1
+                sequence = [progress for progress, _ in received]
+                assert sequence == sorted(set(sequence))
+                output = json.loads(getattr(result[0], "text"))
+                assert "".join(text for _, text in received) == output["output_text"]
+
+    @pytest.mark.asyncio
+    async def test_fabric_run_pattern_batch_progress(
+        self, server_config: ServerConfig, mock_fabric_api_server: MockFabricAPIServer
+    ) -> None:
+        """Test batch progress arrives once per input, before the result."""
+        _ = mock_fabric_api_server  # eliminate unused variable warning
+        reported: list[tuple[float, float | None]] = []
+
+        async def on_progress(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            _ = message  # batch progress carries no text
+            reported.append((progress, total))
+
+        async with run_server(server_config, self.transport_type) as config:
+            client = self.create_client(self.get_server_url(config))
+
+            async with client:
+                result = await client.call_tool(
+                    "fabric_run_pattern_batch",
+                    {"pattern_name": "test_pattern", "inputs": ["a", "b", "c"]},
+                    progress_handler=on_progress,
+                )
+                received = list(reported)
+                await asyncio.sleep(0.2)
+
+        assert json.loads(getattr(result[0], "text"))["succeeded"] == 3
+        assert reported == received == [(1, 3), (2, 3), (3, 3)]
+
     @pytest.mark.asyncio
     async def test_fabric_run_pattern_with_model_name(
         self, server_config: ServerConfig, mock_fabric_api_server: MockFabricAPIServer
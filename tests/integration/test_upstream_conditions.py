@@ -0,0 +1,167 @@
+"""Integration tests of pattern runs against a slow or failing Fabric API.
+
+The mock Fabric API's /chat knobs (see tests/shared/fabric_api/chat_behavior)
+reproduce LLM timing and failures; these tests check that fabric-mcp streams,
+times and reports errors correctly under them.
+"""
+
+import json
+import random
+import time
+from collections.abc import Generator
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from fabric_mcp.core import FabricMCP
+from tests.shared.fabric_api.chat_behavior import ChatBehavior
+from tests.shared.fabric_api.utils import MockFabricAPIServer
+
+RUN_ARGS = {"pattern_name": "summarize", "input_text": "some input"}
+
+
+@pytest.fixture(scope="module", name="paced_fabric")
+def fixture_paced_fabric() -> Generator[MockFabricAPIServer, None, None]:
+    """A mock Fabric API whose /chat knobs each test sets."""
+    with MockFabricAPIServer(log_level="warning") as fabric:
+        yield fabric
+        fabric.set_chat_behavior(ChatBehavior())
+
+
+@pytest.fixture(name="server")
+def fixture_server(
+    paced_fabric: MockFabricAPIServer, monkeypatch: pytest.MonkeyPatch
+) -> FabricMCP:
+    """A FabricMCP server talking to the paced mock."""
+    monkeypatch.setenv("FABRIC_BASE_URL", paced_fabric.base_url)
+    monkeypatch.setenv("FABRIC_API_KEY", "")
+    return FabricMCP(log_level="WARNING")
+
+
+class TestChatBehaviorPlan:
+    """Test cases for how the mock plans its streamed chunks."""
+
+    def test_default_keeps_canned_chunks_without_delay(self):
+        """Test that the default behavior is the original instant stream."""
+        planned = ChatBehavior().plan(["a ", "b"], random.Random(0))
+        assert planned == [(0.0, "a "), (0.0, "b")]
+
+    def test_generated_output_is_paced_by_chunk_size(self):
+        """Test output length, chunk size range and per-token delays."""
+        behavior = ChatBehavior(
+            first_token_delay=0.5,
+            tokens_per_second=10,
+            chunk_tokens_min=2,
+            chunk_tokens_max=4,
+            output_tokens=50,
+        )
+
+        planned = behavior.plan([], random.Random(1))
+
+        texts = [text for _, text in planned]
+        sizes = [len(text.split()) for text in texts]
+        assert sum(sizes) == 50
+        assert all(2 <= size <= 4 for size in sizes[:-1])
+        assert planned[0][0] == 0.5
+        assert [delay for delay, _ in planned[1:]] == [s / 10 for s in sizes[1:]]
+
+    def test_jitter_spreads_delays_within_bounds(self):
+        """Test that jitter varies delays by at most the given fraction."""
+        behavior = ChatBehavior(tokens_per_second=100, jitter=0.5, output_tokens=200)
+
+        delays = [delay for delay, _ in behavior.plan([], random.Random(2))[1:]]
+
+        assert len(set(delays)) > 1
+        assert all(0.005 <= delay <= 0.015 for delay in delays)
+
+    def test_failures_are_drawn_at_the_configured_rates(self):
+        """Test error and disconnect rates over many requests."""
+        behavior = ChatBehavior(
+            error_500_rate=0.2, error_429_rate=0.3, disconnect_rate=1.0
+        )
+        rng = random.Random(3)
+
+        statuses = [behavior.injected_status(rng) for _ in range(2000)]
+
+        assert 0.15 < statuses.count(500) / 2000 < 0.25
+        assert 0.25 < statuses.count(429) / 2000 < 0.35
+        assert 1 <= (behavior.disconnect_after(5, rng) or 0) <= 4
+
+    def test_unknown_knobs_are_rejected(self):
+        """Test that typos in a behavior update are reported."""
+        with pytest.raises(ValueError, match="tokens_per_sec"):
+            ChatBehavior.from_dict({"tokens_per_sec": 5})
+
+
+class TestPacedFabric:
+    """Test cases for fabric-mcp against paced and failing /chat responses."""
+
+    @pytest.mark.asyncio
+    async def test_stream_follows_first_token_delay_and_rate(
+        self, paced_fabric: MockFabricAPIServer, server: FabricMCP
+    ):
+        """Test that chunks are forwarded as they arrive, not at the end."""
+        paced_fabric.set_chat_behavior(
+            ChatBehavior(
+                first_token_delay=0.3,
+                tokens_per_second=100,
+                chunk_tokens_min=5,
+                chunk_tokens_max=5,
+                output_tokens=50,
+            )
+        )
+        arrivals: list[float] = []
+
+        async def on_progress(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            _ = progress, total  # only the arrival time matters here
+            if message:
+                arrivals.append(time.perf_counter())
+
+        async with Client(server) as client:
+            started = time.perf_counter()
+            content = await client.call_tool(
+                "fabric_run_pattern",
+                {**RUN_ARGS, "stream": True},
+                progress_handler=on_progress,
+            )
+            finished = time.perf_counter()
+
+        output = json.loads(getattr(content[0], "text"))["output_text"]
+        assert len(output.split()) == 50
+        assert len(arrivals) == 10
+        assert arrivals[0] - started >= 0.3
+        # Nine more chunks of 5 tokens at 100 tokens/s take 0.45s
+        assert arrivals[-1] - arrivals[0] >= 0.4
+        assert finished - started >= 0.7
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("behavior", "message"),
+        [
+            (ChatBehavior(error_500_rate=1.0), "error 500"),
+            (ChatBehavior(error_429_rate=1.0), "error 429"),
+            (
+                ChatBehavior(
+                    disconnect_rate=1.0, chunk_tokens_max=1, tokens_per_second=1000
+                ),
+                "Unexpected error",
+            ),
+        ],
+        ids=["500", "429", "disconnect"],
+    )
+    async def test_injected_failures_become_tool_errors(
+        self,
+        paced_fabric: MockFabricAPIServer,
+        server: FabricMCP,
+        behavior: ChatBehavior,
+        message: str,
+    ):
+        """Test that upstream failures are reported instead of partial output."""
+        paced_fabric.set_chat_behavior(behavior)
+
+        async with Client(server) as client:
+            with pytest.raises(ToolError, match=message):
+                await client.call_tool("fabric_run_pattern", RUN_ARGS)
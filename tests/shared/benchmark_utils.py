@@ -0,0 +1,164 @@
+"""Shared helpers for timing and reporting performance benchmarks."""
+
+import json
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class LatencyStats:
+    """Summary statistics for a set of latency samples (in milliseconds)."""
+
+    name: str
+    samples: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    def format(self) -> str:
+        """Return a one-line, human readable summary."""
+        return (
+            f"{self.name:<40} n={self.samples:<6} mean={self.mean_ms:8.3f}ms "
+            f"p50={self.p50_ms:8.3f}ms p95={self.p95_ms:8.3f}ms "
+            f"p99={self.p99_ms:8.3f}ms"
+        )
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def summarize_latencies(name: str, samples_s: list[float]) -> LatencyStats:
+    """Build LatencyStats from raw samples measured in seconds."""
+    samples_ms = sorted(s * 1000.0 for s in samples_s)
+    count = len(samples_ms)
+    return LatencyStats(
+        name=name,
+        samples=count,
+        mean_ms=sum(samples_ms) / count if count else 0.0,
+        p50_ms=percentile(samples_ms, 50),
+        p95_ms=percentile(samples_ms, 95),
+        p99_ms=percentile(samples_ms, 99),
+    )
+
+
+def time_calls(fn: Callable[[], Any], iterations: int, warmup: int = 5) -> list[float]:
+    """Call fn repeatedly and return the per-call wall time in seconds."""
+    for _ in range(warmup):
+        fn()
+
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def time_async_calls(
+    fn: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 5
+) -> list[float]:
+    """Await fn repeatedly and return the per-call wall time in seconds."""
+    for _ in range(warmup):
+        await fn()
+
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+@dataclass
+class ThroughputResult:  # pylint: disable=too-many-instance-attributes
+    """One workload run at a fixed concurrency, as saved to a results file."""
+
+    transport: str
+    tool: str
+    concurrency: int
+    calls: int
+    errors: int
+    throughput_rps: float
+    latency: LatencyStats
+    ttft: LatencyStats | None = None
+
+    def format(self) -> str:
+        """Return a one-line, human readable summary."""
+        ttft = f" ttft p50={self.ttft.p50_ms:7.2f}ms" if self.ttft else ""
+        return (
+            f"{self.transport:<6} {self.tool:<34} c={self.concurrency:<3} "
+            f"{self.throughput_rps:8.1f} calls/s p50={self.latency.p50_ms:7.2f}ms "
+            f"p95={self.latency.p95_ms:7.2f}ms p99={self.latency.p99_ms:7.2f}ms"
+            f"{ttft} errors={self.errors}"
+        )
+
+
+def save_results(
+    path: Path, results: list[ThroughputResult], metadata: dict[str, Any]
+) -> None:
+    """Write benchmark results as JSON, for comparison with later runs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {"metadata": metadata, "results": [asdict(r) for r in results]}
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float = 0.25,
+    min_delta_ms: float = 1.0,
+) -> list[str]:
+    """List regressions of current against baseline, both loaded results files.
+
+    A workload regresses when its throughput drops, or its p95 latency or
+    p95 time to first token grows, by more than tolerance (a fraction).
+    Latency changes below min_delta_ms are ignored as noise. Workloads present
+    in only one of the files are skipped.
+    """
+
+    def by_key(document: dict[str, Any]) -> dict[tuple[str, str, int], Any]:
+        return {
+            (r["transport"], r["tool"], r["concurrency"]): r
+            for r in document["results"]
+        }
+
+    def slower(name: str, old: float, new: float) -> str | None:
+        if new - old > min_delta_ms and new > old * (1 + tolerance):
+            return f"{name} {old:.2f}ms -> {new:.2f}ms"
+        return None
+
+    old_results = by_key(baseline)
+    regressions: list[str] = []
+    for key, new in sorted(by_key(current).items()):
+        old = old_results.get(key)
+        if old is None:
+            continue
+        found: list[str] = []
+        if new["throughput_rps"] < old["throughput_rps"] * (1 - tolerance):
+            found.append(
+                f"throughput {old['throughput_rps']:.1f} -> "
+                f"{new['throughput_rps']:.1f} calls/s"
+            )
+        p95 = slower("p95", old["latency"]["p95_ms"], new["latency"]["p95_ms"])
+        if p95:
+            found.append(p95)
+        if old["ttft"] and new["ttft"]:
+            ttft = slower("ttft p95", old["ttft"]["p95_ms"], new["ttft"]["p95_ms"])
+            if ttft:
+                found.append(ttft)
+        if found:
+            transport, tool, concurrency = key
+            regressions.append(
+                f"{transport} {tool} c={concurrency}: {', '.join(found)}"
+            )
+    return regressions
@@ -0,0 +1,14 @@
+"""Shared clock utilities for testing."""
+
+
+class FakeClock:
+    """Manually advanced clock, for code that takes an injectable time source.
+
+    Set ``now`` to move time forward; calling the clock returns it.
+    """
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
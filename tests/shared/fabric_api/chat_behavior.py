@@ -0,0 +1,145 @@
+"""Timing and failure knobs for the mock Fabric API's /chat stream.
+
+By default the mock streams its canned response at once. A ChatBehavior makes
+it behave like a real LLM backend instead: a delay before the first token, a
+steady token rate with jitter, chunks of varying size, a chosen output length,
+and injected failures (500, 429 and connections dropped mid-stream).
+
+A behavior can be set when the mock starts (``MockFabricAPIServer`` or the
+``MOCK_FABRIC_*`` environment variables) and changed while it runs with
+``PUT /mock/chat-behavior``.
+"""
+
+import os
+import random
+import re
+from dataclasses import dataclass, fields
+from typing import Any
+
+ENV_PREFIX = "MOCK_FABRIC_"
+
+# A "token" of generated output: a short word and its trailing space
+_FILLER_WORDS = (
+    "the model streams tokens at a steady pace while the client waits for "
+    "each chunk to arrive and render"
+).split()
+
+
+class MockDisconnect(Exception):
+    """Raised inside the stream to drop the connection mid-response."""
+
+
+@dataclass(frozen=True)
+class ChatBehavior:  # pylint: disable=too-many-instance-attributes
+    """How the mock /chat endpoint paces and fails its SSE responses.
+
+    Attributes:
+        first_token_delay: Seconds before the first content chunk.
+        tokens_per_second: Output rate after the first chunk; 0 sends the
+            remaining chunks without delay.
+        chunk_tokens_min: Fewest tokens per content chunk.
+        chunk_tokens_max: Most tokens per content chunk; chunk sizes are drawn
+            uniformly from the range. 0 keeps the canned response's chunks.
+        jitter: Random spread of every delay, as a fraction (0.2 is +/-20%).
+        output_tokens: Length of a generated response in tokens; 0 sends the
+            canned response, which echoes the request parameters.
+        error_500_rate: Probability of answering 500 Internal Server Error.
+        error_429_rate: Probability of answering 429 Too Many Requests.
+        disconnect_rate: Probability of dropping the connection after the
+            first chunk, before the response is complete.
+        retry_after: Retry-After header of injected 429 responses, in seconds.
+        seed: Seed for the random choices, for reproducible runs.
+    """
+
+    first_token_delay: float = 0.0
+    tokens_per_second: float = 0.0
+    chunk_tokens_min: int = 1
+    chunk_tokens_max: int = 0
+    jitter: float = 0.0
+    output_tokens: int = 0
+    error_500_rate: float = 0.0
+    error_429_rate: float = 0.0
+    disconnect_rate: float = 0.0
+    retry_after: int = 1
+    seed: int | None = None
+
+    @classmethod
+    def from_env(cls) -> "ChatBehavior":
+        """Read knobs from MOCK_FABRIC_* variables, e.g. MOCK_FABRIC_JITTER."""
+        values: dict[str, Any] = {}
+        for field in fields(cls):
+            raw = os.environ.get(ENV_PREFIX + field.name.upper())
+            if raw:
+                values[field.name] = float(raw) if field.type is float else int(raw)
+        return cls(**values)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ChatBehavior":
+        """Build a behavior from a JSON object, rejecting unknown knobs."""
+        known = {field.name for field in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown chat behavior fields: {sorted(unknown)}")
+        return cls(**data)
+
+    def injected_status(self, rng: random.Random) -> int | None:
+        """The error status to answer with instead of streaming, if any."""
+        roll = rng.random()
+        if roll < self.error_500_rate:
+            return 500
+        if roll < self.error_500_rate + self.error_429_rate:
+            return 429
+        return None
+
+    def plan(
+        self, canned_chunks: list[str], rng: random.Random
+    ) -> list[tuple[float, str]]:
+        """The content chunks to send, each with the delay that precedes it.
+
+        Generated output and re-chunked canned output are split into chunks of
+        chunk_tokens_min..chunk_tokens_max tokens; otherwise the canned chunks
+        are sent as they are.
+        """
+        if self.output_tokens > 0:
+            tokens = [
+                _FILLER_WORDS[i % len(_FILLER_WORDS)] + " "
+                for i in range(self.output_tokens)
+            ]
+        elif self.chunk_tokens_max > 0:
+            tokens = re.findall(r"\S+\s*|\s+", "".join(canned_chunks))
+        else:
+            tokens = []
+
+        if tokens:
+            chunks: list[tuple[int, str]] = []
+            low = max(1, self.chunk_tokens_min)
+            high = max(low, self.chunk_tokens_max)
+            start = 0
+            while start < len(tokens):
+                piece = tokens[start : start + rng.randint(low, high)]
+                chunks.append((len(piece), "".join(piece)))
+                start += len(piece)
+        else:
+            chunks = [(1, chunk) for chunk in canned_chunks]
+
+        planned: list[tuple[float, str]] = []
+        for index, (size, text) in enumerate(chunks):
+            if index == 0:
+                delay = self.first_token_delay
+            elif self.tokens_per_second > 0:
+                delay = size / self.tokens_per_second
+            else:
+                delay = 0.0
+            planned.append((self._jittered(delay, rng), text))
+        return planned
+
+    def disconnect_after(self, chunk_count: int, rng: random.Random) -> int | None:
+        """How many chunks to send before dropping the connection, if at all."""
+        if chunk_count and rng.random() < self.disconnect_rate:
+            return rng.randint(1, max(1, chunk_count - 1))
+        return None
+
+    def _jittered(self, delay: float, rng: random.Random) -> float:
+        if delay <= 0 or self.jitter <= 0:
+            return delay
+        return max(0.0, delay * (1 + rng.uniform(-self.jitter, self.jitter)))
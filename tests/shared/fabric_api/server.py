@@ -6,20 +6,26 @@ API would serve, but with predictable mock data.
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import random
 import signal
 import sys
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from types import FrameType
 from typing import Any, cast
 
 import uvicorn
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from fabric_mcp import __version__ as fabric_mcp_version
 
+from .chat_behavior import ChatBehavior, MockDisconnect
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -226,6 +232,52 @@ app = FastAPI(
 )
 
 
+def configure_chat_behavior(behavior: ChatBehavior) -> None:
+    """Set the pacing and failure knobs of the /chat endpoint."""
+    app.state.chat_behavior = behavior
+    app.state.chat_rng = random.Random(behavior.seed)
+
+
+configure_chat_behavior(ChatBehavior.from_env())
+
+
+def _chat_behavior() -> ChatBehavior:
+    return app.state.chat_behavior
+
+
+def _injected_error(behavior: ChatBehavior, rng: random.Random) -> Response | None:
+    """An error response to send instead of the stream, if one is drawn."""
+    status = behavior.injected_status(rng)
+    if status == 429:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": "Injected rate limit"},
+            headers={"Retry-After": str(behavior.retry_after)},
+        )
+    if status is not None:
+        return JSONResponse(
+            status_code=status, content={"detail": "Injected internal error"}
+        )
+    return None
+
+
+@app.get("/mock/chat-behavior")
+async def get_chat_behavior() -> dict[str, Any]:
+    """Return the current /chat knobs (a test-only endpoint)."""
+    return asdict(_chat_behavior())
+
+
+@app.put("/mock/chat-behavior")
+async def put_chat_behavior(knobs: dict[str, Any]) -> dict[str, Any]:
+    """Replace the /chat knobs; omitted knobs return to their defaults."""
+    try:
+        configure_chat_behavior(ChatBehavior.from_dict(knobs))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    logger.info("Chat behavior set to %s", _chat_behavior())
+    return asdict(_chat_behavior())
+
+
 @app.get("/")
 async def root():
     """Root endpoint for health checks."""
@@ -328,7 +380,7 @@ async def list_empty_models():
 
 
 @app.post("/chat")
-async def chat_endpoint(request_data: dict[str, Any]) -> StreamingResponse:
+async def chat_endpoint(request_data: dict[str, Any]) -> Response:
     """Execute a chat request with patterns (streaming).
 
     This mimics the real Fabric API endpoint POST /chat that handles
@@ -425,8 +477,14 @@ async def chat_endpoint(request_data: dict[str, Any]) -> StreamingResponse:
         temperature,
     )
 
-    def generate_sse_stream():
-        """Generate Server-Sent Events stream with parameter-dependent responses."""
+    behavior = _chat_behavior()
+    rng: random.Random = app.state.chat_rng
+    error = _injected_error(behavior, rng)
+    if error is not None:
+        return error
+
+    def mock_content_chunks() -> list[str]:
+        """Parameter-dependent canned response chunks."""
         # Create parameter-aware response content
         param_info: list[str] = []
         if strategy_name:
@@ -445,7 +503,7 @@ async def chat_endpoint(request_data: dict[str, Any]) -> StreamingResponse:
         param_str = f" [{', '.join(param_info)}]" if param_info else ""
 
         # Mock streaming response chunks that reflect execution parameters
-        mock_content_chunks: list[str] = [
+        chunks: list[str] = [
             f"Mock {pattern_name} output{param_str} for: ",
             user_input[:30] if user_input else "empty input",
             f"...\n\nExecuted with {vendor}/{model_name}",
@@ -453,20 +511,23 @@ async def chat_endpoint(request_data: dict[str, Any]) -> StreamingResponse:
 
         # Add strategy-specific content
         if strategy_name == "creative":
-            mock_content_chunks.append(
-                "\n\n*Creative strategy applied - more diverse output*"
-            )
+            chunks.append("\n\n*Creative strategy applied - more diverse output*")
         elif strategy_name == "focused":
-            mock_content_chunks.append(
-                "\n\n*Focused strategy applied - precise output*"
-            )
+            chunks.append("\n\n*Focused strategy applied - precise output*")
         elif strategy_name == "analytical":
-            mock_content_chunks.append(
-                "\n\n*Analytical strategy applied - logical reasoning*"
-            )
-
-        # Send content chunks
-        for chunk in mock_content_chunks:
+            chunks.append("\n\n*Analytical strategy applied - logical reasoning*")
+        return chunks
+
+    planned = behavior.plan(mock_content_chunks(), rng)
+    disconnect_after = behavior.disconnect_after(len(planned), rng)
+
+    async def generate_sse_stream() -> AsyncGenerator[str, None]:
+        """Generate Server-Sent Events stream, paced as configured."""
+        for sent, (delay, chunk) in enumerate(planned):
+            if sent == disconnect_after:
+                raise MockDisconnect(f"Injected disconnect after {sent} chunks")
+            if delay > 0:
+                await asyncio.sleep(delay)
             sse_data: dict[str, str] = {
                 "type": "content",
                 "content": chunk,
@@ -474,6 +535,9 @@ async def chat_endpoint(request_data: dict[str, Any]) -> StreamingResponse:
             }
             yield f"data: {json.dumps(sse_data)}\n\n"
 
+        if disconnect_after == len(planned):
+            raise MockDisconnect(f"Injected disconnect after {len(planned)} chunks")
+
         # Send completion signal
         completion_data: dict[str, str] = {"type": "complete"}
         yield f"data: {json.dumps(completion_data)}\n\n"
@@ -547,7 +611,20 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Mock Fabric API Server")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8080, help="Port to bind to")
+    # /chat pacing and failure knobs; defaults come from MOCK_FABRIC_* variables
+    defaults = ChatBehavior.from_env()
+    for knob, value in asdict(defaults).items():
+        parser.add_argument(
+            f"--{knob.replace('_', '-')}",
+            dest=knob,
+            type=float if isinstance(value, float) else int,
+            default=value,
+            help=f"/chat {knob.replace('_', ' ')} (default: {value})",
+        )
 
     args = parser.parse_args()
+    configure_chat_behavior(
+        ChatBehavior(**{knob: getattr(args, knob) for knob in asdict(defaults)})
+    )
 
     run_server(host=args.host, port=args.port)
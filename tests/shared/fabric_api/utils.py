@@ -11,13 +11,16 @@ import signal
 import time
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from types import FrameType, TracebackType
 
+import httpx
 import pytest
 import uvicorn
 
 from ..port_utils import find_free_port, is_port_in_use
-from .server import app
+from .chat_behavior import ChatBehavior
+from .server import app, configure_chat_behavior
 
 logger = logging.getLogger(__name__)
 
@@ -32,21 +35,29 @@ def wait_for_server(host: str, port: int, timeout: float = 10.0) -> bool:
     return False
 
 
-def run_mock_server_process(host: str, port: int) -> None:
+def run_mock_server_process(
+    host: str,
+    port: int,
+    log_level: str = "info",
+    chat_behavior: ChatBehavior | None = None,
+) -> None:
     """Run the mock server in a separate process."""
+    if chat_behavior is not None:
+        configure_chat_behavior(chat_behavior)
 
     # Configure logging for the subprocess
     logging.basicConfig(
         level=logging.INFO,
         format="[Mock API] %(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
+    logging.getLogger().setLevel(log_level.upper())
 
     # Configure uvicorn
     config = uvicorn.Config(
         app=app,
         host=host,
         port=port,
-        log_level="info",
+        log_level=log_level,
         access_log=False,  # Reduce noise in tests
         loop="asyncio",
     )
@@ -69,15 +80,27 @@ def run_mock_server_process(host: str, port: int) -> None:
 class MockFabricAPIServer:
     """Context manager for running a mock Fabric API server during tests."""
 
-    def __init__(self, host: str = "127.0.0.1", port: int | None = None):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        log_level: str = "info",
+        chat_behavior: ChatBehavior | None = None,
+    ):
         """Initialize the mock server manager.
 
         Args:
             host: Host to bind the server to
             port: Port to bind the server to. If None, a free port will be found.
+            log_level: Log level of the server process; benchmarks use "warning"
+                to keep per-request logging out of the measurements.
+            chat_behavior: Pacing and failure knobs for /chat. If None, they
+                are read from the MOCK_FABRIC_* environment variables.
         """
         self.host = host
         self.port = port or find_free_port()
+        self.log_level = log_level
+        self.chat_behavior = chat_behavior
         self.process: multiprocessing.Process | None = None
 
     def start(self) -> None:
@@ -89,7 +112,9 @@ class MockFabricAPIServer:
 
         # Start server in separate process
         self.process = multiprocessing.Process(
-            target=run_mock_server_process, args=(self.host, self.port), daemon=True
+            target=run_mock_server_process,
+            args=(self.host, self.port, self.log_level, self.chat_behavior),
+            daemon=True,
         )
         self.process.start()
         # Wait for server to be ready
@@ -138,6 +163,13 @@ class MockFabricAPIServer:
         """Context manager exit."""
         self.stop()
 
+    def set_chat_behavior(self, behavior: ChatBehavior) -> None:
+        """Change the /chat pacing and failure knobs of the running server."""
+        response = httpx.put(
+            f"{self.base_url}/mock/chat-behavior", json=asdict(behavior), timeout=5.0
+        )
+        response.raise_for_status()
+
     @property
     def base_url(self) -> str:
         """Get the base URL for the mock server."""
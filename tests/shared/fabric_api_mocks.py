@@ -4,18 +4,26 @@ This module provides a single, consistent interface for mocking FabricApiClient
 across all test files, eliminating code duplication and improving maintainability.
 """
 
+import asyncio
 import json
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from contextlib import asynccontextmanager, contextmanager
 from json import JSONDecodeError
 from typing import Any
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import httpx
 import pytest
 from mcp import McpError
 from mcp.types import INTERNAL_ERROR
 
+from fabric_mcp.fabric_tools import FabricToolsMixin
+
+
+def sse_event_bytes(line: str) -> bytes:
+    """Encode one SSE line as a complete event, as Fabric writes it on the wire."""
+    return f"{line}\n\n".encode()
+
 
 class FabricApiMockBuilder:
     """Comprehensive builder for FabricApiClient mocks supporting all API patterns."""
@@ -24,15 +32,41 @@ class FabricApiMockBuilder:
         """Initialize builder with sensible defaults."""
         self.mock_api_client = Mock()
         self.mock_response = Mock()
+        self.sse_lines: list[str] = []
+        self.sse_gate: asyncio.Event | None = None
+        self.chat_handler: Callable[[dict[str, Any]], Awaitable[str]] | None = None
+        self.stream_error: Exception | None = None
         self._configure_defaults()
 
     def _configure_defaults(self) -> None:
         """Configure default behavior for the mock."""
-        # Default to successful response behavior
-        self.mock_api_client.get.return_value = self.mock_response
-        self.mock_api_client.post.return_value = self.mock_response
+        # Default to successful response behavior (the client API is async)
+        self.mock_api_client.get = AsyncMock(return_value=self.mock_response)
+        self.mock_api_client.post = AsyncMock(return_value=self.mock_response)
+        self.mock_api_client.stream = Mock(side_effect=self._open_stream)
+        self.mock_api_client.close = AsyncMock()
         self.mock_response.json.return_value = {}
-        self.mock_response.iter_lines.return_value = []
+        self.mock_response.aiter_bytes = Mock(side_effect=self._aiter_sse_bytes)
+
+    @asynccontextmanager
+    async def _open_stream(
+        self, *_args: Any, **kwargs: Any
+    ) -> AsyncGenerator[Mock, None]:
+        """Stand in for FabricApiClient.stream()."""
+        if self.stream_error is not None:
+            raise self.stream_error
+        if self.chat_handler is not None:
+            output = await self.chat_handler(kwargs["json_data"])
+            yield FabricApiMockBuilder().with_successful_sse(output).mock_response
+            return
+        yield self.mock_response
+
+    async def _aiter_sse_bytes(self) -> AsyncGenerator[bytes, None]:
+        """Stand in for httpx.Response.aiter_bytes(), one event per configured line."""
+        if self.sse_gate is not None:
+            await self.sse_gate.wait()
+        for line in self.sse_lines:
+            yield sse_event_bytes(line)
 
     # Methods for configuring JSON API responses (GET endpoints)
     def with_json_response(self, json_data: dict[str, Any]) -> "FabricApiMockBuilder":
@@ -185,7 +219,7 @@ class FabricApiMockBuilder:
         Returns:
             Self for method chaining
         """
-        self.mock_response.iter_lines.return_value = lines
+        self.sse_lines = lines
         return self
 
     def with_successful_sse(
@@ -215,6 +249,35 @@ class FabricApiMockBuilder:
         ]
         return self.with_sse_lines(lines)
 
+    def with_sse_gate(self, gate: asyncio.Event) -> "FabricApiMockBuilder":
+        """Hold back the SSE stream until the gate event is set.
+
+        Args:
+            gate: Event that releases the stream; until then the /chat call
+                stays in flight
+
+        Returns:
+            Self for method chaining
+        """
+        self.sse_gate = gate
+        return self
+
+    def with_chat_handler(
+        self, handler: Callable[[dict[str, Any]], Awaitable[str]]
+    ) -> "FabricApiMockBuilder":
+        """Answer each /chat stream with output computed from its request.
+
+        Args:
+            handler: Async function receiving the /chat JSON payload and
+                returning the output text; exceptions it raises propagate from
+                the stream call
+
+        Returns:
+            Self for method chaining
+        """
+        self.chat_handler = handler
+        return self
+
     def with_sse_error(self, error_message: str) -> "FabricApiMockBuilder":
         """Configure mock to return SSE error response.
 
@@ -261,6 +324,7 @@ class FabricApiMockBuilder:
         connection_error = httpx.ConnectError(error_message)
         self.mock_api_client.get.side_effect = connection_error
         self.mock_api_client.post.side_effect = connection_error
+        self.stream_error = connection_error
         return self
 
     def with_timeout_error(self) -> "FabricApiMockBuilder":
@@ -272,6 +336,7 @@ class FabricApiMockBuilder:
         timeout_error = httpx.TimeoutException("Request timed out")
         self.mock_api_client.get.side_effect = timeout_error
         self.mock_api_client.post.side_effect = timeout_error
+        self.stream_error = timeout_error
         return self
 
     def with_http_error(
@@ -297,6 +362,7 @@ class FabricApiMockBuilder:
         )
         self.mock_api_client.get.side_effect = http_error
         self.mock_api_client.post.side_effect = http_error
+        self.stream_error = http_error
         return self
 
     def with_unexpected_error(self, error: Exception) -> "FabricApiMockBuilder":
@@ -310,6 +376,7 @@ class FabricApiMockBuilder:
         """
         self.mock_api_client.get.side_effect = error
         self.mock_api_client.post.side_effect = error
+        self.stream_error = error
         return self
 
     def build(self) -> Mock:
@@ -338,16 +405,41 @@ def mock_fabric_api_client(
 
     mock_api_client = builder.build()
 
-    # Patch both import locations where FabricApiClient is used
+    # Patch both import locations where FabricApiClient is used, plus the
+    # shared-client accessor so a server that already created its pooled client
+    # still picks up this mock
     with (
         patch("fabric_mcp.fabric_tools.FabricApiClient") as mock_api_client_class1,
         patch("fabric_mcp.core.FabricApiClient") as mock_api_client_class2,
+        patch.object(FabricToolsMixin, "_get_api_client", return_value=mock_api_client),
     ):
         mock_api_client_class1.return_value = mock_api_client
         mock_api_client_class2.return_value = mock_api_client
         yield mock_api_client
 
 
+MCP_REQUEST_ID = "request-1"
+
+
+def mock_mcp_context(progress_token: str | int | None = "progress-token") -> Mock:
+    """Build a stand-in for fastmcp.Context that records notifications.
+
+    Args:
+        progress_token: Progress token carried by the request meta, or None when
+            the client did not ask for progress notifications.
+
+    Returns:
+        Mock whose session (``ctx.request_context.session``) has AsyncMock
+        send_progress_notification() and send_log_message() methods.
+    """
+    ctx = Mock()
+    ctx.request_id = MCP_REQUEST_ID
+    ctx.request_context.meta.progressToken = progress_token
+    ctx.request_context.session.send_progress_notification = AsyncMock()
+    ctx.request_context.session.send_log_message = AsyncMock()
+    return ctx
+
+
 # Pytest fixtures for common scenarios
 @pytest.fixture
 def mock_successful_fabric_api() -> Generator[Mock, None, None]:
@@ -412,7 +504,7 @@ def assert_mcp_error(
 
 
 # Helper function for testing error scenarios with consistent pattern
-def test_error_scenario(
+async def test_error_scenario(
     mock_api_client_class: MagicMock,
     test_function: Any,
     error_config_func: str,
@@ -441,13 +533,13 @@ def test_error_scenario(
 
     # Act & Assert
     with pytest.raises(McpError) as exc_info:
-        test_function()
+        await test_function()
 
     assert_mcp_error(exc_info, error_code, error_message_contains)
 
 
 # Helper function for testing unexpected error scenarios
-def assert_unexpected_error_test(
+async def assert_unexpected_error_test(
     test_function: Any, error_message_contains: str
 ) -> None:
     """Helper function for testing unexpected error scenarios.
@@ -464,7 +556,7 @@ def assert_unexpected_error_test(
     # Act & Assert
     with mock_fabric_api_client(builder):
         with pytest.raises(McpError) as exc_info:
-            test_function()
+            await test_function()
 
     assert exc_info.value.error.code == INTERNAL_ERROR
     assert error_message_contains in str(exc_info.value.error.message)
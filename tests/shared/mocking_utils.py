@@ -2,7 +2,7 @@
 
 import json
 from typing import Any
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import httpx
 import pytest
@@ -23,7 +23,9 @@ class FabricApiMockBuilder:
         self.mock_api_client = Mock()
         self.mock_api_client_class.return_value = self.mock_api_client
         self.mock_response = Mock()
-        self.mock_api_client.get.return_value = self.mock_response
+        # The client API is async
+        self.mock_api_client.get = AsyncMock(return_value=self.mock_response)
+        self.mock_api_client.close = AsyncMock()
 
     def with_successful_response(self, json_data: Any) -> "FabricApiMockBuilder":
         """Configure mock for successful API response.
@@ -166,11 +168,11 @@ def assert_api_client_calls(
         assert mock_api_client.get.call_count == call_count
         mock_api_client.get.assert_called_with(expected_endpoint)
 
-    mock_api_client.close.assert_called_once()
+    mock_api_client.close.assert_not_called()
 
 
 # Test helper functions to eliminate duplicate code patterns
-def assert_connection_error_test(
+async def assert_connection_error_test(
     mock_api_client_class: MagicMock,
     test_function: Any,
     error_message_contains: str = "Failed to connect to Fabric API",
@@ -190,12 +192,12 @@ def assert_connection_error_test(
 
     # Act & Assert
     with pytest.raises(McpError) as exc_info:
-        test_function()
+        await test_function()
 
     assert error_message_contains in str(exc_info.value.error.message)
 
 
-def assert_unexpected_error_test(
+async def assert_unexpected_error_test(
     mock_api_client_class: MagicMock, test_function: Any, error_message_contains: str
 ) -> None:
     """Helper function for testing unexpected error scenarios.
@@ -213,7 +215,7 @@ def assert_unexpected_error_test(
 
     # Act & Assert
     with pytest.raises(McpError) as exc_info:
-        test_function()
+        await test_function()
 
     assert exc_info.value.error.code == INTERNAL_ERROR
     assert error_message_contains in str(exc_info.value.error.message)
@@ -9,8 +9,10 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
+import uvicorn
 
-from fabric_mcp.core import DEFAULT_MCP_HTTP_PATH
+from fabric_mcp.core import DEFAULT_MCP_HTTP_PATH, FabricMCP
+from tests.shared.port_utils import find_free_port
 
 # Type aliases for better readability
 ServerConfig = dict[str, Any]
@@ -128,12 +130,46 @@ async def run_server(
                     server_process.wait(timeout=1.0)
 
 
+@asynccontextmanager
+async def serve_http_in_process(server: FabricMCP) -> AsyncGenerator[str, None]:
+    """Serve server over streamable HTTP in this event loop; yields its URL.
+
+    Unlike run_server, the server object stays inspectable (and patchable) from
+    the test. Its HTTP app is shut down, running the lifespan's shutdown, on exit.
+    """
+    port = find_free_port()
+    config = uvicorn.Config(
+        server.http_app(path=DEFAULT_MCP_HTTP_PATH),
+        host="127.0.0.1",
+        port=port,
+        lifespan="on",
+        ws="none",
+        log_level="warning",
+    )
+    http_server = uvicorn.Server(config)
+    serving = asyncio.create_task(http_server.serve())
+    try:
+        while not http_server.started:
+            if serving.done():
+                serving.result()  # Raise why the server did not start
+            await asyncio.sleep(0.01)
+        yield f"http://127.0.0.1:{port}{DEFAULT_MCP_HTTP_PATH}"
+    finally:
+        http_server.should_exit = True
+        await serving
+
+
 def get_expected_tools() -> list[str]:
     """Get the list of expected Fabric tools."""
     return [
         "fabric_list_patterns",
         "fabric_get_pattern_details",
+        "fabric_search_patterns",
         "fabric_run_pattern",
+        "fabric_run_pattern_batch",
+        "fabric_run_pipeline",
+        "fabric_run_pattern_fanout",
+        "fabric_run_pattern_mapreduce",
         "fabric_list_models",
         "fabric_list_strategies",
         "fabric_get_configuration",
@@ -0,0 +1,175 @@
+"""Unit tests for admission control of pattern execution."""
+
+import asyncio
+
+import pytest
+from mcp.shared.exceptions import McpError
+
+from fabric_mcp.admission import AdmissionController, AdmissionRejectedError
+from fabric_mcp.constants import SERVER_BUSY
+from fabric_mcp.core import FabricMCP
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+)
+
+
+async def hold_slot(
+    controller: AdmissionController, release: asyncio.Event, order: list[int], n: int
+) -> None:
+    """Take a slot, record the admission order and hold it until released."""
+    async with controller.slot():
+        order.append(n)
+        await release.wait()
+
+
+class TestAdmissionController:
+    """Test the AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_and_admits_in_fifo_order(self):
+        """Test that waiting callers get slots in arrival order."""
+        controller = AdmissionController(
+            max_concurrent=2, max_queue=10, queue_timeout=5
+        )
+        release = asyncio.Event()
+        order: list[int] = []
+
+        tasks = [
+            asyncio.create_task(hold_slot(controller, release, order, n))
+            for n in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        assert order == [0, 1]
+        assert controller.stats.in_flight == 2
+        assert controller.stats.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+        stats = controller.stats
+        assert (stats.admitted, stats.queued, stats.in_flight) == (5, 3, 0)
+        assert (stats.queue_depth, stats.max_queue_depth) == (0, 3)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_immediately(self):
+        """Test that a caller arriving to a full queue is turned away at once."""
+        controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+        tasks = [
+            asyncio.create_task(hold_slot(controller, release, [], n)) for n in range(2)
+        ]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire()
+
+        assert exc_info.value.reason == "queue_full"
+        assert controller.stats.rejected_queue_full == 1
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects_and_leaves_queue(self):
+        """Test that a caller waiting too long is rejected and dequeued."""
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=5, queue_timeout=0.01
+        )
+        await controller.acquire()
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire()
+
+        assert exc_info.value.reason == "queue_timeout"
+        assert controller.stats.rejected_queue_timeout == 1
+        assert controller.stats.queue_depth == 0
+        controller.release()
+        assert controller.stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        """Test that cancelling a queued caller keeps the slot count right."""
+        controller = AdmissionController(max_concurrent=1, max_queue=5, queue_timeout=5)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        controller.release()
+
+        assert controller.stats.in_flight == 0
+        assert controller.stats.queue_depth == 0
+        await asyncio.wait_for(controller.acquire(), 1)
+
+    @pytest.mark.asyncio
+    async def test_wait_time_is_recorded(self):
+        """Test that time spent queued shows up in the wait metrics."""
+        now = [0.0]
+        waits: list[float] = []
+        controller = AdmissionController(
+            max_concurrent=1,
+            max_queue=5,
+            queue_timeout=5,
+            clock=lambda: now[0],
+            on_admit=waits.append,
+        )
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0.01)
+
+        now[0] = 2.5
+        controller.release()
+        await waiter
+
+        stats = controller.stats.as_dict()
+        assert stats["max_wait_seconds"] == 2.5
+        assert stats["mean_wait_seconds"] == 1.25
+        assert waits == [0.0, 2.5]
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_disables_admission_control(self):
+        """Test that max_concurrent=0 never queues or rejects."""
+        controller = AdmissionController(max_concurrent=0, max_queue=0, queue_timeout=0)
+        for _ in range(100):
+            await controller.acquire()
+
+        assert not controller.enabled
+        assert controller.stats.in_flight == 100
+
+
+class TestPatternAdmission(TestFixturesBase):
+    """Test admission control of fabric_run_pattern."""
+
+    @pytest.mark.asyncio
+    async def test_run_pattern_rejected_when_server_is_busy(
+        self, server: FabricMCP, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that excess runs fail fast with a SERVER_BUSY McpError."""
+        monkeypatch.setenv("FABRIC_MCP_MAX_CONCURRENT_PATTERNS", "1")
+        monkeypatch.setenv("FABRIC_MCP_PATTERN_QUEUE_SIZE", "1")
+        release = asyncio.Event()
+        builder = (
+            FabricApiMockBuilder().with_successful_sse("done").with_sse_gate(release)
+        )
+
+        with mock_fabric_api_client(builder) as mock_client:
+            running = [
+                asyncio.create_task(server.fabric_run_pattern("summarize", f"in {n}"))
+                for n in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            with pytest.raises(McpError) as exc_info:
+                await server.fabric_run_pattern("summarize", "one too many")
+            release.set()
+            results = await asyncio.gather(*running)
+
+        assert exc_info.value.error.code == SERVER_BUSY
+        assert "at capacity" in exc_info.value.error.message
+        assert [r["output_text"] for r in results] == ["done", "done"]
+        assert mock_client.stream.call_count == 2
+        stats = server.get_admission_stats()
+        assert (stats.admitted, stats.queued, stats.rejected_queue_full) == (2, 1, 1)
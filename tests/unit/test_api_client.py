@@ -1,7 +1,10 @@
 """Unit tests for fabric_mcp.api_client module."""
 
+import asyncio
+import json
 import os
-from unittest.mock import Mock, patch
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
@@ -28,7 +31,7 @@ class TestFabricApiClientInitialization:
         assert client.base_url == DEFAULT_BASE_URL
         assert client.api_key is None
         assert client.timeout == DEFAULT_TIMEOUT
-        assert isinstance(client.client, httpx.Client)
+        assert isinstance(client.client, httpx.AsyncClient)
 
     def test_init_with_parameters(self):
         """Test client initialization with explicit parameters."""
@@ -104,10 +107,11 @@ class TestFabricApiClientConfiguration:
 class TestFabricApiClientErrorHandling:
     """Test cases for error handling via public methods."""
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_request_handles_request_error(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_request_handles_request_error(self, mock_client_class: Mock):
         """Test that requests handle httpx.RequestError."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_client.request.side_effect = httpx.RequestError("Connection failed")
         mock_client.headers = {}
         mock_client_class.return_value = mock_client
@@ -115,12 +119,13 @@ class TestFabricApiClientErrorHandling:
         client = FabricApiClient()
 
         with pytest.raises(httpx.RequestError):
-            client.get("/test")
+            await client.get("/test")
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_request_handles_http_status_error(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_request_handles_http_status_error(self, mock_client_class: Mock):
         """Test that requests handle httpx.HTTPStatusError."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -133,16 +138,17 @@ class TestFabricApiClientErrorHandling:
         client = FabricApiClient()
 
         with pytest.raises(httpx.HTTPStatusError):
-            client.get("/test")
+            await client.get("/test")
 
 
 class TestFabricApiClientPublicMethods:
     """Test cases for public HTTP methods."""
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_get_method_without_params(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_get_method_without_params(self, mock_client_class: Mock):
         """Test GET method without parameters to cover default config creation."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 200
         mock_client.request.return_value = mock_response
@@ -150,7 +156,9 @@ class TestFabricApiClientPublicMethods:
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        result = client.get("/test")  # No params, should create default RequestConfig
+        result = await client.get(
+            "/test"
+        )  # No params, should create default RequestConfig
 
         assert result == mock_response
         call_args = mock_client.request.call_args
@@ -158,10 +166,11 @@ class TestFabricApiClientPublicMethods:
         assert call_args[1]["url"] == "/test"
         assert call_args[1]["params"] is None
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_get_method(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_get_method(self, mock_client_class: Mock):
         """Test GET method."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 200
         mock_client.request.return_value = mock_response
@@ -169,7 +178,7 @@ class TestFabricApiClientPublicMethods:
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        result = client.get("/test", params={"key": "value"})
+        result = await client.get("/test", params={"key": "value"})
 
         assert result == mock_response
         call_args = mock_client.request.call_args
@@ -177,10 +186,11 @@ class TestFabricApiClientPublicMethods:
         assert call_args[1]["url"] == "/test"
         assert call_args[1]["params"] == {"key": "value"}
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_post_method(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_post_method(self, mock_client_class: Mock):
         """Test POST method."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 201
         mock_client.request.return_value = mock_response
@@ -188,39 +198,50 @@ class TestFabricApiClientPublicMethods:
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        result = client.post("/test", json_data={"key": "value"})
+        result = await client.post("/test", json_data={"key": "value"})
 
         assert result == mock_response
         call_args = mock_client.request.call_args
         assert call_args[1]["method"] == "POST"
         assert call_args[1]["url"] == "/test"
-        assert call_args[1]["json"] == {"key": "value"}
-
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_post_method_with_headers(self, mock_client_class: Mock):
-        """Test POST method with custom headers to cover header update logic."""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_client.request.return_value = mock_response
-        mock_client.headers = {"Default": "header"}
-        mock_client_class.return_value = mock_client
-
-        client = FabricApiClient()
-        result = client.post(
-            "/test", json_data={"key": "value"}, headers={"Custom": "header"}
+        assert json.loads(call_args[1]["content"]) == {"key": "value"}
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_post_method_with_headers(self):
+        """Test that custom headers are sent along with the client defaults."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(201)
+
+        client = FabricApiClient(base_url="http://fabric.test", api_key="secret")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url,
+            headers=client.client.headers,
+            transport=httpx.MockTransport(handler),
         )
-
-        assert result == mock_response
-        call_args = mock_client.request.call_args
+        try:
+            result = await client.post(
+                "/test", json_data={"key": "value"}, headers={"Custom": "header"}
+            )
+        finally:
+            await client.close()
+
+        assert result.status_code == 201
         # Should have both default and custom headers
-        assert "Default" in call_args[1]["headers"]
-        assert "Custom" in call_args[1]["headers"]
-
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_post_method_with_raw_data(self, mock_client_class: Mock):
+        headers = sent[0].headers
+        assert headers["Custom"] == "header"
+        assert headers[FabricApiClient.FABRIC_API_HEADER] == "secret"
+        assert headers["User-Agent"].startswith("FabricMCPClient/")
+        assert headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_post_method_with_raw_data(self, mock_client_class: Mock):
         """Test POST method with raw data to cover raw data logging."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 201
         mock_client.request.return_value = mock_response
@@ -228,16 +249,19 @@ class TestFabricApiClientPublicMethods:
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        result = client.post("/test", data=b"raw binary data")
+        result = await client.post("/test", data=b"raw binary data")
 
         assert result == mock_response
         call_args = mock_client.request.call_args
         assert call_args[1]["data"] == b"raw binary data"
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_post_method_with_api_key_header_masking(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_post_method_with_api_key_header_masking(
+        self, mock_client_class: Mock
+    ):
         """Test that API key headers are masked in logs."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 201
         mock_client.request.return_value = mock_response
@@ -247,7 +271,7 @@ class TestFabricApiClientPublicMethods:
         client = FabricApiClient(api_key="secret-key")
 
         with patch("fabric_mcp.api_client.logger") as mock_logger:
-            result = client.post("/test", json_data={"key": "value"})
+            result = await client.post("/test", json_data={"key": "value"})
 
             # Check that logger.debug was called and API key was masked
             mock_logger.debug.assert_called()
@@ -267,10 +291,50 @@ class TestFabricApiClientPublicMethods:
 
         assert result == mock_response
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_put_method(self, mock_client_class: Mock):
+    @staticmethod
+    def _mock_transport_client() -> FabricApiClient:
+        client = FabricApiClient(base_url="http://fabric.test", api_key="secret-key")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url,
+            headers=client.client.headers,
+            transport=httpx.MockTransport(lambda _: httpx.Response(200)),
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_debug_log_redacts_lowercased_httpx_headers(self):
+        """Test that the API key is masked although httpx lower-cases names."""
+        client = self._mock_transport_client()
+
+        with patch("fabric_mcp.api_client.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = True
+            await client.get("/test")
+        await client.close()
+
+        logged = " ".join(str(call) for call in mock_logger.debug.call_args_list)
+        assert "secret-key" not in logged
+        assert "***REDACTED***" in logged
+
+    @pytest.mark.asyncio
+    async def test_request_logging_is_skipped_above_debug(self):
+        """Test that the request headers are not copied for logging at INFO."""
+        client = self._mock_transport_client()
+
+        with (
+            patch("fabric_mcp.api_client.logger") as mock_logger,
+            patch.object(client, "_log_request") as log_request,
+        ):
+            mock_logger.isEnabledFor.return_value = False
+            await client.post("/test", json_data={"key": "value"})
+        await client.close()
+
+        log_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_put_method(self, mock_client_class: Mock):
         """Test PUT method."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 200
         mock_client.request.return_value = mock_response
@@ -278,16 +342,17 @@ class TestFabricApiClientPublicMethods:
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        result = client.put("/test", json_data={"key": "value"})
+        result = await client.put("/test", json_data={"key": "value"})
 
         assert result == mock_response
         call_args = mock_client.request.call_args
         assert call_args[1]["method"] == "PUT"
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_delete_method(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_delete_method(self, mock_client_class: Mock):
         """Test DELETE method."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.status_code = 204
         mock_client.request.return_value = mock_response
@@ -295,22 +360,101 @@ class TestFabricApiClientPublicMethods:
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        result = client.delete("/test")
+        result = await client.delete("/test")
 
         assert result == mock_response
         call_args = mock_client.request.call_args
         assert call_args[1]["method"] == "DELETE"
 
-    @patch("fabric_mcp.api_client.httpx.Client")
-    def test_close_method(self, mock_client_class: Mock):
+    @pytest.mark.asyncio
+    @patch("fabric_mcp.api_client.httpx.AsyncClient")
+    async def test_close_method(self, mock_client_class: Mock):
         """Test close method."""
-        mock_client = Mock()
+        mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
 
         client = FabricApiClient()
-        client.close()
+        await client.close()
 
-        mock_client.close.assert_called_once()
+        mock_client.aclose.assert_called_once()
+
+
+class TestFabricApiClientStreaming:
+    """Test cases for FabricApiClient.stream()."""
+
+    @staticmethod
+    def _client_with_handler(
+        handler: Callable[[httpx.Request], httpx.Response],
+    ) -> FabricApiClient:
+        """Build a FabricApiClient whose HTTP traffic goes to an in-memory handler."""
+        client = FabricApiClient(base_url="http://fabric.test")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url,
+            headers=client.client.headers,
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_lines_before_body_completes(self):
+        """Test that streamed lines are visible while the server is still sending."""
+        release = asyncio.Event()
+
+        async def body() -> AsyncIterator[bytes]:
+            yield b'data: {"type": "content", "content": "first"}\n\n'
+            await release.wait()
+            yield b'data: {"type": "complete"}\n\n'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "POST"
+            assert request.url.path == "/chat"
+            return httpx.Response(200, content=body())
+
+        client = self._client_with_handler(handler)
+        try:
+            async with client.stream("POST", "/chat", json_data={"a": 1}) as response:
+                lines = response.aiter_lines()
+                first = await asyncio.wait_for(anext(lines), timeout=1)
+                assert "first" in first
+
+                release.set()
+                rest = [line async for line in lines if line]
+                assert rest == ['data: {"type": "complete"}']
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_http_error_reads_body(self):
+        """Test that an error status raises with the response body available."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, content=b"no such file or directory")
+
+        client = self._client_with_handler(handler)
+        try:
+            with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                async with client.stream("POST", "/chat"):
+                    pytest.fail("stream body should not be entered on error")
+
+            assert exc_info.value.response.status_code == 500
+            assert exc_info.value.response.text == "no such file or directory"
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_request_error_is_reraised(self):
+        """Test that transport errors propagate from stream()."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = self._client_with_handler(handler)
+        try:
+            with pytest.raises(httpx.ConnectError):
+                async with client.stream("POST", "/chat"):
+                    pytest.fail("stream body should not be entered on error")
+        finally:
+            await client.close()
 
 
 class TestFabricApiClientConstants:
@@ -0,0 +1,313 @@
+"""Unit tests for the fabric_mcp.cache module."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from fabric_mcp.cache import (
+    ByteBoundedLRUCache,
+    CacheStats,
+    StaleWhileRevalidateCache,
+    stable_hash,
+)
+from tests.shared.clock import FakeClock
+
+
+class CountingLoader:
+    """Loader returning an incrementing value, optionally gated or failing."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return self.calls
+
+
+def make_cache(
+    ttl: float = 10.0, max_stale: float | None = None
+) -> tuple[StaleWhileRevalidateCache[str, int], FakeClock]:
+    """Create a cache driven by a fake clock."""
+    clock = FakeClock()
+    return StaleWhileRevalidateCache(ttl, max_stale=max_stale, clock=clock), clock
+
+
+class TestCacheStats:
+    """Test the CacheStats counters."""
+
+    def test_hit_ratio_counts_fresh_and_stale_hits(self):
+        """Test that stale hits count as hits in the ratio."""
+        stats = CacheStats(hits=2, stale_hits=1, misses=1)
+        assert stats.hit_ratio == 0.75
+        assert stats.as_dict()["hit_ratio"] == 0.75
+
+    def test_hit_ratio_without_lookups(self):
+        """Test that an unused cache reports a zero hit ratio."""
+        assert CacheStats().hit_ratio == 0.0
+
+
+class TestStaleWhileRevalidateCache:
+    """Test TTL expiry and stale-while-revalidate behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_value_is_served_from_cache(self):
+        """Test that lookups within the TTL do not call the loader again."""
+        cache, clock = make_cache()
+        loader = CountingLoader()
+
+        assert await cache.get("k", loader) == 1
+        clock.now = 5.0
+        assert await cache.get("k", loader) == 1
+
+        assert loader.calls == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_stale_value_is_served_while_refreshing(self):
+        """Test that an expired value is returned at once and refreshed later."""
+        cache, clock = make_cache()
+        loader = CountingLoader()
+        await cache.get("k", loader)
+
+        clock.now = 11.0
+        loader.gate = asyncio.Event()
+        assert await cache.get("k", loader) == 1
+        assert await cache.get("k", loader) == 1  # refresh still in flight
+
+        loader.gate.set()
+        await cache.wait_for_refreshes()
+
+        assert loader.calls == 2  # only one background refresh
+        assert await cache.get("k", loader) == 2
+        assert cache.stats.stale_hits == 2
+        assert cache.stats.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self):
+        """Test that a background refresh failure does not evict the value."""
+        cache, clock = make_cache()
+        loader = CountingLoader()
+        await cache.get("k", loader)
+
+        clock.now = 11.0
+        loader.fail = True
+        assert await cache.get("k", loader) == 1
+        await cache.wait_for_refreshes()
+
+        assert cache.stats.refresh_failures == 1
+        assert await cache.get("k", loader) == 1
+
+    @pytest.mark.asyncio
+    async def test_value_past_max_stale_is_reloaded(self):
+        """Test that a value older than ttl + max_stale is not served."""
+        cache, clock = make_cache(ttl=10.0, max_stale=5.0)
+        loader = CountingLoader()
+        await cache.get("k", loader)
+
+        clock.now = 16.0
+        assert await cache.get("k", loader) == 2
+        assert cache.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_are_not_cached(self):
+        """Test that a failed miss propagates and the next lookup retries."""
+        cache, _ = make_cache()
+        loader = CountingLoader()
+        loader.fail = True
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            await cache.get("k", loader)
+
+        loader.fail = False
+        assert await cache.get("k", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_caching(self):
+        """Test that a TTL of zero always calls the loader."""
+        cache, _ = make_cache(ttl=0)
+        loader = CountingLoader()
+
+        assert await cache.get("k", loader) == 1
+        assert await cache.get("k", loader) == 2
+        assert cache.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test dropping a single key and all keys."""
+        cache, _ = make_cache()
+        loader = CountingLoader()
+        await cache.get("a", loader)
+        await cache.get("b", loader)
+
+        cache.invalidate("a")
+        assert await cache.get("a", loader) == 3
+        assert await cache.get("b", loader) == 2
+
+        cache.invalidate()
+        assert await cache.get("b", loader) == 4
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_refreshes(self):
+        """Test that close() cancels in-flight refreshes and clears entries."""
+        cache, clock = make_cache()
+        loader = CountingLoader()
+        await cache.get("k", loader)
+
+        clock.now = 11.0
+        loader.gate = asyncio.Event()
+        await cache.get("k", loader)
+        await asyncio.sleep(0)  # let the refresh task start
+
+        await cache.close()
+
+        assert cache.stats.refreshes == 0
+        assert await cache.get("k", CountingLoader()) == 1
+
+
+def make_lru(
+    max_bytes: int = 10, ttl: float = 10.0, negative_ttl: float = 5.0
+) -> tuple[ByteBoundedLRUCache[str, str], FakeClock]:
+    """Create a byte-bounded cache of strings driven by a fake clock."""
+    clock = FakeClock()
+    cache: ByteBoundedLRUCache[str, str] = ByteBoundedLRUCache(
+        max_bytes=max_bytes,
+        ttl=ttl,
+        sizeof=len,
+        negative_ttl=negative_ttl,
+        cache_error=lambda e: isinstance(e, KeyError),
+        clock=clock,
+    )
+    return cache, clock
+
+
+def value_loader(value: str) -> Callable[[], Awaitable[str]]:
+    """Return a loader that produces value."""
+
+    async def load() -> str:
+        return value
+
+    return load
+
+
+def error_loader(error: Exception) -> Callable[[], Awaitable[str]]:
+    """Return a loader that raises error."""
+
+    async def load() -> str:
+        raise error
+
+    return load
+
+
+class TestByteBoundedLRUCache:
+    """Test size-bounded LRU eviction, TTL and negative caching."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl_and_expiry(self):
+        """Test that an entry is served until its TTL elapses."""
+        cache, clock = make_lru()
+        assert await cache.get("a", value_loader("aaa")) == "aaa"
+        assert await cache.get("a", value_loader("new")) == "aaa"
+
+        clock.now = 10.0
+        assert await cache.get("a", value_loader("new")) == "new"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_membership_ignores_expired_and_negative_entries(self):
+        """Test that `in` reports only live values and is not counted."""
+        cache, clock = make_lru(max_bytes=100)
+        await cache.get("a", value_loader("aaa"))
+        with pytest.raises(KeyError):
+            await cache.get("missing", error_loader(KeyError("missing")))
+
+        assert "a" in cache
+        assert "missing" not in cache
+        clock.now = 10.0
+        assert "a" not in cache
+        assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_size(self):
+        """Test that entries are evicted oldest-first to stay under max_bytes."""
+        cache, _ = make_lru(max_bytes=10)
+        await cache.get("a", value_loader("aaaa"))
+        await cache.get("b", value_loader("bbbb"))
+        await cache.get("a", value_loader("unused"))  # a is now most recent
+
+        await cache.get("c", value_loader("cccc"))
+
+        assert cache.current_bytes == 8
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        assert await cache.get("a", value_loader("unused")) == "aaaa"
+        assert await cache.get("b", value_loader("reloaded")) == "reloaded"
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_not_stored(self):
+        """Test that a value larger than max_bytes is returned but not cached."""
+        cache, _ = make_lru(max_bytes=10)
+        await cache.get("a", value_loader("aaaa"))
+
+        assert await cache.get("big", value_loader("x" * 11)) == "x" * 11
+
+        assert len(cache) == 1
+        assert cache.current_bytes == 4
+
+    @pytest.mark.asyncio
+    async def test_negative_caching(self):
+        """Test that accepted errors are cached for negative_ttl seconds."""
+        cache, clock = make_lru(negative_ttl=5.0)
+
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                await cache.get("missing", error_loader(KeyError("missing")))
+        assert cache.stats.negative_hits == 1
+
+        clock.now = 5.0
+        assert await cache.get("missing", value_loader("found")) == "found"
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_cached(self):
+        """Test that errors rejected by cache_error propagate uncached."""
+        cache, _ = make_lru()
+
+        with pytest.raises(RuntimeError):
+            await cache.get("a", error_loader(RuntimeError("boom")))
+
+        assert len(cache) == 0
+        assert await cache.get("a", value_loader("ok")) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test dropping a single key and all keys."""
+        cache, _ = make_lru()
+        await cache.get("a", value_loader("aa"))
+        await cache.get("b", value_loader("bb"))
+
+        cache.invalidate("a")
+        assert cache.current_bytes == 2
+        cache.invalidate("not cached")
+        cache.invalidate()
+        assert (len(cache), cache.current_bytes) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_zero_size_disables_caching(self):
+        """Test that max_bytes=0 never stores values or errors."""
+        cache, _ = make_lru(max_bytes=0)
+        await cache.get("a", value_loader(""))
+        with pytest.raises(KeyError):
+            await cache.get("b", error_loader(KeyError("b")))
+        assert len(cache) == 0
+
+
+def test_stable_hash_ignores_key_order():
+    """Test that stable_hash depends on content, not dict ordering."""
+    assert stable_hash({"a": 1, "b": [1, 2]}) == stable_hash({"b": [1, 2], "a": 1})
+    assert stable_hash({"a": 1}) != stable_hash({"a": 2})
@@ -0,0 +1,254 @@
+"""Unit tests for the on-disk catalog snapshot."""
+
+import asyncio
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS
+
+from fabric_mcp.catalog_snapshot import CatalogSnapshot
+from fabric_mcp.constants import CATALOG_SNAPSHOT_ENV
+from fabric_mcp.core import FabricMCP
+from tests.shared.clock import FakeClock
+from tests.shared.fabric_api_mocks import FabricApiMockBuilder, mock_fabric_api_client
+
+
+class Loader:
+    """Counts calls and returns (or raises) a configured result."""
+
+    def __init__(self, result: object = None, error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def stored_snapshot(path: Path, **values: object) -> CatalogSnapshot:
+    """A freshly loaded snapshot of a file holding the given values."""
+    writer = CatalogSnapshot(path, max_age=60)
+    for key, value in values.items():
+        await writer.put(key, value)
+    snapshot = CatalogSnapshot(path, max_age=60)
+    await snapshot.load()
+    return snapshot
+
+
+class TestCatalogSnapshot:
+    """Test storing, loading and revalidating snapshot entries."""
+
+    @pytest.mark.asyncio
+    async def test_loaded_entry_is_served_while_revalidated(self, tmp_path: Path):
+        """Test that a new instance answers from disk and refreshes once."""
+        snapshot = await stored_snapshot(tmp_path / "catalog.db", names=["a", "b"])
+        loader = Loader(["a", "b", "c"])
+
+        first, second = await asyncio.gather(
+            snapshot.get("names", loader), snapshot.get("names", loader)
+        )
+        await snapshot.wait_for_refreshes()
+
+        assert first == second == ["a", "b"]
+        assert loader.calls == 1
+        assert await snapshot.get("names", loader) == ["a", "b", "c"]
+        assert loader.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_served_values_are_copies(self, tmp_path: Path):
+        """Test that callers cannot change what the snapshot serves."""
+        snapshot = await stored_snapshot(tmp_path / "catalog.db", names=["a"])
+        loader = Loader(error=ConnectionError("down"))
+
+        served = cast(list[str], await snapshot.get("names", loader))
+        served.append("x")
+
+        assert await snapshot.get("names", loader) == ["a"]
+        await snapshot.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_serving(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that the entry is still served while Fabric is unreachable."""
+        snapshot = await stored_snapshot(tmp_path / "catalog.db", names=["a"])
+        loader = Loader(error=ConnectionError("down"))
+
+        await snapshot.get("names", loader)
+        await snapshot.wait_for_refreshes()
+
+        assert await snapshot.get("names", loader) == ["a"]
+        assert "Revalidating 'names' from the snapshot failed" in caplog.text
+        await snapshot.close()
+
+    @pytest.mark.asyncio
+    async def test_discarded_entry_is_deleted(self, tmp_path: Path):
+        """Test that an entry gone upstream is neither served nor kept on disk."""
+        path = tmp_path / "catalog.db"
+        await stored_snapshot(path, gone={"name": "gone"})
+        snapshot = CatalogSnapshot(
+            path, max_age=60, discard_error=lambda e: isinstance(e, KeyError)
+        )
+        await snapshot.load()
+
+        await snapshot.get("gone", Loader(error=KeyError("gone")))
+        await snapshot.wait_for_refreshes()
+
+        assert len(snapshot) == 0
+        reloaded = CatalogSnapshot(path, max_age=60)
+        await reloaded.load()
+        assert len(reloaded) == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_older_than_max_age_are_not_loaded(self, tmp_path: Path):
+        """Test that only recent entries are loaded."""
+        path = tmp_path / "catalog.db"
+        wall_clock = FakeClock(1000.0)
+        writer = CatalogSnapshot(path, max_age=60, wall_clock=wall_clock)
+        await writer.put("old", 1)
+        wall_clock.now = 1050.0
+        await writer.put("new", 2)
+        wall_clock.now = 1070.0
+
+        snapshot = CatalogSnapshot(path, max_age=60, wall_clock=wall_clock)
+        await snapshot.load()
+
+        assert len(snapshot) == 1
+        assert await snapshot.get("new", Loader(3)) == 2
+
+    @pytest.mark.asyncio
+    async def test_file_uses_wal_mode(self, tmp_path: Path):
+        """Test that the database can be shared by concurrent processes."""
+        path = tmp_path / "nested" / "catalog.db"
+        await CatalogSnapshot(path, max_age=60).put("key", "value")
+
+        with closing(sqlite3.connect(path)) as db:
+            assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_is_ignored(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that a corrupt snapshot is skipped with a warning."""
+        path = tmp_path / "catalog.db"
+        path.write_bytes(b"not a database" * 100)
+        snapshot = CatalogSnapshot(path, max_age=60)
+
+        await snapshot.load()
+
+        assert len(snapshot) == 0
+        assert "unreadable catalog snapshot" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_read_the_file_once(self, tmp_path: Path):
+        """Test that callers racing on the first load share one read."""
+        path = tmp_path / "catalog.db"
+        await CatalogSnapshot(path, max_age=60).put("key", "value")
+        snapshot = CatalogSnapshot(path, max_age=60)
+
+        with patch.object(snapshot, "_read", wraps=getattr(snapshot, "_read")) as read:
+            await asyncio.gather(snapshot.load(), snapshot.load())
+            await snapshot.load()
+
+        read.assert_called_once()
+        assert len(snapshot) == 1
+
+    @pytest.mark.asyncio
+    async def test_other_schema_version_is_dropped(self, tmp_path: Path):
+        """Test that entries in an older value format are not loaded."""
+        path = tmp_path / "catalog.db"
+        await CatalogSnapshot(path, max_age=60).put("key", "value")
+        with closing(sqlite3.connect(path)) as db:
+            db.execute("PRAGMA user_version = 999")
+
+        snapshot = CatalogSnapshot(path, max_age=60)
+        await snapshot.load()
+
+        assert len(snapshot) == 0
+
+
+class TestFabricCatalogSnapshot:
+    """Test catalog tools answering from the snapshot of an earlier process."""
+
+    @pytest.fixture(autouse=True)
+    def enable_snapshot(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Point the catalog snapshot at a fresh file."""
+        monkeypatch.setenv(CATALOG_SNAPSHOT_ENV, str(tmp_path / "catalog.db"))
+
+    @staticmethod
+    async def _fill_snapshot() -> None:
+        """Run every catalog tool once against a reachable Fabric."""
+        server = FabricMCP()
+        builder = FabricApiMockBuilder()
+        with mock_fabric_api_client(builder):
+            builder.with_successful_pattern_list(["summarize"])
+            await server.fabric_list_patterns()
+            builder.with_successful_pattern_details("summarize", "Sums up", "# S")
+            await server.fabric_get_pattern_details("summarize")
+            builder.with_successful_models_list()
+            await server.fabric_list_models()
+            builder.with_successful_strategies_list()
+            await server.fabric_list_strategies()
+
+    @pytest.mark.asyncio
+    async def test_new_server_answers_while_fabric_is_down(self):
+        """Test that a new process answers every catalog tool from the snapshot."""
+        await self._fill_snapshot()
+        server = FabricMCP()
+
+        builder = FabricApiMockBuilder().with_connection_error()
+        with mock_fabric_api_client(builder) as mock_client:
+            patterns = await server.fabric_list_patterns()
+            details = await server.fabric_get_pattern_details("summarize")
+            models = await server.fabric_list_models()
+            strategies = await server.fabric_list_strategies()
+            await server.wait_for_catalog_revalidation()
+
+        assert patterns == ["summarize"]
+        assert details == {
+            "name": "summarize",
+            "description": "Sums up",
+            "system_prompt": "# S",
+        }
+        assert models["vendors"]["anthropic"] == ["claude-3-opus"]
+        assert [s["name"] for s in strategies["strategies"]] == ["default", "creative"]
+        # One background revalidation per entry
+        assert mock_client.get.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_revalidated_entries_come_from_fabric(self):
+        """Test that calls after a successful revalidation see Fabric's data."""
+        await self._fill_snapshot()
+        server = FabricMCP()
+
+        builder = FabricApiMockBuilder().with_successful_pattern_list(["new"])
+        with mock_fabric_api_client(builder):
+            assert await server.fabric_list_patterns() == ["summarize"]
+            await server.wait_for_catalog_revalidation()
+            assert await server.fabric_list_patterns() == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_deleted_pattern_is_dropped(self):
+        """Test that a pattern Fabric no longer knows is not served again."""
+        await self._fill_snapshot()
+        server = FabricMCP()
+
+        builder = FabricApiMockBuilder().with_http_error(
+            500, "open summarize/system.md: no such file or directory"
+        )
+        with mock_fabric_api_client(builder):
+            await server.fabric_get_pattern_details("summarize")
+            await server.wait_for_catalog_revalidation()
+            with pytest.raises(McpError) as exc_info:
+                await server.fabric_get_pattern_details("summarize")
+
+        assert exc_info.value.error.code == INVALID_PARAMS
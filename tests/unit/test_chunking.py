@@ -0,0 +1,116 @@
+"""Unit tests for token estimates and input splitting."""
+
+import pytest
+
+from fabric_mcp.chunking import (
+    ModelProfile,
+    estimate_tokens,
+    model_profile,
+    split_text,
+)
+
+
+def _paragraphs(count: int, sentences: int = 4) -> str:
+    return "\n\n".join(
+        " ".join(
+            f"Paragraph {p} sentence {s} says something." for s in range(sentences)
+        )
+        for p in range(count)
+    )
+
+
+class TestModelProfile:
+    """Test cases for model profile lookup."""
+
+    @pytest.mark.parametrize(
+        ("model", "context_window"),
+        [
+            ("gpt-4o-mini", 128_000),
+            ("gpt-4", 8_192),
+            ("GPT-4-Turbo-2024-04-09", 128_000),
+            ("anthropic/claude-3-5-sonnet", 200_000),
+            ("some-unknown-model", 8_192),
+            ("", 8_192),
+        ],
+    )
+    def test_longest_prefix_wins(self, model: str, context_window: int):
+        """Test that the most specific prefix decides the context window."""
+        assert model_profile(model).context_window == context_window
+
+    def test_profile_is_a_named_tuple(self):
+        """Test the profile fields."""
+        assert model_profile("gpt-4o") == ModelProfile(128_000, 4.0)
+
+
+class TestEstimateTokens:
+    """Test cases for estimate_tokens."""
+
+    def test_ascii_uses_chars_per_token(self):
+        """Test that ASCII text is counted at the model's density, rounded up."""
+        assert estimate_tokens("a" * 40, "gpt-4o") == 10
+        assert estimate_tokens("a" * 41, "gpt-4o") == 11
+        assert estimate_tokens("") == 0
+
+    def test_non_ascii_counts_one_token_per_character(self):
+        """Test that CJK text is not underestimated."""
+        assert estimate_tokens("日本語のテキスト", "gpt-4o") == 8
+
+
+class TestSplitText:
+    """Test cases for split_text."""
+
+    def test_small_input_is_one_chunk(self):
+        """Test that text within the budget is returned unchanged."""
+        assert split_text("short text", 100) == ["short text"]
+        assert not split_text("  \n ", 100)
+
+    def test_chunks_respect_budget_and_end_at_paragraphs(self):
+        """Test that chunks fit the budget and break between paragraphs."""
+        text = _paragraphs(20)
+
+        chunks = split_text(text, 150)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 150 for chunk in chunks)
+        assert all(chunk.endswith("something.\n\n") for chunk in chunks[:-1])
+        assert "".join(chunks) == text
+
+    def test_long_paragraph_breaks_at_sentences(self):
+        """Test that a paragraph over the budget is split between sentences."""
+        text = _paragraphs(1, sentences=40)
+
+        chunks = split_text(text, 60)
+
+        assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+        assert all(chunk.endswith("something. ") for chunk in chunks[:-1])
+        assert "".join(chunks) == text
+
+    def test_long_sentence_breaks_between_words(self):
+        """Test that a single sentence over the budget is split between words."""
+        text = " ".join(f"word{n}" for n in range(500))
+
+        chunks = split_text(text, 30)
+
+        assert all(estimate_tokens(chunk) <= 30 for chunk in chunks)
+        assert "".join(chunks) == text
+        assert all(chunk.endswith(" ") for chunk in chunks[:-1])
+
+    def test_overlap_repeats_trailing_sentences(self):
+        """Test that each chunk starts with the end of the previous one."""
+        text = _paragraphs(1, sentences=40)
+
+        chunks = split_text(text, 60, overlap_tokens=15)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+        for previous, chunk in zip(chunks, chunks[1:], strict=False):
+            first_sentence = chunk.split(". ")[0] + ". "
+            assert previous.endswith(first_sentence)
+
+    def test_model_changes_chunk_count(self):
+        """Test that denser tokenizers produce more chunks for the same budget."""
+        text = _paragraphs(30)
+
+        assert len(split_text(text, 200, model="claude-3")) >= len(
+            split_text(text, 200, model="gpt-4o")
+        )
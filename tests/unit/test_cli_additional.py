@@ -39,7 +39,7 @@ class TestCLIMain:
         """Test that running with no arguments fails due to missing transport."""
         with (
             patch("fabric_mcp.cli.Log") as mock_log_class,
-            patch("fabric_mcp.cli.FabricMCP") as mock_fabric_mcp_class,
+            patch("fabric_mcp.core.FabricMCP") as mock_fabric_mcp_class,
         ):
             mock_log = Mock()
             mock_log.level_name = "INFO"
@@ -56,7 +56,7 @@ class TestCLIMain:
             assert result.exit_code != 0
             assert "Missing option '--transport'" in result.stderr
 
-    @patch("fabric_mcp.cli.FabricMCP")
+    @patch("fabric_mcp.core.FabricMCP")
     @patch("fabric_mcp.cli.Log")
     def test_transport_stdio_creates_server_and_runs(
         self, mock_log_class: Mock, mock_fabric_mcp_class: Mock
@@ -86,7 +86,7 @@ class TestCLIMain:
         # Verify stdio() was called
         mock_server.stdio.assert_called_once()
 
-    @patch("fabric_mcp.cli.FabricMCP")
+    @patch("fabric_mcp.core.FabricMCP")
     @patch("fabric_mcp.cli.Log")
     def test_transport_stdio_with_custom_log_level(
         self, mock_log_class: Mock, mock_fabric_mcp_class: Mock
@@ -111,7 +111,7 @@ class TestCLIMain:
         # Verify FabricMCP was created
         mock_fabric_mcp_class.assert_called_once()
 
-    @patch("fabric_mcp.cli.FabricMCP")
+    @patch("fabric_mcp.core.FabricMCP")
     @patch("fabric_mcp.cli.Log")
     def test_transport_stdio_with_short_log_level_flag(
         self, mock_log_class: Mock, mock_fabric_mcp_class: Mock
@@ -132,7 +132,7 @@ class TestCLIMain:
         mock_log_class.assert_called_once_with("error")
         mock_fabric_mcp_class.assert_called_once()
 
-    @patch("fabric_mcp.cli.FabricMCP")
+    @patch("fabric_mcp.core.FabricMCP")
     @patch("fabric_mcp.cli.Log")
     def test_transport_stdio_logs_startup_and_shutdown_messages(
         self, mock_log_class: Mock, mock_fabric_mcp_class: Mock
@@ -176,7 +176,7 @@ class TestCLIMain:
         runner = CliRunner()
 
         for level in valid_levels:
-            with patch("fabric_mcp.cli.FabricMCP"):
+            with patch("fabric_mcp.core.FabricMCP"):
                 with patch("fabric_mcp.cli.Log"):
                     result = runner.invoke(
                         main, ["--transport", "stdio", "--log-level", level]
@@ -193,7 +193,7 @@ class TestCLIMain:
         """Test that default log level is 'info'."""
         with (
             patch("fabric_mcp.cli.Log") as mock_log_class,
-            patch("fabric_mcp.cli.FabricMCP") as mock_fabric_mcp_class,
+            patch("fabric_mcp.core.FabricMCP") as mock_fabric_mcp_class,
         ):
             mock_log = Mock()
             mock_log.level_name = "INFO"
@@ -211,7 +211,7 @@ class TestCLIMain:
             # Verify default log level was used
             mock_log_class.assert_called_once_with("info")
 
-    @patch("fabric_mcp.cli.FabricMCP")
+    @patch("fabric_mcp.core.FabricMCP")
     @patch("fabric_mcp.cli.Log")
     def test_transport_http_creates_server_and_runs(
         self, mock_log_class: Mock, mock_fabric_mcp_class: Mock
@@ -243,7 +243,7 @@ class TestCLIMain:
             host="127.0.0.1", port=8000, mcp_path="/message"
         )
 
-    @patch("fabric_mcp.cli.FabricMCP")
+    @patch("fabric_mcp.core.FabricMCP")
     @patch("fabric_mcp.cli.Log")
     def test_transport_http_with_custom_config(
         self, mock_log_class: Mock, mock_fabric_mcp_class: Mock
@@ -321,7 +321,7 @@ class TestCLIValidation:
         """Test that HTTP options are accepted when using http transport."""
         with (
             patch("fabric_mcp.cli.Log") as mock_log_class,
-            patch("fabric_mcp.cli.FabricMCP") as mock_fabric_mcp_class,
+            patch("fabric_mcp.core.FabricMCP") as mock_fabric_mcp_class,
         ):
             mock_log = Mock()
             mock_log.level_name = "INFO"
@@ -355,7 +355,7 @@ class TestCLIValidation:
         """Test that default values work correctly with stdio transport."""
         with (
             patch("fabric_mcp.cli.Log") as mock_log_class,
-            patch("fabric_mcp.cli.FabricMCP") as mock_fabric_mcp_class,
+            patch("fabric_mcp.core.FabricMCP") as mock_fabric_mcp_class,
         ):
             mock_log = Mock()
             mock_log.level_name = "INFO"
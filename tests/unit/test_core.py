@@ -1,16 +1,18 @@
 """Test core functionality of fabric-mcp"""
 
+import asyncio
 import logging
 import subprocess
 import sys
 from asyncio.exceptions import CancelledError
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
 from typing import Any, cast
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from anyio import WouldBlock
-from fastmcp import FastMCP
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import StreamableHttpTransport
 from fastmcp.tools import Tool
 
 from fabric_mcp import __version__
@@ -19,8 +21,10 @@ from tests.shared.fabric_api.base import TestFixturesBase
 from tests.shared.fabric_api_mocks import (
     FabricApiMockBuilder,
     mock_fabric_api_client,
+    sse_event_bytes,
 )
 from tests.shared.mocking_utils import COMMON_PATTERN_LIST
+from tests.shared.transport_test_utils import serve_http_in_process
 
 
 class TestCore(TestFixturesBase):
@@ -98,28 +102,35 @@ class TestCore(TestFixturesBase):
         # Note: The exact way to check registered tools may depend on FastMCP's API
         # This is a basic check to ensure the tools list is populated
         assert hasattr(server, "get_tools")
-        assert len(await server.get_tools()) == 6
+        assert len(await server.get_tools()) == 11
 
-    def test_tool_registration_coverage(self, mcp_tools: dict[str, Tool]):
+    @pytest.mark.asyncio
+    async def test_tool_registration_coverage(self, mcp_tools: dict[str, Tool]):
         """Test that all tools are properly registered and accessible."""
 
         # Check that the tools are registered by accessing them
-        assert len(mcp_tools) == 6
+        assert len(mcp_tools) == 11
 
-        self._test_list_patterns_tool(getattr(mcp_tools["fabric_list_patterns"], "fn"))
-        self._test_get_pattern_details_tool(
+        await self._test_list_patterns_tool(
+            getattr(mcp_tools["fabric_list_patterns"], "fn")
+        )
+        await self._test_get_pattern_details_tool(
             getattr(mcp_tools["fabric_get_pattern_details"], "fn")
         )
-        self._test_run_pattern_tool(getattr(mcp_tools["fabric_run_pattern"], "fn"))
-        self._test_list_models_tool(getattr(mcp_tools["fabric_list_models"], "fn"))
-        self._test_list_strategies_tool(
+        await self._test_run_pattern_tool(
+            getattr(mcp_tools["fabric_run_pattern"], "fn")
+        )
+        await self._test_list_models_tool(
+            getattr(mcp_tools["fabric_list_models"], "fn")
+        )
+        await self._test_list_strategies_tool(
             getattr(mcp_tools["fabric_list_strategies"], "fn")
         )
-        self._test_get_configuration_tool(
+        await self._test_get_configuration_tool(
             getattr(mcp_tools["fabric_get_configuration"], "fn")
         )
 
-    def _test_list_patterns_tool(
+    async def _test_list_patterns_tool(
         self, fabric_list_patterns: Callable[..., Any]
     ) -> None:
         # Test fabric_list_patterns with new shared utilities
@@ -127,11 +138,11 @@ class TestCore(TestFixturesBase):
             COMMON_PATTERN_LIST
         )
         with mock_fabric_api_client(builder):
-            patterns_result: list[str] = fabric_list_patterns()
+            patterns_result: list[str] = await fabric_list_patterns()
             assert isinstance(patterns_result, list)
             assert len(patterns_result) == 3
 
-    def _test_get_pattern_details_tool(
+    async def _test_get_pattern_details_tool(
         self, fabric_get_pattern_details: Callable[..., Any]
     ) -> None:
         # Test fabric_get_pattern_details with new shared utilities
@@ -139,7 +150,7 @@ class TestCore(TestFixturesBase):
             "test_pattern", "Test pattern description", "# Test pattern system prompt"
         )
         with mock_fabric_api_client(builder):
-            pattern_details_result: dict[str, str] = fabric_get_pattern_details(
+            pattern_details_result: dict[str, str] = await fabric_get_pattern_details(
                 "test_pattern"
             )
             assert isinstance(pattern_details_result, dict)
@@ -153,24 +164,28 @@ class TestCore(TestFixturesBase):
                 == "# Test pattern system prompt"
             )
 
-    def _test_run_pattern_tool(self, fabric_run_pattern: Callable[..., Any]) -> None:
+    async def _test_run_pattern_tool(
+        self, fabric_run_pattern: Callable[..., Any]
+    ) -> None:
         # Test fabric_run_pattern with new shared utilities
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            run_pattern_result = fabric_run_pattern("test_pattern", "test_input")
+            run_pattern_result = await fabric_run_pattern("test_pattern", "test_input")
             assert isinstance(run_pattern_result, dict)
             assert "output_format" in run_pattern_result
             assert "output_text" in run_pattern_result
             assert run_pattern_result["output_text"] == "Hello, World!"
             assert run_pattern_result["output_format"] == "text"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def _test_list_models_tool(self, fabric_list_models: Callable[..., Any]) -> None:
+    async def _test_list_models_tool(
+        self, fabric_list_models: Callable[..., Any]
+    ) -> None:
         # Test fabric_list_models with mocked API
         builder = FabricApiMockBuilder().with_successful_models_list()
         with mock_fabric_api_client(builder):
-            models_result: dict[str, Any] = fabric_list_models()
+            models_result: dict[str, Any] = await fabric_list_models()
             assert isinstance(models_result, dict)
             assert "models" in models_result
             assert "vendors" in models_result
@@ -193,15 +208,15 @@ class TestCore(TestFixturesBase):
             assert "gpt-4o" in vendors["openai"]
             assert "claude-3-opus" in vendors["anthropic"]
 
-    def _test_list_strategies_tool(
+    async def _test_list_strategies_tool(
         self, fabric_list_strategies: Callable[..., Any]
     ) -> None:
         # Test fabric_list_strategies with mocked API
         builder = FabricApiMockBuilder().with_successful_strategies_list()
         with mock_fabric_api_client(builder):
-            strategies_result: dict[str, list[dict[str, str]]] = (
-                fabric_list_strategies()
-            )
+            strategies_result: dict[
+                str, list[dict[str, str]]
+            ] = await fabric_list_strategies()
             assert isinstance(strategies_result, dict)
             assert "strategies" in strategies_result
             assert isinstance(strategies_result["strategies"], list)
@@ -212,7 +227,7 @@ class TestCore(TestFixturesBase):
             assert "description" in first_strategy
             assert "prompt" in first_strategy
 
-    def _test_get_configuration_tool(
+    async def _test_get_configuration_tool(
         self, fabric_get_configuration: Callable[..., Any]
     ) -> None:
         # Mock the configuration API response
@@ -225,7 +240,7 @@ class TestCore(TestFixturesBase):
 
         builder = FabricApiMockBuilder().with_json_response(mock_config_data)
         with mock_fabric_api_client(builder):
-            config_result: dict[str, Any] = fabric_get_configuration()
+            config_result: dict[str, Any] = await fabric_get_configuration()
             assert isinstance(config_result, dict)
             # Check that we have some configuration data
             assert len(config_result) > 0
@@ -391,7 +406,8 @@ class TestCore(TestFixturesBase):
 class TestFabricGetConfiguration(TestFixturesBase):
     """Test fabric_get_configuration tool implementation and redaction logic."""
 
-    def test_fabric_get_configuration_successful_call(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_successful_call(self, server: FabricMCP):
         """Test successful API call with mixed sensitive/non-sensitive config."""
         mock_config_data = {
             "openai_api_key": "sk-abc123def456",
@@ -409,11 +425,11 @@ class TestFabricGetConfiguration(TestFixturesBase):
         builder = FabricApiMockBuilder().with_json_response(mock_config_data)
 
         with mock_fabric_api_client(builder) as mock_api:
-            result = server.fabric_get_configuration()
+            result = await server.fabric_get_configuration()
 
             # Verify API was called correctly
             mock_api.get.assert_called_once_with("/config")
-            mock_api.close.assert_called_once()
+            mock_api.close.assert_not_called()
 
             # Verify result structure
             assert isinstance(result, dict)
@@ -434,7 +450,8 @@ class TestFabricGetConfiguration(TestFixturesBase):
             assert result["default_model"] == "gpt-4"
             assert result["regular_setting"] == "value123"
 
-    def test_fabric_get_configuration_redaction_patterns(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_redaction_patterns(self, server: FabricMCP):
         """Test redaction patterns work with various key formats."""
         mock_config_data = {
             "OPENAI_API_KEY": "value1",  # Uppercase
@@ -452,7 +469,7 @@ class TestFabricGetConfiguration(TestFixturesBase):
         builder = FabricApiMockBuilder().with_json_response(mock_config_data)
 
         with mock_fabric_api_client(builder):
-            result = server.fabric_get_configuration()
+            result = await server.fabric_get_configuration()
 
             # Verify all sensitive patterns are redacted
             assert result["OPENAI_API_KEY"] == "[REDACTED_BY_MCP_SERVER]"
@@ -468,7 +485,10 @@ class TestFabricGetConfiguration(TestFixturesBase):
             # Verify non-sensitive value is passed through
             assert result["some_setting"] == "value10"
 
-    def test_fabric_get_configuration_empty_sensitive_values(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_empty_sensitive_values(
+        self, server: FabricMCP
+    ):
         """Test that empty sensitive values are passed through, not redacted."""
         mock_config_data = {
             "openai_api_key": "",
@@ -481,7 +501,7 @@ class TestFabricGetConfiguration(TestFixturesBase):
         builder = FabricApiMockBuilder().with_json_response(mock_config_data)
 
         with mock_fabric_api_client(builder):
-            result = server.fabric_get_configuration()
+            result = await server.fabric_get_configuration()
 
             # Verify empty sensitive values are NOT redacted
             assert result["openai_api_key"] == ""
@@ -490,43 +510,53 @@ class TestFabricGetConfiguration(TestFixturesBase):
             assert result["user_password"] == ""
             assert result["regular_setting"] == ""
 
-    def test_fabric_get_configuration_api_connection_error(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_api_connection_error(
+        self, server: FabricMCP
+    ):
         """Test handling of API connection errors."""
         builder = FabricApiMockBuilder().with_connection_error()
 
         with mock_fabric_api_client(builder):
             with pytest.raises(Exception) as exc_info:
-                server.fabric_get_configuration()
+                await server.fabric_get_configuration()
 
             # Should raise McpError with appropriate message
             assert "Failed to connect to Fabric API" in str(exc_info.value)
 
-    def test_fabric_get_configuration_http_status_error(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_http_status_error(self, server: FabricMCP):
         """Test handling of HTTP status errors (4xx, 5xx responses)."""
         builder = FabricApiMockBuilder().with_http_error(500, "Internal Server Error")
 
         with mock_fabric_api_client(builder):
             with pytest.raises(Exception) as exc_info:
-                server.fabric_get_configuration()
+                await server.fabric_get_configuration()
 
             # Should raise McpError with appropriate message
             assert "Fabric API error during retrieving configuration: 500" in str(
                 exc_info.value
             )
 
-    def test_fabric_get_configuration_invalid_response_type(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_invalid_response_type(
+        self, server: FabricMCP
+    ):
         """Test handling of invalid JSON response (non-dict)."""
         # Mock API returning a list instead of dict
         builder = FabricApiMockBuilder().with_raw_response_data(["not", "a", "dict"])
 
         with mock_fabric_api_client(builder):
             with pytest.raises(Exception) as exc_info:
-                server.fabric_get_configuration()
+                await server.fabric_get_configuration()
 
             # Should raise McpError about invalid response type
             assert "expected dict for config" in str(exc_info.value)
 
-    def test_fabric_get_configuration_api_key_value_redaction(self, server: FabricMCP):
+    @pytest.mark.asyncio
+    async def test_fabric_get_configuration_api_key_value_redaction(
+        self, server: FabricMCP
+    ):
         """Test redaction of values that look like API keys regardless of key name."""
         mock_config_data = {
             # Real Fabric config format: vendor names as keys, API keys as values
@@ -546,7 +576,7 @@ class TestFabricGetConfiguration(TestFixturesBase):
         builder = FabricApiMockBuilder().with_json_response(mock_config_data)
 
         with mock_fabric_api_client(builder):
-            result = server.fabric_get_configuration()
+            result = await server.fabric_get_configuration()
 
             # Verify API key values are redacted regardless of key name
             assert result["openai"] == "[REDACTED_BY_MCP_SERVER]"
@@ -564,3 +594,105 @@ class TestFabricGetConfiguration(TestFixturesBase):
             # Verify non-API key values are passed through
             assert result["fabric_config_dir"] == "~/.config/fabric"
             assert result["debug_mode"] is True
+
+
+class TestSharedApiClient(TestFixturesBase):
+    """Test the shared, pooled FabricApiClient owned by FabricMCP."""
+
+    @pytest.mark.asyncio
+    async def test_api_client_is_reused_across_tool_calls(self, server: FabricMCP):
+        """Test that consecutive tool calls share one FabricApiClient."""
+        builder = FabricApiMockBuilder().with_successful_pattern_list(
+            COMMON_PATTERN_LIST
+        )
+        with patch("fabric_mcp.fabric_tools.FabricApiClient") as mock_client_class:
+            mock_client_class.return_value = builder.build()
+
+            await server.fabric_list_patterns()
+            await server.fabric_list_patterns()
+
+            mock_client_class.assert_called_once()
+            builder.mock_api_client.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_api_client(self, server: FabricMCP):
+        """Test that close() closes the client, which is later created anew."""
+        get_api_client = getattr(server, "_get_api_client")
+
+        with patch("fabric_mcp.fabric_tools.FabricApiClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            assert get_api_client() is mock_client
+            await server.close()
+            mock_client.close.assert_called_once()
+
+            # A fresh client is created lazily after shutdown
+            get_api_client()
+            assert mock_client_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_http_sessions_share_api_client(self, server: FabricMCP):
+        """Test that HTTP sessions reuse one client, closed at server shutdown."""
+        builder = FabricApiMockBuilder().with_successful_sse("done")
+        with patch("fabric_mcp.fabric_tools.FabricApiClient") as mock_client_class:
+            mock_client_class.return_value = builder.build()
+
+            async with serve_http_in_process(server) as url:
+                for _ in range(2):
+                    async with Client(StreamableHttpTransport(url)) as client:
+                        await client.call_tool(
+                            "fabric_run_pattern",
+                            {"pattern_name": "summarize", "input_text": "text"},
+                        )
+                builder.mock_api_client.close.assert_not_called()
+
+        mock_client_class.assert_called_once()
+        assert builder.mock_api_client.stream.call_count == 2
+        builder.mock_api_client.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_api_client_without_client_is_noop(self, server: FabricMCP):
+        """Test closing before any client was created does nothing."""
+        with patch("fabric_mcp.fabric_tools.FabricApiClient") as mock_client_class:
+            await getattr(server, "_close_api_client")()
+            mock_client_class.assert_not_called()
+
+
+class TestConcurrentToolCalls(TestFixturesBase):
+    """Test that async tools do not block the event loop while awaiting Fabric."""
+
+    @pytest.mark.asyncio
+    async def test_slow_pattern_run_does_not_block_other_tools(self, server: FabricMCP):
+        """Test a pending /chat request lets metadata tools complete meanwhile."""
+        chat_started = asyncio.Event()
+        release_chat = asyncio.Event()
+
+        builder = FabricApiMockBuilder().with_successful_pattern_list(
+            COMMON_PATTERN_LIST
+        )
+
+        async def slow_sse_bytes() -> AsyncGenerator[bytes, None]:
+            chat_started.set()
+            await release_chat.wait()
+            yield sse_event_bytes(
+                'data: {"type": "content", "content": "done", "format": "text"}'
+            )
+            yield sse_event_bytes('data: {"type": "complete"}')
+
+        builder.mock_response.aiter_bytes = Mock(side_effect=slow_sse_bytes)
+
+        with mock_fabric_api_client(builder):
+            run_task = asyncio.create_task(
+                server.fabric_run_pattern("summarize", "some input")
+            )
+            await asyncio.wait_for(chat_started.wait(), timeout=1)
+
+            patterns = await asyncio.wait_for(server.fabric_list_patterns(), timeout=1)
+            assert patterns == COMMON_PATTERN_LIST
+            assert not run_task.done()
+
+            release_chat.set()
+            result = await asyncio.wait_for(run_task, timeout=1)
+
+        assert result["output_text"] == "done"
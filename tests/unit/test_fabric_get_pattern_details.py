@@ -1,11 +1,13 @@
 """Unit tests for fabric_get_pattern_details tool."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 import pytest
 import pytest_asyncio
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
 from mcp.shared.exceptions import McpError
-from mcp.types import INTERNAL_ERROR
+from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
 
 from fabric_mcp.core import FabricMCP
 from tests.shared.fabric_api.base import TestFixturesBase
@@ -15,6 +17,7 @@ from tests.shared.fabric_api_mocks import (
     assert_mcp_error,
     mock_fabric_api_client,
 )
+from tests.shared.transport_test_utils import serve_http_in_process
 
 
 class TestFabricGetPatternDetails(TestFixturesBase):
@@ -23,14 +26,15 @@ class TestFabricGetPatternDetails(TestFixturesBase):
     @pytest_asyncio.fixture
     async def get_pattern_details_tool(
         self, server: FabricMCP
-    ) -> Callable[[str], dict[str, str]]:
+    ) -> Callable[[str], Awaitable[dict[str, str]]]:
         """Get the fabric_get_pattern_details tool function."""
         tools = await server.get_tools()
         return getattr(tools["fabric_get_pattern_details"], "fn")
 
-    def test_successful_pattern_details_retrieval(
+    @pytest.mark.asyncio
+    async def test_successful_pattern_details_retrieval(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test successful retrieval of pattern details."""
         # Arrange
@@ -42,7 +46,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act
-            result = get_pattern_details_tool("summarize")
+            result = await get_pattern_details_tool("summarize")
 
             # Assert
             assert isinstance(result, dict)
@@ -54,9 +58,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
 
             assert_api_client_calls(mock_api_client, "/patterns/summarize")
 
-    def test_successful_pattern_details_with_empty_description(
+    @pytest.mark.asyncio
+    async def test_successful_pattern_details_with_empty_description(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test successful retrieval when description is empty."""
         # Arrange
@@ -66,7 +71,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act
-            result = get_pattern_details_tool("test_pattern")
+            result = await get_pattern_details_tool("test_pattern")
 
             # Assert
             assert result["name"] == "test_pattern"
@@ -74,9 +79,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
             assert result["system_prompt"] == "# Test pattern content"
             assert_api_client_calls(mock_api_client, "/patterns/test_pattern")
 
-    def test_pattern_not_found_500_error(
+    @pytest.mark.asyncio
+    async def test_pattern_not_found_500_error(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test handling of 500 server error for non-existent pattern."""
         # Arrange
@@ -85,14 +91,15 @@ class TestFabricGetPatternDetails(TestFixturesBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act & Assert
             with pytest.raises(McpError) as exc_info:
-                get_pattern_details_tool("nonexistent_pattern")
+                await get_pattern_details_tool("nonexistent_pattern")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Fabric API internal error")
             assert_api_client_calls(mock_api_client, "/patterns/nonexistent_pattern")
 
-    def test_pattern_details_with_special_characters(
+    @pytest.mark.asyncio
+    async def test_pattern_details_with_special_characters(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test pattern details retrieval with special characters in name."""
         # Arrange
@@ -104,7 +111,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act
-            result = get_pattern_details_tool("pattern-with_special.chars")
+            result = await get_pattern_details_tool("pattern-with_special.chars")
 
             # Assert
             assert result["name"] == "pattern-with_special.chars"
@@ -114,9 +121,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
                 mock_api_client, "/patterns/pattern-with_special.chars"
             )
 
-    def test_pattern_details_with_long_content(
+    @pytest.mark.asyncio
+    async def test_pattern_details_with_long_content(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test pattern details with long content."""
         # Arrange
@@ -128,7 +136,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act
-            result = get_pattern_details_tool("long_pattern")
+            result = await get_pattern_details_tool("long_pattern")
 
             # Assert
             assert result["name"] == "long_pattern"
@@ -136,9 +144,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
             assert result["system_prompt"] == long_pattern
             assert_api_client_calls(mock_api_client, "/patterns/long_pattern")
 
-    def test_connection_error_handling(
+    @pytest.mark.asyncio
+    async def test_connection_error_handling(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test handling of connection errors."""
         # Arrange
@@ -147,7 +156,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act & Assert
             with pytest.raises(McpError) as exc_info:
-                get_pattern_details_tool("test_pattern")
+                await get_pattern_details_tool("test_pattern")
 
             assert_mcp_error(
                 exc_info, INTERNAL_ERROR, "Failed to connect to Fabric API"
@@ -155,9 +164,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
             # Connection errors may not result in API calls
             assert mock_api_client.get.call_count >= 0
 
-    def test_timeout_error_handling(
+    @pytest.mark.asyncio
+    async def test_timeout_error_handling(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test handling of timeout errors."""
         # Arrange
@@ -166,7 +176,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act & Assert
             with pytest.raises(McpError) as exc_info:
-                get_pattern_details_tool("test_pattern")
+                await get_pattern_details_tool("test_pattern")
 
             assert_mcp_error(
                 exc_info, INTERNAL_ERROR, "Failed to connect to Fabric API"
@@ -174,9 +184,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
             # Timeout errors may not result in completed API calls
             assert mock_api_client.get.call_count >= 0
 
-    def test_404_error_handling(
+    @pytest.mark.asyncio
+    async def test_404_error_handling(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test handling of 404 errors for non-existent patterns."""
         # Arrange
@@ -185,7 +196,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act & Assert
             with pytest.raises(McpError) as exc_info:
-                get_pattern_details_tool("nonexistent")
+                await get_pattern_details_tool("nonexistent")
 
             assert_mcp_error(
                 exc_info,
@@ -194,9 +205,10 @@ class TestFabricGetPatternDetails(TestFixturesBase):
             )
             assert_api_client_calls(mock_api_client, "/patterns/nonexistent")
 
-    def test_unexpected_error_handling(
+    @pytest.mark.asyncio
+    async def test_unexpected_error_handling(
         self,
-        get_pattern_details_tool: Callable[[str], dict[str, str]],
+        get_pattern_details_tool: Callable[[str], Awaitable[dict[str, str]]],
     ) -> None:
         """Test handling of unexpected errors."""
         # Arrange
@@ -207,7 +219,7 @@ class TestFabricGetPatternDetails(TestFixturesBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # Act & Assert
             with pytest.raises(McpError) as exc_info:
-                get_pattern_details_tool("test_pattern")
+                await get_pattern_details_tool("test_pattern")
 
             assert_mcp_error(
                 exc_info,
@@ -216,3 +228,99 @@ class TestFabricGetPatternDetails(TestFixturesBase):
             )
             # Unexpected errors may not result in completed API calls
             assert mock_api_client.get.call_count >= 0
+
+
+class TestFabricGetPatternDetailsCache(TestFixturesBase):
+    """Test the LRU cache in front of fabric_get_pattern_details."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_hit_the_cache(self, server: FabricMCP) -> None:
+        """Test that a cached pattern is not fetched from Fabric again."""
+        builder = FabricApiMockBuilder().with_successful_pattern_details("summarize")
+
+        with mock_fabric_api_client(builder) as mock_api_client:
+            first = await server.fabric_get_pattern_details("summarize")
+            first["name"] = "mutated by caller"
+            second = await server.fabric_get_pattern_details("summarize")
+
+        assert second["name"] == "summarize"
+        assert mock_api_client.get.call_count == 1
+        stats = server.get_cache_stats()["fabric_get_pattern_details"]
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_pattern_not_found_is_negatively_cached(
+        self, server: FabricMCP
+    ) -> None:
+        """Test that a "pattern not found" error is served from the cache."""
+        builder = FabricApiMockBuilder().with_http_error(
+            500, "open /patterns/missing/system.md: no such file or directory"
+        )
+
+        with mock_fabric_api_client(builder) as mock_api_client:
+            for _ in range(2):
+                with pytest.raises(McpError) as exc_info:
+                    await server.fabric_get_pattern_details("missing")
+                assert_mcp_error(exc_info, INVALID_PARAMS, "not found")
+
+        assert mock_api_client.get.call_count == 1
+        stats = server.get_cache_stats()["fabric_get_pattern_details"]
+        assert stats.negative_hits == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("builder", "not_found"),
+        [
+            (
+                FabricApiMockBuilder().with_successful_pattern_details("summarize"),
+                False,
+            ),
+            (
+                FabricApiMockBuilder().with_http_error(
+                    500, "open /patterns/summarize/system.md: no such file or directory"
+                ),
+                True,
+            ),
+        ],
+        ids=["found", "not-found"],
+    )
+    async def test_cache_outlives_http_sessions(
+        self, server: FabricMCP, builder: FabricApiMockBuilder, not_found: bool
+    ) -> None:
+        """Test that sequential HTTP sessions share cached (and missing) details."""
+        with mock_fabric_api_client(builder) as mock_api_client:
+            async with serve_http_in_process(server) as url:
+                for _ in range(2):
+                    async with Client(StreamableHttpTransport(url)) as client:
+                        result = await client.call_tool_mcp(
+                            "fabric_get_pattern_details", {"pattern_name": "summarize"}
+                        )
+                        assert result.isError is not_found
+
+        mock_api_client.get.assert_called_once_with("/patterns/summarize")
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_cached(self, server: FabricMCP) -> None:
+        """Test that transient Fabric errors are retried on the next lookup."""
+        builder = FabricApiMockBuilder().with_http_error(500, "Internal Server Error")
+
+        with mock_fabric_api_client(builder) as mock_api_client:
+            for _ in range(2):
+                with pytest.raises(McpError):
+                    await server.fabric_get_pattern_details("summarize")
+
+        assert mock_api_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_cache(self, server: FabricMCP) -> None:
+        """Test that invalidating a pattern forces a fresh fetch."""
+        builder = FabricApiMockBuilder().with_successful_pattern_details("summarize")
+
+        with mock_fabric_api_client(builder) as mock_api_client:
+            await server.fabric_get_pattern_details("summarize")
+            server.invalidate_pattern_cache("summarize")
+            await server.fabric_get_pattern_details("summarize")
+            server.invalidate_pattern_cache()
+            await server.fabric_get_pattern_details("summarize")
+
+        assert mock_api_client.get.call_count == 3
@@ -3,10 +3,14 @@
 import inspect
 
 import pytest
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
 from fastmcp.tools import Tool
 from mcp.shared.exceptions import McpError
 from mcp.types import INTERNAL_ERROR
 
+from fabric_mcp.constants import PATTERN_LIST_TTL_ENV
+from fabric_mcp.core import FabricMCP
 from tests.shared.fabric_api.base import TestFixturesBase
 from tests.shared.fabric_api_mocks import (
     FabricApiMockBuilder,
@@ -14,12 +18,14 @@ from tests.shared.fabric_api_mocks import (
     assert_unexpected_error_test,
     mock_fabric_api_client,
 )
+from tests.shared.transport_test_utils import serve_http_in_process
 
 
 class TestFabricListPatterns(TestFixturesBase):
     """Test cases for the fabric_list_patterns MCP tool."""
 
-    def test_successful_response_with_multiple_patterns(
+    @pytest.mark.asyncio
+    async def test_successful_response_with_multiple_patterns(
         self, mcp_tools: dict[str, Tool]
     ):
         """Test successful API response with multiple pattern names."""
@@ -31,13 +37,16 @@ class TestFabricListPatterns(TestFixturesBase):
 
         # Act
         with mock_fabric_api_client(builder) as mock_client:
-            result = fabric_list_patterns()
+            result = await fabric_list_patterns()
 
         # Assert
         assert result == patterns
         assert_api_client_calls(mock_client, "/patterns/names")
 
-    def test_successful_response_with_empty_list(self, mcp_tools: dict[str, Tool]):
+    @pytest.mark.asyncio
+    async def test_successful_response_with_empty_list(
+        self, mcp_tools: dict[str, Tool]
+    ):
         """Test successful API response with empty pattern list."""
         # Arrange
         builder = FabricApiMockBuilder().with_successful_pattern_list([])
@@ -46,13 +55,14 @@ class TestFabricListPatterns(TestFixturesBase):
 
         # Act
         with mock_fabric_api_client(builder) as mock_client:
-            result = fabric_list_patterns()
+            result = await fabric_list_patterns()
 
         # Assert
         assert result == []
         assert_api_client_calls(mock_client, "/patterns/names")
 
-    def test_connection_error_handling(self, mcp_tools: dict[str, Tool]):
+    @pytest.mark.asyncio
+    async def test_connection_error_handling(self, mcp_tools: dict[str, Tool]):
         """Test handling of connection errors (httpx.RequestError)."""
         # Arrange
         builder = FabricApiMockBuilder().with_connection_error(
@@ -64,14 +74,15 @@ class TestFabricListPatterns(TestFixturesBase):
         # Act & Assert
         with mock_fabric_api_client(builder) as _:
             with pytest.raises(McpError) as exc_info:
-                fabric_list_patterns()
+                await fabric_list_patterns()
 
             assert "Failed to connect to Fabric API" in str(
                 exc_info.value.error.message
             )
             assert exc_info.value.error.code == INTERNAL_ERROR
 
-    def test_http_status_error_handling(self, mcp_tools: dict[str, Tool]):
+    @pytest.mark.asyncio
+    async def test_http_status_error_handling(self, mcp_tools: dict[str, Tool]):
         """Test handling of HTTP status errors (httpx.HTTPStatusError)."""
         # Arrange
         builder = FabricApiMockBuilder().with_http_error(
@@ -83,7 +94,7 @@ class TestFabricListPatterns(TestFixturesBase):
         # Act & Assert
         with mock_fabric_api_client(builder) as mock_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_list_patterns()
+                await fabric_list_patterns()
 
             assert (
                 "Fabric API error during retrieving patterns: 500 Internal Server Error"
@@ -92,7 +103,8 @@ class TestFabricListPatterns(TestFixturesBase):
             assert exc_info.value.error.code == INTERNAL_ERROR
             assert_api_client_calls(mock_client, "/patterns/names")
 
-    def test_json_parsing_error_handling(self, mcp_tools: dict[str, Tool]):
+    @pytest.mark.asyncio
+    async def test_json_parsing_error_handling(self, mcp_tools: dict[str, Tool]):
         """Test handling of JSON parsing errors."""
         # Arrange
         builder = FabricApiMockBuilder().with_json_decode_error("Invalid JSON")
@@ -102,7 +114,7 @@ class TestFabricListPatterns(TestFixturesBase):
         # Act & Assert
         with mock_fabric_api_client(builder) as mock_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_list_patterns()
+                await fabric_list_patterns()
 
         assert "Unexpected error during retrieving patterns" in str(
             exc_info.value.error.message
@@ -110,10 +122,11 @@ class TestFabricListPatterns(TestFixturesBase):
         assert exc_info.value.error.code == INTERNAL_ERROR
         assert_api_client_calls(mock_client, "/patterns/names")
 
-    def test_unexpected_exception_handling(self, mcp_tools: dict[str, Tool]):
+    @pytest.mark.asyncio
+    async def test_unexpected_exception_handling(self, mcp_tools: dict[str, Tool]):
         """Test handling of unexpected exceptions."""
         fabric_list_patterns = getattr(mcp_tools["fabric_list_patterns"], "fn")
-        assert_unexpected_error_test(
+        await assert_unexpected_error_test(
             fabric_list_patterns,
             "Unexpected error during retrieving patterns",
         )
@@ -135,3 +148,74 @@ class TestFabricListPatterns(TestFixturesBase):
         fabric_list_patterns = getattr(mcp_tools["fabric_list_patterns"], "fn")
         assert fabric_list_patterns.__doc__ is not None
         assert "available fabric patterns" in fabric_list_patterns.__doc__.lower()
+
+
+class TestFabricListPatternsCache(TestFixturesBase):
+    """Test the TTL cache in front of fabric_list_patterns."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_hit_the_cache(self, server: FabricMCP):
+        """Test that a second call within the TTL does not reach Fabric."""
+        builder = FabricApiMockBuilder().with_successful_pattern_list(["summarize"])
+
+        with mock_fabric_api_client(builder) as mock_client:
+            first = await server.fabric_list_patterns()
+            first.append("mutated by caller")
+            second = await server.fabric_list_patterns()
+
+        assert second == ["summarize"]
+        assert mock_client.get.call_count == 1
+        stats = server.get_cache_stats()["fabric_list_patterns"]
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_is_not_cached(self, server: FabricMCP):
+        """Test that a validation failure is retried on the next call."""
+        builder = FabricApiMockBuilder().with_raw_response_data("not a list")
+
+        with mock_fabric_api_client(builder) as mock_client:
+            with pytest.raises(McpError):
+                await server.fabric_list_patterns()
+            builder.mock_response.json.return_value = ["summarize"]
+            assert await server.fabric_list_patterns() == ["summarize"]
+
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_from_environment(
+        self, server: FabricMCP, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that FABRIC_MCP_PATTERN_LIST_TTL=0 disables the cache."""
+        monkeypatch.setenv(PATTERN_LIST_TTL_ENV, "0")
+        builder = FabricApiMockBuilder().with_successful_pattern_list(["summarize"])
+
+        with mock_fabric_api_client(builder) as mock_client:
+            await server.fabric_list_patterns()
+            await server.fabric_list_patterns()
+
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_outlives_http_sessions(self, server: FabricMCP):
+        """Test that sequential HTTP sessions share the cached pattern list."""
+        builder = FabricApiMockBuilder().with_successful_pattern_list(["summarize"])
+
+        with mock_fabric_api_client(builder) as mock_client:
+            async with serve_http_in_process(server) as url:
+                for _ in range(3):
+                    async with Client(StreamableHttpTransport(url)) as client:
+                        await client.call_tool("fabric_list_patterns")
+
+        mock_client.get.assert_called_once_with("/patterns/names")
+
+    @pytest.mark.asyncio
+    async def test_close_clears_cache(self, server: FabricMCP):
+        """Test that closing the server drops cached patterns."""
+        builder = FabricApiMockBuilder().with_successful_pattern_list(["summarize"])
+
+        with mock_fabric_api_client(builder) as mock_client:
+            await server.fabric_list_patterns()
+            await server.close()
+            await server.fabric_list_patterns()
+
+        assert mock_client.get.call_count == 2
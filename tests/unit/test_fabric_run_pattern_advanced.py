@@ -31,7 +31,8 @@ from tests.unit.test_fabric_run_pattern_base import (
 class TestFabricRunPatternRequestConstruction(TestFabricRunPatternFixtureBase):
     """Test cases for fabric_run_pattern request construction with new parameters."""
 
-    def test_request_construction_with_new_parameters(
+    @pytest.mark.asyncio
+    async def test_request_construction_with_new_parameters(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test that new parameters are correctly included in API request."""
@@ -40,15 +41,15 @@ class TestFabricRunPatternRequestConstruction(TestFabricRunPatternFixtureBase):
         )
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            fabric_run_pattern_tool(
+            await fabric_run_pattern_tool(
                 "test_pattern",
                 "test input",
                 **COMMON_PARAMS_FULL,
             )
 
             # Verify API was called with correct parameters
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
 
             # Check prompt-level parameters
@@ -62,18 +63,19 @@ class TestFabricRunPatternRequestConstruction(TestFabricRunPatternFixtureBase):
             assert payload["presencePenalty"] == 0.1
             assert payload["frequencyPenalty"] == -0.1
 
-    def test_request_construction_with_defaults(
+    @pytest.mark.asyncio
+    async def test_request_construction_with_defaults(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test that omitted parameters use appropriate defaults."""
         builder = FabricApiMockBuilder().with_successful_sse("Default test")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            fabric_run_pattern_tool("test_pattern", "test input")
+            await fabric_run_pattern_tool("test_pattern", "test input")
 
             # Verify API was called with defaults
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
 
             # Check default values are used
@@ -85,7 +87,8 @@ class TestFabricRunPatternRequestConstruction(TestFabricRunPatternFixtureBase):
             prompt = payload["prompts"][0]
             assert prompt["strategyName"] == ""  # Default empty strategy
 
-    def test_backward_compatibility(
+    @pytest.mark.asyncio
+    async def test_backward_compatibility(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test that existing calls without new parameters still work."""
@@ -95,17 +98,19 @@ class TestFabricRunPatternRequestConstruction(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder):
             # Test basic call (original Story 3.1 format)
-            result = fabric_run_pattern_tool("test_pattern", "test input")
+            result = await fabric_run_pattern_tool("test_pattern", "test input")
             assert result["output_text"] == "Backward compatibility test"
             assert "output_format" in result
 
             # Test with stream parameter (original Story 3.1 format)
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=False)
+            result = await fabric_run_pattern_tool(
+                "test_pattern", "test input", stream=False
+            )
             assert result["output_text"] == "Backward compatibility test"
 
             # Test with config parameter (original Story 3.1 format)
             config = PatternExecutionConfig()
-            result = fabric_run_pattern_tool(
+            result = await fabric_run_pattern_tool(
                 "test_pattern", "test input", config=config
             )
             assert result["output_text"] == "Backward compatibility test"
@@ -162,7 +167,8 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
         tools = await server_gpt_model.get_tools()
         return getattr(tools["fabric_run_pattern"], "fn")
 
-    def test_pattern_not_found_500_error(
+    @pytest.mark.asyncio
+    async def test_pattern_not_found_500_error(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of 500 error indicating pattern not found."""
@@ -172,8 +178,8 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("nonexistent_pattern", "test input")
-                mock_api_client.close.assert_called_once()
+                await fabric_run_pattern_tool("nonexistent_pattern", "test input")
+                mock_api_client.close.assert_not_called()
 
             # Should be transformed to Invalid params error
             assert exc_info.value.error.code == INVALID_PARAMS
@@ -182,7 +188,8 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
                 in exc_info.value.error.message
             )
 
-    def test_generic_500_error(
+    @pytest.mark.asyncio
+    async def test_generic_500_error(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of generic 500 error (not pattern not found)."""
@@ -192,14 +199,15 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             error = exc_info.value
             assert error.error.code == INTERNAL_ERROR  # Internal error
             assert "Database connection failed" in error.error.message
-            client.close.assert_called_once()
+            client.close.assert_not_called()
 
-    def test_vendor_inference_from_model_name(
+    @pytest.mark.asyncio
+    async def test_vendor_inference_from_model_name(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test vendor inference when no default vendor is configured."""
@@ -209,7 +217,7 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
         with patch("fabric_mcp.core.get_default_model", return_value=(None, None)):
             with mock_fabric_api_client(builder):
                 config = PatternExecutionConfig(model_name="claude-3-sonnet")
-                result = fabric_run_pattern_tool(
+                result = await fabric_run_pattern_tool(
                     "test_pattern", "test input", config=config
                 )
                 assert result["output_text"] == "Inference test"
@@ -218,12 +226,13 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
         with patch("fabric_mcp.core.get_default_model", return_value=(None, None)):
             with mock_fabric_api_client(builder):
                 config = PatternExecutionConfig(model_name="gpt-4")
-                result = fabric_run_pattern_tool(
+                result = await fabric_run_pattern_tool(
                     "test_pattern", "test input", config=config
                 )
                 assert result["output_text"] == "Inference test"
 
-    def test_hardcoded_model_fallback_when_no_defaults(
+    @pytest.mark.asyncio
+    async def test_hardcoded_model_fallback_when_no_defaults(
         self, fabric_run_pattern_tool_no_defaults: Callable[..., Any]
     ) -> None:
         """Test fallback to hardcoded default model when no environment defaults."""
@@ -231,52 +240,54 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
 
         # Mock get_default_model to return None for both model and vendor
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool_no_defaults(
+            result: dict[str, Any] = await fabric_run_pattern_tool_no_defaults(
                 "test_pattern", "test input"
             )
 
             assert isinstance(result, dict)
             # Check that API was called (would use hardcoded defaults)
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["model"] == DEFAULT_MODEL
             assert payload["prompts"][0]["vendor"] == DEFAULT_VENDOR
 
-    def test_vendor_inference_for_claude_models(
+    @pytest.mark.asyncio
+    async def test_vendor_inference_for_claude_models(
         self, fabric_run_pattern_tool_claude: Callable[..., Any]
     ) -> None:
         """Test vendor inference from Claude model names."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool_claude(
+            result: dict[str, Any] = await fabric_run_pattern_tool_claude(
                 "test_pattern", "test input"
             )
 
             assert isinstance(result, dict)
             # Check that vendor was inferred as "anthropic" for Claude models
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["model"] == "claude-3-opus"
             assert payload["prompts"][0]["vendor"] == DEFAULT_VENDOR
 
-    def test_vendor_inference_for_gpt_models(
+    @pytest.mark.asyncio
+    async def test_vendor_inference_for_gpt_models(
         self, fabric_run_pattern_tool_gpt: Callable[..., Any]
     ) -> None:
         """Test vendor inference from GPT model names."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool_gpt(
+            result: dict[str, Any] = await fabric_run_pattern_tool_gpt(
                 "test_pattern", "test input"
             )
 
             assert isinstance(result, dict)
             # Check that vendor was inferred as "openai" for GPT models
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["model"] == "gpt-3.5-turbo"
             assert payload["prompts"][0]["vendor"] == DEFAULT_VENDOR
@@ -285,7 +296,8 @@ class TestFabricRunPatternModelInference(TestFabricRunPatternFixtureBase):
 class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBase):
     """Test cases for fabric_run_pattern tool variables and attachments parameters."""
 
-    def test_variables_parameter_basic(
+    @pytest.mark.asyncio
+    async def test_variables_parameter_basic(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test fabric_run_pattern with variables parameter."""
@@ -293,7 +305,7 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
         variables = {"key1": "value1", "key2": "value2"}
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input", variables=variables
             )
 
@@ -301,13 +313,14 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify variables were passed to the API
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["variables"] == variables
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_attachments_parameter_basic(
+    @pytest.mark.asyncio
+    async def test_attachments_parameter_basic(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test fabric_run_pattern with attachments parameter."""
@@ -315,7 +328,7 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
         attachments = ["file1.txt", "file2.pdf"]
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input", attachments=attachments
             )
 
@@ -323,13 +336,14 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify attachments were passed to the API
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["attachments"] == attachments
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_variables_and_attachments_together(
+    @pytest.mark.asyncio
+    async def test_variables_and_attachments_together(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test fabric_run_pattern with both variables and attachments."""
@@ -338,7 +352,7 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
         attachments = ["doc.txt", "data.json"]
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern",
                 "test input",
                 variables=variables,
@@ -349,21 +363,22 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify both parameters were passed to the API
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["variables"] == variables
             assert payload["prompts"][0]["attachments"] == attachments
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_variables_empty_dict(
+    @pytest.mark.asyncio
+    async def test_variables_empty_dict(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test fabric_run_pattern with empty variables dict."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input", variables={}
             )
 
@@ -371,20 +386,21 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify empty variables dict was passed
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["variables"] == {}
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_attachments_empty_list(
+    @pytest.mark.asyncio
+    async def test_attachments_empty_list(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test fabric_run_pattern with empty attachments list."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input", attachments=[]
             )
 
@@ -392,20 +408,21 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify empty attachments list was passed
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert payload["prompts"][0]["attachments"] == []
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_variables_none_excluded_from_payload(
+    @pytest.mark.asyncio
+    async def test_variables_none_excluded_from_payload(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test that None variables are excluded from API payload."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input", variables=None
             )
 
@@ -413,20 +430,21 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify variables is not in the payload when None
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert "variables" not in payload["prompts"][0]
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_attachments_none_excluded_from_payload(
+    @pytest.mark.asyncio
+    async def test_attachments_none_excluded_from_payload(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test that None attachments are excluded from API payload."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input", attachments=None
             )
 
@@ -434,17 +452,18 @@ class TestFabricRunPatternVariablesAndAttachments(TestFabricRunPatternFixtureBas
             assert result["output_text"] == "Hello, World!"
 
             # Verify attachments is not in the payload when None
-            mock_api_client.post.assert_called_once()
-            call_args = mock_api_client.post.call_args
+            mock_api_client.stream.assert_called_once()
+            call_args = mock_api_client.stream.call_args
             payload = call_args[1]["json_data"]
             assert "attachments" not in payload["prompts"][0]
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
 
 class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
     """Test cases for fabric_run_pattern tool with unexpected SSE data types."""
 
-    def test_unexpected_sse_data_type(
+    @pytest.mark.asyncio
+    async def test_unexpected_sse_data_type(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of unexpected SSE data type."""
@@ -458,7 +477,7 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
             # Let's see what actually happens - it might return successfully
             # but with empty content due to no 'complete' signal
             try:
-                result = fabric_run_pattern_tool("test_pattern", "test input")
+                result = await fabric_run_pattern_tool("test_pattern", "test input")
                 # If it doesn't raise an error, we should get an empty result
                 assert result["output_text"] == ""
                 assert result["output_format"] == "text"
@@ -470,9 +489,10 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
                     or "Unexpected SSE data type" in error_msg
                 )
 
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_unexpected_sse_data_type_with_unknown_field(
+    @pytest.mark.asyncio
+    async def test_unexpected_sse_data_type_with_unknown_field(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of SSE data with missing type field."""
@@ -485,7 +505,7 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # This should trigger the unexpected SSE data type handling
             try:
-                result = fabric_run_pattern_tool("test_pattern", "test input")
+                result = await fabric_run_pattern_tool("test_pattern", "test input")
                 # If it doesn't raise an error, we should get an empty result
                 assert result["output_text"] == ""
                 assert result["output_format"] == "text"
@@ -497,9 +517,10 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
                     or "Unexpected SSE data type" in error_msg
                 )
 
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_sse_error_response_detailed(
+    @pytest.mark.asyncio
+    async def test_sse_error_response_detailed(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of SSE error response with detailed error message."""
@@ -507,12 +528,13 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Pattern validation failed")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_unexpected_sse_data_type_forces_exception(
+    @pytest.mark.asyncio
+    async def test_unexpected_sse_data_type_forces_exception(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test to ensure unexpected SSE type definitely triggers exception."""
@@ -525,7 +547,7 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
         with mock_fabric_api_client(builder) as mock_api_client:
             # This should either raise an error or return empty result
             try:
-                result = fabric_run_pattern_tool("test_pattern", "test input")
+                result = await fabric_run_pattern_tool("test_pattern", "test input")
                 # If no exception, it should return empty content
                 assert result["output_text"] == ""
                 assert result["output_format"] == "text"
@@ -537,13 +559,14 @@ class TestFabricRunPatternUnexpectedSSETypes(TestFabricRunPatternFixtureBase):
                     or "Empty SSE stream" in error_msg
                 )
 
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
 
 class TestFabricRunPatternCoverageTargets(TestFabricRunPatternFixtureBase):
     """Test cases to target specific missing coverage lines."""
 
-    def test_default_config_creation_without_explicit_config(
+    @pytest.mark.asyncio
+    async def test_default_config_creation_without_explicit_config(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test calling fabric_run_pattern without config to trigger defaults."""
@@ -551,7 +574,7 @@ class TestFabricRunPatternCoverageTargets(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             # Call without config parameter to trigger default config creation
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern",
                 "test input",
                 # No config parameter provided - should trigger line 494
@@ -560,4 +583,4 @@ class TestFabricRunPatternCoverageTargets(TestFabricRunPatternFixtureBase):
             assert isinstance(result, dict)
             assert result["output_text"] == "Coverage test"
             assert result["output_format"] == "text"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
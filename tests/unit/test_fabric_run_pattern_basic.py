@@ -7,6 +7,8 @@ including successful execution with various input and output formats.
 from collections.abc import Callable
 from typing import Any
 
+import pytest
+
 from tests.shared.fabric_api_mocks import (
     FabricApiMockBuilder,
     mock_fabric_api_client,
@@ -17,14 +19,15 @@ from tests.unit.test_fabric_run_pattern_base import TestFabricRunPatternFixtureB
 class TestFabricRunPatternBasicExecution(TestFabricRunPatternFixtureBase):
     """Test cases for basic fabric_run_pattern tool execution scenarios."""
 
-    def test_successful_execution_with_basic_input(
+    @pytest.mark.asyncio
+    async def test_successful_execution_with_basic_input(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test successful pattern execution with basic input."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input"
             )
 
@@ -33,9 +36,10 @@ class TestFabricRunPatternBasicExecution(TestFabricRunPatternFixtureBase):
             assert "output_text" in result
             assert result["output_text"] == "Hello, World!"
             assert result["output_format"] == "text"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_successful_execution_with_markdown_format(
+    @pytest.mark.asyncio
+    async def test_successful_execution_with_markdown_format(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test successful pattern execution with markdown output."""
@@ -44,15 +48,16 @@ class TestFabricRunPatternBasicExecution(TestFabricRunPatternFixtureBase):
         )
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input"
             )
 
             assert result["output_text"] == "# Header\n\nContent"
             assert result["output_format"] == "markdown"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_successful_execution_with_complex_sse_response(
+    @pytest.mark.asyncio
+    async def test_successful_execution_with_complex_sse_response(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test pattern execution with complex SSE response containing
@@ -66,15 +71,16 @@ class TestFabricRunPatternBasicExecution(TestFabricRunPatternFixtureBase):
         builder = FabricApiMockBuilder().with_sse_lines(sse_lines)
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input"
             )
 
             assert result["output_text"] == "First chunk Second chunk Final chunk"
             assert result["output_format"] == "text"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_sse_response_with_empty_lines(
+    @pytest.mark.asyncio
+    async def test_sse_response_with_empty_lines(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test SSE parsing to ensure handling of empty lines in the response."""
@@ -89,11 +95,11 @@ class TestFabricRunPatternBasicExecution(TestFabricRunPatternFixtureBase):
         builder = FabricApiMockBuilder().with_sse_lines(sse_lines)
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input"
             )
 
             assert isinstance(result, dict)
             assert result["output_text"] == "Hello"
             assert result["output_format"] == "text"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
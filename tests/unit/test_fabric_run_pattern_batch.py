@@ -0,0 +1,176 @@
+"""Unit tests for the fabric_run_pattern_batch tool."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import call
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastmcp.tools import Tool
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
+
+from fabric_mcp.models import PatternExecutionConfig
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    MCP_REQUEST_ID,
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+    mock_mcp_context,
+)
+
+
+class ConcurrencyTracker:
+    """Chat handler that upper-cases its input and records peak concurrency."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.payloads: list[dict[str, Any]] = []
+
+    async def __call__(self, payload: dict[str, Any]) -> str:
+        self.payloads.append(payload)
+        text: str = payload["prompts"][0]["userInput"]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Later inputs finish first, so ordering is not an accident
+            await asyncio.sleep(self.delay / (1 + len(self.payloads)))
+            if text == "fail":
+                raise httpx.ConnectError("Connection refused")
+            return text.upper()
+        finally:
+            self.active -= 1
+
+
+class TestFabricRunPatternBatch(TestFixturesBase):
+    """Test cases for the fabric_run_pattern_batch tool."""
+
+    @pytest_asyncio.fixture
+    async def run_batch(self, mcp_tools: dict[str, Tool]) -> Callable[..., Any]:
+        """Get the fabric_run_pattern_batch tool from the server."""
+        return getattr(mcp_tools["fabric_run_pattern_batch"], "fn")
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_with_per_item_errors(
+        self, run_batch: Callable[..., Any]
+    ):
+        """Test that results line up with inputs and failures stay per item."""
+        handler = ConcurrencyTracker()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+
+        with mock_fabric_api_client(builder):
+            result = await run_batch("summarize", ["one", "fail", "three", "four"])
+
+        assert result["succeeded"] == 3
+        assert result["failed"] == 1
+        outputs = [r.get("output_text") for r in result["results"]]
+        assert outputs == ["ONE", None, "THREE", "FOUR"]
+        error = result["results"][1]["error"]
+        assert error["code"] == INTERNAL_ERROR
+        assert "summarize" in error["message"]
+
+    @pytest.mark.asyncio
+    async def test_shared_config_applies_to_every_run(
+        self, run_batch: Callable[..., Any]
+    ):
+        """Test that every /chat request carries the shared configuration."""
+        handler = ConcurrencyTracker()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+        config = PatternExecutionConfig(model_name="gpt-4o-mini", temperature=0.2)
+
+        with mock_fabric_api_client(builder):
+            await run_batch("summarize", ["a", "b"], config=config)
+
+        assert [p["prompts"][0]["model"] for p in handler.payloads] == [
+            "gpt-4o-mini"
+        ] * 2
+        assert [p["temperature"] for p in handler.payloads] == [0.2, 0.2]
+
+    @pytest.mark.parametrize(
+        ("env_cap", "max_parallel", "expected_peak"),
+        [("8", 2, 2), ("3", 10, 3), ("3", None, 3)],
+    )
+    @pytest.mark.asyncio
+    async def test_parallelism_is_capped(
+        self,
+        run_batch: Callable[..., Any],
+        monkeypatch: pytest.MonkeyPatch,
+        env_cap: str,
+        max_parallel: int | None,
+        expected_peak: int,
+    ):
+        """Test that max_parallel and FABRIC_MCP_BATCH_PARALLELISM bound runs."""
+        monkeypatch.setenv("FABRIC_MCP_BATCH_PARALLELISM", env_cap)
+        handler = ConcurrencyTracker()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+
+        with mock_fabric_api_client(builder):
+            result = await run_batch(
+                "summarize", [f"input {n}" for n in range(8)], max_parallel=max_parallel
+            )
+
+        assert result["succeeded"] == 8
+        assert handler.peak == expected_peak
+
+    @pytest.mark.asyncio
+    async def test_progress_is_reported_per_completed_input(
+        self, run_batch: Callable[..., Any]
+    ):
+        """Test one progress notification per finished input."""
+        builder = FabricApiMockBuilder().with_chat_handler(ConcurrencyTracker())
+        ctx = mock_mcp_context(progress_token="batch-1")
+
+        with mock_fabric_api_client(builder):
+            await run_batch("summarize", ["a", "b", "c"], ctx=ctx)
+
+        session = ctx.request_context.session
+        assert session.send_progress_notification.await_args_list == [
+            call(
+                progress_token="batch-1",
+                progress=n,
+                total=3,
+                related_request_id=MCP_REQUEST_ID,
+            )
+            for n in (1, 2, 3)
+        ]
+
+    @pytest.mark.parametrize(
+        ("pattern_name", "inputs", "max_parallel", "config", "message"),
+        [
+            ("summarize", [], None, None, "inputs must be a non-empty list"),
+            ("  ", ["a"], None, None, "pattern_name must be a non-empty string"),
+            ("summarize", ["a"], 0, None, "max_parallel must be at least 1"),
+            ("summarize", ["a"], -2, None, "max_parallel must be at least 1"),
+            (
+                "summarize",
+                ["a"],
+                None,
+                PatternExecutionConfig(temperature=3),
+                "temperature must be a number between 0.0 and 2.0",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_are_rejected(
+        self,
+        run_batch: Callable[..., Any],
+        pattern_name: str,
+        inputs: list[str],
+        max_parallel: int | None,
+        config: PatternExecutionConfig | None,
+        message: str,
+    ):
+        """Test that invalid batch arguments fail before any run starts."""
+        with mock_fabric_api_client() as mock_client:
+            with pytest.raises(McpError) as exc_info:
+                await run_batch(
+                    pattern_name, inputs, config=config, max_parallel=max_parallel
+                )
+
+        assert exc_info.value.error.code == INVALID_PARAMS
+        assert exc_info.value.error.message == message
+        mock_client.stream.assert_not_called()
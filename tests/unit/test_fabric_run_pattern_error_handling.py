@@ -26,7 +26,8 @@ _ = fabric_api_server_fixture  # to get rid of unused variable warning
 class TestFabricRunPatternErrorHandling(TestFabricRunPatternFixtureBase):
     """Test cases for fabric_run_pattern tool error handling."""
 
-    def test_network_connection_error(
+    @pytest.mark.asyncio
+    async def test_network_connection_error(
         self, server: FabricMCP, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of network connection errors."""
@@ -35,35 +36,42 @@ class TestFabricRunPatternErrorHandling(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             # Connection errors should be wrapped in McpError by the tool wrapper
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Error executing pattern")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_http_404_error(self, fabric_run_pattern_tool: Callable[..., Any]) -> None:
+    @pytest.mark.asyncio
+    async def test_http_404_error(
+        self, fabric_run_pattern_tool: Callable[..., Any]
+    ) -> None:
         """Test handling of HTTP 404 errors."""
         builder = FabricApiMockBuilder().with_http_error(404, "Pattern not found")
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("nonexistent_pattern", "test input")
+                await fabric_run_pattern_tool("nonexistent_pattern", "test input")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Fabric API returned error 404")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_timeout_error(self, fabric_run_pattern_tool: Callable[..., Any]) -> None:
+    @pytest.mark.asyncio
+    async def test_timeout_error(
+        self, fabric_run_pattern_tool: Callable[..., Any]
+    ) -> None:
         """Test handling of timeout errors."""
         builder = FabricApiMockBuilder().with_timeout_error()
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Request timed out")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_sse_error_response(
+    @pytest.mark.asyncio
+    async def test_sse_error_response(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of SSE error responses."""
@@ -71,12 +79,13 @@ class TestFabricRunPatternErrorHandling(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Pattern execution failed")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_malformed_sse_data(
+    @pytest.mark.asyncio
+    async def test_malformed_sse_data(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of malformed SSE data."""
@@ -84,12 +93,13 @@ class TestFabricRunPatternErrorHandling(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Malformed SSE data")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_empty_sse_stream(
+    @pytest.mark.asyncio
+    async def test_empty_sse_stream(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test handling of empty SSE stream."""
@@ -97,12 +107,13 @@ class TestFabricRunPatternErrorHandling(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             with pytest.raises(McpError) as exc_info:
-                fabric_run_pattern_tool("test_pattern", "test input")
+                await fabric_run_pattern_tool("test_pattern", "test input")
 
             assert_mcp_error(exc_info, INTERNAL_ERROR, "Empty SSE stream")
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_sse_stream_with_non_data_lines(
+    @pytest.mark.asyncio
+    async def test_sse_stream_with_non_data_lines(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test SSE stream processing with non-data lines (should be ignored)."""
@@ -116,10 +127,10 @@ class TestFabricRunPatternErrorHandling(TestFabricRunPatternFixtureBase):
         builder = FabricApiMockBuilder().with_sse_lines(sse_lines)
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result: dict[str, Any] = fabric_run_pattern_tool(
+            result: dict[str, Any] = await fabric_run_pattern_tool(
                 "test_pattern", "test input"
             )
 
             assert result["output_text"] == "Hello"
             assert result["output_format"] == "text"
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
@@ -0,0 +1,127 @@
+"""Unit tests for the fabric_run_pattern_fanout tool."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastmcp.tools import Tool
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
+
+from fabric_mcp.models import PatternExecutionConfig, PatternRun
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+)
+
+
+class BarrierHandler:
+    """Chat handler that only answers once `parties` requests are in flight."""
+
+    def __init__(self, parties: int) -> None:
+        self.parties = parties
+        self.payloads: list[dict[str, Any]] = []
+        self.all_arrived = asyncio.Event()
+
+    async def __call__(self, payload: dict[str, Any]) -> str:
+        self.payloads.append(payload)
+        if len(self.payloads) >= self.parties:
+            self.all_arrived.set()
+        # Times out (and fails the test) if the runs were serialized
+        await asyncio.wait_for(self.all_arrived.wait(), 2)
+        prompt = payload["prompts"][0]
+        if prompt["patternName"] == "broken":
+            raise httpx.ConnectError("Connection refused")
+        return f"{prompt['patternName']}: {prompt['userInput']}"
+
+
+class TestFabricRunPatternFanout(TestFixturesBase):
+    """Test cases for the fabric_run_pattern_fanout tool."""
+
+    @pytest_asyncio.fixture
+    async def run_fanout(self, mcp_tools: dict[str, Tool]) -> Callable[..., Any]:
+        """Get the fabric_run_pattern_fanout tool from the server."""
+        return getattr(mcp_tools["fabric_run_pattern_fanout"], "fn")
+
+    @pytest.mark.asyncio
+    async def test_patterns_run_concurrently_and_map_to_results(
+        self, run_fanout: Callable[..., Any]
+    ):
+        """Test that every pattern runs at once and is keyed by its name."""
+        names = ["extract_claims", "extract_insights", "summarize"]
+        builder = FabricApiMockBuilder().with_chat_handler(BarrierHandler(len(names)))
+
+        with mock_fabric_api_client(builder):
+            result = await run_fanout([PatternRun(name) for name in names], "doc")
+
+        assert list(result["results"]) == names
+        assert {name: r["output_text"] for name, r in result["results"].items()} == {
+            name: f"{name}: doc" for name in names
+        }
+        assert (result["succeeded"], result["failed"]) == (3, 0)
+        assert all(r["duration_seconds"] >= 0 for r in result["results"].values())
+        assert result["total_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_per_pattern_config_and_errors(self, run_fanout: Callable[..., Any]):
+        """Test per-pattern configs and that one failure leaves the rest intact."""
+        handler = BarrierHandler(2)
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+        patterns = [
+            PatternRun("summarize", PatternExecutionConfig(model_name="gpt-4o-mini")),
+            PatternRun("broken"),
+        ]
+
+        with mock_fabric_api_client(builder):
+            result = await run_fanout(patterns, "doc")
+
+        models = {
+            p["prompts"][0]["patternName"]: p["prompts"][0]["model"]
+            for p in handler.payloads
+        }
+        assert models["summarize"] == "gpt-4o-mini"
+        assert result["results"]["summarize"]["output_text"] == "summarize: doc"
+        assert result["results"]["broken"]["error"]["code"] == INTERNAL_ERROR
+        assert (result["succeeded"], result["failed"]) == (1, 1)
+
+    @pytest.mark.parametrize(
+        ("patterns", "max_parallel", "message"),
+        [
+            ([], None, "patterns must be a non-empty list"),
+            ([PatternRun("")], None, "pattern_name must be a non-empty string"),
+            (
+                [PatternRun("a"), PatternRun("b"), PatternRun("a")],
+                None,
+                "patterns must be unique; repeated: a",
+            ),
+            (
+                [
+                    PatternRun("a"),
+                    PatternRun("b", PatternExecutionConfig(temperature=-1)),
+                ],
+                None,
+                "temperature must be a number between 0.0 and 2.0",
+            ),
+            ([PatternRun("a")], 0, "max_parallel must be at least 1"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_invalid_patterns_are_rejected(
+        self,
+        run_fanout: Callable[..., Any],
+        patterns: list[PatternRun],
+        max_parallel: int | None,
+        message: str,
+    ):
+        """Test that invalid arguments fail before any run starts."""
+        with mock_fabric_api_client() as mock_client:
+            with pytest.raises(McpError) as exc_info:
+                await run_fanout(patterns, "doc", max_parallel=max_parallel)
+
+        assert exc_info.value.error.code == INVALID_PARAMS
+        assert exc_info.value.error.message == message
+        mock_client.stream.assert_not_called()
@@ -0,0 +1,209 @@
+"""Unit tests for the fabric_run_pattern_mapreduce tool."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastmcp.tools import Tool
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
+
+from fabric_mcp.chunking import estimate_tokens
+from fabric_mcp.constants import MAPREDUCE_SEPARATOR
+from fabric_mcp.models import PatternExecutionConfig
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+)
+
+DOCUMENT = "\n\n".join(
+    f"Section {n} opens here. It has a second sentence. And a third one."
+    for n in range(12)
+)
+# Chunk sizes are estimated for the configured model
+GPT_4O = PatternExecutionConfig(model_name="gpt-4o")
+
+
+class MapReduceHandler:
+    """Chat handler with a few toy patterns.
+
+    - ``heading``: the first three words of its input
+    - ``echo``: its input, unchanged
+    - ``first_line``: the first line of its input
+    """
+
+    def __init__(self, failing_text: str | None = None) -> None:
+        self.failing_text = failing_text
+        self.calls: list[tuple[str, str]] = []
+
+    async def __call__(self, payload: dict[str, Any]) -> str:
+        prompt = payload["prompts"][0]
+        pattern, text = prompt["patternName"], prompt["userInput"]
+        self.calls.append((pattern, text))
+        if self.failing_text and self.failing_text in text:
+            raise httpx.ConnectError("Connection refused")
+        if pattern == "heading":
+            return " ".join(text.split()[:2])
+        if pattern == "first_line":
+            return text.split("\n")[0]
+        return text
+
+
+class TestFabricRunPatternMapreduce(TestFixturesBase):
+    """Test cases for the fabric_run_pattern_mapreduce tool."""
+
+    @pytest_asyncio.fixture
+    async def run_mapreduce(self, mcp_tools: dict[str, Tool]) -> Callable[..., Any]:
+        """Get the fabric_run_pattern_mapreduce tool from the server."""
+        return getattr(mcp_tools["fabric_run_pattern_mapreduce"], "fn")
+
+    @pytest.mark.asyncio
+    async def test_small_input_runs_once(self, run_mapreduce: Callable[..., Any]):
+        """Test that an input that fits one chunk skips the reduce step."""
+        handler = MapReduceHandler()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+
+        with mock_fabric_api_client(builder):
+            result = await run_mapreduce("heading", "Short input text", "first_line")
+
+        assert handler.calls == [("heading", "Short input text")]
+        assert result["output_text"] == "Short input"
+        assert (result["chunks"], result["reduce_rounds"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_mapped_then_reduced_in_order(
+        self, run_mapreduce: Callable[..., Any]
+    ):
+        """Test that the reduce pattern gets every partial output, in order."""
+        handler = MapReduceHandler()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+
+        with mock_fabric_api_client(builder):
+            result = await run_mapreduce(
+                "heading",
+                DOCUMENT,
+                reduce_pattern_name="echo",
+                config=GPT_4O,
+                chunk_tokens=40,
+                overlap_tokens=0,
+            )
+
+        mapped = [text for pattern, text in handler.calls if pattern == "heading"]
+        assert len(mapped) == result["chunks"] > 1
+        assert all(estimate_tokens(text, "gpt-4o") <= 40 for text in mapped)
+        assert "".join(mapped) == DOCUMENT
+        assert handler.calls[-1][0] == "echo"
+        expected = MAPREDUCE_SEPARATOR.join(
+            " ".join(text.split()[:2]) for text in mapped
+        )
+        assert result["output_text"] == expected
+        assert result["reduce_rounds"] == 1
+        assert result["total_seconds"] >= result["map_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_large_partials_are_reduced_hierarchically(
+        self, run_mapreduce: Callable[..., Any]
+    ):
+        """Test that partial outputs too big for one call are reduced in groups."""
+        handler = MapReduceHandler()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+
+        with mock_fabric_api_client(builder):
+            result = await run_mapreduce(
+                "echo",
+                DOCUMENT,
+                reduce_pattern_name="first_line",
+                config=GPT_4O,
+                chunk_tokens=40,
+                overlap_tokens=0,
+            )
+
+        assert result["reduce_rounds"] > 1
+        reduce_inputs = [t for p, t in handler.calls if p == "first_line"]
+        assert all(estimate_tokens(text, "gpt-4o") <= 40 for text in reduce_inputs)
+        assert result["output_text"] == DOCUMENT.split("\n", maxsplit=1)[0]
+        assert handler.calls[-1][0] == "first_line"
+
+    @pytest.mark.asyncio
+    async def test_default_chunk_size_follows_the_model(
+        self,
+        run_mapreduce: Callable[..., Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that the chunk size is capped at half the model's context."""
+        monkeypatch.setenv("FABRIC_MCP_MAPREDUCE_CHUNK_TOKENS", "1000000")
+        handler = MapReduceHandler()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+        text = "word " * 20_000  # ~28k tokens for a gpt-4 sized model
+        config = PatternExecutionConfig(model_name="gpt-4")
+
+        with mock_fabric_api_client(builder):
+            result = await run_mapreduce("heading", text, "echo", config=config)
+
+        assert result["chunks"] > 1
+        mapped = [t for p, t in handler.calls if p == "heading"]
+        assert all(estimate_tokens(t, "gpt-4") <= 4096 for t in mapped)
+
+    @pytest.mark.asyncio
+    async def test_failing_chunk_is_named(self, run_mapreduce: Callable[..., Any]):
+        """Test that a failed chunk fails the call and says which one it was."""
+        handler = MapReduceHandler(failing_text="Section 5 ")
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+
+        with mock_fabric_api_client(builder):
+            with pytest.raises(McpError) as exc_info:
+                await run_mapreduce(
+                    "heading", DOCUMENT, chunk_tokens=40, overlap_tokens=0
+                )
+
+        assert exc_info.value.error.code == INTERNAL_ERROR
+        assert exc_info.value.error.message.startswith("Map-reduce chunk ")
+        assert "('heading') failed:" in exc_info.value.error.message
+        assert all(pattern == "heading" for pattern, _ in handler.calls)
+
+    @pytest.mark.parametrize(
+        ("arguments", "message"),
+        [
+            ({"pattern_name": " "}, "pattern_name must be a non-empty string"),
+            (
+                {"reduce_pattern_name": ""},
+                "reduce_pattern_name must be a non-empty string",
+            ),
+            ({"chunk_tokens": 0}, "chunk_tokens must be at least 1"),
+            ({"chunk_tokens": -100}, "chunk_tokens must be at least 1"),
+            ({"overlap_tokens": -1}, "overlap_tokens must not be negative"),
+            (
+                {"chunk_tokens": 100, "overlap_tokens": 100},
+                "overlap_tokens must be less than chunk_tokens",
+            ),
+            (
+                {"chunk_tokens": 100, "overlap_tokens": 500},
+                "overlap_tokens must be less than chunk_tokens",
+            ),
+            ({"max_parallel": 0}, "max_parallel must be at least 1"),
+            ({"max_parallel": -1}, "max_parallel must be at least 1"),
+            (
+                {"config": PatternExecutionConfig(presence_penalty=9)},
+                "presence_penalty must be a number between -2.0 and 2.0",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_are_rejected(
+        self,
+        run_mapreduce: Callable[..., Any],
+        arguments: dict[str, Any],
+        message: str,
+    ):
+        """Test that invalid arguments fail before any run starts."""
+        kwargs: dict[str, Any] = {"pattern_name": "heading", "input_text": DOCUMENT}
+        with mock_fabric_api_client() as mock_client:
+            with pytest.raises(McpError) as exc_info:
+                await run_mapreduce(**(kwargs | arguments))
+
+        assert exc_info.value.error.code == INVALID_PARAMS
+        assert exc_info.value.error.message == message
+        mock_client.stream.assert_not_called()
@@ -1,19 +1,28 @@
 """Tests for fabric_run_pattern tool streaming functionality.
 
 This module tests the streaming functionality of the fabric_run_pattern tool,
-including streaming mode behavior, error handling during streaming, and
-comparison between streaming and non-streaming modes.
+including chunk forwarding as MCP notifications, error handling during
+streaming, and comparison between streaming and non-streaming modes.
 """
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
 from typing import Any
+from unittest.mock import Mock, call
 
 import pytest
+from mcp.shared.exceptions import McpError
 
+from fabric_mcp.constants import STREAM_LOGGER_NAME
+from fabric_mcp.core import FabricMCP
 from tests.shared.fabric_api.utils import fabric_api_server_fixture
 from tests.shared.fabric_api_mocks import (
+    MCP_REQUEST_ID,
     FabricApiMockBuilder,
     mock_fabric_api_client,
+    mock_mcp_context,
+    sse_event_bytes,
 )
 from tests.unit.test_fabric_run_pattern_base import TestFabricRunPatternFixtureBase
 
@@ -23,42 +32,26 @@ _ = fabric_api_server_fixture  # to get rid of unused variable warning
 class TestFabricRunPatternStreaming(TestFabricRunPatternFixtureBase):
     """Test cases for fabric_run_pattern tool streaming functionality."""
 
-    def test_streaming_mode_with_simple_content(
+    @pytest.mark.asyncio
+    async def test_streaming_mode_with_simple_content(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
-        """Test streaming mode returns generator with simple content."""
+        """Test streaming mode returns the aggregated result."""
         builder = FabricApiMockBuilder().with_successful_sse("Hello, World!")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=True)
-
-            # Should return a generator for streaming mode
-            assert hasattr(result, "__iter__")
-
-            # Collect all chunks from the stream
-            chunks = list(result)
-
-            # Should have content and complete chunks
-            assert len(chunks) >= 1
-
-            # Find content chunks
-            content_chunks = [c for c in chunks if c.get("type") == "content"]
-            assert len(content_chunks) >= 1
-
-            # Verify chunk structure
-            content_chunk = content_chunks[0]
-            assert "type" in content_chunk
-            assert "format" in content_chunk
-            assert "content" in content_chunk
-            assert content_chunk["type"] == "content"
-            assert content_chunk["content"] == "Hello, World!"
+            result = await fabric_run_pattern_tool(
+                "test_pattern", "test input", stream=True
+            )
 
-            mock_api_client.close.assert_called_once()
+            assert result == {"output_format": "text", "output_text": "Hello, World!"}
+            mock_api_client.close.assert_not_called()
 
-    def test_streaming_mode_with_multiple_chunks(
+    @pytest.mark.asyncio
+    async def test_streaming_mode_sends_progress_per_chunk(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
-        """Test streaming mode with multiple content chunks."""
+        """Test each content chunk becomes a progress notification, in order."""
         sse_lines = [
             'data: {"type": "content", "content": "First", "format": "text"}',
             'data: {"type": "content", "content": " Second", "format": "text"}',
@@ -66,94 +59,122 @@ class TestFabricRunPatternStreaming(TestFabricRunPatternFixtureBase):
             'data: {"type": "complete"}',
         ]
         builder = FabricApiMockBuilder().with_sse_lines(sse_lines)
+        ctx = mock_mcp_context(progress_token="run-1")
 
-        with mock_fabric_api_client(builder) as mock_api_client:
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=True)
-
-            chunks = list(result)
-            content_chunks = [c for c in chunks if c.get("type") == "content"]
-
-            # Should have 3 content chunks
-            assert len(content_chunks) == 3
-            assert content_chunks[0]["content"] == "First"
-            assert content_chunks[1]["content"] == " Second"
-            assert content_chunks[2]["content"] == " Third"
+        with mock_fabric_api_client(builder):
+            result = await fabric_run_pattern_tool(
+                "test_pattern", "test input", stream=True, ctx=ctx
+            )
 
-            mock_api_client.close.assert_called_once()
+        assert result["output_text"] == "First Second Third"
+        session = ctx.request_context.session
+        assert session.send_progress_notification.await_args_list == [
+            call(
+                progress_token="run-1",
+                progress=n,
+                message=text,
+                related_request_id=MCP_REQUEST_ID,
+            )
+            for n, text in enumerate(["First", " Second", " Third"], start=1)
+        ]
+        session.send_log_message.assert_not_called()
 
-    def test_streaming_mode_with_different_formats(
+    @pytest.mark.asyncio
+    async def test_streaming_mode_falls_back_to_log_notifications(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
-        """Test streaming mode handles different content formats."""
+        """Test chunks are sent as log notifications without a progress token."""
         sse_lines = [
             'data: {"type": "content", "content": "# Header", "format": "markdown"}',
             'data: {"type": "content", "content": " Text", "format": "markdown"}',
             'data: {"type": "complete", "format": "markdown"}',
         ]
         builder = FabricApiMockBuilder().with_sse_lines(sse_lines)
+        ctx = mock_mcp_context(progress_token=None)
 
-        with mock_fabric_api_client(builder) as mock_api_client:
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=True)
+        with mock_fabric_api_client(builder):
+            result = await fabric_run_pattern_tool(
+                "test_pattern", "test input", stream=True, ctx=ctx
+            )
+
+        # Verify format is preserved in streaming
+        assert result == {"output_format": "markdown", "output_text": "# Header Text"}
+        session = ctx.request_context.session
+        assert session.send_log_message.await_args_list == [
+            call(
+                level="info",
+                data=text,
+                logger=STREAM_LOGGER_NAME,
+                related_request_id=MCP_REQUEST_ID,
+            )
+            for text in ["# Header", " Text"]
+        ]
+        session.send_progress_notification.assert_not_called()
 
-            chunks = list(result)
-            content_chunks = [c for c in chunks if c.get("type") == "content"]
+    @pytest.mark.asyncio
+    async def test_non_streaming_mode_sends_no_notifications(
+        self, fabric_run_pattern_tool: Callable[..., Any]
+    ) -> None:
+        """Test stream=False returns the result without per-chunk notifications."""
+        builder = FabricApiMockBuilder().with_successful_sse("Hello")
+        ctx = mock_mcp_context(progress_token="run-1")
 
-            # Verify format is preserved in streaming
-            assert len(content_chunks) == 2
-            assert content_chunks[0]["format"] == "markdown"
-            assert content_chunks[1]["format"] == "markdown"
+        with mock_fabric_api_client(builder):
+            result = await fabric_run_pattern_tool(
+                "test_pattern", "test input", stream=False, ctx=ctx
+            )
 
-            mock_api_client.close.assert_called_once()
+        assert result["output_text"] == "Hello"
+        ctx.request_context.session.send_progress_notification.assert_not_called()
+        ctx.request_context.session.send_log_message.assert_not_called()
 
-    def test_streaming_mode_error_handling(
+    @pytest.mark.asyncio
+    async def test_streaming_mode_error_handling(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test streaming mode error handling during stream."""
         builder = FabricApiMockBuilder().with_sse_error("Stream error occurred")
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=True)
-
-            # Should raise RuntimeError when iterating over the stream
-            with pytest.raises(RuntimeError) as exc_info:
-                list(result)
+            # Should raise McpError while reading the stream
+            with pytest.raises(McpError) as exc_info:
+                await fabric_run_pattern_tool("test_pattern", "test input", stream=True)
 
             assert "Stream error occurred" in str(exc_info.value)
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_streaming_mode_malformed_sse_data(
+    @pytest.mark.asyncio
+    async def test_streaming_mode_malformed_sse_data(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test streaming mode with malformed SSE data."""
         builder = FabricApiMockBuilder().with_partial_sse_data()
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=True)
-
-            # Should raise RuntimeError when processing malformed data
-            with pytest.raises(RuntimeError) as exc_info:
-                list(result)
+            # Should raise McpError when processing malformed data
+            with pytest.raises(McpError) as exc_info:
+                await fabric_run_pattern_tool("test_pattern", "test input", stream=True)
 
             assert "Malformed SSE data" in str(exc_info.value)
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_streaming_mode_empty_stream(
+    @pytest.mark.asyncio
+    async def test_streaming_mode_empty_stream(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test streaming mode with empty SSE stream."""
         builder = FabricApiMockBuilder().with_empty_sse_stream()
 
         with mock_fabric_api_client(builder) as mock_api_client:
-            result = fabric_run_pattern_tool("test_pattern", "test input", stream=True)
-
-            # Should raise RuntimeError for empty stream
-            with pytest.raises(RuntimeError) as exc_info:
-                list(result)
+            # Should raise McpError for empty stream
+            with pytest.raises(McpError) as exc_info:
+                await fabric_run_pattern_tool("test_pattern", "test input", stream=True)
 
             assert "Empty SSE stream" in str(exc_info.value)
-            mock_api_client.close.assert_called_once()
+            mock_api_client.close.assert_not_called()
 
-    def test_streaming_vs_non_streaming_behavior(
+    @pytest.mark.asyncio
+    async def test_streaming_vs_non_streaming_behavior(
         self, fabric_run_pattern_tool: Callable[..., Any]
     ) -> None:
         """Test that streaming vs non-streaming modes behave differently."""
@@ -166,7 +187,7 @@ class TestFabricRunPatternStreaming(TestFabricRunPatternFixtureBase):
 
         with mock_fabric_api_client(builder) as mock_api_client:
             # Test non-streaming mode (default)
-            non_streaming_result = fabric_run_pattern_tool(
+            non_streaming_result = await fabric_run_pattern_tool(
                 "test_pattern", "test input", stream=False
             )
 
@@ -178,20 +199,139 @@ class TestFabricRunPatternStreaming(TestFabricRunPatternFixtureBase):
 
         # Reset the mock for streaming test
         with mock_fabric_api_client(builder) as mock_api_client:
-            # Test streaming mode
-            streaming_result = fabric_run_pattern_tool(
-                "test_pattern", "test input", stream=True
+            ctx = mock_mcp_context()
+            streaming_result = await fabric_run_pattern_tool(
+                "test_pattern", "test input", stream=True, ctx=ctx
+            )
+
+            # Same final result, but the chunks were also sent individually
+            assert streaming_result == non_streaming_result
+            session = ctx.request_context.session
+            assert session.send_progress_notification.await_count == 2
+            # The shared client stays open across both calls
+            mock_api_client.close.assert_not_called()
+
+
+class TestFabricPatternIncrementalStreaming(TestFabricRunPatternFixtureBase):
+    """Test that stream=True delivers chunks as the upstream produces them."""
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_arrives_before_upstream_finishes(
+        self, server: FabricMCP
+    ) -> None:
+        """Test the first chunk is yielded while the /chat body is still open."""
+        release = asyncio.Event()
+
+        async def gated_sse_bytes() -> AsyncGenerator[bytes, None]:
+            yield sse_event_bytes(
+                'data: {"type": "content", "content": "Hello", "format": "text"}'
+            )
+            await release.wait()
+            yield sse_event_bytes(
+                'data: {"type": "content", "content": " World", "format": "text"}'
+            )
+            yield sse_event_bytes('data: {"type": "complete"}')
+
+        builder = FabricApiMockBuilder()
+        builder.mock_response.aiter_bytes = Mock(side_effect=gated_sse_bytes)
+
+        with mock_fabric_api_client(builder) as mock_api_client:
+            stream = await getattr(server, "_execute_fabric_pattern")(
+                "test_pattern", "test input", None, stream=True
+            )
+
+            first = await asyncio.wait_for(anext(stream), timeout=1)
+            assert first["content"] == "Hello"
+
+            release.set()
+            rest = [chunk async for chunk in stream]
+            assert [c["type"] for c in rest] == ["content", "complete"]
+
+            mock_api_client.stream.assert_called_once()
+            assert mock_api_client.stream.call_args[0] == ("POST", "/chat")
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_early_releases_upstream(
+        self, server: FabricMCP
+    ) -> None:
+        """Test abandoning the generator exits the upstream response context."""
+        upstream_closed = asyncio.Event()
+        builder = FabricApiMockBuilder().with_sse_lines(
+            [
+                'data: {"type": "content", "content": "a", "format": "text"}',
+                'data: {"type": "content", "content": "b", "format": "text"}',
+                'data: {"type": "complete"}',
+            ]
+        )
+
+        @asynccontextmanager
+        async def tracked_stream(
+            *_args: Any, **_kwargs: Any
+        ) -> AsyncGenerator[Mock, None]:
+            try:
+                yield builder.mock_response
+            finally:
+                upstream_closed.set()
+
+        builder.mock_api_client.stream = Mock(side_effect=tracked_stream)
+
+        with mock_fabric_api_client(builder):
+            stream = await getattr(server, "_execute_fabric_pattern")(
+                "test_pattern", "test input", None, stream=True
+            )
+            first = await anext(stream)
+            assert first["content"] == "a"
+            assert not upstream_closed.is_set()
+
+            await stream.aclose()
+            assert upstream_closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_releases_slot_and_upstream(
+        self, server: FabricMCP
+    ) -> None:
+        """Test cancelling a streaming run mid-notification frees its resources."""
+        upstream_closed = asyncio.Event()
+        notified = asyncio.Event()
+        builder = FabricApiMockBuilder().with_sse_lines(
+            [
+                'data: {"type": "content", "content": "a", "format": "text"}',
+                'data: {"type": "content", "content": "b", "format": "text"}',
+                'data: {"type": "complete"}',
+            ]
+        )
+
+        @asynccontextmanager
+        async def tracked_stream(
+            *_args: Any, **_kwargs: Any
+        ) -> AsyncGenerator[Mock, None]:
+            try:
+                yield builder.mock_response
+            finally:
+                upstream_closed.set()
+
+        async def stalled_notification(**_kwargs: Any) -> None:
+            notified.set()
+            await asyncio.Event().wait()
+
+        builder.mock_api_client.stream = Mock(side_effect=tracked_stream)
+        ctx = mock_mcp_context()
+        ctx.request_context.session.send_progress_notification.side_effect = (
+            stalled_notification
+        )
+
+        with mock_fabric_api_client(builder):
+            run = asyncio.create_task(
+                server.fabric_run_pattern(
+                    "test_pattern", "test input", stream=True, ctx=ctx
+                )
             )
+            await asyncio.wait_for(notified.wait(), timeout=1)
+            assert server.get_admission_stats().in_flight == 1
+
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
 
-            # Should return generator
-            assert hasattr(streaming_result, "__iter__")
-            chunks = list(streaming_result)
-            content_chunks = [c for c in chunks if c.get("type") == "content"]
-
-            # Should have separate chunks, not accumulated
-            assert len(content_chunks) == 2
-            assert content_chunks[0]["content"] == "First"
-            assert content_chunks[1]["content"] == " Second"
-            # Note: close() is called twice in this test (once for non-streaming, once
-            # for streaming)
-            assert mock_api_client.close.call_count == 2
+            assert server.get_admission_stats().in_flight == 0
+            assert upstream_closed.is_set()
@@ -0,0 +1,181 @@
+"""Unit tests for the fabric_run_pipeline tool."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastmcp import Client
+from fastmcp.tools import Tool
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
+
+from fabric_mcp.core import FabricMCP
+from fabric_mcp.models import PatternExecutionConfig, PatternRun
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+    mock_mcp_context,
+)
+
+
+class WrappingHandler:
+    """Chat handler whose output wraps the input in the pattern name."""
+
+    def __init__(self, failing_pattern: str | None = None) -> None:
+        self.failing_pattern = failing_pattern
+        self.payloads: list[dict[str, Any]] = []
+
+    async def __call__(self, payload: dict[str, Any]) -> str:
+        self.payloads.append(payload)
+        prompt = payload["prompts"][0]
+        if prompt["patternName"] == self.failing_pattern:
+            raise httpx.ConnectError("Connection refused")
+        return f"{prompt['patternName']}({prompt['userInput']})"
+
+
+class TestFabricRunPipeline(TestFixturesBase):
+    """Test cases for the fabric_run_pipeline tool."""
+
+    @pytest_asyncio.fixture
+    async def run_pipeline(self, mcp_tools: dict[str, Tool]) -> Callable[..., Any]:
+        """Get the fabric_run_pipeline tool from the server."""
+        return getattr(mcp_tools["fabric_run_pipeline"], "fn")
+
+    @pytest.mark.asyncio
+    async def test_each_stage_feeds_the_next(self, run_pipeline: Callable[..., Any]):
+        """Test that outputs chain through the stages and timings are reported."""
+        builder = FabricApiMockBuilder().with_chat_handler(WrappingHandler())
+        stages = [
+            PatternRun("extract_wisdom"),
+            PatternRun("summarize"),
+            PatternRun("create_outline"),
+        ]
+
+        with mock_fabric_api_client(builder):
+            result = await run_pipeline(stages, "text")
+
+        assert (
+            result["output_text"] == "create_outline(summarize(extract_wisdom(text)))"
+        )
+        assert [s["pattern_name"] for s in result["stages"]] == [
+            "extract_wisdom",
+            "summarize",
+            "create_outline",
+        ]
+        assert [s["output_chars"] for s in result["stages"]] == [20, 31, 47]
+        assert all(s["duration_seconds"] >= 0 for s in result["stages"])
+        assert result["total_seconds"] >= sum(
+            s["duration_seconds"] for s in result["stages"]
+        )
+        assert "output_text" not in result["stages"][0]
+
+    @pytest.mark.asyncio
+    async def test_per_stage_config_and_intermediate_outputs(
+        self, run_pipeline: Callable[..., Any]
+    ):
+        """Test that each stage uses its own config and can return its output."""
+        handler = WrappingHandler()
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+        stages = [
+            PatternRun("a", PatternExecutionConfig(model_name="gpt-4o-mini")),
+            PatternRun("b", PatternExecutionConfig(temperature=0.1)),
+        ]
+
+        with mock_fabric_api_client(builder):
+            result = await run_pipeline(stages, "x", include_intermediate=True)
+
+        assert handler.payloads[0]["prompts"][0]["model"] == "gpt-4o-mini"
+        assert handler.payloads[1]["temperature"] == 0.1
+        assert [s["output_text"] for s in result["stages"]] == ["a(x)", "b(a(x))"]
+
+    @pytest.mark.asyncio
+    async def test_only_final_stage_is_streamed(self, run_pipeline: Callable[..., Any]):
+        """Test that streaming relays the last stage's chunks to the client."""
+        builder = FabricApiMockBuilder().with_chat_handler(WrappingHandler())
+        ctx = mock_mcp_context(progress_token="pipe-1")
+
+        with mock_fabric_api_client(builder):
+            result = await run_pipeline(
+                [PatternRun("a"), PatternRun("b")], "x", stream=True, ctx=ctx
+            )
+
+        assert result["output_text"] == "b(a(x))"
+        notifications = ctx.request_context.session.send_progress_notification
+        messages = [c.kwargs["message"] for c in notifications.await_args_list]
+        assert messages == ["b(a(x))"]
+
+    @pytest.mark.asyncio
+    async def test_failing_stage_is_named_and_stops_the_pipeline(
+        self, run_pipeline: Callable[..., Any]
+    ):
+        """Test that a stage failure names the stage and skips later stages."""
+        handler = WrappingHandler(failing_pattern="b")
+        builder = FabricApiMockBuilder().with_chat_handler(handler)
+        stages = [PatternRun("a"), PatternRun("b"), PatternRun("c")]
+
+        with mock_fabric_api_client(builder):
+            with pytest.raises(McpError) as exc_info:
+                await run_pipeline(stages, "x")
+
+        assert exc_info.value.error.code == INTERNAL_ERROR
+        assert exc_info.value.error.message.startswith(
+            "Pipeline stage 2/3 ('b') failed:"
+        )
+        assert len(handler.payloads) == 2
+
+    @pytest.mark.parametrize(
+        ("stages", "message"),
+        [
+            ([], "stages must be a non-empty list"),
+            ([PatternRun(" ")], "pattern_name must be a non-empty string"),
+            (
+                [PatternRun("a"), PatternRun(" ")],
+                "pattern_name must be a non-empty string",
+            ),
+            (
+                [
+                    PatternRun("a"),
+                    PatternRun("b", PatternExecutionConfig(top_p=1.5)),
+                ],
+                "top_p must be a number between 0.0 and 1.0",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_invalid_stages_are_rejected(
+        self,
+        run_pipeline: Callable[..., Any],
+        stages: list[PatternRun],
+        message: str,
+    ):
+        """Test that invalid stage lists fail before any run starts."""
+        with mock_fabric_api_client() as mock_client:
+            with pytest.raises(McpError) as exc_info:
+                await run_pipeline(stages, "x")
+
+        assert exc_info.value.error.code == INVALID_PARAMS
+        assert exc_info.value.error.message == message
+        mock_client.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stages_are_parsed_from_tool_arguments(self, server: FabricMCP):
+        """Test that JSON stage objects from an MCP client are accepted."""
+        builder = FabricApiMockBuilder().with_chat_handler(WrappingHandler())
+        arguments = {
+            "stages": [
+                {"pattern_name": "a"},
+                {"pattern_name": "b", "config": {"model_name": "gpt-4o"}},
+            ],
+            "input_text": "x",
+        }
+
+        with mock_fabric_api_client(builder):
+            async with Client(server) as client:
+                content = await client.call_tool("fabric_run_pipeline", arguments)
+
+        result = json.loads(getattr(content[0], "text"))
+        assert result["output_text"] == "b(a(x))"
@@ -0,0 +1,90 @@
+"""Tests for the pluggable JSON codec."""
+
+import importlib.util
+import json
+import logging
+
+import pytest
+
+from fabric_mcp import json_codec
+from fabric_mcp.constants import JSON_BACKEND_ENV
+from fabric_mcp.json_codec import get_codec
+
+AVAILABLE_BACKENDS = [
+    name
+    for name in ("json", "orjson", "msgspec")
+    if name == "json" or importlib.util.find_spec(name) is not None
+]
+
+PAYLOAD = {
+    "prompts": [{"userInput": "héllo ✓", "patternName": "summarize"}],
+    "temperature": 0.7,
+    "variables": {"a": "1"},
+}
+
+
+class TestJsonCodecBackends:
+    """Behavior every backend must share."""
+
+    @pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+    def test_round_trip(self, backend: str):
+        """Test dumps/loads round-trip and accept both bytes and str."""
+        codec = get_codec(backend)
+        encoded = codec.dumps(PAYLOAD)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == PAYLOAD
+        assert codec.loads(encoded.decode()) == PAYLOAD
+        # Interoperable with the stdlib and UTF-8 encoded, not ASCII-escaped
+        assert json.loads(encoded) == PAYLOAD
+        assert "héllo ✓".encode() in encoded
+
+    @pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+    def test_invalid_json_raises_decode_error(self, backend: str):
+        """Test malformed input raises the backend's advertised error type."""
+        codec = get_codec(backend)
+        with pytest.raises(codec.decode_error):
+            codec.loads('{"type": "content",')
+
+
+class TestJsonCodecSelection:
+    """Test backend selection."""
+
+    def test_auto_prefers_fast_backend(self):
+        """Test auto picks the first installed backend in preference order."""
+        expected = next(
+            (name for name in ("orjson", "msgspec") if name in AVAILABLE_BACKENDS),
+            "json",
+        )
+        assert get_codec("auto").name == expected
+
+    def test_unknown_backend_raises_value_error(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend 'yaml'"):
+            get_codec("yaml")
+
+    def test_missing_backend_raises_import_error(self, monkeypatch: pytest.MonkeyPatch):
+        """Test requesting a backend that is not installed raises ImportError."""
+
+        def missing() -> json_codec.JsonCodec:
+            raise ImportError("No module named 'orjson'")
+
+        monkeypatch.setitem(getattr(json_codec, "_BACKENDS"), "orjson", missing)
+        with pytest.raises(ImportError):
+            get_codec("orjson")
+
+    def test_env_var_selects_backend(self, monkeypatch: pytest.MonkeyPatch):
+        """Test FABRIC_MCP_JSON_BACKEND forces the stdlib codec."""
+        monkeypatch.setenv(JSON_BACKEND_ENV, "json")
+        assert getattr(json_codec, "_select_codec")().name == "json"
+
+    def test_bad_env_var_falls_back_to_stdlib(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """Test an unusable backend setting logs a warning and uses stdlib json."""
+        monkeypatch.setenv(JSON_BACKEND_ENV, "yaml")
+        with caplog.at_level(logging.WARNING, logger="fabric_mcp.json_codec"):
+            codec = getattr(json_codec, "_select_codec")()
+
+        assert codec.name == "json"
+        assert "Cannot use JSON backend 'yaml'" in caplog.text
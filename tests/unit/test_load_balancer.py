@@ -0,0 +1,293 @@
+"""Unit tests for the load balancing transport."""
+
+import asyncio
+import random
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from fabric_mcp.api_client import FabricApiClient
+from fabric_mcp.load_balancer import (
+    POWER_OF_TWO_CHOICES,
+    LoadBalancingTransport,
+)
+from tests.shared.clock import FakeClock
+
+BACKENDS = ["http://fabric-a:8080", "http://fabric-b:8080/api"]
+
+
+class RecordingHandler:
+    """MockTransport handler recording requests and failing chosen hosts."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.down: set[str] = set()
+        self.status: dict[str, int] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.host in self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        status = self.status.get(request.url.host, 200)
+        return httpx.Response(status, text=f"from {request.url.host}")
+
+    def hosts(self) -> list[str]:
+        """Hosts of the recorded requests, in order."""
+        return [r.url.host for r in self.requests]
+
+
+class HangingTransport(httpx.AsyncBaseTransport):
+    """Transport whose requests never complete."""
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.started.set()
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+
+def make_balancer(
+    handler: Callable[[httpx.Request], httpx.Response],
+    backends: list[str] | None = None,
+    **kwargs: object,
+) -> tuple[LoadBalancingTransport, FakeClock]:
+    """Create a balancer over MockTransport with a fake clock."""
+    clock = FakeClock()
+    balancer = LoadBalancingTransport(
+        backends or BACKENDS,
+        httpx.MockTransport(handler),
+        health_check_interval=0,
+        clock=clock,
+        rng=random.Random(0),
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return balancer, clock
+
+
+def make_client(balancer: LoadBalancingTransport) -> httpx.AsyncClient:
+    """Create a client whose base URL is the first backend."""
+    return httpx.AsyncClient(base_url=BACKENDS[0], transport=balancer)
+
+
+class TestRouting:
+    """Test backend selection and request rewriting."""
+
+    @pytest.mark.asyncio
+    async def test_request_is_rewritten_for_the_chosen_backend(self):
+        """Test that host, port, path prefix and Host header follow the backend."""
+        handler = RecordingHandler()
+        balancer, _ = make_balancer(handler)
+        balancer.backends[0].outstanding = 1  # force the second backend
+
+        async with make_client(balancer) as client:
+            response = await client.get("/patterns/names", params={"q": "x"})
+
+        request = handler.requests[0]
+        assert str(request.url) == "http://fabric-b:8080/api/patterns/names?q=x"
+        assert request.headers["Host"] == "fabric-b:8080"
+        assert response.text == "from fabric-b"
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_avoids_busy_backend(self):
+        """Test that an open streamed response keeps its backend busy."""
+        handler = RecordingHandler()
+        balancer, _ = make_balancer(handler)
+
+        async with make_client(balancer) as client:
+            async with client.stream("GET", "/chat"):
+                await client.get("/patterns/names")
+                await client.get("/patterns/names")
+            assert all(b.outstanding == 0 for b in balancer.backends)
+
+        busy, *others = handler.hosts()
+        assert others == [({"fabric-a", "fabric-b"} - {busy}).pop()] * 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_releases_backend(self):
+        """Test that cancelling an in-flight request frees its backend slot."""
+        transport = HangingTransport()
+        balancer = LoadBalancingTransport(
+            BACKENDS, transport, health_check_interval=0, clock=FakeClock()
+        )
+
+        async with make_client(balancer) as client:
+            request = asyncio.create_task(client.get("/chat"))
+            await transport.started.wait()
+            assert sum(b.outstanding for b in balancer.backends) == 1
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+
+        assert all(b.outstanding == 0 for b in balancer.backends)
+        assert all(b.consecutive_failures == 0 for b in balancer.backends)
+
+    def test_power_of_two_choices_picks_less_loaded_of_two(self):
+        """Test p2c never picks the busiest backend when comparing two."""
+        backends = ["http://a", "http://b", "http://c"]
+        balancer, _ = make_balancer(
+            RecordingHandler(), backends, strategy=POWER_OF_TWO_CHOICES
+        )
+        for backend, load in zip(balancer.backends, (5, 1, 3), strict=True):
+            backend.outstanding = load
+
+        chosen = {balancer.choose().url.host for _ in range(50)}
+
+        assert "a" not in chosen
+        assert chosen <= {"b", "c"}
+
+    def test_unknown_strategy_is_rejected(self):
+        """Test that an unknown strategy name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown load balancing strategy"):
+            make_balancer(RecordingHandler(), strategy="random")
+
+
+class TestPassiveHealthChecks:
+    """Test ejection of backends that fail live requests."""
+
+    @pytest.mark.asyncio
+    async def test_failing_backend_is_ejected_and_readmitted(self):
+        """Test ejection after consecutive failures and return after the timeout."""
+        handler = RecordingHandler()
+        handler.down.add("fabric-a")
+        balancer, clock = make_balancer(handler, failure_threshold=2, ejection_time=30)
+        balancer.backends[1].outstanding = 10  # make fabric-a the preferred choice
+
+        async with make_client(balancer) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("/patterns/names")
+            assert not balancer.backends[0].is_available(clock.now)
+
+            response = await client.get("/patterns/names")
+            assert response.text == "from fabric-b"
+
+            clock.now = 30.0
+            handler.down.clear()
+            response = await client.get("/patterns/names")
+            assert response.text == "from fabric-a"
+
+    @pytest.mark.asyncio
+    async def test_gateway_errors_count_as_failures(self):
+        """Test that a 503 is a failure but its body stays readable."""
+        handler = RecordingHandler()
+        handler.status["fabric-a"] = 503
+        balancer, clock = make_balancer(handler, failure_threshold=1)
+        balancer.backends[1].outstanding = 10
+
+        async with make_client(balancer) as client:
+            response = await client.get("/patterns/names")
+
+        assert response.status_code == 503
+        assert response.text == "from fabric-a"
+        assert balancer.backends[0].outstanding == 0
+        assert not balancer.backends[0].is_available(clock.now)
+
+    @pytest.mark.asyncio
+    async def test_all_backends_ejected_fails_open(self):
+        """Test that traffic still flows when every backend is ejected."""
+        handler = RecordingHandler()
+        balancer, clock = make_balancer(handler)
+        for backend in balancer.backends:
+            backend.ejected_until = clock.now + 60
+
+        async with make_client(balancer) as client:
+            response = await client.get("/patterns/names")
+
+        assert response.status_code == 200
+
+
+class TestActiveHealthChecks:
+    """Test periodic probing of backends."""
+
+    @pytest.mark.asyncio
+    async def test_probe_readmits_recovered_backend(self):
+        """Test that a successful probe ends an ejection early."""
+        handler = RecordingHandler()
+        balancer, clock = make_balancer(handler, health_check_path="/health")
+        balancer.backends[0].ejected_until = clock.now + 60
+
+        await balancer.check_health()
+
+        assert balancer.backends[0].is_available(clock.now)
+        probed = sorted(str(r.url) for r in handler.requests)
+        assert probed == [
+            "http://fabric-a:8080/health",
+            "http://fabric-b:8080/api/health",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_probes_eject_backend(self):
+        """Test that repeated failed probes eject an idle backend."""
+        handler = RecordingHandler()
+        handler.down.add("fabric-b")
+        balancer, clock = make_balancer(handler, failure_threshold=2)
+
+        await balancer.check_health()
+        await balancer.check_health()
+
+        assert balancer.backends[0].is_available(clock.now)
+        assert not balancer.backends[1].is_available(clock.now)
+
+    @pytest.mark.asyncio
+    async def test_checks_continue_after_a_probe_raises(
+        self, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that an unexpected probe error is logged, not fatal to the loop."""
+        probes = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal probes
+            if request.url.path.endswith("/health"):
+                probes += 1
+                if probes <= 2:
+                    raise RuntimeError("probe bug")
+            return httpx.Response(200)
+
+        balancer = LoadBalancingTransport(
+            BACKENDS,
+            httpx.MockTransport(handler),
+            health_check_interval=0.01,
+            health_check_path="/health",
+            clock=FakeClock(),
+            rng=random.Random(0),
+        )
+        async with make_client(balancer) as client:
+            await client.get("/patterns/names")
+            for _ in range(100):
+                if probes > 4:
+                    break
+                await asyncio.sleep(0.01)
+
+        assert probes > 4
+        assert "Fabric backend health check failed" in caplog.text
+        assert "probe bug" in caplog.text
+
+
+class TestFabricApiClientBackends:
+    """Test how FabricApiClient configures load balancing."""
+
+    def test_single_url_has_no_load_balancer(self):
+        """Test that one base URL keeps the plain transport."""
+        client = FabricApiClient(base_url="http://fabric:8080", api_key="key")
+        assert client.load_balancer is None
+        assert client.base_urls == ["http://fabric:8080"]
+
+    def test_comma_separated_urls_enable_load_balancing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that FABRIC_BASE_URL may list several backends."""
+        monkeypatch.setenv("FABRIC_BASE_URL", "http://a:8080, http://b:8080,")
+        monkeypatch.setenv("FABRIC_MCP_LB_STRATEGY", POWER_OF_TWO_CHOICES)
+
+        client = FabricApiClient(api_key="key")
+
+        assert client.base_url == "http://a:8080"
+        assert client.load_balancer is not None
+        assert client.load_balancer.strategy == POWER_OF_TWO_CHOICES
+        assert [str(b.url) for b in client.load_balancer.backends] == [
+            "http://a:8080",
+            "http://b:8080",
+        ]
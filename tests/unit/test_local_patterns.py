@@ -0,0 +1,214 @@
+"""Unit tests for reading patterns straight from Fabric's patterns directory."""
+
+import asyncio
+import json
+import os
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+
+from fabric_mcp.constants import LOCAL_PATTERNS_DIR_ENV
+from fabric_mcp.core import FabricMCP
+from fabric_mcp.local_patterns import LocalPatternSource, pattern_description
+from tests.shared.clock import FakeClock
+from tests.shared.fabric_api_mocks import FabricApiMockBuilder, mock_fabric_api_client
+
+SUMMARIZE = """# IDENTITY and PURPOSE
+
+You are an expert content summarizer.
+You take content in and output a summary.
+
+# OUTPUT INSTRUCTIONS
+
+- Output a Markdown summary.
+"""
+
+
+def write_pattern(directory: Path, name: str, text: str) -> Path:
+    """Write a pattern's system.md, as Fabric stores it."""
+    path = directory / name / "system.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestLocalPatternSource:
+    """Test indexing and incremental updates of a patterns directory."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_pattern_directories(self, tmp_path: Path):
+        """Test that every subdirectory with a system.md is a pattern."""
+        write_pattern(tmp_path, "summarize", SUMMARIZE)
+        write_pattern(tmp_path, "explain", "Explain things.")
+        (tmp_path / "not_a_pattern").mkdir()
+        (tmp_path / "README.md").write_text("# Patterns")
+
+        source = LocalPatternSource(tmp_path, poll_interval=60)
+
+        assert await source.names() == ["explain", "summarize"]
+        assert await source.details("summarize") == {
+            "name": "summarize",
+            "description": "You are an expert content summarizer. "
+            "You take content in and output a summary.",
+            "system_prompt": SUMMARIZE,
+        }
+        assert await source.details("not_a_pattern") is None
+
+    def test_description_is_first_paragraph_after_headings(self):
+        """Test the description taken from a pattern's text."""
+        assert pattern_description("# A\n\n## B\n\nFirst\nline.\n\nSecond.") == (
+            "First line."
+        )
+        assert pattern_description("# Only a heading\n") == ""
+
+    @pytest.mark.asyncio
+    async def test_changes_are_picked_up_after_poll_interval(self, tmp_path: Path):
+        """Test that new, modified and removed patterns show up after polling."""
+        clock = FakeClock()
+        path = write_pattern(tmp_path, "summarize", SUMMARIZE)
+        write_pattern(tmp_path, "explain", "Explain things.")
+        source = LocalPatternSource(tmp_path, poll_interval=2, clock=clock)
+        assert await source.names() == ["explain", "summarize"]
+
+        write_pattern(tmp_path, "new", "Something new.")
+        path.write_text("Summarize briefly.", encoding="utf-8")
+        (tmp_path / "explain" / "system.md").unlink()
+        clock.now = 1
+        assert await source.names() == ["explain", "summarize"]
+
+        clock.now = 2
+        assert await source.names() == ["new", "summarize"]
+        details = await source.details("summarize")
+        assert details is not None
+        assert details["description"] == "Summarize briefly."
+
+    @pytest.mark.asyncio
+    async def test_unchanged_patterns_are_not_read_again(self, tmp_path: Path):
+        """Test that a rescan only reads files whose size or mtime changed."""
+        path = write_pattern(tmp_path, "summarize", SUMMARIZE)
+        source = LocalPatternSource(tmp_path, poll_interval=0)
+        await source.names()
+        stat = path.stat()
+
+        # Same size and mtime: an in-place edit the rescan cannot see
+        path.write_text(SUMMARIZE.upper(), encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        details = await source.details("summarize")
+        assert details is not None and details["system_prompt"] == SUMMARIZE
+
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        details = await source.details("summarize")
+        assert details is not None and details["system_prompt"] == SUMMARIZE.upper()
+
+    @pytest.mark.asyncio
+    async def test_missing_directory_has_no_patterns(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that a missing directory is reported once and later picked up."""
+        directory = tmp_path / "patterns"
+        source = LocalPatternSource(directory, poll_interval=0)
+
+        assert await source.names() == []
+        assert await source.names() == []
+        assert caplog.text.count("Cannot read patterns directory") == 1
+
+        write_pattern(directory, "summarize", SUMMARIZE)
+        assert await source.names() == ["summarize"]
+
+    @pytest.mark.asyncio
+    async def test_watcher_applies_changes_without_polling(self, tmp_path: Path):
+        """Test that file events update the index between polls."""
+        pytest.importorskip("watchfiles")
+        write_pattern(tmp_path, "summarize", SUMMARIZE)
+        source = LocalPatternSource(tmp_path, poll_interval=3600)
+        source.start_watching()
+        try:
+            assert source.watching
+            assert await source.names() == ["summarize"]
+            await asyncio.sleep(0.1)  # let the watcher start
+
+            write_pattern(tmp_path, "explain", "Explain things.")
+            for _ in range(100):
+                if "explain" in await source.names():
+                    break
+                await asyncio.sleep(0.05)
+
+            assert await source.names() == ["explain", "summarize"]
+        finally:
+            await source.close()
+        assert not source.watching
+
+
+class TestFabricLocalPatterns:
+    """Test catalog tools reading a local patterns directory."""
+
+    @pytest.fixture(name="patterns_dir")
+    def fixture_patterns_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Path:
+        """A patterns directory that the server is configured to read."""
+        write_pattern(tmp_path, "summarize", SUMMARIZE)
+        monkeypatch.setenv(LOCAL_PATTERNS_DIR_ENV, str(tmp_path))
+        return tmp_path
+
+    @pytest_asyncio.fixture(name="server")
+    async def fixture_server(
+        self, patterns_dir: Path
+    ) -> AsyncGenerator[FabricMCP, None]:
+        """A server reading patterns_dir, closed (stopping its watcher) after."""
+        _ = patterns_dir
+        server = FabricMCP()
+        yield server
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_catalog_tools_do_not_call_fabric(self, server: FabricMCP):
+        """Test that pattern names and details come from disk only."""
+        with mock_fabric_api_client(FabricApiMockBuilder()) as mock_client:
+            async with Client(server) as client:
+                names = await client.call_tool("fabric_list_patterns")
+                details = await client.call_tool(
+                    "fabric_get_pattern_details", {"pattern_name": "summarize"}
+                )
+
+        assert [getattr(content, "text") for content in names] == ["summarize"]
+        assert json.loads(getattr(details[0], "text"))["system_prompt"] == SUMMARIZE
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_pattern_is_reported(
+        self, server: FabricMCP, patterns_dir: Path
+    ):
+        """Test that a pattern missing on disk is reported as not found."""
+        async with Client(server) as client:
+            with pytest.raises(ToolError, match="not found") as exc_info:
+                await client.call_tool(
+                    "fabric_get_pattern_details", {"pattern_name": "missing"}
+                )
+
+        assert str(patterns_dir) in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_missing_directory_falls_back_to_fabric(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test that a directory that cannot be read is not served as empty."""
+        monkeypatch.setenv(LOCAL_PATTERNS_DIR_ENV, str(tmp_path / "missing"))
+        server = FabricMCP()
+        builder = FabricApiMockBuilder().with_successful_pattern_list(["summarize"])
+        try:
+            with mock_fabric_api_client(builder) as mock_client:
+                assert await server.fabric_list_patterns() == ["summarize"]
+                assert await server.fabric_list_patterns() == ["summarize"]
+        finally:
+            await server.close()
+
+        mock_client.get.assert_awaited_with("/patterns/names")
+        assert caplog.text.count("is not a readable directory") == 1
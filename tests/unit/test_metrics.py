@@ -0,0 +1,179 @@
+"""Unit tests for the Prometheus metrics and the /metrics endpoint."""
+
+import inspect
+
+import httpx
+import pytest
+
+from fabric_mcp import metrics
+from fabric_mcp.api_client import FabricApiClient
+from fabric_mcp.core import FabricMCP
+from fabric_mcp.metrics import (
+    CallbackMetric,
+    ChatTimer,
+    Gauge,
+    Histogram,
+    render,
+    timed_tool,
+)
+from tests.shared.fabric_api_mocks import FabricApiMockBuilder, mock_fabric_api_client
+
+
+class TestMetricTypes:
+    """Test cases for the metric types and text rendering."""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test bucket, sum and count lines of a labelled histogram."""
+        histogram = Histogram("h_seconds", "A histogram.", ("tool",), (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "a")
+
+        assert render([histogram]).splitlines() == [
+            "# HELP h_seconds A histogram.",
+            "# TYPE h_seconds histogram",
+            'h_seconds_bucket{tool="a",le="0.1"} 2',
+            'h_seconds_bucket{tool="a",le="1"} 3',
+            'h_seconds_bucket{tool="a",le="+Inf"} 4',
+            'h_seconds_sum{tool="a"} 3.65',
+            'h_seconds_count{tool="a"} 4',
+        ]
+        assert histogram.count("a") == 4
+        assert histogram.count("b") == 0
+
+    def test_gauge_and_label_escaping(self):
+        """Test gauge arithmetic and escaping of quotes and newlines."""
+        gauge = Gauge("g", "A gauge.", ("name",))
+        gauge.inc('say "hi"\n')
+        gauge.inc('say "hi"\n', amount=2)
+        gauge.dec('say "hi"\n')
+
+        assert render([gauge]).splitlines()[-1] == 'g{name="say \\"hi\\"\\n"} 2'
+
+    def test_unlabelled_gauge_starts_at_zero(self):
+        """Test that a gauge without labels is exported before its first update."""
+        assert render([Gauge("g", "A gauge.")]).splitlines()[-1] == "g 0"
+
+    def test_callback_metric_reads_state_at_render_time(self):
+        """Test that callback metrics are collected when rendered."""
+        state = {"hits": 1}
+        metric = CallbackMetric(
+            "hits_total", "Hits.", (), lambda: [((), state["hits"])], kind="counter"
+        )
+        state["hits"] = 7
+
+        assert render([metric]).splitlines()[1:] == [
+            "# TYPE hits_total counter",
+            "hits_total 7",
+        ]
+
+
+class TestRecording:
+    """Test cases for the hot-path recording helpers."""
+
+    @pytest.mark.asyncio
+    async def test_timed_tool_records_outcome_and_keeps_signature(self):
+        """Test that calls are timed by outcome and the signature survives."""
+
+        async def metrics_probe_tool(text: str, fail: bool = False) -> str:
+            if fail:
+                raise ValueError("boom")
+            assert metrics.TOOL_CALLS_IN_FLIGHT.value("metrics_probe_tool") == 1
+            return text
+
+        timed = timed_tool(metrics_probe_tool)
+        assert timed.__name__ == "metrics_probe_tool"
+        assert inspect.signature(timed) == inspect.signature(metrics_probe_tool)
+
+        assert await timed("x") == "x"
+        with pytest.raises(ValueError):
+            await timed("x", fail=True)
+
+        duration = metrics.TOOL_DURATION
+        assert duration.count("metrics_probe_tool", "ok") == 1
+        assert duration.count("metrics_probe_tool", "error") == 1
+        assert metrics.TOOL_CALLS_IN_FLIGHT.value("metrics_probe_tool") == 0
+
+    def test_chat_timer_records_ttft_and_rate(self):
+        """Test time to first token and tokens per second of a response."""
+        timer = ChatTimer("metrics-probe-model")
+        timer.content("Hello ")
+        timer.content("world, this is a response.")
+        timer.finish()
+
+        assert metrics.CHAT_TIME_TO_FIRST_TOKEN.count("metrics-probe-model") == 1
+        assert metrics.CHAT_TOKENS_PER_SECOND.count("metrics-probe-model") == 1
+
+    def test_chat_timer_without_content_records_nothing(self):
+        """Test that an empty response does not skew the histograms."""
+        ChatTimer("metrics-empty-model").finish()
+
+        assert metrics.CHAT_TIME_TO_FIRST_TOKEN.count("metrics-empty-model") == 0
+        assert metrics.CHAT_TOKENS_PER_SECOND.count("metrics-empty-model") == 0
+
+    @pytest.mark.asyncio
+    async def test_upstream_requests_are_timed_by_endpoint_and_status(self):
+        """Test that pattern names are folded out of the endpoint label."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/patterns/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"Name": "x"})
+
+        client = FabricApiClient(base_url="http://fabric.test")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        duration = metrics.UPSTREAM_DURATION
+        before = (
+            duration.count("GET", "/patterns/{name}", "200"),
+            duration.count("GET", "/patterns/{name}", "404"),
+        )
+        try:
+            await client.get("/patterns/summarize")
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/patterns/missing")
+        finally:
+            await client.close()
+
+        after = (
+            duration.count("GET", "/patterns/{name}", "200"),
+            duration.count("GET", "/patterns/{name}", "404"),
+        )
+        assert after == (before[0] + 1, before[1] + 1)
+        assert metrics.UPSTREAM_IN_FLIGHT.value() == 0
+        assert client.pool_usage() == (0, 0)
+
+
+class TestMetricsEndpoint:
+    """Test cases for the /metrics HTTP route."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_serves_tool_and_cache_metrics(self):
+        """Test that a scrape shows tool latency and cache hit ratios."""
+        server = FabricMCP(log_level="WARNING")
+        builder = FabricApiMockBuilder().with_successful_sse("done")
+        tool = (await server.get_tools())["fabric_run_pattern"]
+        queue_waits = metrics.PATTERN_QUEUE_WAIT.count()
+
+        with mock_fabric_api_client(builder):
+            await getattr(tool, "fn")("summarize", "text")
+        assert metrics.PATTERN_QUEUE_WAIT.count() == queue_waits + 1
+
+        transport = httpx.ASGITransport(app=server.http_app())
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://mcp.test"
+        ) as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == metrics.CONTENT_TYPE
+        body = response.text
+        assert (
+            'fabric_mcp_tool_duration_seconds_count{tool="fabric_run_pattern",'
+            'outcome="ok"}' in body
+        )
+        assert 'fabric_mcp_cache_hit_ratio{cache="fabric_list_patterns"} 0' in body
+        assert "fabric_mcp_pattern_runs_in_flight 0" in body
+        assert 'fabric_mcp_pattern_rejections_total{reason="queue_full"} 0' in body
+        assert "# TYPE fabric_mcp_pattern_queue_wait_seconds histogram" in body
+        assert 'fabric_mcp_pattern_queue_wait_seconds_bucket{le="0.005"}' in body
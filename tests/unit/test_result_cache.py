@@ -0,0 +1,225 @@
+"""Unit tests for the deterministic pattern run result cache."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from mcp.shared.exceptions import McpError
+
+from fabric_mcp.constants import (
+    RESULT_CACHE_BYTES_ENV,
+    RESULT_CACHE_DIR_ENV,
+)
+from fabric_mcp.core import FabricMCP
+from fabric_mcp.result_cache import CachedResult, ResultCache
+from tests.shared.clock import FakeClock
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+    mock_mcp_context,
+)
+
+SSE_LINES = [
+    'data: {"type": "content", "content": "Hello, ", "format": "markdown"}',
+    'data: {"type": "content", "content": "world", "format": "markdown"}',
+    'data: {"type": "complete"}',
+]
+
+
+async def collect(result: CachedResult) -> list[dict[str, Any]]:
+    """Return every chunk replayed from a cached result."""
+    return [chunk async for chunk in result.replay()]
+
+
+class TestCachedResult:
+    """Test CachedResult construction and replay."""
+
+    @pytest.mark.asyncio
+    async def test_replay_reproduces_streamed_chunks(self):
+        """Test that a result built from chunks replays the same chunks."""
+        result = CachedResult.from_chunks("markdown", ["a", "bc", "", "def"])
+
+        chunks = await collect(result)
+
+        assert [c["content"] for c in chunks[:-1]] == ["a", "bc", "", "def"]
+        assert chunks[-1]["type"] == "complete"
+        assert result.as_output() == {
+            "output_format": "markdown",
+            "output_text": "abcdef",
+        }
+
+    @pytest.mark.asyncio
+    async def test_non_streamed_output_replays_as_one_chunk(self):
+        """Test that a non-streamed result is replayed as a single chunk."""
+        result = CachedResult.from_output(
+            {"output_format": "text", "output_text": "all at once"}
+        )
+
+        chunks = await collect(result)
+
+        assert [c["content"] for c in chunks[:-1]] == ["all at once"]
+
+
+class TestResultCache:
+    """Test the memory and disk tiers of ResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_memory_tier(self):
+        """Test storing and finding a result in memory."""
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        result = CachedResult.from_chunks("text", ["x"])
+
+        assert await cache.get("key") is None
+        await cache.put("key", result)
+
+        assert await cache.get("key") == result
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_a_new_instance(self, tmp_path: Path):
+        """Test that results written to disk are found by another cache."""
+        result = CachedResult.from_chunks("text", ["a", "b"])
+        await ResultCache(max_bytes=0, ttl=60, directory=tmp_path).put("key", result)
+
+        other = ResultCache(max_bytes=1024, ttl=60, directory=tmp_path)
+
+        assert await other.get("key") == result
+        assert list(tmp_path.iterdir()) == [tmp_path / "key.json"]
+
+    @pytest.mark.asyncio
+    async def test_disk_entries_expire(self, tmp_path: Path):
+        """Test that an expired disk entry is a miss and is removed."""
+        wall_clock = FakeClock(1000.0)
+        cache = ResultCache(
+            max_bytes=0, ttl=60, directory=tmp_path, wall_clock=wall_clock
+        )
+        await cache.put("key", CachedResult.from_chunks("text", ["x"]))
+
+        wall_clock.now = 1060.0
+
+        assert await cache.get("key") is None
+        assert not (tmp_path / "key.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_corrupt_disk_entry_is_a_miss(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that an unreadable cache file is ignored with a warning."""
+        (tmp_path / "key.json").write_text("{not json")
+        cache = ResultCache(max_bytes=0, ttl=60, directory=tmp_path)
+
+        assert await cache.get("key") is None
+        assert "unreadable cached result" in caplog.text
+
+    def test_disabled_by_default_sizes(self):
+        """Test that the cache is disabled without a memory size or directory."""
+        assert not ResultCache(max_bytes=0, ttl=60).enabled
+        assert not ResultCache(max_bytes=1024, ttl=0).enabled
+
+
+class TestFabricRunPatternResultCache(TestFixturesBase):
+    """Test the result cache in front of fabric_run_pattern."""
+
+    @pytest.fixture(autouse=True)
+    def enable_result_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Enable the memory tier of the result cache."""
+        monkeypatch.setenv(RESULT_CACHE_BYTES_ENV, "65536")
+        monkeypatch.delenv(RESULT_CACHE_DIR_ENV, raising=False)
+
+    @pytest.mark.asyncio
+    async def test_deterministic_run_is_served_from_cache(self, server: FabricMCP):
+        """Test a repeated temperature 0 run does not call Fabric again."""
+        builder = FabricApiMockBuilder().with_sse_lines(SSE_LINES)
+
+        with mock_fabric_api_client(builder) as mock_client:
+            first = await server.fabric_run_pattern("summarize", "in", temperature=0)
+            second = await server.fabric_run_pattern("summarize", "in", temperature=0)
+
+        assert first == {"output_format": "markdown", "output_text": "Hello, world"}
+        assert second == first
+        assert mock_client.stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_runs_are_not_cached(self, server: FabricMCP):
+        """Test runs with a non-zero temperature always reach Fabric."""
+        builder = FabricApiMockBuilder().with_sse_lines(SSE_LINES)
+
+        with mock_fabric_api_client(builder) as mock_client:
+            await server.fabric_run_pattern("summarize", "in")
+            await server.fabric_run_pattern("summarize", "in")
+
+        assert mock_client.stream.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_different_payloads_use_different_entries(self, server: FabricMCP):
+        """Test that any change in the request payload is a cache miss."""
+        builder = FabricApiMockBuilder().with_sse_lines(SSE_LINES)
+
+        with mock_fabric_api_client(builder) as mock_client:
+            await server.fabric_run_pattern("summarize", "in", temperature=0)
+            await server.fabric_run_pattern("summarize", "other", temperature=0)
+            await server.fabric_run_pattern(
+                "summarize", "in", temperature=0, variables={"lang": "fr"}
+            )
+
+        assert mock_client.stream.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_streamed_hit_replays_chunks(self, server: FabricMCP):
+        """Test a cached streamed run replays its chunks as progress updates."""
+        builder = FabricApiMockBuilder().with_sse_lines(SSE_LINES)
+        ctx = mock_mcp_context(progress_token="token")
+
+        with mock_fabric_api_client(builder) as mock_client:
+            await server.fabric_run_pattern(
+                "summarize", "in", stream=True, temperature=0, ctx=ctx
+            )
+            session = ctx.request_context.session
+            session.send_progress_notification.reset_mock()
+            result = await server.fabric_run_pattern(
+                "summarize", "in", stream=True, temperature=0, ctx=ctx
+            )
+
+        assert mock_client.stream.call_count == 1
+        assert result["output_text"] == "Hello, world"
+        notifications = session.send_progress_notification.call_args_list
+        messages = [c.kwargs["message"] for c in notifications]
+        assert messages == ["Hello, ", "world"]
+
+    @pytest.mark.asyncio
+    async def test_bypass_and_refresh_flags(self, server: FabricMCP):
+        """Test that bypass skips the cache and refresh replaces the entry."""
+        builder = FabricApiMockBuilder().with_sse_lines(SSE_LINES)
+
+        with mock_fabric_api_client(builder) as mock_client:
+            await server.fabric_run_pattern(
+                "summarize", "in", temperature=0, cache_bypass=True
+            )
+            assert mock_client.stream.call_count == 1
+            # Bypassed run stored nothing, so this is a miss
+            await server.fabric_run_pattern("summarize", "in", temperature=0)
+            assert mock_client.stream.call_count == 2
+
+            builder.with_sse_lines(
+                ['data: {"type": "content", "content": "new"}', *SSE_LINES[2:]]
+            )
+            refreshed = await server.fabric_run_pattern(
+                "summarize", "in", temperature=0, cache_refresh=True
+            )
+            cached = await server.fabric_run_pattern("summarize", "in", temperature=0)
+
+        assert mock_client.stream.call_count == 3
+        assert refreshed["output_text"] == cached["output_text"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, server: FabricMCP):
+        """Test that a failed run is retried rather than served from cache."""
+        builder = FabricApiMockBuilder().with_sse_error("model overloaded")
+
+        with mock_fabric_api_client(builder) as mock_client:
+            for _ in range(2):
+                with pytest.raises(McpError):
+                    await server.fabric_run_pattern("summarize", "in", temperature=0)
+
+        assert mock_client.stream.call_count == 2
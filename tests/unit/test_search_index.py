@@ -0,0 +1,245 @@
+"""Unit tests for full-text pattern search."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS
+
+from fabric_mcp.constants import (
+    CATALOG_SNAPSHOT_ENV,
+    LOCAL_PATTERNS_DIR_ENV,
+    PATTERN_CACHE_TTL_ENV,
+)
+from fabric_mcp.core import FabricMCP
+from fabric_mcp.search_index import PatternSearchIndex, tokenize
+from tests.shared.fabric_api_mocks import FabricApiMockBuilder, mock_fabric_api_client
+
+PATTERNS = {
+    "summarize": ("Create a concise summary", "You summarize content in bullets."),
+    "extract_wisdom": ("Extract ideas and quotes", "You extract insights from text."),
+    "write_essay": ("Write an essay", "You write an essay in the style of an author."),
+}
+
+
+def details(name: str) -> dict[str, str]:
+    """Pattern details as fabric_get_pattern_details returns them."""
+    description, system_prompt = PATTERNS[name]
+    return {"name": name, "description": description, "system_prompt": system_prompt}
+
+
+def build_index() -> PatternSearchIndex:
+    """An index of every pattern in PATTERNS."""
+    index = PatternSearchIndex()
+    for name in PATTERNS:
+        index.update(name, details(name))
+    return index
+
+
+class TestPatternSearchIndex:
+    """Test ranking and incremental updates of the index."""
+
+    def test_tokenize_splits_pattern_names(self):
+        """Test that names and text are split into lowercase words."""
+        assert tokenize("extract_wisdom, Create-Outline 2") == [
+            "extract",
+            "wisdom",
+            "create",
+            "outline",
+            "2",
+        ]
+
+    def test_results_are_ranked(self):
+        """Test that the best matching patterns come first."""
+        hits = build_index().search("extract insights", limit=10)
+
+        assert [hit.name for hit in hits] == ["extract_wisdom"]
+        assert hits[0].description == "Extract ideas and quotes"
+        assert hits[0].score > 0
+
+    def test_name_matches_outrank_prompt_matches(self):
+        """Test that a word in a pattern's name weighs more than in its prompt."""
+        index = PatternSearchIndex()
+        index.update("essay", {"name": "essay", "system_prompt": "Write prose."})
+        index.update("prose", {"name": "prose", "system_prompt": "Write an essay."})
+
+        assert [hit.name for hit in index.search("essay", limit=10)] == [
+            "essay",
+            "prose",
+        ]
+
+    def test_limit_and_ties(self):
+        """Test that results are cut at limit, ties ordered by name."""
+        index = PatternSearchIndex()
+        for name in ("b", "a", "c"):
+            index.update(name, {"name": name, "description": "same text"})
+
+        assert [hit.name for hit in index.search("text", limit=2)] == ["a", "b"]
+        assert not index.search("unknown words", limit=2)
+
+    def test_updates_replace_removed_words(self):
+        """Test that an update or removal leaves no trace of the old text."""
+        index = build_index()
+        index.update("summarize", {"name": "summarize", "description": "Shorten"})
+
+        assert [hit.name for hit in index.search("bullets", limit=10)] == []
+        assert [hit.name for hit in index.search("shorten", limit=10)] == ["summarize"]
+
+        index.retain(["summarize"])
+        assert len(index) == 1
+        assert not index.search("essay", limit=10)
+        assert "write_essay" not in index
+
+    def test_scores_match_a_fresh_index(self):
+        """Test that incremental updates end where a rebuild would."""
+        index = build_index()
+        index.update("summarize", {"name": "summarize", "description": "Shorten"})
+        index.remove("write_essay")
+
+        rebuilt = PatternSearchIndex()
+        rebuilt.update("summarize", {"name": "summarize", "description": "Shorten"})
+        rebuilt.update("extract_wisdom", details("extract_wisdom"))
+
+        for query in ("shorten", "extract insights", "you text"):
+            assert index.search(query, limit=10) == rebuilt.search(query, limit=10)
+
+
+def api_client_serving(
+    patterns: list[str], catalog: dict[str, tuple[str, str]] | None = None
+) -> FabricApiMockBuilder:
+    """A mock Fabric API serving the pattern list and the catalog's details.
+
+    The catalog (PATTERNS by default) is read on every request, so changes
+    to it are what Fabric returns from then on.
+    """
+    builder = FabricApiMockBuilder()
+    catalog = PATTERNS if catalog is None else catalog
+
+    async def get(endpoint: str, **_: Any) -> Mock:
+        response = Mock()
+        if endpoint == "/patterns/names":
+            response.json.return_value = patterns
+        else:
+            name = endpoint.removeprefix("/patterns/")
+            description, system_prompt = catalog[name]
+            response.json.return_value = {
+                "Name": name,
+                "Description": description,
+                "Pattern": system_prompt,
+            }
+        return response
+
+    builder.mock_api_client.get.side_effect = get
+    return builder
+
+
+class TestFabricSearchPatterns:
+    """Test the fabric_search_patterns tool."""
+
+    @pytest.mark.asyncio
+    async def test_index_is_built_once(self):
+        """Test that a second search fetches nothing new from Fabric."""
+        server = FabricMCP()
+        builder = api_client_serving(list(PATTERNS))
+
+        with mock_fabric_api_client(builder) as mock_client:
+            first = await server.fabric_search_patterns("essay author", limit=1)
+            fetches = mock_client.get.await_count
+            second = await server.fabric_search_patterns("concise summary")
+
+        assert [hit["name"] for hit in first] == ["write_essay"]
+        assert set(first[0]) == {"name", "description", "score"}
+        assert [hit["name"] for hit in second] == ["summarize"]
+        # The pattern list, then each pattern's details once
+        assert fetches == 1 + len(PATTERNS)
+        assert mock_client.get.await_count == fetches
+
+    @pytest.mark.asyncio
+    async def test_catalog_changes_update_the_index(self):
+        """Test that added and removed patterns are found, or not, right away."""
+        server = FabricMCP()
+
+        with mock_fabric_api_client(api_client_serving(["summarize"])):
+            assert not await server.fabric_search_patterns("essay")
+        server.invalidate_pattern_cache()
+        with mock_fabric_api_client(api_client_serving(["write_essay"])):
+            hits = await server.fabric_search_patterns("essay summary")
+
+        assert [hit["name"] for hit in hits] == ["write_essay"]
+
+    @pytest.mark.asyncio
+    async def test_upstream_changes_are_indexed_once_details_expire(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that details fetched again after their TTL replace the indexed ones."""
+        monkeypatch.setenv(PATTERN_CACHE_TTL_ENV, "0.05")
+        catalog = dict(PATTERNS)
+        server = FabricMCP()
+
+        with mock_fabric_api_client(api_client_serving(["summarize"], catalog)):
+            assert not await server.fabric_search_patterns("translate")
+            catalog["summarize"] = ("Translate text", "You translate text.")
+            await asyncio.sleep(0.1)
+            hits = await server.fabric_search_patterns("translate")
+
+        assert [(hit["name"], hit["description"]) for hit in hits] == [
+            ("summarize", "Translate text")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_revalidation_updates_the_index(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that details revalidated behind a snapshot answer reach the index."""
+        monkeypatch.setenv(CATALOG_SNAPSHOT_ENV, str(tmp_path / "catalog.db"))
+        catalog = dict(PATTERNS)
+        with mock_fabric_api_client(api_client_serving(["summarize"], catalog)):
+            await FabricMCP().fabric_search_patterns("summary")
+
+        catalog["summarize"] = ("Translate text", "You translate text.")
+        server = FabricMCP()
+        with mock_fabric_api_client(api_client_serving(["summarize"], catalog)):
+            # Answered from the snapshot while Fabric is asked again
+            assert not await server.fabric_search_patterns("translate")
+            await server.wait_for_catalog_revalidation()
+            hits = await server.fabric_search_patterns("translate")
+
+        assert [hit["name"] for hit in hits] == ["summarize"]
+
+    @pytest.mark.asyncio
+    async def test_local_pattern_edits_are_indexed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that edits in a local patterns directory are searchable."""
+        monkeypatch.setenv(LOCAL_PATTERNS_DIR_ENV, str(tmp_path))
+        path = tmp_path / "summarize" / "system.md"
+        path.parent.mkdir()
+        path.write_text("# IDENTITY\n\nYou summarize content.", encoding="utf-8")
+        server = FabricMCP()
+
+        try:
+            assert not await server.fabric_search_patterns("translate")
+            path.write_text("# IDENTITY\n\nYou translate text.", encoding="utf-8")
+            server.invalidate_pattern_cache("summarize")
+            hits = await server.fabric_search_patterns("translate")
+        finally:
+            await server.close()  # Stops the directory watcher
+
+        assert [(hit["name"], hit["description"]) for hit in hits] == [
+            ("summarize", "You translate text.")
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query, limit, message",
+        [("  ", 10, "query must be a non-empty string"), ("x", 0, "limit")],
+    )
+    async def test_invalid_parameters(self, query: str, limit: int, message: str):
+        """Test that an empty query or a limit below 1 is rejected."""
+        with pytest.raises(McpError, match=message) as exc_info:
+            await FabricMCP().fabric_search_patterns(query, limit)
+
+        assert exc_info.value.error.code == INVALID_PARAMS
@@ -0,0 +1,175 @@
+"""Unit tests for request coalescing (singleflight)."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from fabric_mcp.core import FabricMCP
+from fabric_mcp.models import PatternExecutionConfig
+from fabric_mcp.singleflight import SingleFlight
+from tests.shared.fabric_api.base import TestFixturesBase
+from tests.shared.fabric_api_mocks import (
+    FabricApiMockBuilder,
+    mock_fabric_api_client,
+)
+
+
+class GatedCall:
+    """Coroutine factory that blocks until released and counts its runs."""
+
+    def __init__(self, result: str = "result") -> None:
+        self.runs = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.result = result
+        self.error: Exception | None = None
+
+    async def __call__(self) -> str:
+        self.runs += 1
+        self.started.set()
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    """Test the SingleFlight group."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that callers with the same key receive one shared result."""
+        group: SingleFlight[str, str] = SingleFlight()
+        call = GatedCall()
+
+        tasks = [asyncio.create_task(group.do("k", call)) for _ in range(5)]
+        await call.started.wait()
+        call.release.set()
+
+        assert await asyncio.gather(*tasks) == ["result"] * 5
+        assert call.runs == 1
+        assert (group.stats.executions, group.stats.coalesced) == (1, 4)
+        assert group.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test that calls with different keys are not coalesced."""
+        group: SingleFlight[str, str] = SingleFlight()
+        call = GatedCall()
+        call.release.set()
+
+        await asyncio.gather(group.do("a", call), group.do("b", call))
+
+        assert call.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_key_is_released_after_completion(self):
+        """Test that results are not cached once the call has finished."""
+        group: SingleFlight[str, str] = SingleFlight()
+        call = GatedCall()
+        call.release.set()
+
+        await group.do("k", call)
+        await group.do("k", call)
+
+        assert call.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self):
+        """Test that every waiting caller receives the shared exception."""
+        group: SingleFlight[str, str] = SingleFlight()
+        call = GatedCall()
+        call.error = RuntimeError("upstream failed")
+
+        tasks = [asyncio.create_task(group.do("k", call)) for _ in range(3)]
+        await call.started.wait()
+        call.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert call.runs == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_shared_call_alive(self):
+        """Test that a cancelled caller does not cancel the call for others."""
+        group: SingleFlight[str, str] = SingleFlight()
+        call = GatedCall()
+
+        first = asyncio.create_task(group.do("k", call))
+        second = asyncio.create_task(group.do("k", call))
+        await call.started.wait()
+        first.cancel()
+        call.release.set()
+
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_cancelling_every_caller_cancels_shared_call(self):
+        """Test that the shared call is cancelled when nobody waits for it."""
+        group: SingleFlight[str, str] = SingleFlight()
+        call = GatedCall()
+
+        task = asyncio.create_task(group.do("k", call))
+        await call.started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert group.in_flight() == 0
+
+
+class TestFabricRequestCoalescing(TestFixturesBase):
+    """Test that FabricMCP coalesces identical concurrent upstream calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_metadata_requests_share_one_get(self, server: FabricMCP):
+        """Test concurrent fabric_list_models calls make one upstream GET."""
+        builder = FabricApiMockBuilder().with_successful_models_list()
+        release = asyncio.Event()
+        response = builder.mock_response
+
+        async def slow_get(_endpoint: str) -> Mock:
+            await release.wait()
+            return response
+
+        with mock_fabric_api_client(builder) as mock_client:
+            mock_client.get.side_effect = slow_get
+            tasks = [asyncio.create_task(server.fabric_list_models()) for _ in range(4)]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert all(r == results[0] for r in results)
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("temperature", "expected_upstream_calls"), [(0.0, 1), (0.7, 3)]
+    )
+    @pytest.mark.asyncio
+    async def test_only_deterministic_chat_calls_are_coalesced(
+        self, server: FabricMCP, temperature: float, expected_upstream_calls: int
+    ):
+        """Test identical /chat runs share a call only at temperature 0."""
+        release = asyncio.Event()
+        builder = (
+            FabricApiMockBuilder().with_successful_sse("done").with_sse_gate(release)
+        )
+        config = PatternExecutionConfig(temperature=temperature)
+
+        with mock_fabric_api_client(builder) as mock_client:
+            execute = getattr(server, "_execute_fabric_pattern")
+            tasks = [
+                asyncio.create_task(execute("summarize", "same input", config))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert [r["output_text"] for r in results] == ["done"] * 3
+        assert results[0] is not results[1]
+        assert mock_client.stream.call_count == expected_upstream_calls
@@ -0,0 +1,152 @@
+"""Tests for the incremental Server-Sent Events decoder."""
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from fabric_mcp.sse_parser import ServerSentEvent, SSEDecoder, SSEParserMixin
+
+
+def decode_all(chunks: list[bytes]) -> list[ServerSentEvent]:
+    """Feed chunks to a fresh decoder and collect every event, flush included."""
+    decoder = SSEDecoder()
+    events: list[ServerSentEvent] = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return events
+
+
+def split_every_byte(body: bytes) -> list[bytes]:
+    """Split a body into one-byte chunks, the worst case for incremental parsing."""
+    return [body[i : i + 1] for i in range(len(body))]
+
+
+class TestSSEDecoderFraming:
+    """Test line and event framing."""
+
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+    def test_line_endings(self, newline: bytes):
+        """Test LF, CRLF and bare CR all terminate lines."""
+        body = b"data: one" + newline + newline + b"data: two" + newline + newline
+        events = decode_all([body])
+        assert [e.data for e in events] == ["one", "two"]
+
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+    def test_byte_at_a_time_matches_whole_body(self, newline: bytes):
+        """Test splitting the body at every byte yields the same events."""
+        body = newline.join(
+            [b"event: update", b"id: 7", b"data: a", b"data: b", b"", b"data: c", b""]
+        )
+        assert decode_all(split_every_byte(body)) == decode_all([body])
+
+    def test_crlf_split_across_chunks_is_one_line_ending(self):
+        """Test a CR at the end of a chunk followed by LF is not a blank line."""
+        events = decode_all([b"data: first\r", b"\ndata: second\r\n\r\n"])
+        assert [e.data for e in events] == ["first\nsecond"]
+
+    def test_blank_line_dispatches_event(self):
+        """Test events are returned as soon as their blank line arrives."""
+        decoder = SSEDecoder()
+        assert not decoder.feed(b"data: hello\n")
+        assert [e.data for e in decoder.feed(b"\n")] == ["hello"]
+
+    def test_utf8_split_across_chunks(self):
+        """Test multi-byte characters split between chunks decode correctly."""
+        body = "data: héllo wörld ✓\n\n".encode()
+        events = decode_all(split_every_byte(body))
+        assert [e.data for e in events] == ["héllo wörld ✓"]
+
+    def test_leading_bom_is_ignored(self):
+        """Test a UTF-8 byte order mark at stream start is skipped."""
+        events = decode_all([b"\xef\xbb", b"\xbfdata: x\n\n"])
+        assert [e.data for e in events] == ["x"]
+
+    def test_flush_dispatches_unterminated_event(self):
+        """Test the final event survives a missing trailing blank line."""
+        events = decode_all([b"data: one\n\ndata: last"])
+        assert [e.data for e in events] == ["one", "last"]
+
+
+class TestSSEDecoderFields:
+    """Test field interpretation."""
+
+    def test_multiline_data_is_joined_with_newlines(self):
+        """Test consecutive data fields form one event."""
+        events = decode_all([b"data: line one\ndata: line two\ndata:\n\n"])
+        assert [e.data for e in events] == ["line one\nline two\n"]
+
+    def test_event_id_and_retry(self):
+        """Test event, id and retry fields are reported with the event."""
+        events = decode_all([b"event: token\nid: 42\nretry: 1500\ndata: x\n\n"])
+        assert events == [ServerSentEvent(data="x", event="token", id="42", retry=1500)]
+
+    def test_event_type_resets_but_last_event_id_persists(self):
+        """Test per-event fields reset after dispatch, while the id carries over."""
+        events = decode_all([b"event: a\nid: 1\ndata: x\n\ndata: y\n\n"])
+        assert [(e.event, e.id) for e in events] == [("a", "1"), ("message", "1")]
+
+    def test_comments_and_unknown_fields_are_ignored(self):
+        """Test comment lines and unknown field names do not produce data."""
+        events = decode_all([b": keep-alive\nfoo: bar\nnocolon\ndata: x\n\n"])
+        assert [e.data for e in events] == ["x"]
+
+    def test_only_one_leading_space_is_stripped(self):
+        """Test a single space after the colon is removed, others are kept."""
+        events = decode_all([b"data:no-space\n\ndata:  two-spaces\n\n"])
+        assert [e.data for e in events] == ["no-space", " two-spaces"]
+
+    def test_event_without_data_is_not_dispatched(self):
+        """Test blocks with no data field are dropped."""
+        events = decode_all([b"event: ping\n\n: comment\n\n\n\ndata: x\n\n"])
+        assert [(e.event, e.data) for e in events] == [("message", "x")]
+
+    def test_invalid_retry_and_nul_id_are_ignored(self):
+        """Test non-numeric retry values and ids containing NUL are ignored."""
+        events = decode_all([b"id: ok\n\nid: bad\0id\nretry: soon\ndata: x\n\n"])
+        assert events == [ServerSentEvent(data="x", id="ok")]
+
+
+class TestSSEParserMixinDecoding:
+    """Test the Fabric SSE parsers on raw response bytes."""
+
+    @staticmethod
+    def _response(chunks: list[bytes]) -> httpx.Response:
+        async def body() -> AsyncIterator[bytes]:
+            for chunk in chunks:
+                yield chunk
+
+        return httpx.Response(200, content=body())
+
+    @pytest.mark.asyncio
+    async def test_stream_parser_handles_crlf_comments_and_split_chunks(self):
+        """Test keep-alive comments and CRLF framing split mid-line still parse."""
+        body = (
+            b": keep-alive\r\n\r\n"
+            b'data: {"type": "content", "content": "Hel", "format": "text"}\r\n\r\n'
+            b'data: {"type": "content", "content": "lo", "format": "text"}\r\n\r\n'
+            b'data: {"type": "complete"}\r\n\r\n'
+        )
+        response = self._response([body[:20], body[20:61], body[61:]])
+
+        parse_stream = getattr(SSEParserMixin(), "_parse_sse_stream")
+        chunks = [c async for c in parse_stream(response)]
+
+        assert [c["content"] for c in chunks] == ["Hel", "lo", ""]
+        assert chunks[-1]["type"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_response_parser_accepts_multiline_json_data(self):
+        """Test a JSON payload spread over several data fields is reassembled."""
+        body = (
+            b'data: {"type": "content",\n'
+            b'data:  "content": "multi-line",\n'
+            b'data:  "format": "markdown"}\n\n'
+            b'data: {"type": "complete"}\n\n'
+        )
+
+        parse_response = getattr(SSEParserMixin(), "_parse_sse_response")
+        result = await parse_response(self._response([body]))
+
+        assert result == {"output_format": "markdown", "output_text": "multi-line"}
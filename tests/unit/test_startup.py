@@ -0,0 +1,126 @@
+"""Unit tests for the import-time budget of fabric_mcp.
+
+Each check runs in a fresh interpreter, since the test process has long since
+imported everything.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from fabric_mcp import __version__
+
+# Modules that take most of the start-up time and are only needed to serve
+HEAVY_MODULES = ("fastmcp", "mcp", "rich", "pydantic", "httpx")
+
+# Generous budgets, in milliseconds, for fabric_mcp's own share of `-X importtime`
+# (a few times what a developer laptop measures, to stay clear of CI noise)
+CLI_IMPORT_BUDGET_MS = 300
+SERVER_IMPORT_BUDGET_MS = 400
+
+# Budget for every import of `fabric-mcp --help`, interpreter start-up and
+# third-party libraries included: about 200 ms on a developer laptop, several
+# times that on a loaded test runner. Importing the server stack alone takes
+# more than this.
+HELP_TOTAL_IMPORT_BUDGET_MS = 1000
+
+# Runs the CLI as `fabric-mcp <args>` would, without exiting the interpreter
+RUN_CLI = (
+    "import sys\n"
+    "from fabric_mcp.cli import main\n"
+    "try:\n"
+    "    main({args!r})\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+def _own_import_time_ms(module: str, runs: int = 3) -> float:
+    """fabric_mcp's own import time when importing module, from -X importtime.
+
+    Sums the self time of the fabric_mcp modules, so the third-party libraries
+    they import (fastmcp above all) do not count against the budget. The best
+    of several runs is taken, since other processes only ever add time.
+    """
+    return min(
+        _import_time_once_ms(f"import {module}", prefix="fabric_mcp")
+        for _ in range(runs)
+    )
+
+
+def _total_import_time_ms(code: str, runs: int = 3) -> float:
+    """Time spent in every import made while running code, best of runs."""
+    return min(_import_time_once_ms(code) for _ in range(runs))
+
+
+def _import_time_once_ms(code: str, prefix: str = "") -> float:
+    """Sum of the self times of imported modules whose names start with prefix."""
+    stderr = _python("-X", "importtime", "-c", code).stderr
+    total_us = 0
+    for line in stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        fields = line.removeprefix("import time:").split("|")
+        if (
+            len(fields) == 3
+            and fields[0].strip().isdigit()
+            and fields[2].strip().startswith(prefix)
+        ):
+            total_us += int(fields[0])
+    assert total_us, stderr
+    return total_us / 1000
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fabric_mcp.cli",
+        "import fabric_mcp.utils; fabric_mcp.utils.Log('INFO', sys.stdout)",
+    ],
+    ids=["cli", "log-json"],
+)
+def test_heavy_modules_are_not_imported_up_front(statement: str):
+    """Test that the CLI and JSON logging do not import the server stack."""
+    code = (
+        "import json, os, sys\n"
+        "os.environ['FABRIC_MCP_LOG_FORMAT'] = 'json'\n"
+        f"{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    assert json.loads(_python("-c", code).stdout.splitlines()[-1]) == []
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"]], ids=["version", "help"])
+def test_cli_answers_without_importing_the_server(args: list[str]):
+    """Test that --version and --help leave the server stack unimported."""
+    code = RUN_CLI.format(args=args) + (
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    output = _python("-c", code).stdout.splitlines()
+
+    assert output[-1] == "[]"
+    if args == ["--version"]:
+        assert output[0] == f"fabric-mcp, version {__version__}"
+
+
+def test_cli_import_time_budget():
+    """Test that importing the CLI stays within its budget."""
+    assert _own_import_time_ms("fabric_mcp.cli") < CLI_IMPORT_BUDGET_MS
+
+
+def test_help_total_import_time_budget():
+    """Test that everything `fabric-mcp --help` imports stays within budget."""
+    code = RUN_CLI.format(args=["--help"])
+    assert _total_import_time_ms(code, runs=5) < HELP_TOTAL_IMPORT_BUDGET_MS
+
+
+def test_server_import_time_budget():
+    """Test that fabric_mcp's part of importing the server stays within budget."""
+    assert _own_import_time_ms("fabric_mcp.core") < SERVER_IMPORT_BUDGET_MS
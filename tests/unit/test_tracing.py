@@ -0,0 +1,192 @@
+"""Unit tests for optional OpenTelemetry tracing."""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncGenerator, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from fabric_mcp import tracing
+from fabric_mcp.api_client import FabricApiClient
+from fabric_mcp.core import FabricMCP
+from tests.shared.fabric_api_mocks import FabricApiMockBuilder, mock_fabric_api_client
+
+
+async def _tool(text: str) -> str:
+    return text
+
+
+class TestTracingDisabled:
+    """Test cases for the default, disabled state."""
+
+    def test_helpers_are_no_ops(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that nothing is recorded or injected without configuration."""
+        monkeypatch.delenv("FABRIC_MCP_TRACE_EXPORTER", raising=False)
+        assert not tracing.configure_tracing()
+
+        headers: dict[str, str] = {}
+        tracing.inject_trace_context(headers)
+        with tracing.span("anything") as span:
+            assert span is None
+        assert not headers
+        assert tracing.traced_tool(_tool) is _tool
+
+    def test_unknown_exporter_leaves_tracing_off(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that a bad exporter name is reported instead of failing startup."""
+        monkeypatch.setenv("FABRIC_MCP_TRACE_EXPORTER", "bogus")
+
+        assert not tracing.configure_tracing()
+        assert "Tracing disabled" in caplog.text
+
+
+class TestTracingEnabled:
+    """Test cases with the OpenTelemetry SDK installed and tracing on."""
+
+    @pytest.fixture
+    def exporter(self) -> Iterator[object]:
+        """Enable tracing with an in-memory exporter for the test."""
+        in_memory = pytest.importorskip(
+            "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+        )
+        span_exporter = in_memory.InMemorySpanExporter()
+        assert tracing.configure_tracing(span_exporter)
+        yield span_exporter
+        tracing.shutdown_tracing()
+
+    @staticmethod
+    def _finished_spans(exporter: object) -> dict[str, object]:
+        tracing.shutdown_tracing()  # flushes the batch processor
+        spans = getattr(exporter, "get_finished_spans")()
+        return {span.name: span for span in spans}
+
+    @pytest.mark.asyncio
+    async def test_request_span_propagates_traceparent(self, exporter: object):
+        """Test that Fabric requests get a span and a W3C traceparent header."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"Name": "summarize"})
+
+        client = FabricApiClient(base_url="http://fabric.test")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        try:
+            await client.get("/patterns/summarize")
+        finally:
+            await client.close()
+
+        span = self._finished_spans(exporter)["GET /patterns/{name}"]
+        context = getattr(span, "context")
+        attributes = getattr(span, "attributes")
+        version, trace_id, span_id, _ = seen[0].headers["traceparent"].split("-")
+        assert version == "00"
+        assert trace_id == f"{context.trace_id:032x}"
+        assert span_id == f"{context.span_id:016x}"
+        assert attributes["http.response.status_code"] == 200
+        assert attributes["url.path"] == "/patterns/{name}"
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_leaves_context_intact(
+        self, exporter: object, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that a stream closed early from another task logs no errors."""
+        trace = pytest.importorskip("opentelemetry.trace")
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, text="data: one\n\ndata: two\n\n")
+
+        client = FabricApiClient(base_url="http://fabric.test")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        async def lines() -> AsyncGenerator[str, None]:
+            async with client.stream("POST", "/chat", json_data={}) as response:
+                async for line in response.aiter_lines():
+                    yield line
+
+        stream = lines()
+        try:
+            assert await anext(stream) == "data: one"
+            # The request span is not the consumer's current span between chunks
+            assert not trace.get_current_span().is_recording()
+            with caplog.at_level(logging.ERROR):
+                await asyncio.create_task(stream.aclose())
+        finally:
+            await client.close()
+
+        assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+        span = self._finished_spans(exporter)["POST /chat"]
+        _, trace_id, span_id, _ = seen[0].headers["traceparent"].split("-")
+        assert trace_id == f"{getattr(span, 'context').trace_id:032x}"
+        assert span_id == f"{getattr(span, 'context').span_id:016x}"
+
+    @pytest.mark.asyncio
+    async def test_tool_span_encloses_sse_parse(self, exporter: object):
+        """Test that the SSE parse span is a child of the tool call span."""
+        server = FabricMCP(log_level="WARNING")
+        tool = (await server.get_tools())["fabric_run_pattern"]
+        builder = FabricApiMockBuilder().with_successful_sse("traced output")
+
+        with mock_fabric_api_client(builder):
+            result = await getattr(tool, "fn")("summarize", "text")
+
+        assert result["output_text"] == "traced output"
+        spans = self._finished_spans(exporter)
+        tool_span = spans["tool fabric_run_pattern"]
+        parse_span = spans["sse.parse"]
+        parent = getattr(parse_span, "parent")
+        assert parent.span_id == getattr(tool_span, "context").span_id
+        assert getattr(parse_span, "attributes")["sse.events"] >= 1
+        assert [e.name for e in getattr(parse_span, "events")] == ["first_event"]
+
+    def test_file_exporter_writes_json_lines(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        """Test that FABRIC_MCP_TRACE_EXPORTER=file appends spans to a file."""
+        pytest.importorskip("opentelemetry.sdk")
+        trace_file = tmp_path / "traces.jsonl"
+        monkeypatch.setenv("FABRIC_MCP_TRACE_EXPORTER", "file")
+        monkeypatch.setenv("FABRIC_MCP_TRACE_FILE", str(trace_file))
+
+        assert tracing.configure_tracing()
+        try:
+            with tracing.span("offline", {"answer": 42}):
+                pass
+        finally:
+            tracing.shutdown_tracing()
+
+        (line,) = trace_file.read_text(encoding="utf-8").splitlines()
+        record = json.loads(line)
+        assert record["name"] == "offline"
+        assert record["attributes"] == {"answer": 42}
+
+    @pytest.mark.asyncio
+    async def test_server_close_flushes_and_closes_trace_file(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        """Test that closing the server exports pending spans and ends tracing."""
+        pytest.importorskip("opentelemetry.sdk")
+        trace_file = tmp_path / "traces.jsonl"
+        monkeypatch.setenv("FABRIC_MCP_TRACE_EXPORTER", "file")
+        monkeypatch.setenv("FABRIC_MCP_TRACE_FILE", str(trace_file))
+        server = FabricMCP(log_level="WARNING")
+        try:
+            with tracing.span("before close"):
+                pass
+        finally:
+            await server.close()
+
+        (line,) = trace_file.read_text(encoding="utf-8").splitlines()
+        assert json.loads(line)["name"] == "before close"
+        assert getattr(tracing, "_Tracing").trace_file is None
+        assert tracing.span("after close") is getattr(tracing, "_NO_SPAN")
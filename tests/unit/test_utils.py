@@ -1,10 +1,14 @@
 """Unit tests for the Log class in the fabric_mcp.utils module."""
 
+import io
+import json
 import logging
+import threading
+from collections.abc import Generator
 
 import pytest
 
-from fabric_mcp.utils import Log
+from fabric_mcp.utils import JsonFormatter, Log, get_env_float
 
 
 def test_log_init_valid_level():
@@ -72,3 +76,113 @@ def reset_logging():
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+
+
+def test_get_env_float(monkeypatch: pytest.MonkeyPatch):
+    """Test reading a number from the environment."""
+    monkeypatch.setenv("FABRIC_MCP_TEST_NUMBER", "2.5")
+    assert get_env_float("FABRIC_MCP_TEST_NUMBER", 1.0) == 2.5
+    monkeypatch.delenv("FABRIC_MCP_TEST_NUMBER")
+    assert get_env_float("FABRIC_MCP_TEST_NUMBER", 1.0) == 1.0
+
+
+@pytest.mark.parametrize("raw", ["abc", "-1", "nan", "inf", "-inf", "Infinity"])
+def test_get_env_float_invalid_value(
+    raw: str, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    """Test that invalid values fall back to the default with a warning."""
+    monkeypatch.setenv("FABRIC_MCP_TEST_NUMBER", raw)
+    with caplog.at_level(logging.WARNING):
+        assert get_env_float("FABRIC_MCP_TEST_NUMBER", 1.0) == 1.0
+    assert "FABRIC_MCP_TEST_NUMBER" in caplog.text
+
+
+@pytest.fixture(name="json_log")
+def fixture_json_log(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[tuple[Log, io.StringIO], None, None]:
+    """A `json` format Log writing to a buffer; rich logging is restored after."""
+    monkeypatch.setenv("FABRIC_MCP_LOG_FORMAT", "json")
+    monkeypatch.delenv("FABRIC_MCP_LOG_LEVEL", raising=False)
+    stream = io.StringIO()
+    yield Log("DEBUG", stream=stream), stream
+    monkeypatch.delenv("FABRIC_MCP_LOG_FORMAT")
+    Log()
+
+
+def test_json_log_writes_one_object_per_line(json_log: tuple[Log, io.StringIO]):
+    """Test the fields of structured records, including extra fields."""
+    log, stream = json_log
+    assert log.log_format == "json"
+
+    log.logger.info("Ran %s in %.1fs", "summarize", 1.25, extra={"pattern": "x"})
+    log.logger.debug("second")
+    Log.shutdown()
+
+    first, second = (json.loads(line) for line in stream.getvalue().splitlines())
+    assert first["message"] == "Ran summarize in 1.2s"
+    assert first["level"] == "INFO"
+    assert first["logger"] == "FabricMCP"
+    assert first["module"] == "test_utils"
+    assert first["pattern"] == "x"
+    assert first["timestamp"].endswith("+00:00")
+    assert second["message"] == "second"
+
+
+def test_json_log_formats_off_the_calling_thread(
+    json_log: tuple[Log, io.StringIO], monkeypatch: pytest.MonkeyPatch
+):
+    """Test that JSON encoding happens in the listener thread."""
+    log, _ = json_log
+    threads: list[str] = []
+    original = JsonFormatter.format
+
+    def recording_format(self: JsonFormatter, record: logging.LogRecord) -> str:
+        threads.append(threading.current_thread().name)
+        return original(self, record)
+
+    monkeypatch.setattr(JsonFormatter, "format", recording_format)
+    log.logger.info("hello")
+    Log.shutdown()
+
+    assert threads
+    assert threading.current_thread().name not in threads
+
+
+def test_json_log_keeps_exception_separate(json_log: tuple[Log, io.StringIO]):
+    """Test that tracebacks are rendered into their own field."""
+    log, stream = json_log
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        log.logger.exception("failed")
+    Log.shutdown()
+
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "failed"
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_json_log_reconfiguration_replaces_listener(
+    json_log: tuple[Log, io.StringIO],
+):
+    """Test that creating Log again does not leave listener threads behind."""
+    _, first_stream = json_log
+    second_stream = io.StringIO()
+    log = Log("INFO", stream=second_stream)
+    log.logger.info("only once")
+    Log.shutdown()
+
+    assert len(log.logger.handlers) == 1
+    assert first_stream.getvalue() == ""
+    assert json.loads(second_stream.getvalue())["message"] == "only once"
+
+
+def test_invalid_log_format_falls_back_to_rich(monkeypatch: pytest.MonkeyPatch):
+    """Test that an unknown format is ignored with a warning."""
+    monkeypatch.setenv("FABRIC_MCP_LOG_FORMAT", "xml")
+    stream = io.StringIO()
+    log = Log("INFO", stream=stream)
+
+    assert log.log_format == "rich"
+    assert "FABRIC_MCP_LOG_FORMAT" in stream.getvalue()